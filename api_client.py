@@ -4,8 +4,11 @@ import streamlit as st
 import time
 import datetime
 import os
-from requests.adapters import HTTPAdapter
-from requests.packages.urllib3.util.retry import Retry
+import tracing
+import metrics
+from fantrax_session import get_session_manager, decode_json
+from fantrax_guard import get_guard
+from season_calendar import get_league_calendars
 
 class FantraxAPI:
     def __init__(self):
@@ -16,114 +19,117 @@ class FantraxAPI:
         self.username = os.getenv('FANTRAX_USERNAME')
         self.password = os.getenv('FANTRAX_PASSWORD')
         
-        # Configure retry strategy
-        retry_strategy = Retry(
-            total=3,  # number of retries
-            backoff_factor=1,  # wait 1, 2, 4 seconds between retries
-            status_forcelist=[429, 500, 502, 503, 504]  # HTTP status codes to retry on
-        )
+        # Share the process-wide pooled session (retry strategy and login cookies live there)
+        self._session_manager = get_session_manager()
+        self.session = self._session_manager.session
 
-        # Create session with retry strategy
-        self.session = requests.Session()
-        self.session.mount("https://", HTTPAdapter(max_retries=retry_strategy))
+        # False whenever the last request was answered from a fallback instead of Fantrax
+        self.last_response_live = False
         
-        # Authenticate if credentials are available
+        # Authenticate if credentials are available (no-op while persisted cookies are valid)
         if self.username and self.password:
             self._authenticate()
         else:
             st.sidebar.warning("⚠️ No Fantrax credentials found - using mock data")
     
     def _authenticate(self):
-        """Authenticate with Fantrax to get session cookies"""
-        try:
-            st.sidebar.info("🔐 Authenticating with Fantrax...")
-            
-            # Login to Fantrax
-            login_url = "https://www.fantrax.com/login"
-            login_data = {
-                'username': self.username,
-                'password': self.password
-            }
-            
-            response = self.session.post(login_url, data=login_data, timeout=15)
-            response.raise_for_status()
+        """Authenticate with Fantrax to get session cookies, reusing a live or persisted login"""
+        if self._session_manager.is_authenticated():
+            return True
+        with tracing.span("api.login", "api"):
+            try:
+                st.sidebar.info("🔐 Authenticating with Fantrax...")
             
-            # Check if login was successful by looking for session cookies or redirects
-            if 'JSESSIONID' in self.session.cookies or response.url != login_url:
-                st.sidebar.success("✅ Fantrax authentication successful")
-                return True
-            else:
-                st.sidebar.error("❌ Fantrax authentication failed - invalid credentials")
-                return False
+                # Reload persisted cookies or log in to Fantrax
+                if self._session_manager.ensure_authenticated():
+                    st.sidebar.success("✅ Fantrax authentication successful")
+                    return True
+                else:
+                    st.sidebar.error("❌ Fantrax authentication failed - invalid credentials")
+                    return False
                 
-        except Exception as e:
-            st.sidebar.error(f"❌ Authentication error: {str(e)}")
-            return False
+            except Exception as e:
+                st.sidebar.error(f"❌ Authentication error: {str(e)}")
+                return False
 
-    def _make_request(self, endpoint: str, params: Dict[str, Any] = None) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
-        """Make API request with error handling and retries"""
-        try:
-            st.sidebar.info(f"Making API request to {endpoint} with params: {params}")
-            response = self.session.get(
-                f"{self.base_url}/{endpoint}",
-                params=params,
-                timeout=15  # Extended timeout
-            )
-            response.raise_for_status()
+    def _make_request(self, endpoint: str, params: Dict[str, Any] = None,
+                      remember: bool = True) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
+        """
+        Make API request with error handling (rate limit, circuit breaker and last-known-good fallback)
+
+        Args:
+            endpoint: Fantrax endpoint name
+            params: Query parameters
+            remember: Keep the payload as last-known-good (off for payloads cached elsewhere)
+        """
+        guard = get_guard()
+        skip_reason = guard.before_request(endpoint)
+        if skip_reason:
+            # Fail fast while Fantrax is tripped or we are over the shared request budget
+            return self._fallback(endpoint, params, skip_reason)
+
+        # No per-request UI output: this also runs on the refresh worker thread. The span
+        # carries the timing; failures reach the sidebar through the guard's status.
+        with tracing.span(f"api.{endpoint}", "api"), metrics.FANTRAX_REQUEST_SECONDS.time(endpoint=endpoint):
+            try:
+                response = self._session_manager.get(
+                    f"{self.base_url}/{endpoint}",
+                    params=params,
+                    timeout=15  # Extended timeout
+                )
+                response.raise_for_status()
             
-            # Get the response content
-            response_text = response.text
+                # Get the response content
+                response_text = response.text
             
-            # Check if response is likely HTML instead of JSON (common error)
-            if response_text.strip().startswith(('<html', '<!DOCTYPE html')):
-                st.warning(f"Received HTML response from {endpoint} instead of JSON")
-                return self._get_mock_data(endpoint)
+                # Check if response is likely HTML instead of JSON (common error)
+                if response_text.strip().startswith(('<html', '<!DOCTYPE html')):
+                    guard.record_failure(f"{endpoint}: HTML response")
+                    return self._fallback(endpoint, params, "bad_response")
                 
-            # Try to parse as JSON
-            try:
-                data = response.json()
+                # Try to parse as JSON
+                try:
+                    data = decode_json(response)
                 
-                # Check if the response contains an 'error' key, which indicates API error
-                if isinstance(data, dict) and 'error' in data:
-                    error_msg = data.get('error', 'Unknown API error')
-                    st.sidebar.error(f"API Error in {endpoint}: {error_msg}")
-                    st.sidebar.warning(f"Dictionary keys: {list(data.keys())}")
-                    # Log detailed information for debugging
-                    st.sidebar.info(f"Full response: {data}")
-                    return self._get_mock_data(endpoint)
+                    # Check if the response contains an 'error' key, which indicates API error
+                    if isinstance(data, dict) and 'error' in data:
+                        # Fantrax answered, so the circuit closes (this also ends a
+                        # half-open trial); the error payload is not kept as last-known-good
+                        guard.record_success(endpoint, params, None)
+                        return self._fallback(endpoint, params, "api_error")
                 
-                # Success!
-                if isinstance(data, (dict, list)):
-                    st.sidebar.success(f"✅ {endpoint} API call successful - using live data")
-                    return data
-                else:
-                    st.warning(f"Unexpected data type from {endpoint}: {type(data)}")
-                    st.sidebar.warning(f"⚠️ {endpoint} returned unexpected format - falling back to mock data")
-                    # If we got a string or other non-dict/list, return mock data
-                    return self._get_mock_data(endpoint)
+                    # Success!
+                    if isinstance(data, (dict, list)):
+                        guard.record_success(endpoint, params, data if remember else None)
+                        self.last_response_live = True
+                        return data
+                    else:
+                        # If we got a string or other non-dict/list, fall back
+                        guard.record_failure(f"{endpoint}: unexpected {type(data).__name__} payload")
+                        return self._fallback(endpoint, params, "bad_response")
                     
-            except ValueError as json_error:
-                st.error(f"Failed to parse JSON from {endpoint}: {str(json_error)}")
-                # Show a sample of the response for debugging
-                if len(response_text) > 100:
-                    st.sidebar.info(f"Response preview: {response_text[:100]}...")
-                else:
-                    st.sidebar.info(f"Response: {response_text}")
-                return self._get_mock_data(endpoint)
+                except ValueError:
+                    guard.record_failure(f"{endpoint}: invalid JSON")
+                    return self._fallback(endpoint, params, "bad_response")
                 
-        except requests.exceptions.RequestException as e:
-            st.warning(f"API request to {endpoint} failed: {str(e)}")
-            st.sidebar.warning(f"🔄 {endpoint} API unavailable - using mock data for development")
-            return self._get_mock_data(endpoint)
-        except Exception as e:
-            st.error(f"Unexpected error in API request to {endpoint}: {str(e)}")
-            import traceback
-            st.sidebar.error(f"API request error traceback: {traceback.format_exc()}")
-            st.sidebar.warning(f"🔄 {endpoint} API failed - using mock data for development")
-            return self._get_mock_data(endpoint)
+            except requests.exceptions.RequestException as e:
+                guard.record_failure(f"{endpoint}: {e}")
+                return self._fallback(endpoint, params, "request_failed")
+            except Exception as e:
+                guard.record_failure(f"{endpoint}: {e}")
+                return self._fallback(endpoint, params, "request_failed")
+
+    def _fallback(self, endpoint: str, params: Dict[str, Any], reason: str) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
+        """Serve the last-known-good payload for a request, or mock data if there has never been one"""
+        self.last_response_live = False
+        payload = get_guard().fallback(endpoint, params, reason)
+        if payload is not None:
+            return payload
+        return self._get_mock_data(endpoint)
 
     def _get_mock_data(self, endpoint: str) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
         """Return mock data for development when API is unavailable"""
+        metrics.FANTRAX_MOCK_FALLBACKS.inc(endpoint=endpoint)
         if endpoint == "getLeagueInfo":
             return {
                 "draftSettings": {},
@@ -274,36 +280,24 @@ class FantraxAPI:
         return {}
 
     def get_player_ids(self) -> Dict[str, Any]:
-        """Fetch player IDs"""
-        return self._make_request("getPlayerIds", {"sport": "MLB"})
+        """
+        Fetch the full MLB player universe ({player_id: {'name', 'team', ...}}).
+
+        Callers should go through player_universe.get_player_universe_store(),
+        which keeps a compact copy and refetches at most daily; the raw payload
+        is therefore not kept as last-known-good here.
+        """
+        return self._make_request("getPlayerIds", {"sport": "MLB"}, remember=False)
 
     def get_league_info(self) -> Dict[str, Any]:
         """Fetch league information"""
         return self._make_request("getLeagueInfo", {"leagueId": self.league_id})
 
     def get_team_rosters(self, period: str = None) -> Dict[str, Any]:
-        """Fetch team rosters"""
-        # Use the current period if not specified
+        """Fetch team rosters (for today's daily roster period unless one is given)"""
         if period is None:
-            # Try to get current period from scoring periods
             try:
-                scoring_periods = self.get_scoring_periods()
-                current_period = "1"  # Default fallback
-                
-                # Extract current period from the response
-                if isinstance(scoring_periods, list):
-                    for period_obj in scoring_periods:
-                        if isinstance(period_obj, dict) and period_obj.get('isCurrent', False):
-                            current_period = str(period_obj.get('periodNum', 1))
-                            break
-                elif isinstance(scoring_periods, dict) and 'items' in scoring_periods:
-                    for period_obj in scoring_periods['items']:
-                        if isinstance(period_obj, dict) and period_obj.get('isCurrent', False):
-                            current_period = str(period_obj.get('periodNum', 1))
-                            break
-                
-                period = current_period
-                st.sidebar.info(f"Using scoring period: {period}")
+                period = str(get_league_calendars(self).daily.current())
             except Exception as e:
                 st.sidebar.warning(f"Could not determine current period, using period 1: {str(e)}")
                 period = "1"
@@ -313,115 +307,63 @@ class FantraxAPI:
 
     def get_standings(self) -> List[Dict[str, Any]]:
         """Fetch standings data directly from the API for power rankings calculation"""
-        try:
-            st.sidebar.info("Fetching standings data from Fantrax API...")
-            response = self.session.get(
-                "https://www.fantrax.com/fxea/general/getStandings",
-                params={"leagueId": self.league_id},
-                timeout=20  # Extended timeout
-            )
-            response.raise_for_status()
-            
-            # Try to parse the JSON response
+        guard = get_guard()
+        params = {"leagueId": self.league_id}
+        skip_reason = guard.before_request("getStandings")
+        if skip_reason:
+            return self._fallback("getStandings", params, skip_reason)
+
+        with tracing.span("api.getStandings", "api"), metrics.FANTRAX_REQUEST_SECONDS.time(endpoint="getStandings"):
             try:
-                response_data = response.json()
+                response = self._session_manager.get(
+                    "https://www.fantrax.com/fxea/general/getStandings",
+                    params=params,
+                    timeout=20  # Extended timeout
+                )
+                response.raise_for_status()
+            
+                # Try to parse the JSON response
+                try:
+                    response_data = decode_json(response)
                 
-                # Check the response structure and extract standings if needed
-                if isinstance(response_data, dict) and 'standings' in response_data:
-                    # API returned a dictionary with a 'standings' key containing the actual data
-                    standings_data = response_data['standings']
-                    st.sidebar.success(f"Received standings data: {len(standings_data)} teams found")
-                    return standings_data
-                elif isinstance(response_data, list):
-                    # API returned a list directly (expected format)
-                    st.sidebar.success(f"Received standings data: {len(response_data)} teams found")
-                    return response_data
-                else:
-                    # Unknown format - log it for debugging
-                    st.sidebar.warning(f"Unexpected API response format: {type(response_data)}")
-                    if isinstance(response_data, dict):
-                        st.sidebar.info(f"Response keys: {list(response_data.keys())}")
-                    
-                    # Return what we got, let the processor handle it
-                    return response_data
-            except ValueError as e:
-                st.error(f"Failed to parse JSON response from standings API: {str(e)}")
-                st.warning("Response was not valid JSON - using mock data instead")
-                return self._get_mock_data("getStandings")
-        except requests.exceptions.RequestException as e:
-            st.warning(f"Standings API request failed: {str(e)}")
-            st.info("Using mock data for development purposes")
-            return self._get_mock_data("getStandings")
-        except Exception as e:
-            st.error(f"Unexpected error fetching standings: {str(e)}")
-            import traceback
-            st.sidebar.error(f"Traceback: {traceback.format_exc()}")
-            return self._get_mock_data("getStandings")
+                    # Check the response structure and extract standings if needed
+                    if isinstance(response_data, dict) and 'standings' in response_data:
+                        # API returned a dictionary with a 'standings' key containing the actual data
+                        standings_data = response_data['standings']
+                        guard.record_success("getStandings", params, standings_data)
+                        self.last_response_live = True
+                        return standings_data
+                    elif isinstance(response_data, list):
+                        # API returned a list directly (expected format)
+                        guard.record_success("getStandings", params, response_data)
+                        self.last_response_live = True
+                        return response_data
+                    else:
+                        # Unknown format: Fantrax answered: close the circuit but keep the previous last-known-good
+                        guard.record_success("getStandings", params, None)
+                        self.last_response_live = True
+                        # Return what we got, let the processor handle it
+                        return response_data
+                except ValueError:
+                    guard.record_failure("getStandings: invalid JSON")
+                    return self._fallback("getStandings", params, "bad_response")
+            except requests.exceptions.RequestException as e:
+                guard.record_failure(f"getStandings: {e}")
+                return self._fallback("getStandings", params, "request_failed")
+            except Exception as e:
+                guard.record_failure(f"getStandings: {e}")
+                return self._fallback("getStandings", params, "request_failed")
         
     def get_scoring_periods(self) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
         """
         Fetch scoring periods
         
         Returns:
-            Either a dictionary containing scoring periods data or a list of scoring period dictionaries,
-            depending on the API response format.
+            A dictionary with the season's weekly 'periods' and the 'currentPeriod'.
+            The getScoringPeriods endpoint is not used (it consistently errors);
+            the table comes from the shared season calendar, loaded once per season.
         """
-        # Since the API endpoint is returning errors, we'll use a different approach
-        # and skip making the request entirely
-        
-        st.sidebar.info("Using league info to determine scoring periods...")
-        
-        # Get league info which contains basic season information
-        league_info = self.get_league_info()
-        
-        if isinstance(league_info, dict) and 'season' in league_info:
-            season = league_info.get('season', '2025')
-            
-            # Create a manually constructed scoring periods representation
-            # This is more reliable than making API calls that consistently fail
-            current_year = int(season)
-            
-            # MLB season typically runs April to October
-            start_month = 4  # April
-            start_day = 1
-            
-            # Create weekly scoring periods for the baseball season (approximately 26 weeks)
-            periods = []
-            for week in range(1, 27):
-                # Calculate start and end dates for this week
-                start_date = datetime.datetime(current_year, start_month, start_day) + datetime.timedelta(days=(week-1)*7)
-                end_date = start_date + datetime.timedelta(days=6)
-                
-                # Determine if this is the current period
-                now = datetime.datetime.now()
-                is_current = start_date <= now <= end_date
-                is_completed = now > end_date
-                
-                # Format dates in standard format
-                start_str = start_date.strftime('%Y-%m-%d')
-                end_str = end_date.strftime('%Y-%m-%d')
-                
-                periods.append({
-                    'periodName': f'Week {week}',
-                    'periodNum': week,
-                    'id': week,
-                    'startDate': start_str,
-                    'endDate': end_str,
-                    'isActive': is_current,
-                    'isCurrent': is_current,
-                    'isCompleted': is_completed,
-                    'isFuture': now < start_date
-                })
-            
-            # Return a dictionary with the periods list
-            return {
-                'periods': periods,
-                'currentPeriod': next((p for p in periods if p.get('isActive')), periods[0])
-            }
-        
-        # If we couldn't get league info or construct periods, fall back to mock data
-        st.sidebar.warning("Unable to construct scoring periods. Using default data.")
-        return self._get_mock_data("getScoringPeriods")
+        return get_league_calendars(self).weekly.to_payload()
         
     def get_matchups(self, period_id: int = 1) -> List[Dict[str, Any]]:
         """Fetch matchups for a specific period"""
@@ -1,16 +1,20 @@
 import streamlit as st
 import pandas as pd
 import os
-import base64
-from PIL import Image
-from components import league_info, rosters, standings, power_rankings, prospects, transactions, ddi, mvp_race_new as mvp_race, dump_deadline
+import tracing
+import static_assets
+import league_state
+import metrics
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+from components import league_info, rosters, standings, power_rankings, prospects, transactions, ddi, mvp_race_new as mvp_race, dump_deadline, playoff_race
 # Projected Rankings completely removed as it's no longer relevant for this season
+from refresh_worker import get_refresh_worker
+from fantrax_guard import get_guard, OPEN as CIRCUIT_OPEN, HALF_OPEN as CIRCUIT_HALF_OPEN
 from utils import (
     fetch_api_data, 
+    get_league_data, 
     save_power_rankings_data, 
-    load_power_rankings_data, 
     save_weekly_results, 
-    load_weekly_results,
     save_rankings_history,
     load_rankings_history,
     create_ranking_trend_chart,
@@ -499,13 +503,35 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 def main():
+    # Serve /metrics on the side port if configured (no-op after the first rerun)
+    metrics.start_metrics_server()
+
+    # Collect per-stage timings for this rerun
+    tracing.start_trace("rerun")
+    try:
+        _render_app()
+    finally:
+        summary = tracing.finish_trace()
+        with st.sidebar:
+            tracing.render_performance_panel(summary)
+
+        ctx = get_script_run_ctx()
+        if ctx is not None:
+            metrics.record_session_state_memory(st.session_state, ctx.session_id, exclude=league_state.is_shared)
+        metrics.write_metrics_file()
+
+def _render_app():
     try:
         # Display header image
         col1, col2, col3 = st.columns([1, 3, 1])
         with col2:
             try:
-                # Load the image from attached_assets folder
-                header_img = Image.open('attached_assets/331073D2-5049-4D62-B0E8-56A215C5C224.jpeg')
+                # Prebuilt, resized header variants (static_assets.py); the
+                # source image is only used if no build is available
+                header_html = static_assets.picture_html(
+                    'logo', alt="ABL Analytics", sizes="(max-width: 768px) 100vw, 60vw",
+                    style="width: 100%; height: auto;"
+                )
                 
                 # Create a stylized container for the image
                 container = st.container()
@@ -527,8 +553,10 @@ def main():
                         unsafe_allow_html=True
                     )
                     
-                    # Display the image with Streamlit's image function inside the container
-                    st.image(header_img, use_container_width=True)
+                    if header_html is not None:
+                        st.markdown(header_html, unsafe_allow_html=True)
+                    else:
+                        st.image(static_assets.STATIC_ASSETS['logo']['source'], use_container_width=True)
             except Exception as e:
                 st.error(f"Could not load header image: {str(e)}")
                 # Fallback to text header
@@ -557,11 +585,45 @@ def main():
         with st.sidebar:
             st.markdown("### 🔄 League Controls")
             st.markdown("Refresh roster data to get the latest trades and player assignments from Fantrax API.")
+            worker = get_refresh_worker()
             if st.button("🔄 Refresh Roster Data", use_container_width=True):
-                # Clear the cache to force fresh API data
+                # Refresh the shared snapshot now and clear the fallback cache
+                with st.spinner("Fetching latest roster data from Fantrax..."):
+                    worker.refresh()
                 fetch_api_data.clear()
-                st.success("Cache cleared! Refreshing with latest roster data...")
+                st.success("Refreshed! Reloading with latest roster data...")
                 st.rerun()
+
+            snapshot = worker.get_snapshot(wait=0)
+            if snapshot is not None:
+                st.caption(
+                    f"Data v{snapshot.version} from {snapshot.fetched_at.strftime('%H:%M:%S')}; "
+                    f"auto-refresh every {int(worker.interval)}s"
+                )
+                if snapshot.roster_diff is not None and not snapshot.roster_diff.is_empty():
+                    st.caption(f"Roster changes since last refresh: {snapshot.roster_diff.summary()}")
+            if worker.last_error:
+                st.caption("⚠️ Last background refresh failed; showing the previous snapshot.")
+            with st.expander("Session memory"):
+                memory_report = league_state.session_memory_report(st.session_state)
+                own_bytes = memory_report.loc[~memory_report['shared'], 'bytes'].sum()
+                st.caption(
+                    f"This session owns {own_bytes / 1024:.0f} KB of DataFrames; "
+                    f"{league_state.update_shared_bytes() / 1024:.0f} KB are shared by all sessions"
+                )
+                st.dataframe(memory_report, hide_index=True, use_container_width=True)
+            guard_status = get_guard().status()
+            if guard_status['state'] == CIRCUIT_OPEN:
+                st.caption(
+                    f"🔴 Fantrax circuit open after {guard_status['failures']} failures; "
+                    f"serving last known data, retry in {int(guard_status['retry_in'])}s"
+                )
+            elif guard_status['state'] == CIRCUIT_HALF_OPEN:
+                st.caption("🟡 Fantrax circuit half-open; probing with a trial request")
+            else:
+                st.caption("🟢 Fantrax API healthy")
+            if guard_status['last_error']:
+                st.caption(f"Last Fantrax error: {guard_status['last_error']}")
             
             # Add API test button
             st.markdown("### 🔍 API Diagnostics")
@@ -642,22 +704,10 @@ def main():
             st.markdown("---")
             st.markdown("### 📊 Power Rankings Data")
             
-            # Initialize session state for power rankings data if not exists
-            if 'power_rankings_data' not in st.session_state:
-                # Try to load saved data first
-                saved_data = load_power_rankings_data()
-                if saved_data:
-                    st.session_state.power_rankings_data = saved_data
-                else:
-                    st.session_state.power_rankings_data = {}
-            
-            if 'weekly_results' not in st.session_state:
-                # Try to load saved weekly results
-                saved_results = load_weekly_results()
-                if saved_results:
-                    st.session_state.weekly_results = saved_results
-                else:
-                    st.session_state.weekly_results = []
+            # Saved stats and results are loaded once per process and shared;
+            # a session only gets its own copy once it edits them
+            league_state.use_shared(st.session_state, 'power_rankings_data', league_state.shared_power_rankings_data)
+            league_state.use_shared(st.session_state, 'weekly_results', league_state.shared_weekly_results)
             
             # Section 1: Bulk data entry for team stats
             st.subheader("Team Season Stats")
@@ -681,6 +731,7 @@ def main():
                     lines = bulk_data.strip().split('\n')
                     processed_count = 0
                     errors = []
+                    power_rankings_data = league_state.editable(st.session_state, 'power_rankings_data')
                     
                     for line in lines:
                         try:
@@ -691,7 +742,7 @@ def main():
                                 weeks_played = int(parts[2])
                                 
                                 # Update the session state - store as fptsf to match Fantrax API format
-                                st.session_state.power_rankings_data[team_name] = {
+                                power_rankings_data[team_name] = {
                                     'fptsf': total_points,  # Store as fptsf to match the API format
                                     'weeks_played': weeks_played
                                 }
@@ -703,7 +754,9 @@ def main():
                     
                     if processed_count > 0:
                         # Save to persistent storage
-                        if save_power_rankings_data(st.session_state.power_rankings_data):
+                        if save_power_rankings_data(power_rankings_data):
+                            # Back to the shared copy, reloaded from the saved file
+                            st.session_state.power_rankings_data = league_state.shared_power_rankings_data()
                             st.success(f"Successfully processed and saved {processed_count} team(s)")
                         else:
                             st.warning(f"Processed {processed_count} team(s), but couldn't save to file")
@@ -727,6 +780,14 @@ def main():
             *This will add to previous weekly data. The record should represent the Win-Loss-Draw counts from 3 weekly matchups.*
             """)
             
+            # Completed weeks are ingested from Fantrax matchups automatically;
+            # the paste box below is only needed for corrections
+            if st.button("Sync Weekly Results from Fantrax", use_container_width=True):
+                with st.spinner("Fetching completed matchups from Fantrax..."):
+                    stored_periods = get_refresh_worker().sync_matchups()
+                st.session_state.weekly_results = league_state.shared_weekly_results()
+                st.success(f"Synced {stored_periods} scoring period(s) of matchup results")
+
             # Text area for bulk weekly results
             weekly_results_data = st.text_area("Paste Weekly Results", height=200)
             
@@ -736,6 +797,7 @@ def main():
                     lines = weekly_results_data.strip().split('\n')
                     processed_count = 0
                     errors = []
+                    weekly_results = league_state.editable(st.session_state, 'weekly_results')
                     
                     for line in lines:
                         try:
@@ -776,7 +838,7 @@ def main():
                                     continue
                                 
                                 # Add to the session state with the full record
-                                st.session_state.weekly_results.append({
+                                weekly_results.append({
                                     'team': team_name,
                                     'week': week_number,
                                     'result': weekly_status,  # For backward compatibility
@@ -793,7 +855,8 @@ def main():
                     
                     if processed_count > 0:
                         # Save to persistent storage
-                        if save_weekly_results(st.session_state.weekly_results):
+                        if save_weekly_results(weekly_results):
+                            st.session_state.weekly_results = league_state.shared_weekly_results()
                             st.success(f"Successfully processed and saved {processed_count} weekly result(s)")
                         else:
                             st.warning(f"Processed {processed_count} weekly result(s), but couldn't save to file")
@@ -805,8 +868,8 @@ def main():
             
             # Display current data
             if st.checkbox("Show Current Data"):
-                st.write("Season Stats:", st.session_state.power_rankings_data)
-                st.write("Weekly Results:", st.session_state.weekly_results)
+                st.write("Season Stats:", dict(st.session_state.power_rankings_data))
+                st.write("Weekly Results:", list(st.session_state.weekly_results))
                 
                 # Add option to clear data
                 if st.button("Clear All Data", type="secondary"):
@@ -819,6 +882,9 @@ def main():
                             os.remove('data/team_season_stats.csv')
                         if os.path.exists('data/weekly_results.csv'):
                             os.remove('data/weekly_results.csv')
+                        # Back to the (now empty) shared values
+                        st.session_state.power_rankings_data = league_state.shared_power_rankings_data()
+                        st.session_state.weekly_results = league_state.shared_weekly_results()
                         st.success("All power rankings data has been cleared from memory and storage")
                     except Exception as e:
                         st.warning(f"Data cleared from memory but error deleting files: {str(e)}")
@@ -826,11 +892,12 @@ def main():
             st.markdown("---")
             st.markdown("### About")
             try:
-                # Use a smaller version of the same image for the sidebar
-                sidebar_img = Image.open('attached_assets/331073D2-5049-4D62-B0E8-56A215C5C224.jpeg')
-                
-                # Display the image with Streamlit's image function
-                st.image(sidebar_img, width=150)
+                # 2x variant of the header image, inlined as a precomputed data URI
+                sidebar_src = static_assets.asset_data_uri('logo', 300)
+                if sidebar_src is not None:
+                    st.markdown(f'<img src="{sidebar_src}" alt="ABL" width="150" height="150">', unsafe_allow_html=True)
+                else:
+                    st.image(static_assets.STATIC_ASSETS['logo']['source'], width=150)
             except Exception as e:
                 # Fallback to text if image can't be loaded
                 st.markdown(
@@ -865,20 +932,18 @@ def main():
 
     try:
         # Use the Current API
-        data = fetch_api_data()
+        with tracing.span("get_league_data", "fetch"):
+            data = get_league_data()
         
         if data:
-            # Store standings data in session state for power rankings input
-            if 'standings_data' not in st.session_state:
-                st.session_state.standings_data = data['standings_data']
+            # Reference (not copy) the current snapshot's standings for power
+            # rankings input; re-pointed every rerun so old snapshots are freed
+            st.session_state.standings_data = data['standings_data']
             
             # Session state for power rankings data should be already initialized in the sidebar section
             # but just in case there was an error, let's check again
-            if 'power_rankings_data' not in st.session_state:
-                st.session_state.power_rankings_data = {}
-            
-            if 'weekly_results' not in st.session_state:
-                st.session_state.weekly_results = []
+            league_state.use_shared(st.session_state, 'power_rankings_data', league_state.shared_power_rankings_data)
+            league_state.use_shared(st.session_state, 'weekly_results', league_state.shared_weekly_results)
             
             # Create tabs for different sections
             tab1, tab2, tab3, tab4, tab5, tab6, tab7 = st.tabs([
@@ -891,13 +956,13 @@ def main():
                 "🏆 DDI Rankings"
             ])
 
-            with tab1:
+            with tab1, tracing.span("render.league_info", "render"):
                 league_info.render(data['league_data'])
 
-            with tab2:
+            with tab2, tracing.span("render.rosters", "render"):
                 rosters.render(data['roster_data'])
 
-            with tab3:
+            with tab3, tracing.span("render.power_rankings", "render"):
                 # Pass session state data to power_rankings component
                 power_rankings_data = st.session_state.power_rankings_data if 'power_rankings_data' in st.session_state else {}
                 weekly_results = st.session_state.weekly_results if 'weekly_results' in st.session_state else []
@@ -906,19 +971,23 @@ def main():
                 power_rankings.render(
                     data['standings_data'], 
                     power_rankings_data=power_rankings_data,
-                    weekly_results=weekly_results
+                    weekly_results=weekly_results,
+                    roster_data=data['roster_data']
                 )
 
-            with tab4:
+            with tab3, tracing.span("render.playoff_odds", "render"):
+                playoff_race.render(data['standings_data'], data['roster_data'])
+
+            with tab4, tracing.span("render.mvp_race", "render"):
                 mvp_race.render()
 
-            with tab5:
+            with tab5, tracing.span("render.dump_deadline", "render"):
                 dump_deadline.render()
 
-            with tab6:
+            with tab6, tracing.span("render.prospects", "render"):
                 prospects.render(data['roster_data'])
 
-            with tab7:
+            with tab7, tracing.span("render.ddi", "render"):
                 # Get the power rankings data from the power_rankings component
                 if 'power_rankings_calculated' in st.session_state and st.session_state.power_rankings_calculated is not None:
                     # Use the calculated power rankings
@@ -926,7 +995,7 @@ def main():
                     ddi_df = ddi.render(data['roster_data'], power_rankings_df)
                     
                     # Store DDI data in session state for other components to use
-                    st.session_state.ddi_data_calculated = ddi_df
+                    st.session_state.ddi_data_calculated = league_state.share_frame(ddi_df) if ddi_df is not None else None
                     
                     # Check if we should take a weekly snapshot (Sunday or first run)
                     if should_take_weekly_snapshot():
@@ -950,7 +1019,7 @@ def main():
                     ddi_df = ddi.render(data['roster_data'])
                     
                     # Store DDI data in session state for other components to use
-                    st.session_state.ddi_data_calculated = ddi_df
+                    st.session_state.ddi_data_calculated = league_state.share_frame(ddi_df) if ddi_df is not None else None
         else:
             st.error("Unable to fetch data from the API. Please check your connection and try again.")
 
@@ -34,7 +34,7 @@ def audit_prospect_teams():
         from utils import fetch_api_data
         data = fetch_api_data()
         if data and 'roster_data' in data:
-            roster_data = data['roster_data']
+            roster_data = data['roster_data'].copy()
             roster_data['clean_name'] = roster_data['player_name'].fillna('').astype(str).apply(normalize_name)
             print(f"✅ Loaded {len(roster_data)} players from current rosters")
         else:
@@ -0,0 +1,91 @@
+import streamlit as st
+import pandas as pd
+from typing import Callable, List, Optional
+import hashlib
+import html
+import string
+import metrics
+import tracing
+from change_detection import frame_version
+
+# Rendered sections kept across reruns (one per template and data version)
+MAX_CACHED_SECTIONS = 64
+
+
+class CardTemplate:
+    """
+    HTML card template parsed once, rendered for every row of a frame at once.
+
+    Placeholders use str.format syntax ({column} or {column:.1f}). Values are
+    HTML-escaped, except columns whose name ends in ``_html``, which hold
+    markup built by another template. Whitespace between lines is dropped so
+    a section stays one HTML block for st.markdown.
+    """
+    __slots__ = ('name', 'key', '_pieces')
+
+    def __init__(self, name: str, source: str):
+        source = ' '.join(line.strip() for line in source.splitlines() if line.strip())
+        self.name = name
+        self.key = f"{name}:{hashlib.sha256(source.encode()).hexdigest()[:12]}"
+        self._pieces = [(literal, field, spec) for literal, field, spec, _ in string.Formatter().parse(source)]
+
+    @property
+    def fields(self) -> List[str]:
+        return [field for _, field, _ in self._pieces if field]
+
+    def render_rows(self, frame: pd.DataFrame) -> List[str]:
+        """One card per row; each placeholder is filled for the whole column in one pass"""
+        n = len(frame)
+        columns = []
+        for literal, field, spec in self._pieces:
+            if literal:
+                columns.append([literal] * n)
+            if field:
+                values = [format(value, spec) for value in frame[field].tolist()]
+                columns.append(values if field.endswith('_html') else [html.escape(value) for value in values])
+        return [''.join(parts) for parts in zip(*columns)] if columns else [''] * n
+
+    def render(self, **values) -> str:
+        """A single card"""
+        return self.render_rows(pd.DataFrame([values]))[0]
+
+
+@st.cache_data(max_entries=MAX_CACHED_SECTIONS, show_spinner=False)
+def _cached_section(template_key: str, prepare_key: str, version: str, header: str, footer: str,
+                    _template: CardTemplate, _frame: pd.DataFrame,
+                    _prepare: Optional[Callable[[pd.DataFrame], pd.DataFrame]]) -> str:
+    metrics.mark_cache_miss("card_sections")
+    with tracing.span(f"cards.{_template.name}", "render"):
+        frame = _prepare(_frame) if _prepare is not None else _frame
+        return header + ''.join(_template.render_rows(frame)) + footer
+
+
+def section_html(template: CardTemplate, frame: pd.DataFrame, header: str = "", footer: str = "",
+                 prepare: Optional[Callable[[pd.DataFrame], pd.DataFrame]] = None) -> str:
+    """
+    Cards of every row wrapped in header/footer markup, reused until the
+    frame's content (data version hash) or the template changes.
+
+    Args:
+        template: Card template applied to every row
+        frame: Card data; without ``prepare`` it must hold the template fields
+        header: Markup before the first card
+        footer: Markup after the last card
+        prepare: Module-level function turning ``frame`` into the template
+                 fields; it only runs when the section is not cached, so it
+                 must depend on nothing but ``frame``
+    """
+    if prepare is None:
+        version = frame_version(frame[list(dict.fromkeys(template.fields))])
+        prepare_key = ""
+    else:
+        version = frame_version(frame)
+        prepare_key = f"{prepare.__module__}.{prepare.__qualname__}"
+    with metrics.cache_lookup("card_sections"):
+        return _cached_section(template.key, prepare_key, version, header, footer, template, frame, prepare)
+
+
+def render_section(template: CardTemplate, frame: pd.DataFrame, header: str = "", footer: str = "",
+                   prepare: Optional[Callable[[pd.DataFrame], pd.DataFrame]] = None):
+    """Emit a whole section of cards as a single st.markdown element"""
+    st.markdown(section_html(template, frame, header, footer, prepare), unsafe_allow_html=True)
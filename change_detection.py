@@ -0,0 +1,223 @@
+import pandas as pd
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Set
+import hashlib
+import json
+import os
+import threading
+import metrics
+
+# Processed output -> raw endpoint payloads it is derived from
+OUTPUT_DEPENDENCIES = {
+    'league_data': ('league_info',),
+    'roster_data': ('rosters', 'player_ids'),
+    'standings_data': ('standings',),
+    'current_period': ('scoring_periods',),
+    'transactions': ('transactions',),
+}
+
+# Columns that define a team's roster for change detection
+ROSTER_KEY_COLUMNS = ['player_name', 'position', 'status', 'salary', 'mlb_team']
+
+
+def fingerprint_payload(payload: Any) -> str:
+    """
+    Stable SHA-256 of a JSON-compatible payload (key order independent).
+
+    Objects that already carry a content ``fingerprint`` (e.g. PlayerUniverse)
+    are not re-serialized.
+    """
+    precomputed = getattr(payload, 'fingerprint', None)
+    if isinstance(precomputed, str):
+        return precomputed
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def fingerprint_payloads(raw: Dict[str, Any]) -> Dict[str, str]:
+    """Fingerprint each raw endpoint payload separately"""
+    return {endpoint: fingerprint_payload(payload) for endpoint, payload in raw.items()}
+
+
+def changed_endpoints(previous: Optional[Dict[str, str]], current: Dict[str, str]) -> Set[str]:
+    """Endpoints whose fingerprint differs from (or is missing in) the previous version"""
+    if not previous:
+        return set(current)
+    return {endpoint for endpoint, fp in current.items() if previous.get(endpoint) != fp}
+
+
+def outputs_to_rebuild(changed: Set[str]) -> Set[str]:
+    """Processed outputs that depend on at least one changed endpoint"""
+    return {output for output, inputs in OUTPUT_DEPENDENCIES.items() if changed.intersection(inputs)}
+
+
+class RosterDiff:
+    """
+    Player movement between two processed roster frames.
+
+    Attributes:
+        adds: Players newly rostered ({'player_name', 'team'})
+        drops: Players no longer rostered ({'player_name', 'team'})
+        trades: Players that changed teams ({'player_name', 'from_team', 'to_team'})
+    """
+    __slots__ = ("adds", "drops", "trades")
+
+    def __init__(self, adds: List[Dict[str, str]] = None, drops: List[Dict[str, str]] = None,
+                 trades: List[Dict[str, str]] = None):
+        self.adds = adds or []
+        self.drops = drops or []
+        self.trades = trades or []
+
+    @property
+    def affected_teams(self) -> Set[str]:
+        teams = {m['team'] for m in self.adds} | {m['team'] for m in self.drops}
+        for m in self.trades:
+            teams.add(m['from_team'])
+            teams.add(m['to_team'])
+        return teams
+
+    def is_empty(self) -> bool:
+        return not (self.adds or self.drops or self.trades)
+
+    def summary(self) -> str:
+        return f"{len(self.adds)} adds, {len(self.drops)} drops, {len(self.trades)} trades"
+
+
+def diff_rosters(old: Optional[pd.DataFrame], new: pd.DataFrame) -> RosterDiff:
+    """
+    Compare two process_rosters() frames by player.
+
+    Players are matched on player_name (process_rosters already dedupes on the
+    normalized name, so each name appears once per league).
+    """
+    if old is None or old.empty:
+        return RosterDiff(adds=new[['player_name', 'team']].to_dict('records') if not new.empty else [])
+
+    # Compare teams as plain strings; categorical teams from different snapshots
+    # have different category sets and cannot be compared directly
+    merged = pd.merge(
+        old[['player_name', 'team']].astype({'team': str}),
+        new[['player_name', 'team']].astype({'team': str}),
+        on='player_name',
+        how='outer',
+        suffixes=('_old', '_new'),
+        indicator=True
+    )
+
+    adds = merged[merged['_merge'] == 'right_only']
+    drops = merged[merged['_merge'] == 'left_only']
+    both = merged[merged['_merge'] == 'both']
+    moved = both[both['team_old'] != both['team_new']]
+
+    return RosterDiff(
+        adds=adds.rename(columns={'team_new': 'team'})[['player_name', 'team']].to_dict('records'),
+        drops=drops.rename(columns={'team_old': 'team'})[['player_name', 'team']].to_dict('records'),
+        trades=moved.rename(columns={'team_old': 'from_team', 'team_new': 'to_team'})[
+            ['player_name', 'from_team', 'to_team']].to_dict('records')
+    )
+
+
+def team_roster_fingerprints(roster_data: pd.DataFrame, team_col: str = 'team') -> Dict[str, int]:
+    """
+    Order-independent fingerprint of each team's roster.
+
+    Row hashes are summed per team, so the result does not depend on row order
+    and only changes for teams whose players (or their key fields) changed.
+    """
+    if roster_data.empty:
+        return {}
+    columns = [c for c in ROSTER_KEY_COLUMNS if c in roster_data.columns]
+    row_hashes = pd.util.hash_pandas_object(roster_data[columns].astype(str), index=False)
+    return row_hashes.groupby(roster_data[team_col].astype(str).values).sum().to_dict()
+
+
+def file_version(*paths: str) -> tuple:
+    """(mtime, size) of each file, usable as a TeamResultCache dependency_key"""
+    versions = []
+    for path in paths:
+        try:
+            stat = os.stat(path)
+            versions.append((path, stat.st_mtime_ns, stat.st_size))
+        except OSError:
+            versions.append((path, None, None))
+    return tuple(versions)
+
+
+def frame_version(frame: pd.DataFrame) -> str:
+    """Content hash of a DataFrame (values, index and column names), usable as a cache key"""
+    digest = hashlib.sha256(json.dumps([str(c) for c in frame.columns]).encode())
+    digest.update(pd.util.hash_pandas_object(frame.astype(str), index=True).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+class TeamResultCache:
+    """
+    Per-team memo of derived results keyed by the team's roster fingerprint.
+
+    ``get_many`` recomputes only teams whose roster changed since the cached
+    result was built; a change of ``dependency_key`` (e.g. the mtime of the
+    CSV a computation reads) drops every entry.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._entries: Dict[str, tuple] = {}
+        self._dependency_key: Hashable = None
+        self._lock = threading.Lock()
+
+    def get_many(self, roster_data: pd.DataFrame, compute: Callable[[str, pd.DataFrame], Any],
+                 dependency_key: Hashable = None, team_col: str = 'team') -> Dict[str, Any]:
+        """
+        Return {team: result} for every team in roster_data.
+
+        Args:
+            roster_data: League roster frame
+            compute: Called as compute(team, team_roster) for teams that need recomputing
+            dependency_key: Any non-roster input the results depend on
+            team_col: Team column in roster_data
+        """
+        def compute_stale(stale_rows: pd.DataFrame) -> Dict[str, Any]:
+            groups = stale_rows.groupby(stale_rows[team_col].astype(str), sort=False)
+            return {team: compute(team, team_roster) for team, team_roster in groups}
+
+        return self.get_many_batched(roster_data, compute_stale, dependency_key, team_col)
+
+    def get_many_batched(self, roster_data: pd.DataFrame, compute: Callable[[pd.DataFrame], Dict[str, Any]],
+                         dependency_key: Hashable = None, team_col: str = 'team') -> Dict[str, Any]:
+        """
+        Like get_many, but compute is called once with the rows of every stale
+        team and returns {team: result}, so vectorized computations can process
+        all changed teams in one pass.
+        """
+        fingerprints = team_roster_fingerprints(roster_data, team_col)
+
+        with self._lock:
+            if dependency_key != self._dependency_key:
+                self._entries.clear()
+                self._dependency_key = dependency_key
+            stale = [team for team, fp in fingerprints.items()
+                     if team not in self._entries or self._entries[team][0] != fp]
+
+        if stale:
+            computed = compute(roster_data[roster_data[team_col].astype(str).isin(stale)])
+            with self._lock:
+                for team, result in computed.items():
+                    if team in fingerprints:
+                        self._entries[team] = (fingerprints[team], result)
+
+        hits = len(fingerprints) - len(stale)
+        if hits:
+            metrics.CACHE_REQUESTS.inc(hits, cache=f"team.{self.name}", result="hit")
+        if stale:
+            metrics.CACHE_REQUESTS.inc(len(stale), cache=f"team.{self.name}", result="miss")
+
+        with self._lock:
+            return {team: self._entries[team][1] for team in fingerprints if team in self._entries}
+
+    def invalidate(self, teams: Iterable[str] = None):
+        """Drop cached results for the given teams (all teams if None)"""
+        with self._lock:
+            if teams is None:
+                self._entries.clear()
+            else:
+                for team in teams:
+                    self._entries.pop(team, None)
@@ -1,5 +1,11 @@
 import streamlit as st
 import pandas as pd
+import tracing
+import metrics
+import change_detection
+import prospect_scores
+from card_templates import CardTemplate, render_section
+from prospect_scores import PROSPECT_IMPORT_FILE
 import plotly.express as px
 import plotly.graph_objects as go
 from typing import Dict, List, Any, Optional, Union, Tuple
@@ -47,6 +53,12 @@ for year, data in PLAYOFF_HISTORY.items():
             print(f"  {place} Place: {teams}")
 print("===========================\n")
 
+# Per-team results reused across reruns until that team's roster changes
+PROSPECT_SCORE_CACHE = change_detection.TeamResultCache("prospect_scores")
+DDI_COMPONENT_CACHE = change_detection.TeamResultCache("ddi_components")
+
+HISTORY_FILES = [f"attached_assets/abl history - {year}.csv" for year in ["2021", "2022", "2023", "2024"]]
+
 def load_historical_data() -> Dict[str, pd.DataFrame]:
     """Load historical season data from CSV files"""
     history_data = {}
@@ -55,7 +67,7 @@ def load_historical_data() -> Dict[str, pd.DataFrame]:
     for year in ["2021", "2022", "2023", "2024"]:
         csv_path = f"attached_assets/abl history - {year}.csv"
         if os.path.exists(csv_path):
-            history_data[year] = pd.read_csv(csv_path)
+            history_data[year] = tracing.read_csv(csv_path)
 
     return history_data
 
@@ -68,7 +80,7 @@ def calculate_playoff_score(team_name: str) -> float:
     for year in ["2021", "2022", "2023", "2024"]:
         csv_path = f"attached_assets/abl history - {year}.csv"
         if os.path.exists(csv_path):
-            df = pd.read_csv(csv_path)
+            df = tracing.read_csv(csv_path)
             # Handle Athletics name variations
             team_search = [team_name]
             if team_name in ["Athletics", "Las Vegas Athletics", "Oakland Athletics"]:
@@ -240,81 +252,20 @@ def get_team_prospect_scores(roster_data: pd.DataFrame) -> pd.DataFrame:
     This includes all players, not just those with MINORS status.
     """
     try:
-        # Import the normalize_name function
-        from components.prospects import normalize_name
-
-        # Read prospect import data
-        prospect_import = pd.read_csv("attached_assets/ABL-Import.csv", na_values=['NA', ''], keep_default_na=True)
-
-        # Normalize names in prospect import
-        prospect_import['Name'] = prospect_import['Name'].fillna('').astype(str).apply(normalize_name)
-
-        # Create team-level results
-        team_prospect_scores = []
-
-        # Process each team
-        for team in roster_data['team'].unique():
-            # Filter data by team
-            team_roster = roster_data[roster_data['team'] == team].copy()
-            team_roster['clean_name'] = team_roster['player_name'].fillna('').astype(str).apply(normalize_name)
-
-            # IMPORTANT: Include ALL players, not just minors
-            # Merge with prospect data
-            team_prospects = pd.merge(
-                team_roster,
-                prospect_import[['Name', 'Score', 'Rank']], 
-                left_on='clean_name',
-                right_on='Name',
-                how='left'
-            )
-
-            # Only include players that actually matched with the prospect data (have a Score)
-            team_prospects = team_prospects[team_prospects['Score'].notna()]
-
-            # Calculate prospect stats
-            total_score = team_prospects['Score'].fillna(0).sum()
-            avg_score = team_prospects['Score'].fillna(0).mean() if len(team_prospects) > 0 else 0
-            count = len(team_prospects)
-
-            # Add to results
-            team_prospect_scores.append({
-                'team': team,
-                'total_score': total_score,
-                'avg_score': avg_score,
-                'prospect_count': count
-            })
-
-            # Debug for specific teams
-            if team in ["Baltimore Orioles", "Kansas City Royals", "Atlanta Braves"]:
-                print(f"Team '{team}' ALL prospects details:")
-                print(f"  Total players matched: {len(team_prospects)}")
-                print(f"  Players with scores: {team_prospects['Score'].notna().sum()}")
-                print(f"  Total score: {total_score:.2f}")
-                # Show the top 5 prospects for this team
-                if len(team_prospects) > 0:
-                    top_5 = team_prospects.sort_values('Score', ascending=False).head(5)
-                    print(f"  Top 5 prospects:")
-                    for _, row in top_5.iterrows():
-                        print(f"    {row['player_name']} - Score: {row['Score']:.2f}, Rank: {row['Rank'] if pd.notna(row['Rank']) else 'N/A'}")
-
-        # Convert to DataFrame
-        team_scores = pd.DataFrame(team_prospect_scores)
-
-        # Additional debug info - show the top teams
-        print("\nTeam prospect scores (top 5):")
-        for _, row in team_scores.sort_values('total_score', ascending=False).head(5).iterrows():
-            print(f"{row['team']}: {row['total_score']:.2f} (Count: {int(row['prospect_count'])})")
-
-        # Special debug for the teams mentioned
-        print("\nReference team scores:")
-        for team_name in ["Baltimore Orioles", "Kansas City Royals", "Atlanta Braves"]:
-            team_data = team_scores[team_scores['team'] == team_name]
-            if len(team_data) > 0:
-                print(f"  {team_name}: {team_data['total_score'].values[0]:.2f}")
-            else:
-                print(f"  {team_name}: not found in team_scores")
+        # Only teams whose roster changed since their score was cached are
+        # rescored, all of them in one join and groupby
+        def score_teams(stale_rows: pd.DataFrame) -> Dict[str, dict]:
+            scores = prospect_scores.team_prospect_scores(stale_rows)
+            return scores.set_index('team')[['total_score', 'avg_score', 'prospect_count']].to_dict('index')
+
+        scores_by_team = PROSPECT_SCORE_CACHE.get_many_batched(
+            roster_data, score_teams, dependency_key=change_detection.file_version(PROSPECT_IMPORT_FILE)
+        )
 
-        return team_scores
+        # Convert to DataFrame, keeping roster team order
+        teams = [team for team in roster_data['team'].astype(str).unique() if team in scores_by_team]
+        return pd.DataFrame([{'team': team, **scores_by_team[team]} for team in teams],
+                            columns=['team', 'total_score', 'avg_score', 'prospect_count'])
 
     except Exception as e:
         st.error(f"Error calculating team prospect scores: {str(e)}")
@@ -329,6 +280,7 @@ def get_team_prospect_scores(roster_data: pd.DataFrame) -> pd.DataFrame:
             'prospect_count': [0] * len(teams)
         })
 
+@metrics.RECOMPUTE_SECONDS.timed(kind="ddi")
 def calculate_ddi_scores(roster_data: pd.DataFrame, power_rankings: pd.DataFrame, history_data: Dict[str, pd.DataFrame]) -> pd.DataFrame:
     """Calculate the Dynasty Dominance Index for all teams"""
 
@@ -338,6 +290,14 @@ def calculate_ddi_scores(roster_data: pd.DataFrame, power_rankings: pd.DataFrame
     # Extract unique teams from roster data
     teams = roster_data['team'].unique()
 
+    # Historical and playoff components only change with the history files, so
+    # they are cached per team and recomputed only for teams whose roster changed
+    static_components = DDI_COMPONENT_CACHE.get_many(
+        roster_data,
+        lambda team, _: (calculate_historical_score(team, history_data), calculate_playoff_score(team)),
+        dependency_key=change_detection.file_version(*HISTORY_FILES)
+    )
+
     # Create a DataFrame to store DDI components and total scores
     ddi_data = []
 
@@ -383,11 +343,8 @@ def calculate_ddi_scores(roster_data: pd.DataFrame, power_rankings: pd.DataFrame
         else:
             prospect_score = 0
 
-        # Get historical performance score
-        history_score = calculate_historical_score(team, history_data)
-
-        # Get playoff performance score
-        playoff_score = calculate_playoff_score(team)
+        # Get historical and playoff performance scores
+        history_score, playoff_score = static_components[team]
 
         # Calculate overall DDI score with component weighting
         ddi_score = (
@@ -809,7 +766,7 @@ def get_team_achievements(team_name: str) -> list:
     achievements = []
 
     # Load division data
-    divisions_df = pd.read_csv("attached_assets/divisions.csv", names=['division', 'team'])
+    divisions_df = tracing.read_csv("attached_assets/divisions.csv", names=['division', 'team'])
     team_division = divisions_df[divisions_df['team'] == team_name]['division'].iloc[0] if len(divisions_df[divisions_df['team'] == team_name]) > 0 else None
 
     # Handle Athletics name variations
@@ -874,238 +831,130 @@ def get_team_achievements(team_name: str) -> list:
     # Sort achievements by year (newest first)
     return sorted(achievements, key=lambda x: x['year'], reverse=True)
 
-def render_team_card_native(team_row):
-    """Render a stylish modern card for a team with its DDI information using native Streamlit components - optimized for mobile"""
-    team_name = team_row['Team']
-    team_colors = get_team_colors(team_name)
-    logo_initials = get_team_logo_url(team_name)
-
-    # Get team achievements for trophy case
-    achievements = get_team_achievements(team_name)
-
-    # Calculate normalized scores for progress bars (ensure they're between 0-100)
-    power_norm = min(100, max(0, team_row['Power Score'])) / 100
-    prospect_norm = min(100, max(0, team_row['Prospect Score'])) / 100
-    history_norm = min(100, max(0, team_row['Historical Score'])) / 100
-    playoff_norm = min(100, max(0, team_row['Playoff Score'])) / 100
-
-    # Create card container with custom styling and mobile-friendly design
-    with st.container():
-        # Add a colored top border to the card container
-        st.markdown(f"""
-        <div style="
-            border: 1px solid rgba(230, 230, 230, 0.2);
-            border-radius: 8px;
-            padding: 8px 10px;
-            margin: 8px 0;
-            background-color: rgba(49, 51, 63, 0.7);
-            border-top: 4px solid {team_colors['primary']};
-        ">
+# DDI components shown on team cards: (column, label, bar color, weight)
+CARD_COMPONENTS = [
+    ('Power Score', 'Power', '#4CAF50', POWER_RANK_WEIGHT),
+    ('Prospect Score', 'Prospect', '#2196F3', PROSPECT_WEIGHT),
+    ('Historical Score', 'History', '#FFC107', HISTORY_WEIGHT),
+    ('Playoff Score', 'Playoff', '#E91E63', PLAYOFF_WEIGHT),
+]
+
+# Achievement badges shown per card before collapsing into "+X more"
+MAX_ACHIEVEMENT_BADGES = 4
+
+NL_TEAMS = ["Braves", "Phillies", "Mets", "Nationals", "Marlins", "Cardinals", "Cubs",
+            "Brewers", "Reds", "Pirates", "Dodgers", "Giants", "Padres", "Diamondbacks", "Rockies"]
+
+ACHIEVEMENT_BADGE = CardTemplate("ddi_achievement_badge", """
+    <div style="flex: 1; background-color: rgba(255,255,255,0.05); border-radius: 6px; padding: 5px 3px;
+        margin: 0; font-size: 11px; text-align: center;">
+        <div style="display: flex; align-items: center; justify-content: center;">
+            {emoji}<span style="font-weight: bold; margin-left: 2px;">{year}</span>
         </div>
-        """, unsafe_allow_html=True)
-
-        # First row: Rank + Logo + Team Name
-        row1_cols = st.columns([1, 1, 8])
-        
-        # Rank badge (smaller and more compact)
-        with row1_cols[0]:
-            st.markdown(f"""
-            <div style="
-                width: 28px;
-                height: 28px;
-                background: linear-gradient(135deg, {team_colors['primary']} 0%, {team_colors['secondary']} 100%);
-                border-radius: 6px;
-                display: flex;
-                justify-content: center;
-                align-items: center;
-                color: white;
-                font-weight: bold;
-                font-size: 13px;
-                text-align: center;
-                margin-top: 2px;
-            ">
-                #{int(team_row['Rank'])}
-            </div>
-            """, unsafe_allow_html=True)
-
-        # Team logo image (smaller)
-        with row1_cols[1]:
-            st.markdown(f"""
-            <div style="
-                width: 28px;
-                height: 28px;
-                display: flex;
-                justify-content: center;
-                align-items: center;
-                text-align: center;
-                margin-top: 2px;
-            ">
-                {logo_initials}
-            </div>
-            """, unsafe_allow_html=True)
-
-        # Team name and DDI score in same row
-        with row1_cols[2]:
-            st.markdown(f"""
-            <div style="display: flex; justify-content: space-between; align-items: center;">
-                <span style="font-size: 16px; font-weight: bold;">{team_name}</span>
-                <div style="
-                    background: linear-gradient(135deg, {team_colors['primary']} 0%, {team_colors['secondary']} 100%);
-                    border-radius: 6px;
-                    padding: 3px 6px;
-                    text-align: center;
-                    color: white;
-                    display: inline-block;
-                ">
-                    <div style="font-size: 8px; text-transform: uppercase; letter-spacing: 0.5px;">
-                        DDI
-                    </div>
-                    <div style="font-size: 14px; font-weight: bold; line-height: 1;">
-                        {team_row['DDI Score']:.1f}
-                    </div>
+        <div style="font-size: 9px; opacity: 0.8; margin-top: 2px;">{label}</div>
+    </div>
+""")
+
+SCORE_BAR = CardTemplate("ddi_score_bar", """
+    <div style="flex: 1; background-color: #2A2A35; border-radius: 6px; padding: 5px; margin: 3px 1px;">
+        <div style="display: flex; justify-content: space-between; margin-bottom: 2px;">
+            <span style="font-size: 10px; color: {color}; font-weight: bold;">{label}</span>
+            <span style="font-size: 12px; font-weight: bold;">{score:.1f}</span>
+        </div>
+        <div style="width: 100%; height: 4px; background-color: #444450; border-radius: 2px;">
+            <div style="width: {width}%; height: 100%; background: {color}; border-radius: 2px;"></div>
+        </div>
+        <div style="text-align: center; font-size: 8px; color: #AAAAAA; margin-top: 2px;">{weight:.0%}</div>
+    </div>
+""")
+
+DDI_TEAM_CARD = CardTemplate("ddi_team_card", """
+    <div style="border: 1px solid rgba(230, 230, 230, 0.2); border-radius: 8px; padding: 8px 10px; margin: 8px 0 18px 0;
+        background-color: rgba(49, 51, 63, 0.7); border-top: 4px solid {primary};">
+        <div style="display: flex; align-items: center; gap: 8px;">
+            <div style="width: 28px; height: 28px; background: linear-gradient(135deg, {primary} 0%, {secondary} 100%);
+                border-radius: 6px; display: flex; justify-content: center; align-items: center; color: white;
+                font-weight: bold; font-size: 13px; text-align: center; flex-shrink: 0;">#{rank}</div>
+            <div style="width: 28px; height: 28px; display: flex; justify-content: center; align-items: center;
+                text-align: center; flex-shrink: 0;">{logo_html}</div>
+            <div style="flex-grow: 1; display: flex; justify-content: space-between; align-items: center;">
+                <span style="font-size: 16px; font-weight: bold;">{Team}</span>
+                <div style="background: linear-gradient(135deg, {primary} 0%, {secondary} 100%); border-radius: 6px;
+                    padding: 3px 6px; text-align: center; color: white; display: inline-block;">
+                    <div style="font-size: 8px; text-transform: uppercase; letter-spacing: 0.5px;">DDI</div>
+                    <div style="font-size: 14px; font-weight: bold; line-height: 1;">{ddi_score:.1f}</div>
                 </div>
             </div>
-            """, unsafe_allow_html=True)
+        </div>
+        <div style="display: flex; gap: 4px; margin-top: 6px;">{score_bars_html}</div>
+        <div style="display: flex; gap: 4px; margin-top: 5px;">{achievements_html}</div>
+    </div>
+""")
+
+
+def achievement_badges_html(team_name: str, achievements: list) -> str:
+    """Trophy case row of a team card"""
+    if not achievements:
+        return ""
+    badges = []
+    for achievement in achievements[:MAX_ACHIEVEMENT_BADGES]:
+        # Set emoji and baseball-specific terminology based on achievement
+        result = achievement['result']
+        emoji = "🏆" if result == "1st" else "🥈" if result == "2nd" else "🏅"
+        if result == "1st":
+            label = "WS CHAMP"  # Shortened for mobile
+        elif result == "2nd":
+            label = "WS RUNNER-UP"
+        elif result == "semifinalist":
+            # Simplified league championship series detection
+            label = "NLCS" if any(nl_team in team_name for nl_team in NL_TEAMS) else "ALCS"
+        else:
+            label = str(result).upper()
+        badges.append({'emoji': emoji, 'year': achievement['year'], 'label': label})
+    html = ''.join(ACHIEVEMENT_BADGE.render_rows(pd.DataFrame(badges)))
+
+    # If there are more achievements than fit in one row, add a "+X more" badge
+    if len(achievements) > MAX_ACHIEVEMENT_BADGES:
+        additional = len(achievements) - (MAX_ACHIEVEMENT_BADGES - 1)
+        html += ('<div style="flex: 1; background-color: rgba(255,255,255,0.05); border-radius: 6px; padding: 5px 3px; '
+                 'font-size: 11px; text-align: center; display: flex; flex-direction: column; justify-content: center;">'
+                 f'<div style="opacity: 0.8;">+{additional} more</div></div>')
+    return html
+
+
+def team_card_frame(ddi_df: pd.DataFrame) -> pd.DataFrame:
+    """DDI rows plus the per-team values the card template needs"""
+    teams = ddi_df['Team'].astype(str)
+    colors = teams.map(get_team_colors)
+    bars = []
+    for column, label, color, weight in CARD_COMPONENTS:
+        scores = ddi_df[column].astype(float)
+        bars.append(SCORE_BAR.render_rows(pd.DataFrame({
+            'color': color, 'label': label, 'score': scores,
+            # Normalized scores for progress bars (between 0-100)
+            'width': scores.clip(0, 100), 'weight': weight,
+        })))
+    return pd.DataFrame({
+        'Team': teams,
+        'rank': ddi_df['Rank'].astype(int),
+        'primary': colors.str['primary'],
+        'secondary': colors.str['secondary'],
+        'logo_html': teams.map(get_team_logo_url),
+        'ddi_score': ddi_df['DDI Score'].astype(float),
+        'score_bars_html': [''.join(parts) for parts in zip(*bars)],
+        'achievements_html': [achievement_badges_html(team, get_team_achievements(team)) for team in teams],
+    }, index=ddi_df.index)
+
+
+def render_team_cards(ddi_df: pd.DataFrame):
+    """All team cards as a single element, reused until the DDI table changes"""
+    render_section(DDI_TEAM_CARD, ddi_df, prepare=team_card_frame)
 
-        # Metric scores - All 4 in a single row with more compact display
-        # Each column has two mini-rows: label+value and progress bar
-        score_cols = st.columns(4)
-        
-        # Power score
-        with score_cols[0]:
-            st.markdown(f"""
-            <div style="background-color: #2A2A35; border-radius: 6px; padding: 5px; margin: 3px 1px;">
-                <div style="display: flex; justify-content: space-between; margin-bottom: 2px;">
-                    <span style="font-size: 10px; color: #4CAF50; font-weight: bold;">Power</span>
-                    <span style="font-size: 12px; font-weight: bold;">{team_row['Power Score']:.1f}</span>
-                </div>
-                <div style="width: 100%; height: 4px; background-color: #444450; border-radius: 2px;">
-                    <div style="width: {power_norm*100}%; height: 100%; background: #4CAF50; border-radius: 2px;"></div>
-                </div>
-                <div style="text-align: center; font-size: 8px; color: #AAAAAA; margin-top: 2px;">30%</div>
-            </div>
-            """, unsafe_allow_html=True)
-
-        # Prospects score
-        with score_cols[1]:
-            st.markdown(f"""
-            <div style="background-color: #2A2A35; border-radius: 6px; padding: 5px; margin: 3px 1px;">
-                <div style="display: flex; justify-content: space-between; margin-bottom: 2px;">
-                    <span style="font-size: 10px; color: #2196F3; font-weight: bold;">Prospect</span>
-                    <span style="font-size: 12px; font-weight: bold;">{team_row['Prospect Score']:.1f}</span>
-                </div>
-                <div style="width: 100%; height: 4px; background-color: #444450; border-radius: 2px;">
-                    <div style="width: {prospect_norm*100}%; height: 100%; background: #2196F3; border-radius: 2px;"></div>
-                </div>
-                <div style="text-align: center; font-size: 8px; color: #AAAAAA; margin-top: 2px;">20%</div>
-            </div>
-            """, unsafe_allow_html=True)
-
-        # History score
-        with score_cols[2]:
-            st.markdown(f"""
-            <div style="background-color: #2A2A35; border-radius: 6px; padding: 5px; margin: 3px 1px;">
-                <div style="display: flex; justify-content: space-between; margin-bottom: 2px;">
-                    <span style="font-size: 10px; color: #FFC107; font-weight: bold;">History</span>
-                    <span style="font-size: 12px; font-weight: bold;">{team_row['Historical Score']:.1f}</span>
-                </div>
-                <div style="width: 100%; height: 4px; background-color: #444450; border-radius: 2px;">
-                    <div style="width: {history_norm*100}%; height: 100%; background: #FFC107; border-radius: 2px;"></div>
-                </div>
-                <div style="text-align: center; font-size: 8px; color: #AAAAAA; margin-top: 2px;">25%</div>
-            </div>
-            """, unsafe_allow_html=True)
-
-        # Playoff score
-        with score_cols[3]:
-            st.markdown(f"""
-            <div style="background-color: #2A2A35; border-radius: 6px; padding: 5px; margin: 3px 1px;">
-                <div style="display: flex; justify-content: space-between; margin-bottom: 2px;">
-                    <span style="font-size: 10px; color: #E91E63; font-weight: bold;">Playoff</span>
-                    <span style="font-size: 12px; font-weight: bold;">{team_row['Playoff Score']:.1f}</span>
-                </div>
-                <div style="width: 100%; height: 4px; background-color: #444450; border-radius: 2px;">
-                    <div style="width: {playoff_norm*100}%; height: 100%; background: #E91E63; border-radius: 2px;"></div>
-                </div>
-                <div style="text-align: center; font-size: 8px; color: #AAAAAA; margin-top: 2px;">25%</div>
-            </div>
-            """, unsafe_allow_html=True)
 
-        # Achievements section integrated directly into card
-        if achievements:
-            # Add small margin
-            st.markdown("<div style='height: 5px;'></div>", unsafe_allow_html=True)
-            
-            # Display achievements in a horizontal row
-            achievement_cols = st.columns(min(4, len(achievements)))
-            
-            for i, col in enumerate(achievement_cols):
-                if i < len(achievements):
-                    achievement = achievements[i]
-                    # Set emoji based on achievement type
-                    result_emoji = "🏆" if achievement['result'] == "1st" else "🥈" if achievement['result'] == "2nd" else "🏅"
-                    
-                    # Set baseball-specific terminology based on achievement
-                    if achievement['result'] == "1st":
-                        result_label = "WS CHAMP"  # Shortened for mobile
-                    elif achievement['result'] == "2nd":
-                        result_label = "WS RUNNER-UP"
-                    elif achievement['result'] == "semifinalist":
-                        # Simplified league championship series detection
-                        nl_teams = ["Braves", "Phillies", "Mets", "Nationals", "Marlins", "Cardinals", "Cubs", 
-                                  "Brewers", "Reds", "Pirates", "Dodgers", "Giants", "Padres", "Diamondbacks", "Rockies"]
-                        
-                        if any(nl_team in team_name for nl_team in nl_teams):
-                            result_label = "NLCS"
-                        else:
-                            result_label = "ALCS"  # Default to ALCS if not NL
-                    else:
-                        result_label = achievement['result'].upper()
-                    
-                    # Render achievement badge directly in the card
-                    with col:
-                        st.markdown(f"""
-                        <div style="
-                            background-color: rgba(255,255,255,0.05); 
-                            border-radius: 6px;
-                            padding: 5px 3px;
-                            margin: 0;
-                            font-size: 11px;
-                            text-align: center;
-                        ">
-                            <div style="display: flex; align-items: center; justify-content: center;">
-                                {result_emoji}<span style="font-weight: bold; margin-left: 2px;">{achievement['year']}</span>
-                            </div>
-                            <div style="font-size: 9px; opacity: 0.8; margin-top: 2px;">
-                                {result_label}
-                            </div>
-                        </div>
-                        """, unsafe_allow_html=True)
-        
-            # If there are more achievements than will fit in one row, add a "+X more" badge in the last slot
-            if len(achievements) > 4:
-                additional = len(achievements) - 3
-                st.markdown(f"""
-                <div style="
-                    background-color: rgba(255,255,255,0.05);
-                    border-radius: 6px;
-                    padding: 5px 3px;
-                    margin: 0;
-                    font-size: 11px;
-                    text-align: center;
-                    height: 100%;
-                    display: flex;
-                    flex-direction: column;
-                    justify-content: center;
-                ">
-                    <div style="opacity: 0.8;">
-                        +{additional} more
-                    </div>
-                </div>
-                """, unsafe_allow_html=True)
-                
-        # End of card container - more subtle divider
-        st.markdown("<div style='height: 10px;'></div>", unsafe_allow_html=True)
+def render_team_card_native(team_row):
+    """Render a stylish modern card for a team with its DDI information - optimized for mobile"""
+    card = DDI_TEAM_CARD.render_rows(team_card_frame(pd.DataFrame([team_row])))[0]
+    st.markdown(card, unsafe_allow_html=True)
 
 def render(roster_data: pd.DataFrame, power_rankings_df: pd.DataFrame = None):
     """
@@ -1210,9 +1059,8 @@ def render(roster_data: pd.DataFrame, power_rankings_df: pd.DataFrame = None):
             This metric measures long-term dynasty strength across multiple seasons.
             """)
 
-            # Show team cards using native Streamlit components
-            for _, team_row in display_df.iterrows():
-                render_team_card_native(team_row)
+            # Show all team cards as one section
+            render_team_cards(display_df)
 
             # Also show the traditional table below
             with st.expander("View as Table"):
@@ -1,9 +1,31 @@
 import streamlit as st
 import pandas as pd
+import tracing
+from season_calendar import get_league_calendars
 import plotly.express as px
 import plotly.graph_objects as go
 from datetime import datetime
-import re
+import metrics
+import schemas
+from change_detection import file_version
+from trade_valuation import (DEFAULT_VALUE_CURVE, MVP_PLAYERS_FILE, PROSPECTS_FILE, TRADES_FILE, analyze_trades,
+                             compare_curves, player_value_table, traded_player_names, value_breakdown)
+
+
+@st.cache_data(max_entries=4, show_spinner=False)
+def _cached_trade_analysis(version: tuple, _trades: pd.DataFrame, _mvp_data: pd.DataFrame, _prospect_data: pd.DataFrame):
+    """Player value table and trade analysis, keyed by the versions of the three input files"""
+    metrics.mark_cache_miss("trade_valuation")
+    player_table = player_value_table(_mvp_data, _prospect_data, traded_player_names(_trades))
+    return player_table, analyze_trades(_trades, player_table)
+
+
+@st.cache_data(max_entries=4, show_spinner=False)
+def _cached_curve_report(version: tuple, _trades: pd.DataFrame, _player_table: pd.DataFrame) -> pd.DataFrame:
+    """Trade outcomes under every value curve, keyed like the trade analysis"""
+    metrics.mark_cache_miss("trade_curves")
+    return compare_curves(_trades, _player_table)
+
 
 def render():
     """Render the Dump Deadline trade analysis page"""
@@ -19,188 +41,32 @@ def render():
     
     try:
         # Load trade data
-        trades_df = pd.read_csv("attached_assets/Fantrax-Transaction-History-Trades-ABL Season 5.csv")
+        trades_df = tracing.read_csv(TRADES_FILE)
         st.write(f"DEBUG: Loaded {len(trades_df)} trade records from Fantrax transaction list")
         
         # Load MVP data for comprehensive player values
-        mvp_data = pd.read_csv("attached_assets/MVP-Player-List.csv")
-        
-        def calculate_comprehensive_player_value(player_data):
-            """Calculate comprehensive player value using all MVP metrics"""
-            # Clean and prepare data
-            age = pd.to_numeric(player_data.get('Age', 25), errors='coerce')
-            salary = pd.to_numeric(player_data.get('Salary', 1), errors='coerce')
-            fpts = pd.to_numeric(player_data.get('FPts', 0), errors='coerce')
-            fpg = pd.to_numeric(player_data.get('FP/G', 0), errors='coerce')
-            contract = str(player_data.get('Contract', '2025'))
-            position = str(player_data.get('Position', 'UT'))
-            
-            # Normalize values to 0-1 scale based on dataset ranges
-            max_fpts = mvp_data['FPts'].max() if 'FPts' in mvp_data.columns else 400
-            max_fpg = mvp_data['FP/G'].max() if 'FP/G' in mvp_data.columns else 25
-            max_salary = mvp_data['Salary'].max() if 'Salary' in mvp_data.columns else 70
-            
-            # Fantasy Points component (60% weight) - primary performance metric
-            fpts_score = min(1.0, fpts / max_fpts) if max_fpts > 0 else 0
-            
-            # Fantasy Points per Game component (10% weight) - health/consistency factor
-            fpg_score = min(1.0, fpg / max_fpg) if max_fpg > 0 else 0
-            
-            # Position value component (5% weight) - scarcity-based (reduced from 10%)
-            position_values = {
-                'C': 1.0,      # Catcher - most scarce
-                'SS': 0.9,     # Shortstop
-                '2B': 0.85,    # Second base
-                '3B': 0.8,     # Third base
-                'CF': 0.75,    # Center field
-                'SP': 0.7,     # Starting pitcher
-                '1B': 0.65,    # First base
-                'LF': 0.6, 'RF': 0.6,  # Corner outfield
-                'RP': 0.5,     # Relief pitcher
-                'UT': 0.55,    # Utility
-                'DH': 0.4      # Designated hitter
-            }
-            # Get highest position value for multi-position players
-            pos_score = 0
-            for pos in position.split(','):
-                pos_clean = pos.strip()
-                if pos_clean in position_values:
-                    pos_score = max(pos_score, position_values[pos_clean])
-            
-            # Contract value component (10% weight) - longer contracts more valuable for young players
-            contract_values = {
-                '2050': 1.0, '2045': 0.95, '2040': 0.9, '2035': 0.85, 
-                '2029': 0.8, '2028': 0.7, '2027': 0.6, '2026': 0.5, 
-                '2025': 0.3, '1st': 0.2
-            }
-            contract_score = contract_values.get(contract, 0.1)
-            
-            # Age factor (10% weight) - younger players more valuable (increased from 5%)
-            age_score = max(0, (35 - age) / 15) if age <= 35 else 0
-            
-            # Salary efficiency (10% weight) - lower salary relative to performance is better
-            salary_efficiency = 1.0 - (salary / max_salary) if max_salary > 0 else 0.5
-            
-            # Combine all components
-            total_score = (
-                fpts_score * 0.60 +      # Fantasy points (increased to 60%)
-                fpg_score * 0.10 +       # Points per game (reduced to 10%)
-                pos_score * 0.05 +       # Position value
-                contract_score * 0.10 +  # Contract value
-                age_score * 0.10 +       # Age factor
-                salary_efficiency * 0.05 # Salary efficiency
-            )
-            
-            # Scale to 0-100 range
-            return total_score * 100
-        
-        # Calculate comprehensive values for all MVP players with exponential scaling
-        mvp_raw_values = {}
-        for _, row in mvp_data.iterrows():
-            player_name = row.get('Player', '')
-            if player_name:
-                mvp_raw_values[player_name] = calculate_comprehensive_player_value(row)
-        
-        # Get list of players who appear in trade transactions
-        try:
-            trade_data = pd.read_csv("attached_assets/Fantrax-Transaction-History-Trades-ABL Season 5.csv")
-            traded_players = set()
-            for _, row in trade_data.iterrows():
-                player_name = row.get('Player', '')
-                if player_name and not player_name.startswith('2026 Draft Pick') and not player_name.startswith('2027 Draft Pick') and not player_name.startswith('2028 Draft Pick') and not player_name.startswith('2029 Draft Pick') and not player_name.startswith('Budget Amount'):
-                    traded_players.add(player_name)
-        except:
-            traded_players = set()  # If trade data not available, use all players
-        
-        # Filter MVP players to only those who appear in trades
-        if traded_players:
-            filtered_mvp_raw_values = {k: v for k, v in mvp_raw_values.items() if k in traded_players}
-        else:
-            filtered_mvp_raw_values = mvp_raw_values
-        
-        # Apply scaling to MVP values to emphasize elite players (filtered to traded players only)
-        # Available distribution types:
-        # 1. Linear (no scaling): y = x
-        # 2. Exponential: y = x^n (current: 1.6)
-        # 3. Logarithmic: y = log(1 + x * (e-1))
-        # 4. Square root: y = sqrt(x)
-        # 5. Sigmoid: y = 1 / (1 + e^(-k*(x-0.5)))
-        # 6. Quadratic: y = x^2
-        # 7. Cubic: y = x^3
-        
-        distribution_type = "quadratic"  # Change this to test different distributions
-        
-        mvp_values = {}
-        if filtered_mvp_raw_values:
-            max_value = max(filtered_mvp_raw_values.values())
-            import math
-            
-            for player_name, raw_value in filtered_mvp_raw_values.items():
-                normalized = raw_value / max_value if max_value > 0 else 0
-                
-                if distribution_type == "linear":
-                    scaled = normalized
-                elif distribution_type == "exponential":
-                    scaled = normalized ** 1.6
-                elif distribution_type == "logarithmic":
-                    scaled = math.log(1 + normalized * (math.e - 1)) / math.log(math.e)
-                elif distribution_type == "square_root":
-                    scaled = math.sqrt(normalized)
-                elif distribution_type == "sigmoid":
-                    k = 5  # Steepness parameter
-                    scaled = 1 / (1 + math.exp(-k * (normalized - 0.5)))
-                elif distribution_type == "quadratic":
-                    scaled = normalized ** 2
-                elif distribution_type == "cubic":
-                    scaled = normalized ** 3
-                else:
-                    scaled = normalized  # Default to linear
-                
-                mvp_values[player_name] = scaled * max_value
+        mvp_data = schemas.load_csv(MVP_PLAYERS_FILE)
         
         # Load prospect data for additional player values
         try:
-            prospect_data = pd.read_csv("attached_assets/ABL-Import.csv")
-            prospect_values = {}
-            for _, row in prospect_data.iterrows():
-                if pd.notna(row.get('Name')):
-                    player_name = row['Name']
-                    prospect_score = pd.to_numeric(row.get('Score', 0), errors='coerce')
-                    if pd.notna(prospect_score):
-                        # Check if player also appears in MVP data with actual fantasy points
-                        base_multiplier = 3.5  # Default 0-35 range (reduced from 0-40)
-                        
-                        if player_name in mvp_values:
-                            # Player is in both lists - check if they have MLB production
-                            player_mvp_row = mvp_data[mvp_data['Player'] == player_name]
-                            if not player_mvp_row.empty:
-                                fpts = pd.to_numeric(player_mvp_row.iloc[0].get('FPts', 0), errors='coerce')
-                                if fpts > 0:
-                                    # Player has MLB production - significantly reduce prospect score
-                                    # Focus more on MLB performance than prospect grade
-                                    base_multiplier = 1.5  # Reduce to 0-15 range for players with MLB performance
-                        
-                        prospect_values[player_name] = prospect_score * base_multiplier
-        except:
-            prospect_values = {}
+            prospect_data = tracing.read_csv(PROSPECTS_FILE)
+        except Exception:
+            prospect_data = None
             st.warning("Could not load prospect data for enhanced valuations")
         
         # Process trades data
         trades_df['Date'] = pd.to_datetime(trades_df['Date (EDT)'])
         trades_df = trades_df.sort_values('Date')
-        
-        # Group trades by unique identifier to identify complete transactions
-        trade_groups = {}
-        for _, row in trades_df.iterrows():
-            # Use the 'Unique' column if available, otherwise fall back to date/period
-            if 'Unique' in row and pd.notna(row['Unique']):
-                key = str(row['Unique'])
-            else:
-                key = f"{row['Date']}_{row['Period']}"
-            
-            if key not in trade_groups:
-                trade_groups[key] = []
-            trade_groups[key].append(row)
+
+        # 'Period' is Fantrax's daily roster period (e.g. 72 = Jun 5); place each
+        # trade in its weekly scoring period via the shared season calendar
+        season = int(trades_df['Date'].dt.year.mode().iloc[0]) if trades_df['Date'].notna().any() else None
+        calendars = get_league_calendars(season=season)
+        period_date = calendars.daily.starts_for(trades_df['Period'])
+        # A few rows carry a bogus period (e.g. 1 in June); trust the timestamp for those
+        plausible = (period_date - trades_df['Date'].dt.normalize()).abs() <= pd.Timedelta(days=7)
+        trades_df['Period Date'] = period_date.where(plausible, trades_df['Date'].dt.normalize())
+        trades_df['Scoring Period'] = calendars.weekly.numbers_for(trades_df['Period Date'])
         
         # Team colors and logos mapping
         def get_team_colors(team_name):
@@ -240,236 +106,15 @@ def render():
             }
             return team_colors.get(team_name, {'primary': '#333333', 'secondary': '#666666'})
 
-        # Calculate values for each trade
-        def get_player_value(player_name):
-            """Get combined value of a player from MVP and prospect rankings"""
-            mvp_val = mvp_values.get(player_name, 0)
-            prospect_val = prospect_values.get(player_name, 0)
-            
-            # Rule: If player has both MVP and prospect scores, but zero FPts, ignore MVP score
-            if mvp_val > 0 and prospect_val > 0:
-                # Check if player has zero fantasy points in MVP data
-                player_row = mvp_data[mvp_data['Player'] == player_name]
-                if not player_row.empty:
-                    fpts = pd.to_numeric(player_row.iloc[0].get('FPts', 0), errors='coerce')
-                    if fpts == 0:
-                        # Player has no MLB production, use only prospect value
-                        return prospect_val
-            
-            return mvp_val + prospect_val
-        
-        def get_player_value_breakdown(player_name):
-            """Get detailed breakdown of player value"""
-            mvp_val = mvp_values.get(player_name, 0)
-            prospect_val = prospect_values.get(player_name, 0)
-            
-            # Apply the same logic as get_player_value
-            effective_mvp_val = mvp_val
-            mvp_details = ""
-            zero_fpts_override = False
-            reduced_prospect_override = False
-            
-            if mvp_val > 0 and prospect_val > 0:
-                # Check if player has fantasy points in MVP data
-                player_row = mvp_data[mvp_data['Player'] == player_name]
-                if not player_row.empty:
-                    row = player_row.iloc[0]
-                    fpts = pd.to_numeric(row.get('FPts', 0), errors='coerce')
-                    fpg = pd.to_numeric(row.get('FP/G', 0), errors='coerce')
-                    
-                    if fpts == 0:
-                        # Player has no MLB production, ignore MVP value
-                        effective_mvp_val = 0
-                        zero_fpts_override = True
-                        mvp_details = "No MLB FPts - using prospect value only"
-                    else:
-                        # Player has MLB production - prospect score was reduced
-                        reduced_prospect_override = True
-                        mvp_details = f"FPts: {fpts:.1f}, FP/G: {fpg:.1f} (prospect score reduced)"
-            elif player_name in mvp_values and mvp_val > 0:
-                # Get details for MVP-only players
-                player_row = mvp_data[mvp_data['Player'] == player_name]
-                if not player_row.empty:
-                    row = player_row.iloc[0]
-                    fpts = pd.to_numeric(row.get('FPts', 0), errors='coerce')
-                    fpg = pd.to_numeric(row.get('FP/G', 0), errors='coerce')
-                    mvp_details = f"FPts: {fpts:.1f}, FP/G: {fpg:.1f}"
-            
-            total_val = effective_mvp_val + prospect_val
-            
-            # Determine primary source
-            if zero_fpts_override:
-                source = 'Prospect (MLB inactive)'
-            elif effective_mvp_val > prospect_val:
-                source = 'MLB'
-            elif prospect_val > 0:
-                source = 'Prospect'
-            else:
-                source = 'Unknown'
-            
-            return {
-                'mvp_value': effective_mvp_val,
-                'prospect_value': prospect_val,
-                'total_value': total_val,
-                'source': source,
-                'details': mvp_details
-            }
-        
-        def get_draft_pick_value(pick_text):
-            """Calculate value of draft picks based on year and round with quadratic scaling"""
-            if not isinstance(pick_text, str) or "Draft Pick" not in pick_text:
-                return 0
-            
-            # Extract year and round
-            year_match = re.search(r'(\d{4})', pick_text)
-            round_match = re.search(r'Round (\d+)', pick_text)
-            
-            if not year_match or not round_match:
-                return 0
-            
-            year = int(year_match.group(1))
-            round_num = int(round_match.group(1))
-            
-            # Enhanced draft pick valuation with quadratic scaling
-            current_year = 2025
-            
-            # Base values by round (higher for earlier rounds)
-            round_base_values = {
-                1: 50,  # 1st round picks
-                2: 35,  # 2nd round picks  
-                3: 25,  # 3rd round picks
-                4: 18,  # 4th round picks
-                5: 12   # 5th+ round picks
-            }
-            
-            base_value = round_base_values.get(round_num, 8)  # Default for rounds 6+
-            
-            # Year proximity factor (closer years more valuable)
-            years_out = year - current_year
-            if years_out <= 0:
-                year_multiplier = 1.0  # Current year picks
-            elif years_out == 1:
-                year_multiplier = 0.85  # Next year
-            elif years_out == 2:
-                year_multiplier = 0.7   # 2 years out
-            elif years_out == 3:
-                year_multiplier = 0.55  # 3 years out
-            else:
-                year_multiplier = 0.4   # 4+ years out
-            
-            # Apply quadratic scaling to emphasize elite picks (1st and 2nd round)
-            raw_value = base_value * year_multiplier
-            
-            # Normalize for quadratic scaling (0-1 range)
-            max_possible = 50  # 1st round current year
-            normalized = min(1.0, raw_value / max_possible)
-            
-            # Apply quadratic distribution (x²) to emphasize early picks
-            quadratic_scaled = normalized ** 2
-            
-            # Scale back to meaningful range
-            final_value = quadratic_scaled * max_possible
-            
-            return max(1, final_value)
-        
-        def get_budget_value(budget_text):
-            """Extract budget amount and convert to value based on actual scarcity"""
-            if not isinstance(budget_text, str) or "Budget Amount" not in budget_text:
-                return 0
-            
-            amount_match = re.search(r'\$(\d+(?:\.\d+)?)', budget_text)
-            if amount_match:
-                amount = float(amount_match.group(1))
-                # Scarcity-based valuation: $499 total remaining across all 30 teams
-                # Average remaining per team: $499/30 = $16.63
-                # Each dollar represents 1/$499 = 0.2% of total pool
-                # Value scaled to reflect actual scarcity: 1.2 points per dollar
-                return amount * 1.2
-            return 0
+        # Player values are one table lookup; every trade is valued in one pass
+        version = file_version(TRADES_FILE, MVP_PLAYERS_FILE, PROSPECTS_FILE)
+        with metrics.cache_lookup("trade_valuation"):
+            player_table, trade_analysis = _cached_trade_analysis(version, trades_df, mvp_data, prospect_data)
         
         # Debug: Show all unique players in transaction data
         all_players = trades_df['Player'].dropna().unique()
         st.write(f"DEBUG: Found {len(all_players)} unique players/items in Fantrax transaction data")
         
-        # Analyze each trade group
-        trade_analysis = []
-        
-        for trade_key, trade_items in trade_groups.items():
-            if len(trade_items) < 2:  # Skip single-item transactions
-                continue
-            
-            # Identify teams involved
-            teams_involved = set()
-            for item in trade_items:
-                if pd.notna(item['From']) and item['From'] != "(Drop)":
-                    teams_involved.add(item['From'])
-                if pd.notna(item['To']) and item['To'] != "(Drop)":
-                    teams_involved.add(item['To'])
-            
-            if len(teams_involved) < 2:
-                continue
-            
-            # Calculate values for each team
-            team_values = {team: 0 for team in teams_involved}
-            trade_details = {team: [] for team in teams_involved}
-            
-            for item in trade_items:
-                from_team = item['From']
-                to_team = item['To']
-                player = item['Player']
-                
-                if to_team == "(Drop)":
-                    continue
-                
-                # Calculate item value
-                value = 0
-                item_type = "Player"
-                
-                if "Draft Pick" in player:
-                    value = get_draft_pick_value(player)
-                    item_type = "Draft Pick"
-                elif "Budget Amount" in player:
-                    value = get_budget_value(player)
-                    item_type = "Budget"
-                else:
-                    value = get_player_value(player)
-                    # Debug: Track player processing
-                    if player not in all_players:
-                        st.warning(f"DEBUG: Player '{player}' not found in Fantrax transaction data!")
-                
-                # Add value to receiving team, subtract from giving team
-                if pd.notna(to_team) and to_team in team_values:
-                    team_values[to_team] += value
-                    trade_details[to_team].append({
-                        'item': player,
-                        'value': value,
-                        'type': item_type,
-                        'direction': 'received'
-                    })
-                
-                if pd.notna(from_team) and from_team in team_values and from_team != "(Drop)":
-                    team_values[from_team] -= value
-                    trade_details[from_team].append({
-                        'item': player,
-                        'value': value,
-                        'type': item_type,
-                        'direction': 'gave'
-                    })
-            
-            # Store trade analysis
-            trade_analysis.append({
-                'date': trade_items[0]['Date'],
-                'teams_involved': list(teams_involved),
-                'team_values': team_values,
-                'trade_details': trade_details,
-                'total_value': sum(abs(v) for v in team_values.values()) / 2,  # Divide by 2 to avoid double counting
-                'value_difference': max(team_values.values()) - min(team_values.values()),
-                'is_lopsided': max(team_values.values()) - min(team_values.values()) > 30
-            })
-        
-        # Sort trades by value difference (most lopsided first)
-        trade_analysis.sort(key=lambda x: x['value_difference'], reverse=True)
-        
         st.sidebar.success(f"✅ Analyzed {len(trade_analysis)} trade transactions")
         
         # Display analysis tabs
@@ -656,7 +301,7 @@ def render():
                                 st.write(f"• {item['item']} - {item['value']:.1f} pts")
                             else:
                                 # Show player breakdown
-                                breakdown = get_player_value_breakdown(item['item'])
+                                breakdown = value_breakdown(player_table, item['item'])
                                 mvp_part = f"MVP: {breakdown['mvp_value']:.1f}" if breakdown['mvp_value'] > 0 else ""
                                 prospect_part = f"Prospect: {breakdown['prospect_value']:.1f}" if breakdown['prospect_value'] > 0 else ""
                                 parts = [p for p in [mvp_part, prospect_part] if p]
@@ -675,7 +320,7 @@ def render():
                                 st.write(f"• {item['item']} - {item['value']:.1f} pts")
                             else:
                                 # Show player breakdown
-                                breakdown = get_player_value_breakdown(item['item'])
+                                breakdown = value_breakdown(player_table, item['item'])
                                 mvp_part = f"MVP: {breakdown['mvp_value']:.1f}" if breakdown['mvp_value'] > 0 else ""
                                 prospect_part = f"Prospect: {breakdown['prospect_value']:.1f}" if breakdown['prospect_value'] > 0 else ""
                                 parts = [p for p in [mvp_part, prospect_part] if p]
@@ -716,7 +361,7 @@ def render():
                                 st.write(f"• {item['item']} - {item['value']:.1f} pts")
                             else:
                                 # Show player breakdown
-                                breakdown = get_player_value_breakdown(item['item'])
+                                breakdown = value_breakdown(player_table, item['item'])
                                 mvp_part = f"MVP: {breakdown['mvp_value']:.1f}" if breakdown['mvp_value'] > 0 else ""
                                 prospect_part = f"Prospect: {breakdown['prospect_value']:.1f}" if breakdown['prospect_value'] > 0 else ""
                                 parts = [p for p in [mvp_part, prospect_part] if p]
@@ -735,7 +380,7 @@ def render():
                                 st.write(f"• {item['item']} - {item['value']:.1f} pts")
                             else:
                                 # Show player breakdown
-                                breakdown = get_player_value_breakdown(item['item'])
+                                breakdown = value_breakdown(player_table, item['item'])
                                 mvp_part = f"MVP: {breakdown['mvp_value']:.1f}" if breakdown['mvp_value'] > 0 else ""
                                 prospect_part = f"Prospect: {breakdown['prospect_value']:.1f}" if breakdown['prospect_value'] > 0 else ""
                                 parts = [p for p in [mvp_part, prospect_part] if p]
@@ -765,9 +410,12 @@ def render():
         with tab4:
             st.write("## Trade Activity Analysis")
             
-            # Create timeline chart
-            dates = [t['date'] for t in trade_analysis]
-            values = [t['total_value'] for t in trade_analysis]
+            # Create timeline chart (chronological, labelled with the weekly scoring period)
+            timeline = sorted(trade_analysis, key=lambda t: t['date'])
+            dates = [t['date'] for t in timeline]
+            values = [t['total_value'] for t in timeline]
+            periods = [f"Scoring Period {int(t['scoring_period'])}" if pd.notna(t['scoring_period']) else ""
+                       for t in timeline]
             
             fig = go.Figure()
             fig.add_trace(go.Scatter(
@@ -775,6 +423,8 @@ def render():
                 y=values,
                 mode='markers+lines',
                 name='Trade Value',
+                text=periods,
+                hovertemplate='%{text}<br>Total value: %{y:.1f}<extra></extra>',
                 marker=dict(size=8, color='blue'),
                 line=dict(width=2)
             ))
@@ -805,6 +455,25 @@ def render():
             with col4:
                 max_diff = max(t['value_difference'] for t in trade_analysis) if trade_analysis else 0
                 st.metric("Max Value Diff", f"{max_diff:.1f}")
+            
+            with st.expander("📐 Value Curve Comparison"):
+                st.caption(f"MVP values are curved to emphasize elite players (current: {DEFAULT_VALUE_CURVE}). "
+                           "Every trade re-valued under each curve:")
+                with metrics.cache_lookup("trade_curves"):
+                    curve_report = _cached_curve_report(version, trades_df, player_table)
+                st.dataframe(
+                    curve_report.reset_index(),
+                    column_config={
+                        "curve": "Curve",
+                        "mean_trade_value": st.column_config.NumberColumn("Avg Trade Value", format="%.1f"),
+                        "mean_value_difference": st.column_config.NumberColumn("Avg Value Diff", format="%.1f"),
+                        "max_value_difference": st.column_config.NumberColumn("Max Value Diff", format="%.1f"),
+                        "lopsided_trades": "Lopsided Trades",
+                        "winner_changes": f"Winners Changed vs {DEFAULT_VALUE_CURVE}",
+                    },
+                    hide_index=True,
+                    use_container_width=True
+                )
         
     except FileNotFoundError:
         st.error("Trade data file not found. Please ensure Fantrax-Transaction-History-Trades-ABL Season 5.csv is in the attached_assets folder.")
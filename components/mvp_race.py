@@ -1,5 +1,8 @@
 import streamlit as st
 import pandas as pd
+import tracing
+from card_templates import CardTemplate, render_section
+from headshots import headshot_sources
 import plotly.express as px
 import plotly.graph_objects as go
 from io import StringIO
@@ -9,6 +12,10 @@ from typing import Dict, List, Any, Optional, Tuple
 
 # Constants for MLB team colors
 from components.prospects import MLB_TEAM_COLORS, MLB_TEAM_IDS, MLB_TEAM_ABBR_TO_NAME
+from change_detection import file_version
+from mvp_engine import COMPONENT_CACHE, DEFAULT_MVP_WEIGHTS, min_max, value_scores
+from ros_projections import HITTER_ROS_FILE, PITCHER_ROS_FILE, hitter_ros_points, pitcher_ros_points
+from value_curves import power_curve
 
 def normalize_value(value, min_val, max_val, reverse=False):
     """
@@ -156,6 +163,35 @@ def normalize_name(name: str) -> str:
     except Exception:
         return ""
 
+def normalize_names(names: pd.Series) -> pd.Series:
+    """Vectorized normalize_name"""
+    normalized = names.where(names.map(lambda name: isinstance(name, str)), '').str.lower().str.strip()
+    normalized = normalized.str.replace(r'[\(\[].*?[\)\]]', '', regex=True)
+    normalized = normalized.str.replace(r'[^\w\s]', '', regex=True)
+    return normalized.str.replace(r'\s+', ' ', regex=True).str.strip()
+
+def ros_points(players: pd.DataFrame, ros_data: Optional[Dict[str, pd.DataFrame]]) -> pd.Series:
+    """
+    Vectorized calculate_hitter_ros_score / calculate_pitcher_ros_score for a
+    whole player frame: players with SP or RP eligibility are scored from the
+    pitcher table, everyone else from the hitter table, matched on the
+    normalized 'Name' (first match wins).
+    """
+    points = pd.Series(0.0, index=players.index)
+    if not ros_data or 'Name' not in players.columns:
+        return points
+    names = normalize_names(players['Name'])
+    is_pitcher = players['Position'].fillna('').astype(str).str.contains('SP|RP', regex=True)
+
+    for table, score, rows in ((ros_data.get('hitters'), hitter_ros_points, ~is_pitcher),
+                               (ros_data.get('pitchers'), pitcher_ros_points, is_pitcher)):
+        if table is None or table.empty:
+            continue
+        lookup = pd.Series(score(table).values, index=normalize_names(table['Name']))
+        lookup = lookup[~lookup.index.duplicated(keep='first') & (lookup.index != '')]
+        points[rows] = names[rows].map(lookup).fillna(0.0)
+    return points
+
 def create_player_id_cache(mlb_ids_df: pd.DataFrame = None) -> Dict[str, Dict[str, str]]:
     """
     Create a comprehensive player ID mapping system using both the PLAYERIDMAP.csv file and mlb_ids_df
@@ -176,7 +212,7 @@ def create_player_id_cache(mlb_ids_df: pd.DataFrame = None) -> Dict[str, Dict[st
     
     # Try to load the PLAYERIDMAP.csv file first (this has direct Fantrax ID to MLB ID mapping)
     try:
-        player_map_df = pd.read_csv("attached_assets/PLAYERIDMAP.csv")
+        player_map_df = tracing.read_csv("attached_assets/PLAYERIDMAP.csv")
         
         # Process each row in the player map
         for _, row in player_map_df.iterrows():
@@ -308,36 +344,45 @@ def create_player_id_cache(mlb_ids_df: pd.DataFrame = None) -> Dict[str, Dict[st
     
     return cache
 
+MLB_HEADSHOT_URL = ("https://img.mlbstatic.com/mlb-photos/image/upload/d_people:generic:headshot:67:current.png/"
+                    "w_213,q_auto:best/v1/people/{mlb_id}/headshot/67/current")
+
+MVP_HEADSHOT = CardTemplate("mvp_headshot", """
+    <img src="{headshot_url}" alt="{player_name}"
+        style="width: {size}px; height: {size}px; border-radius: 50%; object-fit: cover;{border}">
+""")
+
+
+def headshot_urls(mlb_ids: pd.Series, size: int) -> pd.Series:
+    """Cached thumbnail (or origin URL) per MLB ID; the generic image for unknown players"""
+    known = mlb_ids != 'generic'
+    urls = pd.Series(MLB_HEADSHOT_URL.format(mlb_id='generic'), index=mlb_ids.index)
+    urls[known] = headshot_sources(mlb_ids[known], size)
+    return urls
+
+
+def headshot_column(player_ids: pd.Series, player_names: pd.Series, player_id_cache=None, size: int = 60,
+                    border: str = "") -> pd.Series:
+    """Headshot HTML for every player at once (generic image when the MLB ID is unknown)"""
+    player_id_cache = player_id_cache or {}
+    by_fantrax = player_ids.map(player_id_cache.get('fantrax_to_mlbid', {}))
+    by_name = normalize_names(player_names).map(player_id_cache.get('name_to_mlbid', {}))
+    # Remove decimal part if present
+    mlb_ids = by_fantrax.fillna(by_name).fillna('generic').astype(str).str.split('.').str[0]
+    frame = pd.DataFrame({
+        'headshot_url': headshot_urls(mlb_ids, size),
+        'player_name': player_names.fillna('').astype(str),
+        'size': size,
+        'border': f" border: {border};" if border else "",
+    }, index=player_names.index)
+    return pd.Series(MVP_HEADSHOT.render_rows(frame), index=player_names.index)
+
+
 def get_player_headshot_html(player_id, player_name, player_id_cache=None):
     """
     Generate player headshot HTML with a simplified approach
     """
-    # Default image for missing headshots
-    default_image = "https://img.mlbstatic.com/mlb-photos/image/upload/d_people:generic:headshot:67:current.png/w_213,q_auto:best/v1/people/generic/headshot/67/current"
-    
-    try:
-        # Default to generic image
-        mlb_id = "generic"
-        
-        if player_id_cache and player_id in player_id_cache.get('fantrax_to_mlbid', {}):
-            mlb_id = player_id_cache['fantrax_to_mlbid'][player_id]
-        elif player_id_cache and normalize_name(player_name) in player_id_cache.get('name_to_mlbid', {}):
-            mlb_id = player_id_cache['name_to_mlbid'][normalize_name(player_name)]
-            
-        # Remove decimal part if present
-        mlb_id = str(mlb_id).split('.')[0]
-        
-        # For simplicity, if we have a valid MLB ID, use it in the URL
-        if mlb_id != "generic":
-            img_url = f"https://img.mlbstatic.com/mlb-photos/image/upload/d_people:generic:headshot:67:current.png/w_213,q_auto:best/v1/people/{mlb_id}/headshot/67/current"
-        else:
-            img_url = default_image
-            
-        # Return a very simple img tag
-        return f'<img src="{img_url}" alt="{player_name}" style="width: 60px; height: 60px; border-radius: 50%; object-fit: cover;">'
-    except Exception:
-        # Return default image if anything goes wrong
-        return f'<img src="{default_image}" alt="{player_name}" style="width: 60px; height: 60px; border-radius: 50%; object-fit: cover;">'
+    return headshot_column(pd.Series([player_id], dtype=object), pd.Series([player_name]), player_id_cache).iat[0]
 
 def get_mlb_team_info(team_name):
     """
@@ -386,138 +431,132 @@ def get_mlb_team_info(team_name):
         'logo_url': logo_url
     }
 
-def get_position_value(position_str, position_counts=None, points_data=None):
+# Default scarcity values when position data is not available
+# Only used as fallback when we can't calculate actual scarcity
+DEFAULT_POSITION_SCARCITY = {
+    'C': 0.90,     # Catchers are historically scarce and low-scoring
+    'SS': 0.85,    # Shortstops are moderately scarce
+    '2B': 0.80,    # Second basemen are moderately scarce
+    'CF': 0.75,    # Center fielders have mid-range scarcity
+    '3B': 0.70,    # Third basemen are moderately common
+    'SP': 0.65,    # Starting pitchers are common but high variance
+    '1B': 0.60,    # First basemen are very common and high-scoring
+    'RF': 0.55,    # Right fielders are common and high-scoring
+    'LF': 0.50,    # Left fielders are common and high-scoring
+    'RP': 0.40,    # Relief pitchers are very common and low-scoring
+    'UT': 0.25     # Utility players get a low value as any position player can fill this role
+}
+UNKNOWN_POSITION_SCARCITY = 0.5  # Middle value for positions without a default
+UT_ONLY_SCARCITY = 0.15          # Fixed low value for UT-only players
+
+# Inverse counts / average FPts are curved to emphasize the most scarce positions
+SCARCITY_CURVE = power_curve(1.2)
+
+# Scarcity tables by data version (positions + FPts content)
+_scarcity_tables: Dict[Any, pd.Series] = {}
+
+
+def explode_positions(positions: pd.Series) -> pd.Series:
+    """One row per (player, eligible position), indexed by the player's row label"""
+    exploded = positions.fillna('').astype(str).str.split(',').explode().str.strip()
+    return exploded[exploded != '']
+
+
+def _scarcity_table(position_counts: Dict[str, int], position_fpts: Dict[str, float]) -> pd.Series:
     """
-    Calculate a position score based on the relative scarcity of the position in fantasy baseball.
-    
-    This function focuses exclusively on positional scarcity relative to fantasy points scored, 
-    ignoring defensive value which doesn't matter for fantasy baseball. It calculates relative 
-    value by looking at:
+    Scaled position value (0.3-1.0) per position.
+
     1. How rare players are at each position (fewer players = higher scarcity)
     2. How fantasy points are distributed at each position (lower average points = higher scarcity)
-    
-    For players with multiple positions, we take the highest position value.
     """
-    # Default scarcity values when position data is not available
-    # Only used as fallback when we can't calculate actual scarcity
-    default_scarcity = {
-        'C': 0.90,     # Catchers are historically scarce and low-scoring
-        'SS': 0.85,    # Shortstops are moderately scarce 
-        '2B': 0.80,    # Second basemen are moderately scarce
-        'CF': 0.75,    # Center fielders have mid-range scarcity
-        '3B': 0.70,    # Third basemen are moderately common
-        'SP': 0.65,    # Starting pitchers are common but high variance
-        '1B': 0.60,    # First basemen are very common and high-scoring
-        'RF': 0.55,    # Right fielders are common and high-scoring
-        'LF': 0.50,    # Left fielders are common and high-scoring
-        'RP': 0.40,    # Relief pitchers are very common and low-scoring
-        'UT': 0.25     # Utility players get a low value as any position player can fill this role
-    }
-    
-    # We'll compute scarcity based solely on player counts and distribution of fantasy points
-    # Initialize with defaults
-    scarcity_values = default_scarcity.copy() 
-    
+    scarcity_values = dict(DEFAULT_POSITION_SCARCITY)
+
     # PART 1: Calculate scarcity based on player counts (50% of the total score)
-    if position_counts is not None and len(position_counts) > 0:
-        # Get the count range for scaling
+    if position_counts:
         min_count = min(position_counts.values())
-        max_count = max(position_counts.values())
-        count_range = max_count - min_count
-        
+        count_range = max(position_counts.values()) - min_count
         # Only recalculate if we have a meaningful distribution
         if count_range > 0:
-            for pos in position_counts:
+            for pos, count in position_counts.items():
                 if pos in scarcity_values:
-                    count = position_counts[pos]
-                    
-                    # Normalize the count inversely (fewer players = higher scarcity)
-                    # This creates a score from 0 to 1 where 1 = most scarce (fewest players)
-                    count_scarcity = 1 - ((count - min_count) / count_range)
-                    
-                    # Apply a curve to emphasize differences in scarcity
-                    # Squaring the value puts more emphasis on the most scarce positions
-                    curved_count_scarcity = count_scarcity ** 1.2
-                    
-                    # Store in the scarcity values dictionary (will combine with fantasy points later)
-                    scarcity_values[pos] = curved_count_scarcity
-    
+                    scarcity_values[pos] = SCARCITY_CURVE(1 - ((count - min_count) / count_range))
+
     # PART 2: Calculate scarcity based on fantasy points per position (50% of total score)
-    # This calculation compares the average fantasy points at each position
-    # Positions with lower average fantasy points have higher scarcity value
-    position_fpts = {}
-    
-    # We can compute this from the mvp_data DataFrame, but we need to pass it
-    # Get the mvp_data from the global scope
-    try:
-        # Get the global mvp_data DataFrame to calculate position FPts
-        global_mvp_data = points_data if points_data is not None else None
-        
-        if global_mvp_data is not None and 'Position' in global_mvp_data.columns and 'FPts' in global_mvp_data.columns:
-            # Calculate average FPts for each position
-            for pos in position_counts.keys() if position_counts else []:
-                # Get all players at this position
-                pos_players = global_mvp_data[global_mvp_data['Position'].str.contains(pos, na=False)]
-                
-                if len(pos_players) > 0:
-                    # Calculate the average FPts for this position
-                    avg_fpts = pos_players['FPts'].mean()
-                    position_fpts[pos] = avg_fpts
-            
-            # If we have position fantasy points data, calculate scarcity based on points
-            if len(position_fpts) > 1:  # Need at least 2 positions to compare
-                # Get min and max for normalization
-                min_fpts = min(position_fpts.values())
-                max_fpts = max(position_fpts.values())
-                fpts_range = max_fpts - min_fpts
-                
-                # Calculate scarcity based on fantasy points (inverse - lower points = higher scarcity)
-                if fpts_range > 0:
-                    for pos, avg_fpts in position_fpts.items():
-                        # Normalize fantasy points inversely (lower points = higher scarcity)
-                        # This creates a value between 0-1 where positions with fewer points have higher values
-                        fpts_scarcity = 1 - ((avg_fpts - min_fpts) / fpts_range)
-                        
-                        # Apply curved emphasis to highlight differences
-                        curved_fpts_scarcity = fpts_scarcity ** 1.2
-                        
-                        # Combine with count-based scarcity value (if we have it)
-                        if pos in scarcity_values:
-                            # Weighted average: 50% count-based, 50% fantasy-points-based
-                            scarcity_values[pos] = (scarcity_values[pos] * 0.5) + (curved_fpts_scarcity * 0.5)
-    except Exception as e:
-        # Silently continue if there's an error with fantasy points calculation
-        pass
-    
-    # Split by comma and get the list of positions
-    positions = [pos.strip() for pos in position_str.split(',')]
-    
-    # Find the highest position value 
-    max_pos_value = 0
-    has_ut_only = False
-    
-    # Check if UT is the only position
-    if len(positions) == 1 and positions[0] == 'UT':
-        has_ut_only = True
-    
-    for pos in positions:
-        # Get scarcity value with default if position not found
-        scarcity = scarcity_values.get(pos, 0.5)  # Default to middle value if position not found
-        
-        # Special handling for UT position
-        if pos == 'UT':
-            if has_ut_only:  # If UT is the only position, penalize it more
-                scarcity = 0.15  # Fixed low value for UT-only players
-            else:  # If UT is one of multiple positions, don't let it increase the value
-                continue  # Skip UT in max calculation when player has other positions
-        
-        # Scale to a range from 0.3 to 1.0 to avoid extremely low values
-        scaled_scarcity = 0.3 + (scarcity * 0.7)
-        
-        max_pos_value = max(max_pos_value, scaled_scarcity)
-    
-    # Cap at 1.0 to ensure we stay within scale
-    return min(max_pos_value, 1.0)
+    if len(position_fpts) > 1:  # Need at least 2 positions to compare
+        min_fpts = min(position_fpts.values())
+        fpts_range = max(position_fpts.values()) - min_fpts
+        if fpts_range > 0:
+            for pos, avg_fpts in position_fpts.items():
+                if pos in scarcity_values:
+                    fpts_scarcity = SCARCITY_CURVE(1 - ((avg_fpts - min_fpts) / fpts_range))
+                    # Weighted average: 50% count-based, 50% fantasy-points-based
+                    scarcity_values[pos] = (scarcity_values[pos] * 0.5) + (fpts_scarcity * 0.5)
+
+    # Scale to a range from 0.3 to 1.0 to avoid extremely low values
+    return pd.Series({pos: 0.3 + (value * 0.7) for pos, value in scarcity_values.items()}, dtype=float)
+
+
+def position_scarcity(points_data: pd.DataFrame = None, position_counts: Dict[str, int] = None) -> pd.Series:
+    """
+    Position -> scaled scarcity value, computed once per data version.
+
+    With ``points_data`` (Position + FPts), counts and average FPts come from
+    the exploded multi-position eligibility of every player; a player listed
+    as "2B,SS" counts once at 2B and once at SS. ``position_counts`` alone
+    gives a count-only table, and neither gives the defaults.
+    """
+    if points_data is not None and 'Position' in points_data.columns and 'FPts' in points_data.columns:
+        version = ('data', int(pd.util.hash_pandas_object(points_data[['Position', 'FPts']], index=False).sum()))
+    else:
+        points_data = None
+        version = ('counts', tuple(sorted((position_counts or {}).items())))
+
+    table = _scarcity_tables.get(version)
+    if table is None:
+        position_fpts = {}
+        if points_data is not None:
+            exploded = explode_positions(points_data['Position'])
+            fpts = pd.to_numeric(points_data['FPts'], errors='coerce').reindex(exploded.index)
+            position_counts = exploded.value_counts().to_dict()
+            position_fpts = fpts.groupby(exploded.values).mean().dropna().to_dict()
+        table = _scarcity_table(position_counts or {}, position_fpts)
+        if len(_scarcity_tables) >= 16:
+            _scarcity_tables.clear()
+        _scarcity_tables[version] = table
+    return table
+
+
+def position_values(positions: pd.Series, scarcity: pd.Series) -> pd.Series:
+    """
+    Vectorized get_position_value: the highest scarcity value over each
+    player's eligible positions. UT only counts for UT-only players, at a
+    fixed low value.
+    """
+    exploded = explode_positions(positions)
+    values = exploded.map(scarcity).fillna(0.3 + UNKNOWN_POSITION_SCARCITY * 0.7)
+
+    eligible_count = exploded.groupby(level=0).size().reindex(exploded.index)
+    is_ut = exploded == 'UT'
+    values = values.mask(is_ut & (eligible_count == 1), 0.3 + UT_ONLY_SCARCITY * 0.7)
+    values = values.mask(is_ut & (eligible_count > 1))
+
+    best = values.groupby(level=0).max()
+    return best.reindex(positions.index).fillna(0.0).clip(upper=1.0)
+
+
+def get_position_value(position_str, position_counts=None, points_data=None):
+    """
+    Calculate a position score based on the relative scarcity of the position in fantasy baseball.
+
+    This function focuses exclusively on positional scarcity relative to fantasy points scored,
+    ignoring defensive value which doesn't matter for fantasy baseball.
+    For players with multiple positions, we take the highest position value.
+
+    Scoring many players? Build the table once with position_scarcity() and
+    use position_values() instead.
+    """
+    scarcity = position_scarcity(points_data, position_counts)
+    return float(position_values(pd.Series([position_str]), scarcity).iloc[0])
 
 def calculate_mvp_score(player_row, weights, norm_columns, position_counts=None, points_data=None, ros_data=None):
     """
@@ -562,6 +601,121 @@ def calculate_mvp_score(player_row, weights, norm_columns, position_counts=None,
     
     return final_score
 
+MVP_FAVORITE_CARD = CardTemplate("mvp_favorite_card", """
+    <div style="background: linear-gradient(135deg, {primary} 0%, {secondary} 100%);
+        border-radius: 10px; padding: 1rem; position: relative; text-align: center; margin-bottom: 15px;">
+        <div style="position: absolute; top: 10px; right: 10px; background: rgba(255,255,255,0.1); padding: 5px; border-radius: 5px;">
+            <span style="color: white; font-size: 0.8rem;">#{rank}</span>
+        </div>
+        <div style="text-align: center;">{large_headshot_html}</div>
+        <h3 style="color: white; margin: 0.5rem 0; text-align: center;">{Player}</h3>
+        <div style="color: rgba(255,255,255,0.8); font-size: 0.9rem; margin-bottom: 0.3rem; text-align: center;">{Position} | {Team}</div>
+        <div style="margin: 0.5rem 0; color: gold; font-size: 1.2rem; text-align: center;">{stars}</div>
+        <div style="background: rgba(0,0,0,0.3); padding: 0.3rem; border-radius: 12px; margin: 0 auto; width: 60%; text-align: center;">
+            <span style="color: white; font-weight: bold;">MVP Score: {MVP_Score:.1f}</span>
+        </div>
+    </div>
+""")
+
+MVP_PLAYER_CARD = CardTemplate("mvp_player_card", """
+    <div style="background: linear-gradient(135deg, {primary} 0%, {secondary} 100%);
+        height: 5px; border-radius: 3px 3px 0 0; margin-bottom: 10px;"></div>
+    <div style="display: flex; align-items: center; gap: 1rem; margin-bottom: 0.5rem;">
+        <div style="flex: 1; min-width: 40px;">
+            <div style="background: {primary}; color: white; text-align: center; padding: 8px; border-radius: 50%;
+                width: 35px; height: 35px; line-height: 19px; font-weight: bold; margin: 0 auto;">#{rank}</div>
+        </div>
+        <div style="flex: 2; text-align: center; font-size: 2rem;">{row_headshot_html}</div>
+        <div style="flex: 4;">
+            <div style="font-weight: bold;">{Player}</div>
+            <div style="font-size: 0.8rem; opacity: 0.7;">{Position} • {Team} • Age {age_years}</div>
+            <div style="background: #ddd; border-radius: 10px; height: 8px; margin-top: 5px;">
+                <div style="background: {primary}; height: 8px; border-radius: 10px; width: {mvp_pct}%;"></div>
+            </div>
+        </div>
+        <div style="flex: 2;">
+            <div style="font-size: 0.8rem; opacity: 0.7;">MVP Score</div>
+            <div style="font-size: 1.6rem;">{MVP_Score:.1f}</div>
+        </div>
+        <div style="flex: 2;">
+            <div style="font-size: 0.8rem; opacity: 0.7;">Fantasy Points</div>
+            <div style="font-size: 1.6rem;">{FPts:.1f}</div>
+            <div style="font-size: 0.8rem; opacity: 0.7;">&#36;{Salary:.1f}M • {Contract}</div>
+        </div>
+    </div>
+    <hr style="margin: 0.5rem 0 1rem 0; opacity: 0.3;">
+    <div class="player-card-container" style="
+        background: linear-gradient(135deg, {primary} 0%, {secondary} 100%);
+        border-radius: 12px; padding: 1rem; margin-bottom: 20px; position: relative; min-height: 80px;
+        border: 2px solid rgba(255,255,255,0.1); box-shadow: 0 4px 8px rgba(0,0,0,0.3); backdrop-filter: blur(5px);">
+        <div style="position: absolute; top: 8px; right: 8px; background: rgba(0,0,0,0.2); padding: 4px 8px; border-radius: 12px;">
+            <span style="color: white; font-weight: bold;">#{rank}</span>
+        </div>
+        <div style="display: flex; align-items: center; margin-bottom: 0.5rem;">
+            {small_headshot_html}
+            <div style="margin-left: 0.5rem;">
+                <div class="player-name" style="color: white; font-weight: bold; font-size: 0.9rem; line-height: 1;">{Player}</div>
+                <div style="color: rgba(255,255,255,0.8); font-size: 0.7rem;">{Position} | {Team}</div>
+            </div>
+        </div>
+        <div style="display: flex; gap: 0.4rem; margin: 0.4rem 0;">
+            <div style="flex: 1; background: rgba(255,255,255,0.1); padding: 0.25rem; border-radius: 4px; text-align: center;">
+                <div style="color: rgba(255,255,255,0.7); font-size: 0.65rem;">FPts</div>
+                <div style="color: white; font-weight: bold; font-size: 0.8rem;">{FPts:.1f}</div>
+            </div>
+            <div style="flex: 1; background: rgba(255,255,255,0.1); padding: 0.25rem; border-radius: 4px; text-align: center;">
+                <div style="color: rgba(255,255,255,0.7); font-size: 0.65rem;">Age</div>
+                <div style="color: white; font-weight: bold; font-size: 0.8rem;">{Age}</div>
+            </div>
+        </div>
+        <div style="display: flex; gap: 0.4rem; margin: 0.4rem 0;">
+            <div style="flex: 1; background: rgba(255,255,255,0.1); padding: 0.25rem; border-radius: 4px; text-align: center;">
+                <div style="color: rgba(255,255,255,0.7); font-size: 0.65rem;">Salary</div>
+                <div style="color: white; font-weight: bold; font-size: 0.8rem;">&#36;{Salary}</div>
+            </div>
+            <div style="flex: 1; background: rgba(255,255,255,0.1); padding: 0.25rem; border-radius: 4px; text-align: center;">
+                <div style="color: rgba(255,255,255,0.7); font-size: 0.65rem;">Contract</div>
+                <div style="color: white; font-weight: bold; font-size: 0.8rem;">{Contract}</div>
+            </div>
+        </div>
+        <div style="background: rgba(0,0,0,0.2); padding: 0.4rem; border-radius: 4px; margin-top: 0.4rem;">
+            <div style="display: flex; justify-content: space-between; align-items: center;">
+                <div style="color: rgba(255,255,255,0.7); font-size: 0.7rem;">MVP Score: <span style="color: white; font-weight: bold;">{MVP_Score:.1f}</span></div>
+                <div style="color: gold; font-size: 0.7rem;">{stars}</div>
+            </div>
+        </div>
+        <div style="background: rgba(255,255,255,0.1); border-radius: 3px; height: 6px; margin-top: 0.2rem;">
+            <div class="mvp-score-bar" style="height: 6px; background: gold; border-radius: 3px; width: {mvp_score_pct}%;"></div>
+        </div>
+    </div>
+""")
+
+
+def mvp_card_frame(players: pd.DataFrame, player_id_cache: Dict, name_to_mlb_id: Dict[str, str]) -> pd.DataFrame:
+    """Players plus the per-row values the MVP card templates need, built column-wise"""
+    team_info = players['Team'].map({team: get_mlb_team_info(team) for team in players['Team'].unique()})
+    colors = team_info.str['colors']
+    mlb_ids = players['Player'].map(name_to_mlb_id).fillna('000000')
+    # Stars from the 0-100 MVP score: 80+ gets 5, 60+ gets 4, ... (minimum 1)
+    stars = (players['MVP_Score'] / 20 + 0.5).astype(int).clip(1, 5)
+    return players.assign(
+        rank=range(1, len(players) + 1),
+        primary=colors.str['primary'],
+        secondary=colors.str['secondary'],
+        stars=stars.map(lambda count: "⭐" * count),
+        mvp_pct=players['MVP_Score'].clip(upper=100),
+        mvp_score_pct=players['MVP_Score'].astype(int),
+        age_years=pd.to_numeric(players['Age'], errors='coerce').fillna(0).astype(int),
+        large_headshot_html=headshot_column(players['ID'], players['Player'], player_id_cache, 120, "3px solid white"),
+        small_headshot_html=headshot_column(players['ID'], players['Player'], player_id_cache, 40, "2px solid white"),
+        row_headshot_html=[
+            f'<img src="{url}" style="width: 60px;">' if mlb_id != '000000'
+            else '<span title="Player photo not available">⚾</span>'
+            for mlb_id, url in zip(mlb_ids, headshot_urls(mlb_ids.where(mlb_ids != '000000', 'generic'), 60))
+        ],
+    )
+
+
 def render():
     """Render the MVP Race page"""
     # Add enhanced CSS for hover effects
@@ -672,7 +826,7 @@ def render():
     # Load MLB player IDs and create cache for headshots
     player_id_cache = {}
     try:
-        mlb_ids_df = pd.read_csv("attached_assets/mlb_player_ids-2.csv")
+        mlb_ids_df = tracing.read_csv("attached_assets/mlb_player_ids-2.csv")
         player_id_cache = create_player_id_cache(mlb_ids_df)
     except Exception as e:
         st.warning(f"Could not load MLB player IDs: {str(e)}")
@@ -680,7 +834,7 @@ def render():
     # Load additional player ID mapping for better headshot matching
     name_to_mlb_id = {}
     try:
-        id_map = pd.read_csv("attached_assets/PLAYERIDMAP.csv")
+        id_map = tracing.read_csv("attached_assets/PLAYERIDMAP.csv")
         for _, row in id_map.iterrows():
             if pd.notna(row.get('MLBID')):
                 names_to_try = [
@@ -698,8 +852,8 @@ def render():
     # Load ROS data files
     ros_data = {'hitters': None, 'pitchers': None}
     try:
-        hitter_ros_df = pd.read_csv("attached_assets/hitter_ROS.csv")
-        pitcher_ros_df = pd.read_csv("attached_assets/pitcher_ROS.csv")
+        hitter_ros_df = tracing.read_csv(HITTER_ROS_FILE)
+        pitcher_ros_df = tracing.read_csv(PITCHER_ROS_FILE)
         ros_data = {'hitters': hitter_ros_df, 'pitchers': pitcher_ros_df}
         st.success(f"Loaded ROS data: {len(hitter_ros_df)} hitters, {len(pitcher_ros_df)} pitchers")
     except Exception as e:
@@ -707,7 +861,7 @@ def render():
     
     # Load the MVP player list
     try:
-        mvp_data = pd.read_csv("attached_assets/MVP-Player-List.csv")
+        mvp_data = tracing.read_csv("attached_assets/MVP-Player-List.csv")
         
         # Convert columns to appropriate data types
         mvp_data['Age'] = pd.to_numeric(mvp_data['Age'], errors='coerce')
@@ -736,47 +890,8 @@ def render():
         
 
         
-        # Calculate value score that combines salary and contract
-        def calculate_value_score(salary, contract):
-            # Base salary score (lower is better)
-            salary_score = 1.0 - (salary / mvp_data['Salary'].max())
-            
-            # Contract length base values
-            contract_values = {
-                '2050': 1.0,
-                '2045': 0.9,
-                '2040': 0.8,
-                '2035': 0.7,
-                '2029': 0.6,
-                '2028': 0.5,
-                '2027': 0.4,
-                '2026': 0.3,
-                '2025': 0.2,
-                '1st': 0.15  # Base value for 1st contracts
-            }
-            
-            # Get base contract value
-            contract_value = contract_values.get(contract, 0.1)
-            
-            # Salary tiers affect contract multiplier
-            if salary < 5:  # Low salary players
-                contract_multiplier = 1.5  # Better contract multiplier for low salary
-            elif salary < 10:  # Mid salary players
-                contract_multiplier = 1.2
-            else:  # High salary players
-                contract_multiplier = 1.0
-            
-            # Calculate final value score
-            value_score = (salary_score * 0.6) + (contract_value * contract_multiplier * 0.4)
-            
-            return min(1.0, value_score)  # Cap at 1.0
-
         # Define weights for MVP criteria (sum should be 1.0)
-        default_weights = {
-            'FPts': 0.70,      # Performance is primary factor (increased)
-            'Position': 0.05,  # Position value remains same
-            'Value': 0.25,    # Combined salary and contract value (reduced)
-        }
+        default_weights = dict(DEFAULT_MVP_WEIGHTS)
         
         # Allow user to adjust weights
         st.sidebar.header("MVP Calculation Settings")
@@ -828,24 +943,21 @@ def render():
             ["All Teams"] + teams
         )
         
-        # Calculate normalized values for each metric
-        norm_columns = {}
-        
-        # For metrics where higher is better (FPts)
-        for col in ['FPts']:
-            min_val = mvp_data[col].min()
-            max_val = mvp_data[col].max()
-            norm_columns[col] = mvp_data[col].apply(lambda x: normalize_value(x, min_val, max_val, reverse=False))
+        # Every normalized component (and the raw ROS points) is computed once
+        # per data version; the weight sliders only redo a matrix-vector product
+        def build_components(data: pd.DataFrame) -> Dict[str, pd.Series]:
+            return {
+                'FPts': min_max(data['FPts']),
+                'Value': value_scores(data['Salary'], data['Contract'], tiered=True),
+                'Position': position_values(data['Position'], position_scarcity(data)),
+                'ROS': ros_points(data, ros_data),
+            }
         
-        # For Value (a combined score of Salary and Contract)
-        norm_columns['Value'] = mvp_data.apply(
-            lambda x: calculate_value_score(x['Salary'], x['Contract']), 
-            axis=1
+        components = COMPONENT_CACHE.get(
+            "mvp_race_full", mvp_data, ['Name', 'Position', 'FPts', 'Salary', 'Contract'], build_components,
+            extra_key=(file_version(HITTER_ROS_FILE, PITCHER_ROS_FILE), ros_data['hitters'] is not None)
         )
         
-        # For Position (calculate based on position value function)
-        norm_columns['Position'] = mvp_data['Position'].apply(get_position_value)
-        
         # Apply filters if selected
         filtered_data = mvp_data.copy()
         
@@ -863,64 +975,23 @@ def render():
             return
         
         # Calculate position counts for scarcity analysis
-        position_counts = {}
-        for pos_list in mvp_data['Position'].str.split(','):
-            for pos in pos_list:
-                pos = pos.strip()
-                if pos in position_counts:
-                    position_counts[pos] += 1
-                else:
-                    position_counts[pos] = 1
-        
-        # Debug position counts
-        #st.sidebar.write("Position Counts:", position_counts)
-        
-        # Calculate ROS scores first for normalization
-        ros_scores = []
-        traditional_mvp_scores = []
+        position_counts = explode_positions(mvp_data['Position']).value_counts().to_dict()
         
         try:
-            for idx, row in filtered_data.iterrows():
-                # Calculate traditional MVP score (20% weight)
-                traditional_score = 0
-                for col, weight in weights.items():
-                    if col in norm_columns and col != 'Position':
-                        traditional_score += norm_columns[col][row.name] * weight
-                
-                # Add position value to traditional MVP score
-                if 'Position' in row and weights.get('Position', 0) > 0:
-                    position_score = get_position_value(row['Position'], position_counts, mvp_data)
-                    traditional_score += position_score * weights.get('Position', 0)
-                
-                traditional_mvp_scores.append(traditional_score)
-                
-                # Calculate ROS fantasy score
-                ros_score = 0
-                if ros_data is not None:
-                    position = row.get('Position', '')
-                    if 'SP' in position or 'RP' in position:
-                        ros_score = calculate_pitcher_ros_score(row, ros_data.get('pitchers'))
-                    else:
-                        ros_score = calculate_hitter_ros_score(row, ros_data.get('hitters'))
-                
-                ros_scores.append(ros_score)
+            # Traditional MVP score (20% weight): weighted normalized components
+            traditional_mvp_scores = components.score(weights, rows=filtered_data.index)
             
-            # Normalize ROS scores to 0-1 scale
-            if ros_scores and max(ros_scores) > min(ros_scores):
-                max_ros = max(ros_scores)
-                min_ros = min(ros_scores)
-                ros_range = max_ros - min_ros
-                normalized_ros_scores = [(score - min_ros) / ros_range for score in ros_scores]
+            # Normalize ROS scores to 0-1 scale over the filtered players
+            ros_scores = components.column('ROS').loc[filtered_data.index]
+            if ros_scores.max() > ros_scores.min():
+                normalized_ros_scores = (ros_scores - ros_scores.min()) / (ros_scores.max() - ros_scores.min())
             else:
-                normalized_ros_scores = [0.5 for _ in ros_scores]  # Default if all ROS scores are the same
+                normalized_ros_scores = pd.Series(0.5, index=filtered_data.index)  # Default if all ROS scores are the same
             
             # Combine scores: 20% traditional MVP + 80% ROS
-            final_scores = []
-            for i in range(len(filtered_data)):
-                final_score = (traditional_mvp_scores[i] * 0.2) + (normalized_ros_scores[i] * 0.8)
-                final_scores.append(final_score)
-            
+            final_scores = (traditional_mvp_scores * 0.2) + (normalized_ros_scores * 0.8)
             filtered_data['MVP_Score_Raw'] = final_scores
+            filtered_data = filtered_data.join(components.frame(prefix='norm_'))
             
         except Exception as e:
             st.error(f"Error calculating MVP scores: {str(e)}")
@@ -928,8 +999,8 @@ def render():
             return
         
         # Scale the final MVP scores to a 0-100 scale for better user understanding
-        max_score = max(final_scores)
-        min_score = min(final_scores)
+        max_score = final_scores.max()
+        min_score = final_scores.min()
         score_range = max_score - min_score
         
         # Scale scores to 0-100 range and round to 1 decimal place
@@ -944,67 +1015,11 @@ def render():
         # Top 3 MVP candidates with special highlighting
         st.write("## Current MVP Favorites")
         
-        # Display top 3 stacked vertically
-        for i, (_, player) in enumerate(filtered_data.head(3).iterrows()):
-            team_info = get_mlb_team_info(player['Team'])
-            colors = team_info['colors']
-            logo_url = team_info['logo_url']
-            
-            # Calculate stars based on MVP score (1-5 stars) using 0-100 scale
-            # Scores above 80 get 5 stars, above 60 get 4 stars, etc.
-            star_score = player['MVP_Score'] / 20  # Convert 0-100 scale to 0-5 scale
-            stars = min(5, max(1, int(star_score + 0.5)))  # Round to nearest star, minimum 1, maximum 5
-            stars_display = "⭐" * stars
-            
-            # Create a more native implementation with less complex HTML
-            col1, col2, col3 = st.columns([1, 10, 1])
-            
-            with col2:
-                # Create a container with custom styling
-                with st.container():
-                    # Apply CSS for the container background
-                    st.markdown(f"""
-                    <div style="
-                        background: linear-gradient(135deg, {colors['primary']} 0%, {colors['secondary']} 100%);
-                        border-radius: 10px;
-                        padding: 1rem;
-                        position: relative;
-                        text-align: center;
-                        margin-bottom: 15px;
-                    ">
-                        <div style="position: absolute; top: 10px; right: 10px; background: rgba(255,255,255,0.1); padding: 5px; border-radius: 5px;">
-                            <span style="color: white; font-size: 0.8rem;">#{i+1}</span>
-                        </div>
-                    </div>
-                    """, unsafe_allow_html=True)
-                    
-                    # Player headshot (simple version)
-                    st.markdown(f"""
-                    <div style="text-align: center; margin-top: -60px;">
-                        {get_player_headshot_html(player['ID'], player['Player'], player_id_cache).replace('width: 60px; height: 60px;', 'width: 120px; height: 120px; border: 3px solid white;')}
-                    </div>
-                    """, unsafe_allow_html=True)
-                    
-                    # Player info
-                    st.markdown(f"""
-                    <h3 style="color: white; margin: 0.5rem 0; text-align: center;">{player['Player']}</h3>
-                    <div style="color: rgba(255,255,255,0.8); font-size: 0.9rem; margin-bottom: 0.3rem; text-align: center;">{player['Position']} | {player['Team']}</div>
-                    """, unsafe_allow_html=True)
-                    
-                    # Star rating
-                    st.markdown(f"""
-                    <div style="margin: 0.5rem 0; color: gold; font-size: 1.2rem; text-align: center;">{stars_display}</div>
-                    """, unsafe_allow_html=True)
-                    
-                    # MVP Score 
-                    st.markdown(f"""
-                    <div style="background: rgba(0,0,0,0.3); padding: 0.3rem; border-radius: 12px; margin: 0 auto; width: 60%; text-align: center;">
-                        <span style="color: white; font-weight: bold;">MVP Score: {player['MVP_Score']:.1f}</span>
-                    </div>
-                    """, unsafe_allow_html=True)
-                    
-                    # Removed Contract display as requested
-        
+        # Display top 3 stacked vertically, as one section
+        col1, col2, col3 = st.columns([1, 10, 1])
+        with col2:
+            render_section(MVP_FAVORITE_CARD, mvp_card_frame(filtered_data.head(3), player_id_cache, name_to_mlb_id))
+
         # MVP Race Complete Rankings Table
         st.write("## Complete MVP Rankings")
         
@@ -1023,165 +1038,9 @@ def render():
             display_count = st.slider("Number of players to display", 10, 100, 30, 5)
             display_data = filtered_data.head(display_count)
             
-            # Display player cards with proper styling
-            for i, (_, player) in enumerate(display_data.iterrows()):
-                rank = i + 1
-                team_info = get_mlb_team_info(player['Team'])
-                colors = team_info['colors']
-                
-                # Get player headshot with ID mapping
-                player_name = player['Player']
-                mlb_id = name_to_mlb_id.get(player_name, '000000')
-                headshot_url = f"https://img.mlbstatic.com/mlb-photos/image/upload/d_people:generic:headshot:67:current.png/w_213,q_auto:best/v1/people/{mlb_id}/headshot/67/current"
-                
-                # Create player card container
-                with st.container():
-                    # Team color strip
-                    st.markdown(f"""
-                    <div style="
-                        background: linear-gradient(135deg, {colors['primary']} 0%, {colors['secondary']} 100%);
-                        height: 5px;
-                        border-radius: 3px 3px 0 0;
-                        margin-bottom: 10px;
-                    "></div>
-                    """, unsafe_allow_html=True)
-                    
-                    # Player card content using columns
-                    col1, col2, col3, col4, col5 = st.columns([1, 2, 4, 2, 2])
-                    
-                    with col1:
-                        # Rank badge
-                        st.markdown(f"""
-                        <div style="
-                            background: {colors['primary']};
-                            color: white;
-                            text-align: center;
-                            padding: 8px;
-                            border-radius: 50%;
-                            width: 35px;
-                            height: 35px;
-                            line-height: 19px;
-                            font-weight: bold;
-                            margin: 0 auto;
-                        ">#{rank}</div>
-                        """, unsafe_allow_html=True)
-                    
-                    with col2:
-                        # Player headshot
-                        if mlb_id != '000000':
-                            st.image(headshot_url, width=60)
-                        else:
-                            st.markdown("⚾", help="Player photo not available")
-                    
-                    with col3:
-                        # Player details
-                        st.markdown(f"**{player['Player']}**")
-                        st.caption(f"{player['Position']} • {player['Team']} • Age {int(player['Age'])}")
-                        
-                        # MVP score bar
-                        mvp_pct = min(100, player['MVP_Score'])
-                        st.markdown(f"""
-                        <div style="background: #ddd; border-radius: 10px; height: 8px; margin-top: 5px;">
-                            <div style="background: {colors['primary']}; height: 8px; border-radius: 10px; width: {mvp_pct}%;"></div>
-                        </div>
-                        """, unsafe_allow_html=True)
-                    
-                    with col4:
-                        # MVP Score
-                        st.metric("MVP Score", f"{player['MVP_Score']:.1f}")
-                    
-                    with col5:
-                        # Fantasy Points and Contract
-                        st.metric("Fantasy Points", f"{player['FPts']:.1f}")
-                        st.caption(f"${player['Salary']:.1f}M • {player['Contract']}")
-                    
-                    st.divider()
-                
-                # MVP score is already on a 0-100 scale, use directly for progress bar
-                mvp_score_pct = int(player['MVP_Score'])
-                
-                # Make star rating based on MVP score using 0-100 scale
-                # Scores above 80 get 5 stars, above 60 get 4 stars, etc.
-                star_score = player['MVP_Score'] / 20  # Convert 0-100 scale to 0-5 scale
-                stars = min(5, max(1, int(star_score + 0.5)))  # Round to nearest star, minimum 1, maximum 5
-                stars_display = "⭐" * stars
-                # Create mini card container with simplified HTML in smaller chunks
-                with st.container():
-                    # Background container and rank with added class for hover effects
-                    st.markdown(f"""
-                    <div class="player-card-container" style="
-                        background: linear-gradient(135deg, {colors['primary']} 0%, {colors['secondary']} 100%);
-                        border-radius: 12px;
-                        padding: 1rem;
-                        margin-bottom: 20px;
-                        position: relative;
-                        min-height: 80px;
-                        border: 2px solid rgba(255,255,255,0.1);
-                        box-shadow: 0 4px 8px rgba(0,0,0,0.3);
-                        backdrop-filter: blur(5px);
-                    ">
-                        <div style="position: absolute; top: 8px; right: 8px; background: rgba(0,0,0,0.2); padding: 4px 8px; border-radius: 12px;">
-                            <span style="color: white; font-weight: bold;">#{rank}</span>
-                        </div>
-                    """, unsafe_allow_html=True)
-                    
-                    # Player header with image and name
-                    st.markdown(f"""
-                        <div style="display: flex; align-items: center; margin-bottom: 0.5rem;">
-                            {get_player_headshot_html(player['ID'], player['Player'], player_id_cache).replace('width: 60px; height: 60px;', 'width: 40px; height: 40px; border: 2px solid white;')}
-                            <div style="margin-left: 0.5rem;">
-                                <div class="player-name" style="color: white; font-weight: bold; font-size: 0.9rem; line-height: 1;">{player['Player']}</div>
-                                <div style="color: rgba(255,255,255,0.8); font-size: 0.7rem;">{player['Position']} | {player['Team']}</div>
-                            </div>
-                        </div>
-                    """, unsafe_allow_html=True)
-                    
-                    # First row of stats (FPts and Age)
-                    st.markdown(f"""
-                        <div style="display: flex; gap: 0.4rem; margin: 0.4rem 0;">
-                            <div style="flex: 1; background: rgba(255,255,255,0.1); padding: 0.25rem; border-radius: 4px; text-align: center;">
-                                <div style="color: rgba(255,255,255,0.7); font-size: 0.65rem;">FPts</div>
-                                <div style="color: white; font-weight: bold; font-size: 0.8rem;">{player['FPts']:.1f}</div>
-                            </div>
-                            <div style="flex: 1; background: rgba(255,255,255,0.1); padding: 0.25rem; border-radius: 4px; text-align: center;">
-                                <div style="color: rgba(255,255,255,0.7); font-size: 0.65rem;">Age</div>
-                                <div style="color: white; font-weight: bold; font-size: 0.8rem;">{player['Age']}</div>
-                            </div>
-                        </div>
-                    """, unsafe_allow_html=True)
-                    
-                    # Second row of stats (Salary and Contract)
-                    st.markdown(f"""
-                        <div style="display: flex; gap: 0.4rem; margin: 0.4rem 0;">
-                            <div style="flex: 1; background: rgba(255,255,255,0.1); padding: 0.25rem; border-radius: 4px; text-align: center;">
-                                <div style="color: rgba(255,255,255,0.7); font-size: 0.65rem;">Salary</div>
-                                <div style="color: white; font-weight: bold; font-size: 0.8rem;">${player['Salary']}</div>
-                            </div>
-                            <div style="flex: 1; background: rgba(255,255,255,0.1); padding: 0.25rem; border-radius: 4px; text-align: center;">
-                                <div style="color: rgba(255,255,255,0.7); font-size: 0.65rem;">Contract</div>
-                                <div style="color: white; font-weight: bold; font-size: 0.8rem;">{player['Contract']}</div>
-                            </div>
-                        </div>
-                    """, unsafe_allow_html=True)
-                    
-                    # MVP Score with progress bar
-                    st.markdown(f"""
-                        <div style="background: rgba(0,0,0,0.2); padding: 0.4rem; border-radius: 4px; margin-top: 0.4rem;">
-                            <div style="display: flex; justify-content: space-between; align-items: center;">
-                                <div style="color: rgba(255,255,255,0.7); font-size: 0.7rem;">MVP Score: <span style="color: white; font-weight: bold;">{player['MVP_Score']:.1f}</span></div>
-                                <div style="color: gold; font-size: 0.7rem;">{stars_display}</div>
-                            </div>
-                        </div>
-                    """, unsafe_allow_html=True)
-                    
-                    # Progress bar for MVP score
-                    st.markdown(f"""
-                        <div style="background: rgba(255,255,255,0.1); border-radius: 3px; height: 6px; margin-top: 0.2rem;">
-                            <div class="mvp-score-bar" style="height: 6px; background: gold; border-radius: 3px; width: {mvp_score_pct}%;"></div>
-                        </div>
-                    </div>
-                    """, unsafe_allow_html=True)
-        
+            # Display player cards with proper styling, as one section
+            render_section(MVP_PLAYER_CARD, mvp_card_frame(display_data, player_id_cache, name_to_mlb_id))
+
         with tab2:
             # Radar chart for performance breakdown
             st.write("### MVP Candidates Performance Breakdown")
@@ -1234,13 +1093,10 @@ def render():
                 
                 with col2:
                     # Calculate and display the position values
-                    position_values = {}
-                    for pos in positions:
-                        position_values[pos] = get_position_value(pos, position_counts)
-                    
+                    count_scarcity = position_scarcity(position_counts=position_counts)
                     value_df = pd.DataFrame({
-                        'Position': list(position_values.keys()),
-                        'Position Value': list(position_values.values())
+                        'Position': list(positions),
+                        'Position Value': position_values(pd.Series(list(positions)), count_scarcity).values
                     })
                     value_df = value_df.sort_values('Position Value', ascending=False)
                     
@@ -1271,8 +1127,8 @@ def render():
                     # Get normalized values for each category
                     values = []
                     for cat in categories:
-                        if cat in norm_columns:
-                            values.append(norm_columns[cat][player.name])
+                        if f'norm_{cat}' in player:
+                            values.append(player[f'norm_{cat}'])
                     
                     # Add player to radar chart
                     fig.add_trace(go.Scatterpolar(
@@ -1317,8 +1173,8 @@ def render():
             
             for _, player in top_players.iterrows():
                 for component, weight in weights.items():
-                    if component in norm_columns:
-                        score_contribution = norm_columns[component][player.name] * weight
+                    if f'norm_{component}' in player:
+                        score_contribution = player[f'norm_{component}'] * weight
                         breakdown_data.append({
                             'Player': player['Player'],
                             'Team': player['Team'],
@@ -0,0 +1,100 @@
+import streamlit as st
+import pandas as pd
+import plotly.express as px
+import metrics
+from playoff_odds import DEFAULT_SIMULATIONS, data_version, playoff_odds
+from ros_projections import projected_standings
+
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def _cached_playoff_odds(version: str, _standings: pd.DataFrame, n_sims: int) -> pd.DataFrame:
+    """Odds are keyed by the data version only; the standings frame itself is not hashed"""
+    metrics.mark_cache_miss("playoff_odds")
+    return playoff_odds(_standings, n_sims=n_sims, version=version)
+
+
+def render(standings_data: pd.DataFrame, roster_data: pd.DataFrame = None):
+    """Render Monte Carlo playoff odds and ROS projected standings for the remaining schedule"""
+    st.subheader("🎲 Playoff Odds")
+    if standings_data is None or standings_data.empty:
+        st.info("Playoff odds need standings data.")
+        return
+
+    try:
+        with metrics.cache_lookup("playoff_odds"), st.spinner("Simulating the rest of the season..."):
+            odds = _cached_playoff_odds(data_version(standings_data), standings_data, DEFAULT_SIMULATIONS)
+    except (OSError, ValueError, KeyError) as e:
+        st.warning(f"Could not simulate playoff odds: {str(e)}")
+        return
+
+    st.caption(f"{DEFAULT_SIMULATIONS:,} simulated completions of the remaining schedule. "
+               "Division winners and the best remaining records make the playoffs.")
+
+    percent_columns = ['division_pct', 'playoff_pct', 'semifinal_pct', 'final_pct', 'champion_pct']
+    table = odds[['team', 'division', 'projected_wins'] + percent_columns].copy()
+    table[percent_columns] = table[percent_columns] * 100
+    st.dataframe(
+        table,
+        column_config={
+            "team": "Team",
+            "division": "Division",
+            "projected_wins": st.column_config.NumberColumn("Proj. Wins", format="%.1f"),
+            "division_pct": st.column_config.NumberColumn("Win Division", format="%.1f%%"),
+            "playoff_pct": st.column_config.NumberColumn("Make Playoffs", format="%.1f%%"),
+            "semifinal_pct": st.column_config.NumberColumn("Semifinal", format="%.1f%%"),
+            "final_pct": st.column_config.NumberColumn("Final", format="%.1f%%"),
+            "champion_pct": st.column_config.NumberColumn("Champion", format="%.1f%%"),
+        },
+        hide_index=True,
+        use_container_width=True
+    )
+
+    seed_columns = [c for c in odds.columns if c.startswith('seed_')]
+    seeds = odds[odds['playoff_pct'] > 0].melt(
+        id_vars=['team'], value_vars=seed_columns, var_name='seed', value_name='probability'
+    )
+    seeds['seed'] = seeds['seed'].str.extract(r'(\d+)', expand=False)
+    fig = px.bar(
+        seeds,
+        x='team',
+        y='probability',
+        color='seed',
+        title='Playoff Seed Probabilities',
+        labels={'team': 'Team', 'probability': 'Probability', 'seed': 'Seed'}
+    )
+    fig.update_layout(xaxis_tickangle=-45, yaxis_tickformat='.0%')
+    st.plotly_chart(fig, use_container_width=True)
+
+    if roster_data is not None and not roster_data.empty:
+        render_projected_standings(standings_data, roster_data)
+
+
+def render_projected_standings(standings_data: pd.DataFrame, roster_data: pd.DataFrame):
+    """Render final standings projected from rest-of-season lineups"""
+    st.subheader("📈 Projected Final Standings (ROS)")
+    try:
+        projection = projected_standings(standings_data, roster_data)
+    except (OSError, ValueError, KeyError) as e:
+        st.warning(f"Could not project standings: {str(e)}")
+        return
+
+    st.caption("Each team's best weekly lineup from the rest-of-season projections, "
+               "played against the remaining schedule.")
+    st.dataframe(
+        projection[['projected_rank', 'team', 'division', 'wins', 'losses', 'projected_weekly_score',
+                    'expected_wins_remaining', 'projected_wins', 'projected_losses', 'projected_win_pct']],
+        column_config={
+            "projected_rank": "Proj. Rank",
+            "team": "Team",
+            "division": "Division",
+            "wins": "Wins",
+            "losses": "Losses",
+            "projected_weekly_score": st.column_config.NumberColumn("Proj. Weekly Score", format="%.1f"),
+            "expected_wins_remaining": st.column_config.NumberColumn("Exp. Wins Left", format="%.1f"),
+            "projected_wins": st.column_config.NumberColumn("Proj. Wins", format="%.1f"),
+            "projected_losses": st.column_config.NumberColumn("Proj. Losses", format="%.1f"),
+            "projected_win_pct": st.column_config.NumberColumn("Proj. Win %", format="%.3f"),
+        },
+        hide_index=True,
+        use_container_width=True
+    )
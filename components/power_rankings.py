@@ -1,15 +1,20 @@
 import streamlit as st
 import pandas as pd
+import tracing
+import metrics
+import league_state
 import plotly.express as px
 import plotly.graph_objects as go
 from typing import Dict, List, Optional, Tuple
 from utils import load_rankings_history
+from season_calendar import get_league_calendars
 from datetime import datetime, timedelta
 import os.path
 import html
 
 # Import team colors and IDs from prospects.py
 from components.prospects import MLB_TEAM_COLORS, MLB_TEAM_IDS
+from prospect_scores import team_prospect_scores
 
 # Load division data
 def load_division_data() -> Dict[str, str]:
@@ -30,7 +35,7 @@ def load_division_data() -> Dict[str, str]:
         
         if file_exists:
             # Load the data from CSV
-            division_df = pd.read_csv(csv_path, header=None)
+            division_df = tracing.read_csv(csv_path, header=None)
             print(f"Loaded division data with {len(division_df)} rows")
             
             for _, row in division_df.iterrows():
@@ -123,13 +128,14 @@ def calculate_points_modifier(total_points: float, all_teams_points: pd.Series)
 
     return modifier  # Returns a value between 1.0 and 1.9 on a linear scale
 
-def calculate_schedule_strength_modifier(team_name: str, current_period: int) -> float:
+def calculate_schedule_strength_modifier(team_name: str, current_period: int = None) -> float:
     """
     Calculate strength of schedule modifier based on how a team performed against good/bad teams.
 
     Args:
         team_name: The team name to calculate the modifier for
-        current_period: The current scoring period (to only include completed games)
+        current_period: The current scoring period (to only include completed games);
+            defaults to today's period from the shared season calendar
 
     Returns:
         float: A modifier between -1.0 and 1.0 where:
@@ -145,9 +151,12 @@ def calculate_schedule_strength_modifier(team_name: str, current_period: int) ->
         if not team_name:
             return 0.0
 
+        if current_period is None:
+            current_period = get_league_calendars().weekly.current()
+
         # Load schedule data with debug output
         try:
-            schedule_df = pd.read_csv("attached_assets/fantasy_baseball_schedule.csv")
+            schedule_df = tracing.read_csv("attached_assets/fantasy_baseball_schedule.csv")
             st.sidebar.info(f"Loaded schedule data with {len(schedule_df)} rows")
 
             # Show a sample of the data for debugging
@@ -304,7 +313,7 @@ def load_team_records() -> Dict[str, Dict[str, int]]:
         Dictionary mapping team names to a dictionary with 'W', 'L', and 'T' keys
     """
     try:
-        records_df = pd.read_csv('data/team_records.csv')
+        records_df = tracing.read_csv('data/team_records.csv')
         records = {}
         
         for _, row in records_df.iterrows():
@@ -549,7 +558,8 @@ def calculate_power_score(row: pd.Series, all_teams_data: pd.DataFrame) -> float
 
     return raw_power_score
 
-def render(standings_data: pd.DataFrame, power_rankings_data: dict = None, weekly_results: list = None):
+def render(standings_data: pd.DataFrame, power_rankings_data: dict = None, weekly_results: list = None,
+           roster_data: pd.DataFrame = None):
     """
     Render power rankings section
 
@@ -557,6 +567,7 @@ def render(standings_data: pd.DataFrame, power_rankings_data: dict = None, weekl
         standings_data: DataFrame containing standings data
         power_rankings_data: Optional dict of custom power rankings data from user input
         weekly_results: Optional list of weekly results data from user input
+        roster_data: Optional league rosters, for the prospect system comparison
     """
     st.header("⚾ Power Rankings")
 
@@ -837,12 +848,13 @@ def render(standings_data: pd.DataFrame, power_rankings_data: dict = None, weekl
         lambda x: hot_cold_data.get(x, {}).get('win_pct', 0.0)
     )
     
-    # Calculate raw power scores
-    rankings_df['raw_power_score'] = rankings_df.apply(lambda x: calculate_power_score(x, rankings_df), axis=1)
+    with metrics.RECOMPUTE_SECONDS.time(kind="power"):
+        # Calculate raw power scores
+        rankings_df['raw_power_score'] = rankings_df.apply(lambda x: calculate_power_score(x, rankings_df), axis=1)
 
-    # Normalize power scores where 100 is the league average
-    average_power = rankings_df['raw_power_score'].mean()
-    rankings_df['power_score'] = (rankings_df['raw_power_score'] / average_power) * 100
+        # Normalize power scores where 100 is the league average
+        average_power = rankings_df['raw_power_score'].mean()
+        rankings_df['power_score'] = (rankings_df['raw_power_score'] / average_power) * 100
 
     # Sort by normalized power score
     rankings_df = rankings_df.sort_values('power_score', ascending=False).reset_index(drop=True)
@@ -888,8 +900,9 @@ def render(standings_data: pd.DataFrame, power_rankings_data: dict = None, weekl
     )
     rankings_df.index = rankings_df.index + 1  # Start ranking from 1
 
-    # Store the calculated rankings in session state for other components to use
-    st.session_state.power_rankings_calculated = rankings_df.copy()
+    # Store the calculated rankings for other components to use; sessions with
+    # the same rankings share one frozen frame
+    st.session_state.power_rankings_calculated = league_state.share_frame(rankings_df)
     
     # Handle snapshot taking if requested
     if st.session_state.get('take_snapshot', False):
@@ -1225,14 +1238,15 @@ def render(standings_data: pd.DataFrame, power_rankings_data: dict = None, weekl
 
     # Load prospect data
     try:
-        prospect_import = pd.read_csv("attached_assets/ABL-Import.csv")
-
-        # Calculate prospect scores
         team_scores = pd.DataFrame({'team': rankings_df['team_name'].unique()})
         team_scores['power_rank'] = team_scores.index + 1
 
-        # Add prospect data processing here.  This is a placeholder, needs real logic.
-        team_scores['prospect_score'] = 0  # Placeholder for actual prospect scores
+        # Average score of each team's ranked prospects (0 without roster data)
+        if roster_data is not None and not roster_data.empty:
+            prospect_avg = team_prospect_scores(roster_data).set_index('team')['avg_score']
+            team_scores['prospect_score'] = team_scores['team'].map(prospect_avg).fillna(0.0)
+        else:
+            team_scores['prospect_score'] = 0.0
 
         # Create comparison visualization
         fig2 = go.Figure()
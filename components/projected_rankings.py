@@ -1,5 +1,6 @@
 import streamlit as st
 import pandas as pd
+import tracing
 import unicodedata
 import os
 import plotly.express as px
@@ -112,7 +113,7 @@ def render(roster_data: pd.DataFrame):
         st.header("📊 Projected Rankings")
 
         # Load division data
-        divisions_df = pd.read_csv("attached_assets/divisions.csv", header=None, names=['division', 'team'])
+        divisions_df = tracing.read_csv("attached_assets/divisions.csv", header=None, names=['division', 'team'])
         division_mapping = dict(zip(divisions_df['team'], divisions_df['division']))
 
         # Division strength ratings (higher means tougher division)
@@ -138,8 +139,8 @@ def render(roster_data: pd.DataFrame):
             st.error("Projection files not found. Please check the file paths.")
             return
 
-        hitters_proj = pd.read_csv(hitters_file)
-        pitchers_proj = pd.read_csv(pitchers_file)
+        hitters_proj = tracing.read_csv(hitters_file)
+        pitchers_proj = tracing.read_csv(pitchers_file)
 
         # Normalize names and calculate fantasy points
         hitters_proj['Name'] = hitters_proj['Name'].apply(normalize_name)
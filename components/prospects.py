@@ -1,6 +1,10 @@
 from pathlib import Path
 import streamlit as st
 import pandas as pd
+import tracing
+from card_templates import CardTemplate, render_section, section_html
+from prospect_scores import match_prospects, team_prospect_scores
+from headshots import FALLBACK_MLBAMID, headshot_sources, mlbam_id_index, resolve_mlbam_ids
 import plotly.express as px
 import plotly.graph_objects as go
 import numpy as np
@@ -81,33 +85,18 @@ def render(roster_data: pd.DataFrame):
 
 
     # Load division data
-    divisions_df = pd.read_csv("attached_assets/divisions.csv", header=None, names=['division', 'team'])
+    divisions_df = tracing.read_csv("attached_assets/divisions.csv", header=None, names=['division', 'team'])
     division_mapping = dict(zip(divisions_df['team'], divisions_df['division']))
 
-    # Load MLB player IDs and create cache
-    mlb_ids_df = pd.read_csv("attached_assets/mlb_player_ids-2.csv")
-    player_id_cache = create_player_id_cache(mlb_ids_df)
+    # Normalized name -> MLBAM ID, for headshots
+    player_id_cache = mlbam_id_index()
 
     try:
-        # Load and process prospect scores
-        prospect_import = pd.read_csv("attached_assets/ABL-Import.csv", na_values=['NA', ''], keep_default_na=True)
-        # Create normalized name column for merging
-        prospect_import['clean_name'] = prospect_import['Name'].fillna('').astype(str).apply(normalize_name)
-
-        # Get all players that could be prospects (MINORS, ACTIVE, or RESERVE)
-        prospects_data = roster_data.copy()
-        prospects_data['clean_name'] = prospects_data['player_name'].fillna('').astype(str).apply(normalize_name)
-        prospects_data = prospects_data.drop_duplicates(subset=['clean_name'], keep='first')
-
-        # Merge prospect import data with current roster data
-        # Use prospect import as primary source to ensure correct team assignments after trades
-        ranked_prospects = pd.merge(
-            prospect_import[['Name', 'Position', 'MLB Team', 'Score', 'Rank', 'clean_name']],
-            prospects_data,
-            left_on='clean_name',
-            right_on='clean_name',
-            how='inner'  # Only include players that exist in both datasets
-        )
+        # Join every rostered player against the prospect import; a name on
+        # several rosters keeps its first roster row
+        ranked_prospects = match_prospects(roster_data)
+        first_rows = ranked_prospects.groupby('clean_name')['roster_row'].transform('min')
+        ranked_prospects = ranked_prospects[ranked_prospects['roster_row'] == first_rows]
 
         # Fill missing values and clean up - use prospect import data as primary source
         ranked_prospects['prospect_score'] = ranked_prospects['Score'].fillna(0)
@@ -126,7 +115,9 @@ def render(roster_data: pd.DataFrame):
             keep='first'
         )
 
-        # Rename columns for consistency - avoid renaming to existing column names
+        # Rename columns for consistency - the roster's own position/mlb_team
+        # columns are dropped first so the names stay unique
+        ranked_prospects = ranked_prospects.drop(columns=['position', 'mlb_team'], errors='ignore')
         ranked_prospects.rename(columns={
             'MLB Team': 'mlb_team',
             'final_position': 'position'
@@ -153,11 +144,7 @@ def render(roster_data: pd.DataFrame):
             (ranked_prospects['prospect_score'] > 0)
         ]
         
-        team_scores = current_team_prospects.groupby('team').agg({
-            'prospect_score': ['sum', 'mean', 'count']
-        }).reset_index()
-
-        team_scores.columns = ['team', 'total_score', 'avg_score', 'prospect_count']
+        team_scores = team_prospect_scores(matched=current_team_prospects)
         team_scores = team_scores.sort_values('avg_score', ascending=False)
         team_scores = team_scores.reset_index(drop=True)
         team_scores.index = team_scores.index + 1
@@ -219,36 +206,6 @@ def render(roster_data: pd.DataFrame):
         st.error(f"Full traceback: {traceback.format_exc()}")
         return
 
-def create_player_id_cache(mlb_ids_df: pd.DataFrame) -> Dict[str, str]:
-    """Create a cache of normalized player names to MLBAMID"""
-    cache = {}
-    try:
-        for _, row in mlb_ids_df.iterrows():
-            try:
-                # Handle empty or NA values
-                if pd.isna(row['Last']) or pd.isna(row['First']) or pd.isna(row['MLBAMID']):
-                    continue
-
-                # Create full name from First and Last
-                name = normalize_name(f"{row['First']} {row['Last']}")
-
-                # Only add if we have a valid name and MLBAMID
-                if name and str(row['MLBAMID']).strip():
-                    cache[name] = str(row['MLBAMID'])
-
-                    # Add alternative name formats
-                    alt_name = normalize_name(f"{row['Last']}, {row['First']}")
-                    if alt_name:
-                        cache[alt_name] = str(row['MLBAMID'])
-
-            except Exception as e:
-                st.warning(f"Error processing player ID row: {str(e)}")
-                continue
-
-    except Exception as e:
-        st.error(f"Error creating player ID cache: {str(e)}")
-    return cache
-
 def get_headshot_url(mlbam_id: str) -> str:
     """Generate MLB/MILB headshot URL from player ID"""
     try:
@@ -276,87 +233,68 @@ def get_headshot_url(mlbam_id: str) -> str:
         st.warning(f"Error generating headshot URL for ID {mlbam_id}: {str(e)}")
         return ""
 
-def get_player_headshot_html(player_name: str, player_id_cache: Dict[str, str]) -> str:
-    """Get player headshot HTML if available"""
-    try:
-        # Default fallback MLBAMID for missing headshots
-        fallback_mlbamid = "805805"
+HEADSHOT_URL = ("https://img.mlbstatic.com/mlb-photos/image/upload/w_213,d_people:generic:headshot:silo:current.png,"
+                "q_auto:best,f_auto/v1/people/{mlbam_id}/headshot/67/current")
+
+PLAYER_HEADSHOT = CardTemplate("player_headshot", """
+    <div class="player-headshot">
+        <img src="{headshot_url}"
+            style="width: {size}px; height: {size}px; border-radius: 50%; object-fit: cover;{border}"
+            alt="{player_name} headshot"
+            onerror="this.onerror=null; this.src='""" + HEADSHOT_URL.format(mlbam_id=FALLBACK_MLBAMID) + """';">
+    </div>
+""")
+
+
+def headshot_column(player_names: pd.Series, player_id_cache: Dict[str, str], size: int = 60,
+                    border: str = "") -> pd.Series:
+    """Headshot HTML for every player at once (cached thumbnails; fallback image for unknown players)"""
+    names = player_names.fillna('').astype(str)
+    mlbam_ids = resolve_mlbam_ids(names, player_id_cache)
+    frame = pd.DataFrame({
+        'headshot_url': headshot_sources(mlbam_ids, size),
+        'player_name': names,
+        'size': size,
+        'border': f" border: {border};" if border else "",
+    }, index=player_names.index)
+    return pd.Series(PLAYER_HEADSHOT.render_rows(frame), index=player_names.index)
 
-        # Normalize name for lookup
-        search_name = normalize_name(player_name)
 
-        # Get player's MLBAMID if available, otherwise use fallback
-        mlbam_id = player_id_cache.get(search_name, fallback_mlbamid)
-
-        # Use a single fallback URL that's known to be reliable
-        headshot_url = f"https://img.mlbstatic.com/mlb-photos/image/upload/w_213,d_people:generic:headshot:silo:current.png,q_auto:best,f_auto/v1/people/{mlbam_id}/headshot/67/current"
+def get_player_headshot_html(player_name: str, player_id_cache: Dict[str, str]) -> str:
+    """Get player headshot HTML if available"""
+    return headshot_column(pd.Series([player_name]), player_id_cache).iat[0]
 
-        return f"""<div class="player-headshot">
-            <img src="{headshot_url}" 
-                style="width: 60px; height: 60px; border-radius: 50%; object-fit: cover;" 
-                alt="{player_name} headshot"
-                onerror="this.onerror=null; this.src='https://img.mlbstatic.com/mlb-photos/image/upload/w_213,d_people:generic:headshot:silo:current.png,q_auto:best,f_auto/v1/people/805805/headshot/67/current';">
-            </div>"""
+TEAM_PROSPECT_ROW = CardTemplate("team_prospect_row", """
+    <div style="padding: 1rem; margin: 0.5rem 0; background: rgba(26, 28, 35, 0.5); border-radius: 8px;">
+    <div style="display: flex; align-items: center; gap: 1rem;">
+        {headshot_html}
+        <div style="flex-grow: 1;">
+            <div style="font-size: 1rem; color: white; font-weight: 500; margin-bottom: 0.25rem;">{player_name}</div>
+            <div style="font-size: 0.9rem; color: rgba(255, 255, 255, 0.7);">Position: {clean_position}</div>
+            <div style="font-size: 0.9rem; color: white; font-weight: 700;">Score: {prospect_score:.2f}</div>
+        </div>
+    </div></div>
+""")
 
-    except Exception as e:
-        st.warning(f"Error generating headshot HTML for {player_name}: {str(e)}")
-        # Still use the fallback image instead of initials
-        return f"""<div class="player-headshot">
-            <img src="https://img.mlbstatic.com/mlb-photos/image/upload/w_213,d_people:generic:headshot:silo:current.png,q_auto:best,f_auto/v1/people/805805/headshot/67/current" 
-                style="width: 60px; height: 60px; border-radius: 50%; object-fit: cover;" 
-                alt="Default headshot">
-            </div>"""
 
 def get_team_prospects_html(prospects_df: pd.DataFrame, player_id_cache: Dict[str, str], global_max_score: float, global_min_score: float) -> str:
     """Generate HTML for team prospects list"""
     # Calculate total and average scores
     total_score = prospects_df['prospect_score'].sum()
-    avg_score = prospects_df['prospect_score'].mean()
     num_prospects = len(prospects_df)
 
-    # Start with container div
-    html_parts = [
-        '<div style="background: rgba(26, 28, 35, 0.3); border-radius: 8px; padding: 1rem;">',
-        f'<div style="font-size: 0.9rem; color: #fafafa; margin-bottom: 1rem;">'
-        f'Total System Score: {total_score:.2f} ({num_prospects} prospects)'
-        '</div>'
-    ]
-
-    # Add each prospect
-    for _, prospect in prospects_df.iterrows():
-        # Ensure we get clean string values
-        player_name = str(prospect.get('player_name', ''))
-        position = str(prospect.get('position', ''))
-        prospect_score = float(prospect.get('prospect_score', 0))
-
-        # Get headshot HTML
-        headshot_html = get_player_headshot_html(player_name, player_id_cache)
-
-        # Start prospect card
-        html_parts.append('<div style="padding: 1rem; margin: 0.5rem 0; background: rgba(26, 28, 35, 0.5); border-radius: 8px;">')
-        html_parts.append('<div style="display: flex; align-items: center; gap: 1rem;">')
-
-        # Add headshot
-        html_parts.append(headshot_html)
-
-        # Add prospect info
-        # Clean up position by taking the first occurrence of position code
-        clean_position = str(position).replace('position ', '').split('Name:')[0].strip().split()[0]
-        html_parts.append(
-            f'<div style="flex-grow: 1;">'
-            f'<div style="font-size: 1rem; color: white; font-weight: 500; margin-bottom: 0.25rem;">{player_name}</div>'
-            f'<div style="font-size: 0.9rem; color: rgba(255, 255, 255, 0.7);">Position: {clean_position}</div>'
-            f'<div style="font-size: 0.9rem; color: white; font-weight: 700;">Score: {prospect_score:.2f}</div>'
-            f'</div>'
-        )
-
-        # Close flex and card divs
-        html_parts.append('</div></div>')
-
-    # Close container div
-    html_parts.append('</div>')
-
-    return '\n'.join(html_parts)
+    # Clean up position by taking the first occurrence of position code
+    cards = pd.DataFrame({
+        'headshot_html': headshot_column(prospects_df['player_name'], player_id_cache),
+        'player_name': prospects_df['player_name'].fillna('').astype(str),
+        'clean_position': prospects_df['position'].astype(str).map(
+            lambda position: (position.replace('position ', '').split('Name:')[0].split() or [''])[0]),
+        'prospect_score': prospects_df['prospect_score'].astype(float),
+    })
+    header = ('<div style="background: rgba(26, 28, 35, 0.3); border-radius: 8px; padding: 1rem;">'
+              '<div style="font-size: 0.9rem; color: #fafafa; margin-bottom: 1rem;">'
+              f'Total System Score: {total_score:.2f} ({num_prospects} prospects)</div>')
+    return section_html(TEAM_PROSPECT_ROW, cards, header=header, footer='</div>')
 
 def get_score_color(score: float, max_score: float, min_score: float) -> str:
     """Calculate color for prospect score on a red-to-blue gradient scale"""
@@ -375,6 +313,69 @@ def get_rank_color(rank: int, total_ranks: int = 100) -> str:
     g = 20  # Keep green low for vibrant colors
     return f"#{r:02x}{g:02x}{b:02x}"
 
+TEAM_PREVIEW_CARD = CardTemplate("team_preview_card", """
+    <div class="prospect-card" style="
+        background: linear-gradient(135deg, {primary} 0%, {secondary} 100%);
+        border-radius: 10px; padding: 1.5rem; margin: 1rem 0; position: relative;
+        box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);">
+        <div style="
+            position: absolute; left: -10px; top: -10px; width: 40px; height: 40px;
+            background: {primary}; border-radius: 50%; display: flex; align-items: center;
+            justify-content: center; color: white; font-weight: bold;
+            border: 2px solid {secondary}; box-shadow: 0 2px 4px rgba(0, 0, 0, 0.2);">#{rank}</div>
+        {logo_html}
+        <div class="prospect-content" style="position: relative; z-index: 2;">
+            <div style="flex-grow: 1;">
+                <div style="font-size: 1.2rem; font-weight: 600; color: white; margin-bottom: 0.25rem;">{player_name}</div>
+                <div style="font-size: 0.9rem; color: rgba(255, 255, 255, 0.8);">
+                    <span style="font-weight: 700;">Score: {prospect_score:.2f}</span>
+                    <div style="margin-top: 0.5rem; font-size: 0.9rem; color: rgba(255,255,255,0.7);">
+                        GM: {gm_name}
+                    </div>
+                </div>
+            </div>
+        </div>
+    </div>
+""")
+
+PLAYER_PREVIEW_CARD = CardTemplate("player_preview_card", """
+    <div class="prospect-card" style="
+        background: linear-gradient(135deg, {primary}80 0%, {secondary}80 100%);
+        border-radius: 10px; padding: 1.5rem; margin: 1rem 0; position: relative;
+        box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);">
+        <div style="
+            position: absolute; left: -10px; top: -10px; width: 40px; height: 40px;
+            background: {primary}; border-radius: 50%; display: flex; align-items: center;
+            justify-content: center; color: white; font-weight: bold;
+            border: 2px solid {secondary}; box-shadow: 0 2px 4px rgba(0, 0, 0, 0.2);">#{rank}</div>
+        {logo_html}
+        <div class="prospect-content" style="position: relative; z-index: 2;">
+            {headshot_html}
+            <div style="flex-grow: 1;">
+                <div style="font-size: 1.2rem; font-weight: 600; color: white; margin-bottom: 0.25rem;">{player_name}</div>
+                <div style="font-size: 0.9rem; color: rgba(255, 255, 255, 0.8);">
+                    <span>{team_name}</span>
+                    <span style="margin: 0 0.5rem;">|</span>
+                    <span>{position}</span>
+                    <span style="margin: 0 0.5rem;">|</span>
+                    <span>Score: {prospect_score:.2f}</span>
+                </div>
+            </div>
+        </div>
+    </div>
+""")
+
+
+def team_logo_html(team_name: str, size: int, opacity: float, right: int) -> str:
+    """Team cap logo positioned on the right edge of a card ('' for unknown teams)"""
+    team_id = MLB_TEAM_IDS.get(team_name, '')
+    if not team_id:
+        return ""
+    return (f'<img src="https://www.mlbstatic.com/team-logos/team-cap-on-dark/{team_id}.svg" '
+            f'style="position: absolute; right: {right}px; top: 50%; transform: translateY(-50%); '
+            f'width: {size}px; height: {size}px; opacity: {opacity}; z-index: 1;" alt="Team Logo">')
+
+
 def render_prospect_preview(prospect, rank: int, team_prospects=None, player_id_cache=None, global_max_score=None, global_min_score=None):
     """Render a single prospect preview card with enhanced styling and animations"""
     # Ensure we have valid team information
@@ -383,115 +384,25 @@ def render_prospect_preview(prospect, rank: int, team_prospects=None, player_id_
         if "Shaw" in str(prospect.get('player_name', '')):
             team_name = "Pittsburgh Pirates"
 
-    # Get team colors and logo
+    # Get team colors
     team_colors = MLB_TEAM_COLORS.get(team_name, {'primary': '#1a1c23', 'secondary': '#2d2f36', 'accent': '#FFFFFF'})
-    team_id = MLB_TEAM_IDS.get(team_name, '')
-    logo_url = f"https://www.mlbstatic.com/team-logos/team-cap-on-dark/{team_id}.svg" if team_id else ""
 
     # Check if this is a team card (has '#' in player_name)
     is_team_card = '#' in str(prospect.get('player_name', ''))
 
     if is_team_card:
-        # Get GM name
-        gm_name = GM_MAPPING.get(team_name, 'Unknown')
-
-        # Team card styling
-        st.markdown(f"""
-            <div class="prospect-card" style="
-                background: linear-gradient(135deg, {team_colors['primary']} 0%, {team_colors['secondary']} 100%);
-                border-radius: 10px;
-                padding: 1.5rem;
-                margin: 1rem 0;
-                position: relative;
-                box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);">
-                <div style="
-                    position: absolute;
-                    left: -10px;
-                    top: -10px;
-                    width: 40px;
-                    height: 40px;
-                    background: {team_colors['primary']};
-                    border-radius: 50%;
-                    display: flex;
-                    align-items: center;
-                    justify-content: center;
-                    color: white;
-                    font-weight: bold;
-                    border: 2px solid {team_colors['secondary']};
-                    box-shadow: 0 2px 4px rgba(0, 0, 0, 0.2);">#{rank}</div>
-                {f'<img src="{logo_url}" style="position: absolute; right: 20px; top: 50%; transform: translateY(-50%); width: 120px; height: 120px; opacity: 1; z-index: 1;" alt="Team Logo">' if logo_url else ''}
-                <div class="prospect-content" style="position: relative; z-index: 2;">
-                    <div style="flex-grow: 1;">
-                        <div style="
-                            font-size: 1.2rem;
-                            font-weight: 600;
-                            color: white;
-                            margin-bottom: 0.25rem;
-                            ">{prospect['player_name']}</div>
-                        <div style="
-                            font-size: 0.9rem;
-                            color: rgba(255, 255, 255, 0.8);
-                            ">
-                            <span style="font-weight: 700;">Score: {prospect['prospect_score']:.2f}</span>
-                            <div style="margin-top: 0.5rem; font-size: 0.9rem; color: rgba(255,255,255,0.7);">
-                                GM: {gm_name}
-                            </div>
-                        </div>
-                    </div>
-                </div>
-            </div>
-        """, unsafe_allow_html=True)
-
+        card = TEAM_PREVIEW_CARD.render(
+            primary=team_colors['primary'], secondary=team_colors['secondary'], rank=rank,
+            logo_html=team_logo_html(team_name, 120, 1, 20), player_name=prospect['player_name'],
+            prospect_score=float(prospect['prospect_score']), gm_name=GM_MAPPING.get(team_name, 'Unknown'))
     else:
-        # Individual player card styling remains the same
-        headshot_html = get_player_headshot_html(prospect['player_name'], player_id_cache)
-        st.markdown(f"""
-            <div class="prospect-card" style="
-                background: linear-gradient(135deg, {team_colors['primary']}80 0%, {team_colors['secondary']}80 100%);
-                border-radius: 10px;
-                padding: 1.5rem;
-                margin: 1rem 0;
-                position: relative;
-                box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);">
-                <div style="
-                    position: absolute;
-                    left: -10px;
-                    top: -10px;
-                    width: 40px;
-                    height: 40px;
-                    background: {team_colors['primary']};
-                    border-radius: 50%;
-                    display: flex;
-                    align-items: center;
-                    justify-content: center;
-                    color: white;
-                    font-weight: bold;
-                    border: 2px solid {team_colors['secondary']};
-                    box-shadow: 0 2px 4px rgba(0, 0, 0, 0.2);">#{rank}</div>
-                {f'<img src="{logo_url}" style="position: absolute; right: 10px; top: 50%; transform: translateY(-50%); width: 60px; height: 60px; opacity: 0.15; z-index: 1;" alt="Team Logo">' if logo_url else ''}
-                <div class="prospect-content" style="position: relative; z-index: 2;">
-                    {headshot_html}
-                    <div style="flex-grow: 1;">
-                        <div style="
-                            font-size: 1.2rem;
-                            font-weight: 600;
-                            color: white;
-                            margin-bottom: 0.25rem;
-                            ">{prospect['player_name']}</div>
-                        <div style="
-                            font-size: 0.9rem;
-                            color: rgba(255, 255, 255, 0.8);
-                            ">
-                            <span>{team_name}</span>
-                            <span style="margin: 0 0.5rem;">|</span>
-                            <span>{prospect['position']}</span>
-                            <span style="margin: 0 0.5rem;">|</span>
-                            <span>Score: {prospect['prospect_score']:.2f}</span>
-                        </div>
-                    </div>
-                </div>
-            </div>
-        """, unsafe_allow_html=True)
+        card = PLAYER_PREVIEW_CARD.render(
+            primary=team_colors['primary'], secondary=team_colors['secondary'], rank=rank,
+            logo_html=team_logo_html(team_name, 60, 0.15, 10),
+            headshot_html=get_player_headshot_html(prospect['player_name'], player_id_cache),
+            player_name=prospect['player_name'], team_name=team_name, position=prospect['position'],
+            prospect_score=float(prospect['prospect_score']))
+    st.markdown(card, unsafe_allow_html=True)
 
     # Show team prospects in expander if available
     if team_prospects is not None:
@@ -612,6 +523,31 @@ def create_sunburst_visualization(team_scores: pd.DataFrame, division_mapping: D
 
     return fig
 
+TOP_100_CARD = CardTemplate("top_100_card", """
+    <div class="prospect-card hover-card" style="
+        background: linear-gradient(135deg, {primary}80 0%, {secondary}80 100%);
+        border-radius: 8px; padding: 0.75rem; margin: 0.5rem 0; position: relative;
+        box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1);
+        transition: transform 0.3s ease, box-shadow 0.3s ease;
+        animation-delay: {delay}s;">
+        <div style="
+            position: absolute; left: -8px; top: -8px; width: 30px; height: 30px;
+            background: {primary}; border-radius: 50%; display: flex; align-items: center;
+            justify-content: center; color: white; font-size: 0.9rem; font-weight: bold;
+            border: 2px solid {secondary}; box-shadow: 0 1px 3px rgba(0, 0, 0, 0.2);">#{rank}</div>
+        {logo_html}
+        <div class="prospect-content" style="position: relative; z-index: 2; display: flex; align-items: center; gap: 0.75rem;">
+            {headshot_html}
+            <div style="flex-grow: 1;">
+                <div style="font-size: 0.95rem; font-weight: 600; color: white;">{player_name}</div>
+                <div style="font-size: 0.8rem; color: rgba(255,255,255,0.8); margin-top: 0.1rem;">
+                    {team} | {position} | Score: {prospect_score:.2f}
+                </div>
+            </div>
+        </div>
+    </div>
+""")
+
 def render_top_100_header(ranked_prospects: pd.DataFrame, player_id_cache: Dict[str, str], global_max_score: float, global_min_score: float):
     """Render the animated TOP 100 header and scrollable list"""
     st.markdown("""
@@ -709,59 +645,26 @@ def render_top_100_header(ranked_prospects: pd.DataFrame, player_id_cache: Dict[
             st.markdown("<p style='text-align: center; color: #999;'>Showing Top 10 prospects</p>", 
                       unsafe_allow_html=True)
         
-        # Display the specified number of prospects
-        for idx, prospect in enumerate(top_100.head(display_count).itertuples(), 1):
-            # Add a small delay to animation for staggered effect
-            delay = min(idx * 0.05, 0.5)
-            
-            # Get team colors and logo
-            team_colors = MLB_TEAM_COLORS.get(prospect.team,
-                                         {'primary': '#1a1c23', 'secondary': '#2df36', 'accent': '#FFFFFF'})
-            team_id = MLB_TEAM_IDS.get(prospect.team, '')
-            logo_url = f"https://www.mlbstatic.com/team-logos/team-cap-on-dark/{team_id}.svg" if team_id else ""
-
-            # Get headshot HTML
-            headshot_html = get_player_headshot_html(prospect.player_name, player_id_cache)
-
-            st.markdown(f"""
-                <div class="prospect-card hover-card" style="
-                    background: linear-gradient(135deg, {team_colors['primary']}80 0%, {team_colors['secondary']}80 100%);
-                    border-radius: 8px;
-                    padding: 0.75rem;
-                    margin: 0.5rem 0;
-                    position: relative;
-                    box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1);
-                    transition: transform 0.3s ease, box-shadow 0.3s ease;
-                    animation-delay: {delay}s;">
-                    <div style="
-                        position: absolute;
-                        left: -8px;
-                        top: -8px;
-                        width: 30px;
-                        height: 30px;
-                        background: {team_colors['primary']};
-                        border-radius: 50%;
-                        display: flex;
-                        align-items: center;
-                        justify-content: center;
-                        color: white;
-                        font-size: 0.9rem;
-                        font-weight: bold;
-                        border: 2px solid {team_colors['secondary']};
-                        box-shadow: 0 1px 3px rgba(0, 0, 0, 0.2);">#{idx}</div>
-                    {f'<img src="{logo_url}" style="position: absolute; right: 8px; top: 50%; transform: translateY(-50%); width: 40px; height: 40px; opacity: 0.15; z-index: 1;" alt="Team Logo">' if logo_url else ''}
-                    <div class="prospect-content" style="position: relative; z-index: 2; display: flex; align-items: center; gap: 0.75rem;">
-                        {headshot_html}
-                        <div style="flex-grow: 1;">
-                            <div style="font-size: 0.95rem; font-weight: 600; color: white;">{prospect.player_name}</div>
-                            <div style="font-size: 0.8rem; color: rgba(255,255,255,0.8); margin-top: 0.1rem;">
-                                {prospect.team} | {str(prospect.position).replace('position ', '').split(',')[0].strip()} | Score: {prospect.prospect_score:.2f}
-                            </div>
-                        </div>
-                    </div>
-                </div>
-            """, unsafe_allow_html=True)
-            
+        # Display the specified number of prospects as one section
+        shown = top_100.head(display_count)
+        teams = shown['team'].astype(str)
+        default_colors = {'primary': '#1a1c23', 'secondary': '#2df36', 'accent': '#FFFFFF'}
+        team_colors = teams.map(lambda team: MLB_TEAM_COLORS.get(team, default_colors))
+        cards = pd.DataFrame({
+            'primary': team_colors.str['primary'],
+            'secondary': team_colors.str['secondary'],
+            # Small animation delay for a staggered effect
+            'delay': [min(idx * 0.05, 0.5) for idx in range(1, len(shown) + 1)],
+            'rank': range(1, len(shown) + 1),
+            'logo_html': teams.map(lambda team: team_logo_html(team, 40, 0.15, 8)),
+            'headshot_html': headshot_column(shown['player_name'], player_id_cache),
+            'player_name': shown['player_name'],
+            'team': teams,
+            'position': shown['position'].astype(str).str.replace('position ', '').str.split(',').str[0].str.strip(),
+            'prospect_score': shown['prospect_score'].astype(float),
+        }, index=shown.index)
+        render_section(TOP_100_CARD, cards)
+
         # If not showing all, display a message about remaining prospects
         if not st.session_state.show_all_prospects:
             remaining = len(top_100) - display_count
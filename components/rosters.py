@@ -1,5 +1,10 @@
 import streamlit as st
 import pandas as pd
+import change_detection
+import schemas
+from schemas import HITTER_PROJECTIONS_FILE, PITCHER_PROJECTIONS_FILE
+from prospect_scores import match_prospects, team_prospect_scores
+from headshots import headshot_sources, mlbam_id_index, resolve_mlbam_ids
 import plotly.express as px
 from typing import Dict, Optional
 # Import necessary functions directly so we don't need to import the projected_rankings module
@@ -7,6 +12,10 @@ from typing import Dict, Optional
 import unicodedata
 from components.prospects import normalize_name, MLB_TEAM_COLORS, MLB_TEAM_IDS, get_player_headshot_html
 
+
+# Per-player projected points, recomputed only for teams whose roster changed
+PROJECTED_POINTS_CACHE = change_detection.TeamResultCache("projected_points")
+
 # Added function definitions from projected_rankings.py to make this module self-contained
 def calculate_hitter_points(row: pd.Series) -> float:
     """Calculate fantasy points for a hitter"""
@@ -384,21 +393,11 @@ def render(roster_data: pd.DataFrame):
 
     try:
         # Load projections data with proper NA handling
-        hitters_proj = pd.read_csv("attached_assets/batx-hitters.csv", na_values=['NA', ''], keep_default_na=True)
-        pitchers_proj = pd.read_csv("attached_assets/oopsy-pitchers-2.csv", na_values=['NA', ''], keep_default_na=True)
-
-        # Load prospect scores
-        prospect_import = pd.read_csv("attached_assets/ABL-Import.csv", na_values=['NA', ''], keep_default_na=True)
-        prospect_import['Name'] = prospect_import['Name'].fillna('').astype(str).apply(normalize_name)
-
-        # Load MLB player IDs for headshots
-        mlb_ids_df = pd.read_csv("attached_assets/mlb_player_ids-2.csv")
-        player_id_cache = {}
-        for _, row in mlb_ids_df.iterrows():
-            if pd.notna(row['Last']) and pd.notna(row['First']) and pd.notna(row['MLBAMID']):
-                name = normalize_name(f"{row['First']} {row['Last']}")
-                if name:
-                    player_id_cache[name] = str(row['MLBAMID'])
+        hitters_proj = schemas.load_csv(HITTER_PROJECTIONS_FILE).copy()
+        pitchers_proj = schemas.load_csv(PITCHER_PROJECTIONS_FILE).copy()
+
+        # Normalized name -> MLBAM ID, for headshots
+        player_id_cache = mlbam_id_index()
 
         # Normalize names in projection data
         hitters_proj['Name'] = hitters_proj['Name'].fillna('').astype(str).apply(normalize_name)
@@ -418,30 +417,33 @@ def render(roster_data: pd.DataFrame):
         # Filter data by selected team and create a copy
         team_roster = roster_data[roster_data['team'] == selected_team].copy()
         team_roster['clean_name'] = team_roster['player_name'].fillna('').astype(str).apply(normalize_name)
-
-        # Calculate projected points for each player
-        team_roster['projected_points'] = team_roster['player_name'].apply(
-            lambda x: calculate_total_points(x, hitters_proj, pitchers_proj)
+        # Fetch any missing headshot thumbnails for the whole team in one batch
+        headshot_sources(resolve_mlbam_ids(team_roster['player_name'], player_id_cache))
+
+        # Calculate projected points for each player (reused until this team's roster changes)
+        points_by_team = PROJECTED_POINTS_CACHE.get_many(
+            team_roster,
+            lambda team, roster: dict(zip(
+                roster['player_name'],
+                roster['player_name'].apply(lambda x: calculate_total_points(x, hitters_proj, pitchers_proj))
+            )),
+            dependency_key=change_detection.file_version(HITTER_PROJECTIONS_FILE, PITCHER_PROJECTIONS_FILE)
         )
+        team_roster['projected_points'] = team_roster['player_name'].map(points_by_team.get(str(selected_team), {})).fillna(0)
 
 
-        # Calculate prospect stats
-        minors_players = team_roster[team_roster['status'].str.upper() == 'MINORS'].copy()
-        minors_players = pd.merge(
-            minors_players,
-            prospect_import[['Name', 'Score']],  # Changed from 'Unique score' to 'Score'
-            left_on='clean_name',
-            right_on='Name',
-            how='left'
-        )
+        # Calculate prospect stats (average over all minor leaguers, unranked ones scoring 0)
+        minors_players = match_prospects(team_roster, statuses=('MINORS',), how='left')
+        team_prospects = team_prospect_scores(team_roster, matched=minors_players).iloc[0]
 
         # Create prospect score lookup dictionary
-        prospect_scores = dict(zip(minors_players['clean_name'], minors_players['Score']))  # Changed from 'Unique score' to 'Score'
+        prospect_scores = dict(zip(minors_players['clean_name'], minors_players['Score']))
 
         prospect_stats = {
-            'total_score': minors_players['Score'].fillna(0).sum(),  # Changed from 'Unique score' to 'Score'
-            'avg_score': minors_players['Score'].fillna(0).mean(),   # Changed from 'Unique score' to 'Score'
-            'count': len(minors_players)
+            'total_score': team_prospects['total_score'],
+            'avg_score': (team_prospects['total_score'] / team_prospects['player_count']
+                          if team_prospects['player_count'] else 0.0),
+            'count': int(team_prospects['player_count'])
         }
 
         # Calculate salary info
@@ -571,6 +573,7 @@ def render(roster_data: pd.DataFrame):
         # Position breakdown
         st.subheader("Position Distribution")
         position_counts = team_roster['position'].value_counts()
+        position_counts = position_counts[position_counts > 0]
         st.bar_chart(position_counts)
         
         # Team Ranking Trends
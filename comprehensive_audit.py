@@ -20,7 +20,7 @@ def comprehensive_audit():
     
     # Get current roster data
     data = fetch_api_data()
-    roster_data = data['roster_data']
+    roster_data = data['roster_data'].copy()
     roster_data['clean_name'] = roster_data['player_name'].fillna('').astype(str).apply(normalize_name)
     
     # Create current team mapping
@@ -1,7 +1,11 @@
 import pandas as pd
 from typing import Dict, List, Union
 import unicodedata
+from functools import lru_cache
 import streamlit as st
+import tracing
+from player_universe import as_universe
+from schemas import ROSTERS
 
 class DataProcessor:
     def normalize_name(self, name: str) -> str:
@@ -23,81 +27,88 @@ class DataProcessor:
             st.error(f"Error normalizing name '{name}': {str(e)}")
             return str(name).strip().lower() if name else ""
 
-    def process_rosters(self, roster_data: Dict, player_ids: Dict) -> pd.DataFrame:
-        """Process roster data and combine with player information"""
-        try:
-            roster_list = []
-            seen_players = {}  # Track players globally across all teams
+    def normalize_names(self, names: pd.Series) -> pd.Series:
+        """Vectorized normalize_name for a whole Series of names"""
+        names = names.fillna('').astype(str).str.lower()
+        names = names.str.normalize('NFKD').str.encode('ascii', 'ignore').str.decode('ascii')
+
+        # "Last, First" -> "First Last"
+        parts = names.str.split(',', n=1, expand=True, regex=False)
+        if parts.shape[1] > 1:
+            has_comma = parts[1].notna()
+            names = names.where(~has_comma, parts[1].str.strip() + ' ' + parts[0].str.strip())
+
+        names = names.str.split('(', n=1, regex=False).str[0].str.strip()
+        names = names.str.split(' - ', n=1, regex=False).str[0].str.strip()
+        names = names.str.replace('.', '', regex=False)
+        return names.str.replace(r'\s+', ' ', regex=True).str.strip()
+
+    @tracing.traced("process.rosters", "process")
+    def process_rosters(self, roster_data: Dict, player_ids) -> pd.DataFrame:
+        """
+        Process roster data and combine with player information.
+
+        The whole payload is flattened into one frame, player details are joined
+        by Fantrax ID, and players are deduped league-wide on their normalized
+        name (first team wins). Columns are typed by schemas.ROSTERS (categorical
+        position/status/mlb_team, Arrow-backed team and player_name).
 
+        Args:
+            roster_data: getTeamRosters payload
+            player_ids: PlayerUniverse or raw getPlayerIds dict
+        """
+        try:
             if not roster_data or not isinstance(roster_data, dict):
                 st.error("Invalid roster data format")
-                return pd.DataFrame(columns=['team', 'player_name', 'position', 'status', 'salary', 'mlb_team'])
-
-            rosters = roster_data.get('rosters', {})
-            st.sidebar.info(f"Processing roster data for {len(rosters)} teams")
-            
-            # Debug: Show team names being processed
-            team_names = [team_data.get('teamName', 'Unknown') for team_data in rosters.values()]
-            st.sidebar.info(f"Teams found: {', '.join(team_names[:5])}{'...' if len(team_names) > 5 else ''}")
-
-            for team_id, team_data in rosters.items():
-                team_name = team_data.get('teamName', 'Unknown')
-                roster_items = team_data.get('rosterItems', [])
-
-                for player in roster_items:
-                    if not isinstance(player, dict):
-                        continue
-
-                    player_id = player.get('id')
-                    player_details = player_ids.get(player_id, {})
-
-                    # Get player name and normalize
-                    player_name = player_details.get('name', player.get('name', 'Unknown')).strip()
-                    if not player_name or player_name == 'Unknown':
-                        continue
-
-                    normalized_name = self.normalize_name(player_name)
-                    if not normalized_name:
-                        continue
-
-                    # Skip if we've already seen this player
-                    if normalized_name in seen_players:
-                        continue
-
-                    # Process status
-                    status = player.get('status', 'Active')
-                    if status.lower() == 'na':
-                        status = 'Minors'
-
-                    player_info = {
-                        'team': team_name,
-                        'player_name': player_name,
-                        'position': player.get('position', 'N/A'),
-                        'status': status,
-                        'salary': player.get('salary', 0.0),
-                        'mlb_team': player_details.get('team', 'N/A')
-                    }
-                    roster_list.append(player_info)
-                    seen_players[normalized_name] = True
-
-            # Create DataFrame
-            df = pd.DataFrame(roster_list) if roster_list else pd.DataFrame(
-                columns=['team', 'player_name', 'position', 'status', 'salary', 'mlb_team']
-            )
-            
-            st.sidebar.success(f"Processed {len(df)} total players across all teams")
-            if len(df) > 0:
-                unique_teams = df['team'].nunique()
-                st.sidebar.info(f"Data contains {unique_teams} unique teams with roster assignments")
+                return self._empty_rosters()
 
-            return df
+            rosters = roster_data.get('rosters', {}) or {}
+            items = []
+            teams = []
+            for team_data in rosters.values():
+                roster_items = [item for item in team_data.get('rosterItems', []) if isinstance(item, dict)]
+                items.extend(roster_items)
+                teams.extend([team_data.get('teamName', 'Unknown')] * len(roster_items))
+            if not items:
+                return self._empty_rosters()
+
+            flat = pd.DataFrame.from_records(items, columns=['id', 'name', 'position', 'status', 'salary'])
+            flat['team'] = teams
+            flat['id'] = flat['id'].astype(str)
+
+            # Keyed join against the player universe
+            players = as_universe(player_ids).to_frame()
+            flat = flat.merge(players, how='left', left_on='id', right_index=True, suffixes=('', '_universe'))
+
+            player_name = flat['name_universe'].where(flat['name_universe'].notna() & (flat['name_universe'] != ''),
+                                                      flat['name'])
+            flat['player_name'] = player_name.fillna('Unknown').astype(str).str.strip()
+            flat['clean_name'] = self.normalize_names(flat['player_name'])
+            keep = (flat['player_name'] != '') & (flat['player_name'] != 'Unknown') & (flat['clean_name'] != '')
+            flat = flat[keep].drop_duplicates(subset=['clean_name'], keep='first')
+
+            status = flat['status'].fillna('Active').astype(str)
+            status = status.mask(status.str.lower() == 'na', 'Minors')
+
+            df = pd.DataFrame({
+                'team': flat['team'].astype(str),
+                'player_name': flat['player_name'],
+                'position': flat['position'].fillna('N/A').astype(str),
+                'status': status,
+                'salary': pd.to_numeric(flat['salary'], errors='coerce').fillna(0.0),
+                'mlb_team': flat['team_universe'].astype(object).fillna('N/A'),
+            }).reset_index(drop=True)
+            return ROSTERS.apply(df)
 
         except Exception as e:
             st.error(f"Error processing roster data: {str(e)}")
-            return pd.DataFrame(
-                columns=['team', 'player_name', 'position', 'status', 'salary', 'mlb_team']
-            )
+            return self._empty_rosters()
 
+    @staticmethod
+    def _empty_rosters() -> pd.DataFrame:
+        return pd.DataFrame(columns=['team', 'player_name', 'position', 'status', 'salary', 'mlb_team'])
+
+    @tracing.traced("process.league_info", "process")
     def process_league_info(self, data: Dict) -> Dict:
         """Process league information data"""
         try:
@@ -133,21 +144,20 @@ class DataProcessor:
                 'scoring_period': 'N/A'
             }
 
+    @tracing.traced("process.standings", "process")
     def process_standings(self, standings_data: List) -> pd.DataFrame:
         """
         Process standings data into a DataFrame with enhanced fields for power rankings
+
+        The payload's key spellings are detected once per key set (see
+        detect_standings_schema); records, streaks and derived columns are then
+        parsed column-wise.
         """
         try:
-            # Debug raw standings data
-            st.sidebar.info("Processing API standings data...")
-            
             if not standings_data:
                 st.sidebar.error("No standings data received from API")
-                return pd.DataFrame(
-                    columns=['team_name', 'team_id', 'rank', 'wins', 'losses', 'ties', 'winning_pct', 
-                             'games_back', 'points_for', 'points_against', 'streak', 'fptsf']
-                )
-                
+                return self._empty_standings()
+
             # Handle non-list data
             if not isinstance(standings_data, list):
                 st.sidebar.error(f"Unexpected standings data format: {type(standings_data)}")
@@ -157,150 +167,63 @@ class DataProcessor:
                     st.sidebar.info(f"Extracted standings from dictionary: found {len(standings_data)} teams")
                 # If it's still not a list, create an empty DataFrame
                 if not isinstance(standings_data, list):
-                    return pd.DataFrame(
-                        columns=['team_name', 'team_id', 'rank', 'wins', 'losses', 'ties', 'winning_pct', 
-                                'games_back', 'points_for', 'points_against', 'streak', 'fptsf']
-                    )
-
-            standings_list = []
-
-            for i, team in enumerate(standings_data):
-                # Skip non-dictionary team data
-                if not isinstance(team, dict):
-                    continue
-                
-                # Extract team name - handle different key formats from API
-                team_name = team.get('teamName', team.get('team_name', 'Unknown'))
-                if team_name == 'Unknown' and 'name' in team:
-                    team_name = team.get('name', 'Unknown')
-                
-                # Debug the first few team records to understand structure
-                if i < 2:
-                    st.sidebar.success(f"Processing team data for: {team_name}")
-                    if 'points' in team:
-                        st.sidebar.info(f"Points format: {team.get('points', 'Not available')}")
-                    if 'pointsFor' in team:
-                        st.sidebar.info(f"Points For: {team.get('pointsFor', 0)}")
-                    if 'fptsf' in team:
-                        st.sidebar.info(f"FPTSF: {team.get('fptsf', 0)}")
-                
-                # Try to parse record - different formats possible
-                wins, losses, ties = 0, 0, 0
-                
-                # Format 1: 'points' string as "W-L-T"
-                if 'points' in team:
-                    points_str = str(team.get('points', '0-0-0'))
-                    try:
-                        parts = points_str.split('-')
-                        if len(parts) >= 3:
-                            wins = int(parts[0])
-                            losses = int(parts[1])
-                            ties = int(parts[2])
-                    except (ValueError, AttributeError, IndexError):
-                        # If parsing fails, try other methods
-                        pass
-                
-                # Format 2: Separate wins/losses/ties fields
-                if wins == 0 and losses == 0 and ties == 0:
-                    wins = int(team.get('wins', 0))
-                    losses = int(team.get('losses', 0))
-                    ties = int(team.get('ties', 0))
-                
-                # Calculate win percentage if not provided
-                win_pct = team.get('winPercentage', 0.0)
-                if win_pct == 0.0 and (wins + losses + ties > 0):
-                    win_pct = (wins + (ties * 0.5)) / (wins + losses + ties)
-                
-                # Handle streak info
-                streak_desc = str(team.get('streakDescription', team.get('streak', '')))
-                streak_direction = streak_desc[0] if streak_desc and len(streak_desc) > 0 else ''
-                streak_count = 0
-                if len(streak_desc) > 1 and streak_desc[1:].isdigit():
-                    try:
-                        streak_count = int(streak_desc[1:])
-                    except (ValueError, IndexError):
-                        streak_count = 0
-                
-                # Handle various points formats
-                points_for = 0.0
-                # Try multiple possible keys for points
-                for key in ['pointsFor', 'points_for', 'fpts', 'fptsf']:
-                    if key in team:
-                        try:
-                            value = team.get(key, 0)
-                            if value:
-                                points_for = float(value)
-                                break
-                        except (ValueError, TypeError):
-                            continue
-                
-                # Points against
-                points_against = 0.0
-                for key in ['pointsAgainst', 'points_against', 'fptsa']:
-                    if key in team:
-                        try:
-                            value = team.get(key, 0)
-                            if value:
-                                points_against = float(value)
-                                break
-                        except (ValueError, TypeError):
-                            continue
-                
-                # Create enhanced team stats dictionary with all possible data points
-                team_stats = {
-                    'team_name': team_name,
-                    'team_id': team.get('teamId', team.get('team_id', 'N/A')),
-                    'rank': int(team.get('rank', i+1)),  # Fall back to index+1 if no rank
-                    'wins': wins,
-                    'losses': losses,
-                    'ties': ties,
-                    'winning_pct': float(win_pct),
-                    'games_back': float(team.get('gamesBack', 0.0)),
-                    'points_for': points_for,
-                    'points_against': points_against,
-                    'streak_direction': streak_direction,
-                    'streak_count': streak_count,
-                    'streak': streak_desc,
-                    # Add Fantasy Points Scored For - critical for power rankings
-                    'fptsf': float(team.get('fptsf', points_for))
-                }
-                standings_list.append(team_stats)
+                    return self._empty_standings()
 
-            # Create DataFrame from processed data
-            if not standings_list:
+            # Fall back to list position + 1 when a team has no rank
+            records = [team for team in standings_data if isinstance(team, dict)]
+            positions = [i + 1 for i, team in enumerate(standings_data) if isinstance(team, dict)]
+            if not records:
                 st.sidebar.warning("No valid team data found in standings response")
-                return pd.DataFrame(
-                    columns=['team_name', 'team_id', 'rank', 'wins', 'losses', 'ties', 'winning_pct', 
-                            'games_back', 'points_for', 'points_against', 'streak', 'fptsf']
-                )
-            
-            df = pd.DataFrame(standings_list)
+                return self._empty_standings()
+
+            raw = pd.DataFrame.from_records(records)
+            schema = detect_standings_schema(frozenset(raw.columns))
+
+            wins, losses, ties = self._parse_records(raw, schema)
+            games = wins + losses + ties
+
+            win_pct = _column(raw, 'winPercentage', 0.0)
+            win_pct = win_pct.where((win_pct != 0) | (games == 0), (wins + ties * 0.5) / games.where(games > 0, 1))
+
+            streak = _coalesce(raw, schema['streak']).fillna('').astype(str)
+            streak_tail = streak.str[1:]
+            streak_count = pd.to_numeric(streak_tail.where(streak_tail.str.isdigit()), errors='coerce').fillna(0).astype(int)
+
+            points_for = _first_nonzero(raw, schema['points_for'])
+            points_against = _first_nonzero(raw, schema['points_against'])
+            fptsf = _column(raw, 'fptsf', float('nan')).fillna(points_for) if 'fptsf' in raw.columns else points_for
+
+            rank = _column(raw, 'rank', float('nan')).fillna(pd.Series(positions, index=raw.index, dtype=float))
+
+            df = pd.DataFrame({
+                'team_name': _coalesce(raw, schema['team_name']).fillna('Unknown'),
+                'team_id': _coalesce(raw, schema['team_id']).fillna('N/A'),
+                'rank': rank,
+                'wins': wins,
+                'losses': losses,
+                'ties': ties,
+                'winning_pct': win_pct.astype(float),
+                'games_back': _column(raw, 'gamesBack', 0.0).astype(float),
+                'points_for': points_for,
+                'points_against': points_against,
+                'streak_direction': streak.str[:1],
+                'streak_count': streak_count,
+                'streak': streak,
+                # Fantasy Points Scored For - critical for power rankings
+                'fptsf': fptsf.astype(float),
+            })
 
             # Calculate additional metrics for power rankings
-            if not df.empty:
-                # Total games played
-                df['games_played'] = df['wins'] + df['losses'] + df['ties']
-                
-                # Points per game (safely handle division by zero)
-                df['points_per_game'] = df.apply(
-                    lambda row: row['points_for'] / max(row['games_played'], 1), 
-                    axis=1
-                )
-                
-                # Initialize total_points and weeks_played for power rankings calculation
-                df['total_points'] = df['points_for']
-                df['weeks_played'] = df['games_played'].apply(lambda x: max(x, 1))  # Avoid division by zero
-                
-                # Make sure we have a 'fptsf' column even if it wasn't in the data
-                if 'fptsf' not in df.columns:
-                    df['fptsf'] = df['points_for']
-                
-                # Success message if we have team data
-                st.sidebar.success(f"Successfully processed standings data for {len(df)} teams")
-            
+            df['games_played'] = games
+            df['points_per_game'] = df['points_for'] / games.clip(lower=1)
+            df['total_points'] = df['points_for']
+            df['weeks_played'] = games.clip(lower=1)  # Avoid division by zero
+
+            st.sidebar.success(f"Successfully processed standings data for {len(df)} teams")
+
             # Ensure rank is numeric and sort by it
             df['rank'] = pd.to_numeric(df['rank'], errors='coerce').fillna(0).astype(int)
-            df = df.sort_values('rank', ascending=True).reset_index(drop=True)
+            df = df.sort_values('rank', ascending=True, kind='stable').reset_index(drop=True)
 
             return df
 
@@ -308,7 +231,84 @@ class DataProcessor:
             st.error(f"Error processing standings: {str(e)}")
             import traceback
             st.sidebar.error(f"Traceback: {traceback.format_exc()}")
-            return pd.DataFrame(
-                columns=['team_name', 'team_id', 'rank', 'wins', 'losses', 'ties', 'winning_pct', 
-                        'games_back', 'points_for', 'points_against', 'streak', 'fptsf']
-            )
\ No newline at end of file
+            return self._empty_standings()
+
+    @staticmethod
+    def _parse_records(raw: pd.DataFrame, schema: Dict) -> tuple:
+        """(wins, losses, ties) from a "W-L-T" 'points' string, else from separate columns"""
+        zeros = pd.Series(0, index=raw.index, dtype=int)
+        wins, losses, ties = zeros, zeros, zeros
+
+        if schema['record_string']:
+            # Same records int() would accept from str.split('-'): three integer fields, extras ignored
+            parsed = raw['points'].astype(str).str.extract(RECORD_PATTERN)
+            parsed = parsed.apply(pd.to_numeric, errors='coerce')
+            parsed = parsed.where(parsed.notna().all(axis=1), 0).astype(int)
+            wins, losses, ties = parsed[0], parsed[1], parsed[2]
+
+        # Separate wins/losses/ties fields when no record could be parsed
+        no_record = (wins == 0) & (losses == 0) & (ties == 0)
+        if no_record.any():
+            wins = wins.where(~no_record, _column(raw, 'wins', 0).astype(int))
+            losses = losses.where(~no_record, _column(raw, 'losses', 0).astype(int))
+            ties = ties.where(~no_record, _column(raw, 'ties', 0).astype(int))
+        return wins, losses, ties
+
+    @staticmethod
+    def _empty_standings() -> pd.DataFrame:
+        return pd.DataFrame(columns=STANDINGS_COLUMNS)
+
+
+# Columns of an empty process_standings() result
+STANDINGS_COLUMNS = ['team_name', 'team_id', 'rank', 'wins', 'losses', 'ties', 'winning_pct',
+                     'games_back', 'points_for', 'points_against', 'streak', 'fptsf']
+
+# "W-L-T" record string
+RECORD_PATTERN = r'^\s*\+?(\d+)\s*-\s*\+?(\d+)\s*-\s*\+?(\d+)\s*(?:-|$)'
+
+# Accepted key spellings per standings field, in priority order
+STANDINGS_KEY_VARIANTS = {
+    'team_name': ('teamName', 'team_name', 'name'),
+    'team_id': ('teamId', 'team_id'),
+    'streak': ('streakDescription', 'streak'),
+    'points_for': ('pointsFor', 'points_for', 'fpts', 'fptsf'),
+    'points_against': ('pointsAgainst', 'points_against', 'fptsa'),
+}
+
+
+@lru_cache(maxsize=32)
+def detect_standings_schema(keys: frozenset) -> Dict:
+    """
+    Which key spellings a standings payload uses, decided once per key set.
+
+    Returns:
+        dict: field -> tuple of present keys (priority order), plus
+              'record_string' (True if records come as a "W-L-T" 'points' string)
+    """
+    schema = {field: tuple(k for k in variants if k in keys) for field, variants in STANDINGS_KEY_VARIANTS.items()}
+    schema['record_string'] = 'points' in keys
+    return schema
+
+
+def _column(raw: pd.DataFrame, key: str, default) -> pd.Series:
+    """Numeric column with missing values (or a missing column) set to default"""
+    if key not in raw.columns:
+        return pd.Series(default, index=raw.index)
+    return pd.to_numeric(raw[key], errors='coerce').fillna(default)
+
+
+def _coalesce(raw: pd.DataFrame, keys: tuple) -> pd.Series:
+    """First non-null value across keys, row by row"""
+    result = pd.Series(None, index=raw.index, dtype=object)
+    for key in keys:
+        result = result.fillna(raw[key])
+    return result
+
+
+def _first_nonzero(raw: pd.DataFrame, keys: tuple) -> pd.Series:
+    """First numeric, non-zero value across keys, row by row (0.0 if none)"""
+    result = pd.Series(float('nan'), index=raw.index)
+    for key in keys:
+        values = pd.to_numeric(raw[key], errors='coerce')
+        result = result.fillna(values.where(values != 0))
+    return result.fillna(0.0)
@@ -0,0 +1,252 @@
+from typing import Any, Dict, Optional, Tuple
+import hashlib
+import json
+import os
+import threading
+import time
+import metrics
+
+# Process-wide request budget for Fantrax: sustained rate and burst size
+RATE_LIMIT_PER_SECOND = float(os.getenv("ABL_FANTRAX_RATE_PER_SECOND", 4))
+RATE_LIMIT_BURST = int(os.getenv("ABL_FANTRAX_RATE_BURST", 8))
+# Longest a caller waits for a token before using the last-known-good payload
+RATE_LIMIT_MAX_WAIT_SECONDS = 5.0
+
+# Consecutive failures that open the circuit, and how long it stays open
+CIRCUIT_FAILURE_THRESHOLD = 5
+CIRCUIT_RESET_SECONDS = 60
+
+# Last-known-good payloads survive restarts here
+LAST_KNOWN_GOOD_DIR = "data/cache/fantrax_lkg"
+
+# Endpoints whose last-known-good payload is keyed by only some params. Rosters
+# are requested for today's daily period, so a key including the period would
+# miss yesterday's rosters on the first outage of a new day.
+LAST_KNOWN_GOOD_KEY_PARAMS = {
+    'getTeamRosters': ('leagueId',),
+}
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+CIRCUIT_STATE = metrics.Gauge(
+    "abl_fantrax_circuit_open",
+    "1 while the Fantrax circuit breaker is open or half-open, 0 when closed",
+)
+RATE_LIMITED = metrics.Counter(
+    "abl_fantrax_rate_limited_total",
+    "Fantrax requests that could not get a rate-limit token in time",
+    ["endpoint"],
+)
+STALE_FALLBACKS = metrics.Counter(
+    "abl_fantrax_stale_fallbacks_total",
+    "Responses served from the last-known-good payload instead of Fantrax",
+    ["endpoint", "reason"],
+)
+
+
+class TokenBucket:
+    """Thread-safe token bucket: ``rate`` tokens per second up to ``capacity``"""
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self, timeout: float = 0.0) -> bool:
+        """
+        Take one token, waiting up to ``timeout`` seconds for it.
+
+        Returns:
+            bool: True if a token was taken
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return True
+                wait = (1 - self._tokens) / self.rate if self.rate > 0 else timeout
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            time.sleep(min(wait, remaining))
+
+
+class CircuitBreaker:
+    """
+    Closed -> open after ``failure_threshold`` consecutive failures; open -> half-open
+    after ``reset_seconds``, where a single trial request decides whether to close
+    again or re-open.
+    """
+
+    def __init__(self, failure_threshold: int = CIRCUIT_FAILURE_THRESHOLD, reset_seconds: float = CIRCUIT_RESET_SECONDS):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.last_error: Optional[str] = None
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    def allow_request(self) -> bool:
+        with self._lock:
+            if self.state == CLOSED:
+                return True
+            if self.state == OPEN and time.monotonic() - self.opened_at >= self.reset_seconds:
+                self.state = HALF_OPEN
+                self._trial_in_flight = False
+            if self.state == HALF_OPEN and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self.state = CLOSED
+            self.failures = 0
+            self._trial_in_flight = False
+            self.last_error = None
+        CIRCUIT_STATE.set(0)
+
+    def record_failure(self, error: str = ""):
+        with self._lock:
+            self.failures += 1
+            self.last_error = error or self.last_error
+            if self.state == HALF_OPEN or self.failures >= self.failure_threshold:
+                self.state = OPEN
+                self.opened_at = time.monotonic()
+                self._trial_in_flight = False
+        if self.state != CLOSED:
+            CIRCUIT_STATE.set(1)
+
+    def cancel_trial(self):
+        """Release a half-open trial slot that ended up not sending a request"""
+        with self._lock:
+            self._trial_in_flight = False
+
+    def seconds_until_retry(self) -> float:
+        if self.state != OPEN:
+            return 0.0
+        return max(0.0, self.reset_seconds - (time.monotonic() - self.opened_at))
+
+
+class LastKnownGoodStore:
+    """
+    Most recent successful payload per (endpoint, params), in memory and on disk
+    (params limited to LAST_KNOWN_GOOD_KEY_PARAMS for the endpoints listed there)
+    """
+
+    def __init__(self, directory: str = LAST_KNOWN_GOOD_DIR):
+        self.directory = directory
+        self._payloads: Dict[str, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(endpoint: str, params: Optional[Dict[str, Any]] = None) -> str:
+        params = params or {}
+        if endpoint in LAST_KNOWN_GOOD_KEY_PARAMS:
+            params = {name: params[name] for name in LAST_KNOWN_GOOD_KEY_PARAMS[endpoint] if name in params}
+        encoded = json.dumps(params, sort_keys=True, default=str)
+        return f"{endpoint}-{hashlib.sha1(encoded.encode('utf-8')).hexdigest()[:12]}"
+
+    def put(self, endpoint: str, params: Optional[Dict[str, Any]], payload: Any):
+        key = self.key(endpoint, params)
+        with self._lock:
+            self._payloads[key] = (time.time(), payload)
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            path = os.path.join(self.directory, f"{key}.json")
+            with open(f"{path}.tmp", "w", encoding="utf-8") as f:
+                json.dump({'saved_at': time.time(), 'payload': payload}, f)
+            os.replace(f"{path}.tmp", path)
+        except (OSError, TypeError, ValueError):
+            pass
+
+    def get(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Optional[Tuple[float, Any]]:
+        """Return (saved_at, payload) or None"""
+        key = self.key(endpoint, params)
+        with self._lock:
+            if key in self._payloads:
+                return self._payloads[key]
+        try:
+            with open(os.path.join(self.directory, f"{key}.json"), encoding="utf-8") as f:
+                stored = json.load(f)
+        except (OSError, ValueError):
+            return None
+        entry = (float(stored.get('saved_at', 0)), stored.get('payload'))
+        with self._lock:
+            self._payloads.setdefault(key, entry)
+        return entry
+
+
+class FantraxGuard:
+    """Shared rate limiter + circuit breaker + last-known-good store for all Fantrax calls"""
+
+    def __init__(self):
+        self.bucket = TokenBucket(RATE_LIMIT_PER_SECOND, RATE_LIMIT_BURST)
+        self.breaker = CircuitBreaker()
+        self.last_known_good = LastKnownGoodStore()
+
+    def before_request(self, endpoint: str) -> Optional[str]:
+        """
+        Gate a request.
+
+        Returns:
+            str: Reason to skip the request ('circuit_open' or 'rate_limited'), or None to proceed
+        """
+        if not self.breaker.allow_request():
+            return "circuit_open"
+        if not self.bucket.acquire(timeout=RATE_LIMIT_MAX_WAIT_SECONDS):
+            self.breaker.cancel_trial()
+            RATE_LIMITED.inc(endpoint=endpoint)
+            return "rate_limited"
+        return None
+
+    def record_success(self, endpoint: str, params: Optional[Dict[str, Any]], payload: Any = None):
+        """Close the circuit and remember ``payload`` (unless None) as last-known-good"""
+        self.breaker.record_success()
+        if payload is not None:
+            self.last_known_good.put(endpoint, params, payload)
+
+    def record_failure(self, error: str = ""):
+        self.breaker.record_failure(error)
+
+    def fallback(self, endpoint: str, params: Optional[Dict[str, Any]], reason: str) -> Optional[Any]:
+        """Last-known-good payload for this request, or None if there is none"""
+        entry = self.last_known_good.get(endpoint, params)
+        if entry is None:
+            return None
+        STALE_FALLBACKS.inc(endpoint=endpoint, reason=reason)
+        return entry[1]
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            'state': self.breaker.state,
+            'failures': self.breaker.failures,
+            'retry_in': self.breaker.seconds_until_retry(),
+            'last_error': self.breaker.last_error,
+        }
+
+
+_guard: Optional[FantraxGuard] = None
+_guard_lock = threading.Lock()
+
+
+def get_guard() -> FantraxGuard:
+    """Process-wide guard shared by every FantraxAPI instance and Streamlit session"""
+    global _guard
+    with _guard_lock:
+        if _guard is None:
+            _guard = FantraxGuard()
+        return _guard
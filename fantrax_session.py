@@ -0,0 +1,242 @@
+import requests
+from typing import Any, Dict, Optional
+from requests.adapters import HTTPAdapter
+import json
+import os
+import threading
+import time
+import metrics
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional, stdlib json still works
+    orjson = None
+
+LOGIN_URL = "https://www.fantrax.com/login"
+
+# Where authenticated cookies (e.g. JSESSIONID) are persisted between restarts
+COOKIE_CACHE_PATH = os.getenv("ABL_FANTRAX_COOKIE_PATH", "data/.fantrax_session.json")
+
+# Upper bound on how long a login is trusted when the cookies carry no expiry
+SESSION_TTL_SECONDS = int(os.getenv("ABL_FANTRAX_SESSION_TTL_SECONDS", 12 * 3600))
+
+# Connection pool sizing for the shared session (concurrent Streamlit sessions
+# plus the refresh worker all go through it)
+POOL_CONNECTIONS = 4
+POOL_MAXSIZE = 16
+
+# After a rejected login, wait this long before trying again so bad
+# credentials don't turn every request into a login attempt
+LOGIN_RETRY_SECONDS = 60
+
+FANTRAX_LOGINS = metrics.Counter(
+    "abl_fantrax_logins_total",
+    "Fantrax login attempts by result (success/rejected)",
+    ["result"],
+)
+
+
+class FantraxSessionManager:
+    """
+    One pooled, authenticated requests.Session shared by every FantraxAPI in the process.
+
+    Login happens at most once per cookie lifetime: cookies are persisted to disk
+    with an expiry, reloaded on startup, and a fresh login is only performed when
+    they are missing, expired, or a request comes back 401.
+    """
+
+    def __init__(self, username: Optional[str], password: Optional[str],
+                 cookie_path: str = COOKIE_CACHE_PATH, ttl: int = SESSION_TTL_SECONDS):
+        self.username = username
+        self.password = password
+        self.cookie_path = cookie_path
+        self.ttl = ttl
+        self.expires_at: float = 0.0
+        self.login_count = 0
+        self.last_failed_login: float = 0.0
+        self._lock = threading.RLock()
+
+        # No transport-level retries: every HTTP request is one rate-limit token,
+        # and failures reach the circuit breaker (fantrax_guard) immediately
+        adapter = HTTPAdapter(max_retries=0, pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE)
+        self.session = requests.Session()
+        self.session.mount("https://", adapter)
+
+    @property
+    def has_credentials(self) -> bool:
+        return bool(self.username and self.password)
+
+    def is_authenticated(self) -> bool:
+        return time.time() < self.expires_at
+
+    def ensure_authenticated(self) -> bool:
+        """
+        Make sure the shared session carries valid login cookies.
+
+        Returns:
+            bool: True if the session is authenticated (from memory, disk or a new login)
+        """
+        if not self.has_credentials:
+            return False
+        with self._lock:
+            if self.is_authenticated():
+                return True
+            if self._load_cookies():
+                return True
+            if time.time() - self.last_failed_login < LOGIN_RETRY_SECONDS:
+                return False
+            return self.login()
+
+    def login(self) -> bool:
+        """
+        POST credentials to Fantrax and persist the resulting cookies.
+
+        Raises:
+            requests.exceptions.RequestException: If the login request itself fails
+                (this also starts the LOGIN_RETRY_SECONDS backoff)
+        """
+        with self._lock:
+            self.session.cookies.clear()
+            try:
+                response = self.session.post(
+                    LOGIN_URL,
+                    data={'username': self.username, 'password': self.password},
+                    timeout=15
+                )
+                response.raise_for_status()
+            except requests.exceptions.RequestException:
+                self.last_failed_login = time.time()
+                raise
+            self.login_count += 1
+
+            # Check if login was successful by looking for session cookies or redirects
+            if 'JSESSIONID' not in self.session.cookies and response.url == LOGIN_URL:
+                self.expires_at = 0.0
+                self.last_failed_login = time.time()
+                FANTRAX_LOGINS.inc(result="rejected")
+                return False
+
+            FANTRAX_LOGINS.inc(result="success")
+            self.expires_at = self._cookie_expiry()
+            self._save_cookies()
+            return True
+
+    def invalidate(self):
+        """Forget the current login (memory and disk)"""
+        with self._lock:
+            self.session.cookies.clear()
+            self.expires_at = 0.0
+            try:
+                os.remove(self.cookie_path)
+            except OSError:
+                pass
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        Send a request through the shared session, re-authenticating once on 401.
+
+        Logins go through ensure_authenticated, so the LOGIN_RETRY_SECONDS
+        backoff applies and a failed login never raises out of the request;
+        if re-authentication fails, the original 401 response is returned.
+
+        Concurrent 401s log in once: the login state is noted before sending,
+        and a thread that finds it changed after taking the lock retries with
+        the cookies another thread just obtained instead of logging in again.
+        """
+        self._try_authenticate()
+        login_state = (self.login_count, self.expires_at)
+        response = self.session.request(method, url, **kwargs)
+        if response.status_code == 401 and self.has_credentials:
+            with self._lock:
+                if (self.login_count, self.expires_at) == login_state:
+                    self.invalidate()
+                    authenticated = self._try_authenticate()
+                else:
+                    authenticated = self.is_authenticated()
+            if authenticated:
+                response = self.session.request(method, url, **kwargs)
+        return response
+
+    def _try_authenticate(self) -> bool:
+        try:
+            return self.ensure_authenticated()
+        except requests.exceptions.RequestException:
+            return False
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    def _cookie_expiry(self) -> float:
+        """Earliest cookie expiry, capped at now + ttl"""
+        expiry = time.time() + self.ttl
+        for cookie in self.session.cookies:
+            if cookie.expires:
+                expiry = min(expiry, float(cookie.expires))
+        return expiry
+
+    def _save_cookies(self):
+        try:
+            directory = os.path.dirname(self.cookie_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            payload = {
+                'username': self.username,
+                'expires_at': self.expires_at,
+                'cookies': [
+                    {'name': c.name, 'value': c.value, 'domain': c.domain, 'path': c.path, 'expires': c.expires}
+                    for c in self.session.cookies
+                ]
+            }
+            tmp_path = f"{self.cookie_path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(payload, f)
+            os.chmod(tmp_path, 0o600)
+            os.replace(tmp_path, self.cookie_path)
+        except OSError:
+            # Persistence is an optimisation; the in-memory session still works
+            pass
+
+    def _load_cookies(self) -> bool:
+        """Restore persisted cookies if they belong to this user and have not expired"""
+        try:
+            with open(self.cookie_path, encoding="utf-8") as f:
+                payload: Dict[str, Any] = json.load(f)
+        except (OSError, ValueError):
+            return False
+
+        if payload.get('username') != self.username or time.time() >= float(payload.get('expires_at', 0)):
+            return False
+
+        self.session.cookies.clear()
+        for c in payload.get('cookies', []):
+            self.session.cookies.set(c['name'], c['value'], domain=c.get('domain'), path=c.get('path', '/'),
+                                     expires=c.get('expires'))
+        if not len(self.session.cookies):
+            return False
+        self.expires_at = float(payload['expires_at'])
+        return True
+
+
+def decode_json(response: requests.Response) -> Any:
+    """
+    Decode a JSON response body, with orjson when it is installed.
+
+    Raises:
+        ValueError: If the body is not valid JSON (orjson.JSONDecodeError subclasses it)
+    """
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+_manager: Optional[FantraxSessionManager] = None
+_manager_lock = threading.Lock()
+
+
+def get_session_manager() -> FantraxSessionManager:
+    """Process-wide session manager using FANTRAX_USERNAME / FANTRAX_PASSWORD"""
+    global _manager
+    with _manager_lock:
+        if _manager is None:
+            _manager = FantraxSessionManager(os.getenv('FANTRAX_USERNAME'), os.getenv('FANTRAX_PASSWORD'))
+        return _manager
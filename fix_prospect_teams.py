@@ -18,7 +18,7 @@ def fix_prospect_teams():
     
     # Get current roster data
     data = fetch_api_data()
-    roster_data = data['roster_data']
+    roster_data = data['roster_data'].copy()
     roster_data['clean_name'] = roster_data['player_name'].fillna('').astype(str).apply(normalize_name)
     
     # Create mapping of player clean_name to current team
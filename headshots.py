@@ -0,0 +1,311 @@
+import pandas as pd
+import requests
+from typing import Dict, Iterable, Optional
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import base64
+import io
+import os
+import threading
+import time
+import metrics
+import tracing
+from change_detection import file_version
+from prospect_scores import normalize_names
+
+try:
+    from PIL import Image
+except ImportError:  # pragma: no cover - Pillow is optional, pages fall back to origin URLs
+    Image = None
+
+PLAYER_IDS_FILE = "attached_assets/mlb_player_ids-2.csv"
+
+# Where the image for an MLBAM ID comes from. An http(s) URL template is the
+# live origin; anything else is a local directory of <mlbam_id>.<ext> files
+# (a stand-in origin for offline use and testing).
+HEADSHOT_ORIGIN = os.getenv(
+    "ABL_HEADSHOT_ORIGIN",
+    "https://img.mlbstatic.com/mlb-photos/image/upload/w_240,d_people:generic:headshot:silo:current.png,"
+    "q_auto:best,f_auto/v1/people/{mlbam_id}/headshot/67/current"
+)
+
+# Thumbnails are stored as WebP at these square sizes (px)
+THUMBNAIL_SIZES = (60, 120)
+WEBP_QUALITY = 80
+
+# Disk cache, evicted least recently used first once it grows past the limit
+HEADSHOT_CACHE_DIR = os.getenv("ABL_HEADSHOT_CACHE_DIR", "data/cache/headshots")
+HEADSHOT_CACHE_MAX_BYTES = int(os.getenv("ABL_HEADSHOT_CACHE_MAX_BYTES", 32 * 1024 * 1024))
+
+# Data URIs kept in memory so reruns don't touch the disk
+MEMORY_CACHE_ENTRIES = 2048
+
+# Origin fetches: parallel downloads per batch, per-request timeout, and how
+# long a missing image / an unreachable origin is not retried
+FETCH_WORKERS = 8
+FETCH_TIMEOUT_SECONDS = 5
+MISSING_RETRY_SECONDS = 6 * 3600
+ORIGIN_RETRY_SECONDS = 60
+
+# Shown for players without a known MLBAM ID
+FALLBACK_MLBAMID = "805805"
+
+HEADSHOT_REQUESTS = metrics.Counter(
+    "abl_headshot_requests_total",
+    "Headshot thumbnail lookups by result (memory/disk hit, fetched, unavailable)",
+    ["result"],
+)
+
+
+@lru_cache(maxsize=2)
+def _mlbam_id_index(version: tuple) -> Dict[str, str]:
+    ids = tracing.read_csv(PLAYER_IDS_FILE, encoding='utf-8-sig', dtype={'MLBAMID': str})
+    ids = ids.dropna(subset=['First', 'Last', 'MLBAMID'])
+    ids = ids[ids['MLBAMID'].str.strip() != '']
+    mlbam_ids = ids['MLBAMID'].str.strip().str.split('.').str[0]
+    first, last = ids['First'].astype(str), ids['Last'].astype(str)
+    # "Last, First" is indexed too; later rows win, as in the old per-page caches
+    index = pd.concat([
+        pd.Series(mlbam_ids.values, index=normalize_names(first + ' ' + last).values),
+        pd.Series(mlbam_ids.values, index=normalize_names(last + ', ' + first).values),
+    ])
+    index = index[index.index != '']
+    return index[~index.index.duplicated(keep='last')].to_dict()
+
+
+def mlbam_id_index() -> Dict[str, str]:
+    """Normalized player name -> MLBAM ID, rebuilt only when the ID file changes"""
+    return _mlbam_id_index(file_version(PLAYER_IDS_FILE))
+
+
+def resolve_mlbam_ids(player_names: pd.Series, id_index: Optional[Dict[str, str]] = None) -> pd.Series:
+    """MLBAM ID of every player (FALLBACK_MLBAMID when unknown)"""
+    id_index = mlbam_id_index() if id_index is None else id_index
+    return normalize_names(player_names.fillna('').astype(str)).map(id_index).fillna(FALLBACK_MLBAMID)
+
+
+class HttpOrigin:
+    """Headshots fetched from a URL template with an {mlbam_id} placeholder"""
+    __slots__ = ('url_template', 'session')
+
+    def __init__(self, url_template: str):
+        self.url_template = url_template
+        self.session = requests.Session()
+
+    def url(self, mlbam_id: str) -> str:
+        return self.url_template.format(mlbam_id=mlbam_id)
+
+    def fetch(self, mlbam_id: str) -> Optional[bytes]:
+        """Image bytes, None if the origin has no image; raises OSError if unreachable"""
+        try:
+            response = self.session.get(self.url(mlbam_id), timeout=FETCH_TIMEOUT_SECONDS)
+        except requests.RequestException as e:
+            raise OSError(str(e)) from e
+        return response.content if response.ok and response.content else None
+
+
+class DirectoryOrigin:
+    """Local stand-in origin: <directory>/<mlbam_id>.(jpg|jpeg|png|webp)"""
+    __slots__ = ('directory',)
+
+    EXTENSIONS = ('.jpg', '.jpeg', '.png', '.webp')
+
+    def __init__(self, directory: str):
+        self.directory = directory
+
+    def _path(self, mlbam_id: str) -> Optional[str]:
+        for extension in self.EXTENSIONS:
+            path = os.path.join(self.directory, f"{mlbam_id}{extension}")
+            if os.path.exists(path):
+                return path
+        return None
+
+    def url(self, mlbam_id: str) -> str:
+        return self._path(mlbam_id) or ""
+
+    def fetch(self, mlbam_id: str) -> Optional[bytes]:
+        path = self._path(mlbam_id)
+        if path is None:
+            return None
+        with open(path, 'rb') as f:
+            return f.read()
+
+
+def origin_from_spec(spec: str):
+    """HttpOrigin for http(s) URL templates, DirectoryOrigin for anything else"""
+    return HttpOrigin(spec) if spec.startswith(('http://', 'https://')) else DirectoryOrigin(spec)
+
+
+def make_thumbnails(image_bytes: bytes, sizes: Iterable[int] = THUMBNAIL_SIZES) -> Dict[int, bytes]:
+    """Square WebP thumbnails (center crop, then downscale) of one source image"""
+    with Image.open(io.BytesIO(image_bytes)) as image:
+        image = image.convert('RGBA' if 'A' in image.getbands() else 'RGB')
+        side = min(image.size)
+        left, top = (image.width - side) // 2, (image.height - side) // 2
+        square = image.crop((left, top, left + side, top + side))
+        thumbnails = {}
+        for size in sizes:
+            buffer = io.BytesIO()
+            square.resize((size, size), Image.LANCZOS).save(buffer, 'WEBP', quality=WEBP_QUALITY, method=6)
+            thumbnails[size] = buffer.getvalue()
+    return thumbnails
+
+
+class HeadshotCache:
+    """
+    Thumbnails of origin headshots, fetched once per MLBAM ID.
+
+    Each source image is downloaded once and stored as WebP at every
+    THUMBNAIL_SIZES size. Reads refresh a file's mtime, and once the
+    directory is over ``max_bytes`` the least recently used files are
+    deleted. Thumbnails are handed to pages as data URIs; an image that
+    cannot be produced (no Pillow, origin miss or outage, unwritable cache
+    directory) falls back to the origin URL, i.e. the browser fetches it as
+    before.
+    """
+
+    def __init__(self, origin=None, directory: str = HEADSHOT_CACHE_DIR,
+                 max_bytes: int = HEADSHOT_CACHE_MAX_BYTES):
+        self.origin = origin if origin is not None else origin_from_spec(HEADSHOT_ORIGIN)
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._uris: "OrderedDict[tuple, str]" = OrderedDict()
+        self._missing: Dict[str, float] = {}
+        self._origin_down_until = 0.0
+        self._lock = threading.Lock()
+
+    def _path(self, mlbam_id: str, size: int) -> str:
+        return os.path.join(self.directory, f"{mlbam_id}-{size}.webp")
+
+    def _remember(self, key: tuple, uri: str):
+        with self._lock:
+            self._uris[key] = uri
+            self._uris.move_to_end(key)
+            while len(self._uris) > MEMORY_CACHE_ENTRIES:
+                self._uris.popitem(last=False)
+
+    def _read(self, mlbam_id: str, size: int) -> Optional[str]:
+        path = self._path(mlbam_id, size)
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+            os.utime(path)
+        except OSError:
+            return None
+        return "data:image/webp;base64," + base64.b64encode(data).decode('ascii')
+
+    def _fetch(self, mlbam_id: str) -> bool:
+        """Download one source image and store all its thumbnails; True on success"""
+        if time.monotonic() < self._origin_down_until:
+            return False
+        if time.monotonic() < self._missing.get(mlbam_id, 0.0):
+            return False
+        try:
+            image_bytes = self.origin.fetch(mlbam_id)
+        except OSError:
+            self._origin_down_until = time.monotonic() + ORIGIN_RETRY_SECONDS
+            return False
+        try:
+            thumbnails = make_thumbnails(image_bytes) if image_bytes else None
+        except (OSError, ValueError):
+            thumbnails = None
+        if not thumbnails:
+            self._missing[mlbam_id] = time.monotonic() + MISSING_RETRY_SECONDS
+            return False
+
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            for size, data in thumbnails.items():
+                path = self._path(mlbam_id, size)
+                with open(f"{path}.tmp", 'wb') as f:
+                    f.write(data)
+                os.replace(f"{path}.tmp", path)
+        except OSError:
+            # Unwritable cache directory: serve origin URLs and stop downloading
+            # images that cannot be stored for a while
+            self._origin_down_until = time.monotonic() + ORIGIN_RETRY_SECONDS
+            return False
+        return True
+
+    def evict(self):
+        """Delete least recently used thumbnails until the cache fits in max_bytes"""
+        try:
+            entries = [entry for entry in os.scandir(self.directory) if entry.name.endswith('.webp')]
+        except OSError:
+            return
+        stats = sorted(((entry.stat().st_mtime, entry.stat().st_size, entry.path) for entry in entries))
+        total = sum(size for _, size, _ in stats)
+        for _, size, path in stats:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                pass
+
+    def sources(self, mlbam_ids: pd.Series, size: int) -> pd.Series:
+        """
+        Image src for every player: a WebP data URI of the smallest thumbnail
+        at least ``size`` px, or the origin URL when no thumbnail is available.
+        Missing thumbnails are fetched in parallel, each ID once.
+        """
+        thumb_size = next((s for s in THUMBNAIL_SIZES if s >= size), THUMBNAIL_SIZES[-1])
+        ids = mlbam_ids.astype(str)
+        unique = list(dict.fromkeys(ids))
+        uris: Dict[str, str] = {}
+        to_fetch = []
+        with tracing.span("headshots.resolve", "fetch"):
+            for mlbam_id in unique:
+                key = (mlbam_id, thumb_size)
+                with self._lock:
+                    uri = self._uris.get(key)
+                if uri is not None:
+                    HEADSHOT_REQUESTS.inc(result="memory")
+                    uris[mlbam_id] = uri
+                    continue
+                uri = self._read(mlbam_id, thumb_size)
+                if uri is not None:
+                    HEADSHOT_REQUESTS.inc(result="disk")
+                    self._remember(key, uri)
+                    uris[mlbam_id] = uri
+                else:
+                    to_fetch.append(mlbam_id)
+
+            if to_fetch and Image is not None:
+                with ThreadPoolExecutor(max_workers=min(FETCH_WORKERS, len(to_fetch))) as pool:
+                    fetched = dict(zip(to_fetch, pool.map(self._fetch, to_fetch)))
+                for mlbam_id in to_fetch:
+                    uri = self._read(mlbam_id, thumb_size) if fetched[mlbam_id] else None
+                    if uri is not None:
+                        self._remember((mlbam_id, thumb_size), uri)
+                        uris[mlbam_id] = uri
+                if any(fetched.values()):
+                    self.evict()
+
+            for mlbam_id in to_fetch:
+                if mlbam_id in uris:
+                    HEADSHOT_REQUESTS.inc(result="fetched")
+                else:
+                    HEADSHOT_REQUESTS.inc(result="unavailable")
+                    uris[mlbam_id] = self.origin.url(mlbam_id)
+        return ids.map(uris)
+
+
+_cache: Optional[HeadshotCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_headshot_cache() -> HeadshotCache:
+    """Process-wide thumbnail cache shared by every Streamlit session"""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = HeadshotCache()
+        return _cache
+
+
+def headshot_sources(mlbam_ids: pd.Series, size: int = 60) -> pd.Series:
+    """Image src (thumbnail data URI or origin URL) for every MLBAM ID"""
+    return get_headshot_cache().sources(mlbam_ids, size)
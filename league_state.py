@@ -0,0 +1,205 @@
+import pandas as pd
+import numpy as np
+from typing import Any, Callable, Dict, Mapping
+from collections import OrderedDict
+from functools import lru_cache
+from types import MappingProxyType
+import threading
+import weakref
+import metrics
+from change_detection import file_version, frame_version
+
+# Arrow-backed strings with NaN (not pd.NA) for missing values, so comparisons
+# and masks behave as they do on object columns
+try:
+    import pyarrow  # noqa: F401
+    try:
+        ARROW_STRING = pd.StringDtype("pyarrow", na_value=np.nan)
+    except TypeError:  # pandas < 2.3
+        ARROW_STRING = pd.StringDtype("pyarrow_numpy")
+except ImportError:  # pragma: no cover - pyarrow is optional, strings stay as Python objects
+    ARROW_STRING = None
+
+# Derived frames (e.g. power and DDI rankings) interned for all sessions;
+# sessions computing identical content end up referencing one frame
+SHARED_FRAME_ENTRIES = 32
+
+# Read-only containers (saved season stats, weekly results) remembered by
+# identity, one per loaded file version. A session still holding one that
+# has dropped out keeps it as its own value until it reloads.
+SHARED_VALUE_ENTRIES = 64
+
+POWER_RANKINGS_DATA_FILE = 'data/team_season_stats.csv'
+WEEKLY_RESULTS_FILE = 'data/weekly_results.csv'
+
+SHARED_FRAME_BYTES = metrics.Gauge(
+    "abl_shared_frame_bytes",
+    "Deep memory usage of frozen DataFrames shared by all sessions (snapshot and interned frames)",
+)
+
+# Frozen frames by id(); entries disappear when the frame is garbage collected
+_frozen: "weakref.WeakValueDictionary[int, pd.DataFrame]" = weakref.WeakValueDictionary()
+_interned: "OrderedDict[str, pd.DataFrame]" = OrderedDict()
+# Shared containers by id(); tuples and mappingproxies can't be weakly
+# referenced, so the entries hold them (bounded by SHARED_VALUE_ENTRIES)
+_shared_values: "OrderedDict[int, Any]" = OrderedDict()
+_lock = threading.Lock()
+
+
+def freeze_frame(frame: pd.DataFrame) -> pd.DataFrame:
+    """
+    Read-only copy of a frame for sharing between sessions.
+
+    String columns become Arrow-backed (one contiguous buffer instead of a
+    Python object per cell) and numeric columns are marked read-only, so an
+    in-place write to a numeric cell raises ValueError instead of leaking
+    into every session. Copies (``.copy()``, filtering, ``assign``) are
+    ordinary writable frames.
+
+    Not blocked (the frame stays a plain DataFrame, which Streamlit's
+    hashing and display require): adding, replacing or deleting columns,
+    writes to string cells, and ``inplace=True`` methods. These change the
+    frame for every session, so callers must go through :func:`editable`
+    or ``.copy()`` before any such write.
+    """
+    if is_shared(frame):
+        return frame
+    columns = []
+    for _, column in frame.items():
+        if (ARROW_STRING is not None and column.dtype == object
+                and pd.api.types.infer_dtype(column, skipna=True) == 'string'):
+            column = column.astype(ARROW_STRING)
+        elif isinstance(column.dtype, np.dtype) and column.dtype != object:
+            values = column.to_numpy(copy=True)
+            values.flags.writeable = False
+            column = pd.Series(values, index=column.index, name=column.name, copy=False)
+        columns.append(column)
+    frozen = pd.concat(columns, axis=1, copy=False) if columns else frame.copy()
+    frozen.columns = frame.columns
+    frozen.attrs = dict(frame.attrs)
+    with _lock:
+        _frozen[id(frozen)] = frozen
+    return frozen
+
+
+def is_shared(value: Any) -> bool:
+    """True for frozen frames and the read-only containers handed out by this module"""
+    with _lock:
+        if isinstance(value, pd.DataFrame):
+            return _frozen.get(id(value)) is value
+        return _shared_values.get(id(value)) is value
+
+
+def _share_value(value: Any) -> Any:
+    """Remember a read-only container handed out to sessions"""
+    with _lock:
+        _shared_values[id(value)] = value
+        _shared_values.move_to_end(id(value))
+        while len(_shared_values) > SHARED_VALUE_ENTRIES:
+            _shared_values.popitem(last=False)
+    return value
+
+
+def freeze_league_data(data: Mapping[str, Any]) -> Dict[str, Any]:
+    """Freeze every DataFrame in a fetch_api_data()-style dict; other values are kept"""
+    return {key: freeze_frame(value) if isinstance(value, pd.DataFrame) else value for key, value in data.items()}
+
+
+def share_frame(frame: pd.DataFrame) -> pd.DataFrame:
+    """
+    Frozen frame with the content of ``frame``, shared by every session that
+    produces the same content (keyed by data version hash).
+    """
+    key = frame_version(frame)
+    with _lock:
+        shared = _interned.get(key)
+        if shared is not None:
+            _interned.move_to_end(key)
+            return shared
+    shared = freeze_frame(frame)
+    with _lock:
+        shared = _interned.setdefault(key, shared)
+        _interned.move_to_end(key)
+        while len(_interned) > SHARED_FRAME_ENTRIES:
+            _interned.popitem(last=False)
+    update_shared_bytes()
+    return shared
+
+
+def update_shared_bytes() -> int:
+    """Refresh the shared-memory gauge; each frozen frame counts once per process"""
+    with _lock:
+        frames = list(_frozen.values())
+    total = sum(int(frame.memory_usage(deep=True).sum()) for frame in frames)
+    SHARED_FRAME_BYTES.set(total)
+    return total
+
+
+# --- Copy-on-write session values ---------------------------------------------
+
+@lru_cache(maxsize=2)
+def _power_rankings_data(version: tuple) -> Mapping[str, Dict[str, Any]]:
+    from utils import load_power_rankings_data
+    return _share_value(MappingProxyType(load_power_rankings_data(POWER_RANKINGS_DATA_FILE)))
+
+
+@lru_cache(maxsize=2)
+def _weekly_results(version: tuple) -> tuple:
+    from utils import load_weekly_results
+    return _share_value(tuple(load_weekly_results(WEEKLY_RESULTS_FILE)))
+
+
+def shared_power_rankings_data() -> Mapping[str, Dict[str, Any]]:
+    """Saved team season stats, loaded once per file version and read-only"""
+    return _power_rankings_data(file_version(POWER_RANKINGS_DATA_FILE))
+
+
+def shared_weekly_results() -> tuple:
+    """Saved weekly results, loaded once per file version and read-only"""
+    return _weekly_results(file_version(WEEKLY_RESULTS_FILE))
+
+
+def use_shared(session_state: Any, key: str, loader: Callable[[], Any]) -> Any:
+    """
+    Point ``session_state[key]`` at the current shared value unless the
+    session holds its own edited copy (see :func:`editable`).
+    """
+    if key not in session_state or is_shared(session_state[key]):
+        session_state[key] = loader()
+    return session_state[key]
+
+
+def editable(session_state: Any, key: str) -> Any:
+    """
+    Mutable value of ``session_state[key]``, copied from the shared value on
+    the first write (copy-on-write); later calls return the same copy.
+    """
+    value = session_state[key]
+    if isinstance(value, MappingProxyType):
+        value = {name: dict(entry) if isinstance(entry, dict) else entry for name, entry in value.items()}
+    elif isinstance(value, tuple):
+        value = list(value)
+    elif isinstance(value, pd.DataFrame) and is_shared(value):
+        value = value.copy()
+    else:
+        return value
+    session_state[key] = value
+    return value
+
+
+def session_memory_report(session_state: Any) -> pd.DataFrame:
+    """
+    Deep size of every DataFrame in a session's state.
+
+    Returns:
+        DataFrame: key, shared (True for frames held once per process and only
+                   referenced by the session) and bytes, largest first
+    """
+    rows = []
+    for key in list(session_state.keys()):
+        value = session_state[key]
+        if isinstance(value, pd.DataFrame):
+            rows.append({'key': str(key), 'shared': is_shared(value),
+                         'bytes': int(value.memory_usage(deep=True).sum())})
+    report = pd.DataFrame(rows, columns=['key', 'shared', 'bytes'])
+    return report.sort_values('bytes', ascending=False, ignore_index=True)
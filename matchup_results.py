@@ -0,0 +1,296 @@
+import pandas as pd
+import numpy as np
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+from concurrent.futures import ThreadPoolExecutor
+import datetime
+import os
+import threading
+import metrics
+import tracing
+
+# Matchup-level results, one row per (period, team, opponent)
+MATCHUP_RESULTS_FILE = "data/matchup_results.csv"
+# Weekly W-L-D records consumed by power rankings (same file the manual paste box writes)
+WEEKLY_RESULTS_FILE = "data/weekly_results.csv"
+
+# Concurrent getMatchups requests during a backfill (the shared Fantrax rate
+# limiter still applies on top of this)
+MATCHUP_FETCH_WORKERS = 4
+
+MATCHUP_COLUMNS = ['period', 'team', 'opponent', 'team_score', 'opponent_score', 'result']
+
+# Days after it ends that the most recently completed period is refetched for
+# late stat corrections (it stops earlier once a refetch changes nothing)
+LATE_CORRECTION_DAYS = 7
+
+MATCHUP_PERIODS_FETCHED = metrics.Counter(
+    "abl_matchup_periods_fetched_total",
+    "getMatchups periods fetched by the matchup ingestion job, by outcome (stored/unchanged/empty/failed)",
+    ["outcome"],
+)
+
+
+def _team_name(side: Any) -> Optional[str]:
+    if isinstance(side, dict):
+        return side.get('name') or side.get('teamName')
+    return str(side) if side else None
+
+
+def _score(matchup: Dict[str, Any], side: str) -> Optional[float]:
+    value = matchup.get(f'{side}Score')
+    if value is None:
+        team = matchup.get(side) or matchup.get(f'{side}Team')
+        if isinstance(team, dict):
+            value = team.get('score', team.get('points', team.get('fpts')))
+    try:
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def parse_matchups(payload: Any, period: int) -> pd.DataFrame:
+    """
+    Flatten a getMatchups payload into two rows per scored matchup (one per side).
+
+    Accepts a list of matchups or a dict holding one under 'matchups' or
+    'matchupList'; sides are 'away'/'home' (or 'awayTeam'/'homeTeam') with
+    scores either on the matchup ('awayScore') or on the side ('score').
+    Unscored matchups are skipped.
+    """
+    if isinstance(payload, dict):
+        payload = payload.get('matchups', payload.get('matchupList', []))
+    rows = []
+    for matchup in payload if isinstance(payload, list) else []:
+        if not isinstance(matchup, dict):
+            continue
+        away = _team_name(matchup.get('away', matchup.get('awayTeam')))
+        home = _team_name(matchup.get('home', matchup.get('homeTeam')))
+        away_score, home_score = _score(matchup, 'away'), _score(matchup, 'home')
+        if not away or not home or away_score is None or home_score is None:
+            continue
+        rows.append((period, away, home, away_score, home_score))
+        rows.append((period, home, away, home_score, away_score))
+
+    df = pd.DataFrame(rows, columns=MATCHUP_COLUMNS[:-1])
+    df['result'] = 'T'
+    df.loc[df['team_score'] > df['opponent_score'], 'result'] = 'W'
+    df.loc[df['team_score'] < df['opponent_score'], 'result'] = 'L'
+    return df
+
+
+class MatchupResultsStore:
+    """
+    Matchup results indexed by (period, team, opponent), persisted as CSV.
+
+    ``upsert`` replaces whole periods, so re-ingesting a period (e.g. after stat
+    corrections) never duplicates rows. ``weekly_records`` derives the weekly
+    W-L-D record per team from the matchup rows.
+    """
+
+    def __init__(self, file_path: str = MATCHUP_RESULTS_FILE):
+        self.file_path = file_path
+        self._lock = threading.Lock()
+        self._frame = self._load()
+
+    def _load(self) -> pd.DataFrame:
+        if os.path.exists(self.file_path):
+            try:
+                frame = tracing.read_csv(self.file_path)
+                return frame.set_index(['period', 'team', 'opponent']).sort_index()
+            except (OSError, ValueError, KeyError):
+                pass
+        return pd.DataFrame(columns=MATCHUP_COLUMNS).set_index(['period', 'team', 'opponent'])
+
+    @property
+    def periods(self) -> Set[int]:
+        """Periods with at least one stored result"""
+        with self._lock:
+            return {int(p) for p in self._frame.index.get_level_values('period').unique()}
+
+    def frame(self) -> pd.DataFrame:
+        with self._lock:
+            return self._frame.reset_index()
+
+    def has_results(self, results: pd.DataFrame) -> bool:
+        """True if the store already holds exactly these rows for the periods in results"""
+        incoming = results.set_index(['period', 'team', 'opponent']).sort_index()
+        with self._lock:
+            stored = self._frame[self._frame.index.get_level_values('period').isin(
+                incoming.index.get_level_values('period'))]
+        scores = ['team_score', 'opponent_score']
+        return (stored.index.equals(incoming.index)
+                and np.array_equal(stored[scores].to_numpy(dtype=float), incoming[scores].to_numpy(dtype=float))
+                and (stored['result'].to_numpy() == incoming['result'].to_numpy()).all())
+
+    def upsert(self, results: pd.DataFrame):
+        """Replace the stored rows of every period present in results"""
+        if results.empty:
+            return
+        incoming = results.set_index(['period', 'team', 'opponent'])
+        with self._lock:
+            keep = ~self._frame.index.get_level_values('period').isin(incoming.index.get_level_values('period'))
+            kept = self._frame[keep]
+            self._frame = (pd.concat([kept, incoming]) if not kept.empty else incoming).sort_index()
+            self._save()
+
+    def _save(self):
+        try:
+            directory = os.path.dirname(self.file_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            tmp_path = f"{self.file_path}.tmp"
+            self._frame.reset_index().to_csv(tmp_path, index=False)
+            os.replace(tmp_path, self.file_path)
+        except OSError:
+            pass
+
+    def weekly_records(self) -> pd.DataFrame:
+        """One row per (team, week) with columns 'team', 'week number', 'record' ("W-L-D")"""
+        frame = self.frame()
+        if frame.empty:
+            return pd.DataFrame(columns=['team', 'week number', 'record'])
+        counts = pd.crosstab([frame['team'], frame['period']], frame['result'])
+        counts = counts.reindex(columns=['W', 'L', 'T'], fill_value=0).reset_index()
+        counts['record'] = (counts['W'].astype(str) + '-' + counts['L'].astype(str) + '-' + counts['T'].astype(str))
+        return counts.rename(columns={'period': 'week number'})[['team', 'week number', 'record']]
+
+
+def completed_periods(calendar, today: datetime.date = None) -> List[int]:
+    """Weekly periods that ended before today"""
+    today = today or datetime.date.today()
+    return [p.number for p in calendar.periods if p.end < today]
+
+
+def fetch_periods(api_factory: Callable[[], Any], periods: Iterable[int],
+                  max_workers: int = MATCHUP_FETCH_WORKERS) -> Dict[int, Optional[pd.DataFrame]]:
+    """
+    Fetch and parse getMatchups for several periods concurrently.
+
+    Returns:
+        dict: period -> parsed results, or None where Fantrax did not answer
+              with live data (fallback payloads are never stored)
+    """
+    def fetch(period: int) -> Optional[pd.DataFrame]:
+        api = api_factory()
+        payload = api.get_matchups(period)
+        if not getattr(api, 'last_response_live', True):
+            return None
+        return parse_matchups(payload, period)
+
+    periods = list(periods)
+    if not periods:
+        return {}
+    with tracing.span("matchups.fetch", "api"), ThreadPoolExecutor(max_workers=max_workers,
+                                                                  thread_name_prefix="abl-matchups") as pool:
+        return dict(zip(periods, pool.map(fetch, periods)))
+
+
+def sync_weekly_results(store: MatchupResultsStore, file_path: str = WEEKLY_RESULTS_FILE) -> int:
+    """
+    Upsert the store's weekly records into the weekly results CSV on (team, week).
+
+    Weeks entered by hand that the store has no matchups for are left alone.
+
+    Returns:
+        int: Number of (team, week) rows written from matchup data
+    """
+    records = store.weekly_records()
+    if records.empty:
+        return 0
+    existing = pd.DataFrame(columns=['team', 'week number', 'record'])
+    if os.path.exists(file_path):
+        try:
+            existing = tracing.read_csv(file_path)
+            if 'week' in existing.columns and 'week number' not in existing.columns:
+                existing = existing.rename(columns={'week': 'week number'})
+        except (OSError, ValueError):
+            pass
+
+    key = ['team', 'week number']
+    existing = existing.set_index(key)
+    merged = records.set_index(key).combine_first(existing).reset_index()
+    merged = merged.sort_values(['week number', 'team'])[['team', 'week number', 'record']]
+
+    directory = os.path.dirname(file_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    merged.to_csv(file_path, index=False)
+    return len(records)
+
+
+class MatchupIngestor:
+    """
+    Backfills every completed weekly period once, then only new ones.
+
+    Periods already in the store are skipped, except the most recently
+    completed one, which is refetched for late stat corrections: for
+    LATE_CORRECTION_DAYS after it ends, or until a refetch returns the
+    results already stored (it is then settled). After the season nothing
+    is refetched.
+    """
+
+    def __init__(self, store: MatchupResultsStore = None, max_workers: int = MATCHUP_FETCH_WORKERS):
+        self.store = store or MatchupResultsStore()
+        self.max_workers = max_workers
+        self._empty_periods: Set[int] = set()
+        self._settled_periods: Set[int] = set()
+        self._lock = threading.Lock()
+
+    def pending_periods(self, calendar, today: datetime.date = None) -> List[int]:
+        today = today or datetime.date.today()
+        done = completed_periods(calendar, today)
+        if not done:
+            return []
+        stored = self.store.periods | self._empty_periods
+        pending = [p for p in done if p not in stored]
+        last = done[-1]
+        if last not in pending and last not in self._settled_periods:
+            ended = calendar.date_range(last)[1]
+            if (today - ended).days <= LATE_CORRECTION_DAYS:
+                pending.append(last)
+        return pending
+
+    def run(self, api_factory: Callable[[], Any], calendar, today: datetime.date = None) -> int:
+        """
+        Fetch pending periods and update both stores.
+
+        Returns:
+            int: Number of periods whose results were stored
+        """
+        with self._lock:
+            pending = self.pending_periods(calendar, today)
+            fetched = fetch_periods(api_factory, pending, self.max_workers)
+
+            stored = 0
+            for period, results in fetched.items():
+                if results is None:
+                    MATCHUP_PERIODS_FETCHED.inc(outcome="failed")
+                elif results.empty:
+                    # Live but unscored (e.g. a period the league did not play)
+                    self._empty_periods.add(period)
+                    MATCHUP_PERIODS_FETCHED.inc(outcome="empty")
+                elif period in self.store.periods and self.store.has_results(results):
+                    # A refetch with no corrections: the period is settled
+                    self._settled_periods.add(period)
+                    MATCHUP_PERIODS_FETCHED.inc(outcome="unchanged")
+                else:
+                    self.store.upsert(results)
+                    MATCHUP_PERIODS_FETCHED.inc(outcome="stored")
+                    stored += 1
+
+            if stored:
+                sync_weekly_results(self.store)
+            return stored
+
+
+_ingestor: Optional[MatchupIngestor] = None
+_ingestor_lock = threading.Lock()
+
+
+def get_matchup_ingestor() -> MatchupIngestor:
+    """Process-wide ingestor used by the refresh worker and the sidebar button"""
+    global _ingestor
+    with _ingestor_lock:
+        if _ingestor is None:
+            _ingestor = MatchupIngestor()
+        return _ingestor
@@ -0,0 +1,341 @@
+import pandas as pd
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from contextlib import contextmanager
+from functools import wraps
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import os
+import threading
+import time
+
+# Exposition targets. Set ABL_METRICS_PORT to serve /metrics from a side port,
+# and/or ABL_METRICS_FILE to have the text exposition rewritten after every rerun
+# (e.g. for the node_exporter textfile collector).
+METRICS_PORT_ENV_VAR = "ABL_METRICS_PORT"
+METRICS_FILE_ENV_VAR = "ABL_METRICS_FILE"
+
+# Latency buckets (seconds) shared by request and recompute histograms
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# Drop per-session gauges that have not been updated for this long
+SESSION_TTL_SECONDS = 3600
+
+_registry: List["_Metric"] = []
+_registry_lock = threading.Lock()
+
+
+def _format_labels(labelnames: Tuple[str, ...], values: Tuple[str, ...], extra: str = "") -> str:
+    pairs = [f'{k}="{_escape(v)}"' for k, v in zip(labelnames, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric:
+    """Base class for a named metric family with a fixed set of label names"""
+    type_name = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[Tuple[str, ...], Any] = {}
+        self._lock = threading.Lock()
+        with _registry_lock:
+            _registry.append(self)
+
+    def _key(self, labels: Dict[str, Any]) -> Tuple[str, ...]:
+        return tuple(str(labels.get(name, "")) for name in self.labelnames)
+
+    def _samples(self) -> List[str]:
+        raise NotImplementedError
+
+    def render(self) -> str:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.type_name}"]
+        lines.extend(self._samples())
+        return "\n".join(lines)
+
+
+class Counter(_Metric):
+    """Monotonically increasing count"""
+    type_name = "counter"
+
+    def inc(self, amount: float = 1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def get(self, **labels) -> float:
+        return self._values.get(self._key(labels), 0)
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            items = list(self._values.items())
+        return [f"{self.name}{_format_labels(self.labelnames, k)} {_format_value(v)}" for k, v in items]
+
+
+class Gauge(_Metric):
+    """Value that can go up and down; remembers when each series was last set"""
+    type_name = "gauge"
+
+    def set(self, value: float, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = (value, time.time())
+
+    def prune(self, max_age_seconds: float):
+        """Forget series that have not been set within max_age_seconds"""
+        cutoff = time.time() - max_age_seconds
+        with self._lock:
+            for key in [k for k, (_, ts) in self._values.items() if ts < cutoff]:
+                del self._values[key]
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            items = list(self._values.items())
+        return [f"{self.name}{_format_labels(self.labelnames, k)} {_format_value(v)}" for k, (v, _) in items]
+
+
+class Histogram(_Metric):
+    """Cumulative bucketed distribution of observed values (e.g. durations in seconds)"""
+    type_name = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = (),
+                 buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = {"counts": [0] * len(self.buckets), "sum": 0.0, "count": 0}
+            # Non-cumulative per-bucket counts; accumulated at render time
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    state["counts"][i] += 1
+                    break
+            state["sum"] += value
+            state["count"] += 1
+
+    @contextmanager
+    def time(self, **labels):
+        """Observe the wall-clock duration of a block in seconds"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def timed(self, **labels) -> Callable:
+        """Decorator form of :meth:`time`"""
+        def decorator(func: Callable) -> Callable:
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.time(**labels):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            items = [(k, dict(v, counts=list(v["counts"]))) for k, v in self._values.items()]
+        lines = []
+        inf_label = 'le="+Inf"'
+        for key, state in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets, state["counts"]):
+                cumulative += count
+                le = f'le="{_format_value(bound)}"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, key, le)} {cumulative}")
+            lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, key, inf_label)} {state['count']}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labelnames, key)} {_format_value(state['sum'])}")
+            lines.append(f"{self.name}_count{_format_labels(self.labelnames, key)} {state['count']}")
+        return lines
+
+
+# --- Application metrics ---------------------------------------------------
+
+FANTRAX_REQUEST_SECONDS = Histogram(
+    "abl_fantrax_request_seconds",
+    "Fantrax API request latency in seconds",
+    ["endpoint"],
+)
+FANTRAX_MOCK_FALLBACKS = Counter(
+    "abl_fantrax_mock_fallbacks_total",
+    "Responses replaced by _get_mock_data after a failed Fantrax request",
+    ["endpoint"],
+)
+CACHE_REQUESTS = Counter(
+    "abl_cache_requests_total",
+    "Cache lookups by cache name and result (hit/miss)",
+    ["cache", "result"],
+)
+RECOMPUTE_SECONDS = Histogram(
+    "abl_recompute_seconds",
+    "Duration of ranking recomputes (ddi, power, mvp); _count is the recompute count",
+    ["kind"],
+)
+SESSION_STATE_BYTES = Gauge(
+    "abl_session_state_bytes",
+    "Deep memory usage of DataFrames owned by a session's st.session_state (shared frames excluded)",
+    ["session"],
+)
+
+
+# --- Cache hit/miss tracking -----------------------------------------------
+
+_cache_local = threading.local()
+
+
+def mark_cache_miss(cache: str):
+    """
+    Record that a cached function body actually executed.
+
+    Call this as the first statement inside an ``st.cache_data`` function; it only
+    runs on a miss, which :func:`cache_lookup` at the call site picks up.
+    """
+    misses = getattr(_cache_local, "misses", None)
+    if misses is not None:
+        misses.add(cache)
+
+
+@contextmanager
+def cache_lookup(cache: str):
+    """Wrap a call to a cached function and count it as a hit or a miss"""
+    previous = getattr(_cache_local, "misses", None)
+    _cache_local.misses = set()
+    try:
+        yield
+    finally:
+        missed = cache in _cache_local.misses
+        _cache_local.misses = previous
+        CACHE_REQUESTS.inc(cache=cache, result="miss" if missed else "hit")
+
+
+# --- Session memory ----------------------------------------------------------
+
+def record_session_state_memory(session_state: Any, session_id: str,
+                                exclude: Optional[Callable[[Any], bool]] = None) -> int:
+    """
+    Update the session memory gauge with the size of all DataFrames in session state.
+
+    Args:
+        session_state: The session's st.session_state
+        session_id: Gauge label
+        exclude: Predicate for frames the session only references (e.g.
+                 league_state.is_shared); they are not counted
+
+    Returns:
+        int: Total bytes held by DataFrames in this session
+    """
+    total = 0
+    try:
+        for key in list(session_state.keys()):
+            value = session_state[key]
+            if isinstance(value, pd.DataFrame) and not (exclude is not None and exclude(value)):
+                total += int(value.memory_usage(deep=True).sum())
+    except Exception:
+        return total
+    SESSION_STATE_BYTES.set(total, session=session_id)
+    SESSION_STATE_BYTES.prune(SESSION_TTL_SECONDS)
+    return total
+
+
+# --- Exposition --------------------------------------------------------------
+
+def render_text() -> str:
+    """Render all registered metrics in the Prometheus text exposition format"""
+    with _registry_lock:
+        metrics = list(_registry)
+    return "\n".join(m.render() for m in metrics) + "\n"
+
+
+def write_metrics_file(file_path: Optional[str] = None) -> bool:
+    """
+    Atomically write the exposition text to a file
+
+    Args:
+        file_path: Target path; defaults to $ABL_METRICS_FILE
+
+    Returns:
+        bool: True if written, False if no path is configured or writing failed
+    """
+    file_path = file_path or os.getenv(METRICS_FILE_ENV_VAR)
+    if not file_path:
+        return False
+    try:
+        directory = os.path.dirname(file_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{file_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(render_text())
+        os.replace(tmp_path, file_path)
+        return True
+    except Exception:
+        return False
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split("?")[0] not in ("/", "/metrics"):
+            self.send_error(404)
+            return
+        body = render_text().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # Keep scrapes out of the Streamlit console
+        pass
+
+
+_server: Optional[ThreadingHTTPServer] = None
+_server_lock = threading.Lock()
+
+
+def start_metrics_server(port: Optional[int] = None) -> Optional[int]:
+    """
+    Serve /metrics on a side port from a daemon thread, once per process.
+
+    Args:
+        port: Port to bind; defaults to $ABL_METRICS_PORT. Nothing is started if neither is set.
+
+    Returns:
+        int: The bound port, or None if the server is not running
+    """
+    global _server
+    with _server_lock:
+        if _server is not None:
+            return _server.server_address[1]
+        if port is None:
+            raw = os.getenv(METRICS_PORT_ENV_VAR)
+            if not raw:
+                return None
+            try:
+                port = int(raw)
+            except ValueError:
+                return None
+        try:
+            _server = ThreadingHTTPServer(("0.0.0.0", port), _MetricsHandler)
+        except OSError:
+            return None
+        thread = threading.Thread(target=_server.serve_forever, name="abl-metrics", daemon=True)
+        thread.start()
+        return _server.server_address[1]
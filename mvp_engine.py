@@ -0,0 +1,138 @@
+import pandas as pd
+import numpy as np
+from typing import Callable, Dict, Hashable, Iterable, List, Optional
+import threading
+import metrics
+
+# Default weights of the MVP criteria (sum should be 1.0)
+DEFAULT_MVP_WEIGHTS = {
+    'FPts': 0.70,      # Performance is primary factor
+    'Position': 0.05,  # Scarcity-based positional adjustment
+    'Value': 0.25,     # Combined salary and contract value
+}
+
+# Contract length base values
+CONTRACT_VALUES = {
+    '2050': 1.0, '2045': 0.9, '2040': 0.8, '2035': 0.7, '2029': 0.6,
+    '2028': 0.5, '2027': 0.4, '2026': 0.3, '2025': 0.2, '1st': 0.15,
+}
+UNKNOWN_CONTRACT_VALUE = 0.1
+
+# Component matrices kept per (engine, data version)
+MAX_CACHED_MATRICES = 8
+
+
+def min_max(values: pd.Series, reverse: bool = False) -> pd.Series:
+    """Vectorized 0-1 normalization; a constant column normalizes to 1.0"""
+    values = pd.to_numeric(values, errors='coerce').astype(float)
+    low, high = values.min(), values.max()
+    if not high > low:
+        return pd.Series(1.0, index=values.index)
+    scaled = (values - low) / (high - low)
+    return 1 - scaled if reverse else scaled
+
+
+def contract_values(contracts: pd.Series) -> pd.Series:
+    return contracts.astype(str).map(CONTRACT_VALUES).fillna(UNKNOWN_CONTRACT_VALUE)
+
+
+def value_scores(salary: pd.Series, contract: pd.Series, tiered: bool = True) -> pd.Series:
+    """
+    Combined salary/contract value for every player at once.
+
+    Lower salary is better; with ``tiered``, cheap contracts get a larger
+    contract-length multiplier (1.5x under $5, 1.2x under $10) and the score
+    is capped at 1.0.
+    """
+    salary = pd.to_numeric(salary, errors='coerce').astype(float)
+    max_salary = salary.max()
+    salary_score = 1.0 - (salary / max_salary) if max_salary > 0 else pd.Series(0.5, index=salary.index)
+    contract_score = contract_values(contract)
+    if not tiered:
+        return salary_score * 0.6 + contract_score * 0.4
+    multiplier = np.select([salary < 5, salary < 10], [1.5, 1.2], default=1.0)
+    return (salary_score * 0.6 + contract_score * multiplier * 0.4).clip(upper=1.0)
+
+
+class ComponentMatrix:
+    """
+    Normalized MVP components as the columns of one float matrix.
+
+    Rows follow the player frame's index. ``score(weights)`` is a single
+    matrix-vector product, so re-weighting (e.g. from sidebar sliders) never
+    recomputes a component.
+    """
+    __slots__ = ("index", "columns", "matrix", "_positions")
+
+    def __init__(self, components: Dict[str, pd.Series]):
+        first = next(iter(components.values()))
+        self.index = first.index
+        self.columns: List[str] = list(components)
+        self.matrix = np.column_stack([
+            pd.to_numeric(components[name], errors='coerce').reindex(self.index).fillna(0.0).to_numpy(dtype=float)
+            for name in self.columns
+        ])
+        self.matrix.setflags(write=False)
+        self._positions = {name: i for i, name in enumerate(self.columns)}
+
+    def weight_vector(self, weights: Dict[str, float]) -> np.ndarray:
+        """Weights in column order; components without a weight count zero"""
+        vector = np.zeros(len(self.columns))
+        for name, weight in weights.items():
+            if name in self._positions:
+                vector[self._positions[name]] = weight
+        return vector
+
+    def score(self, weights: Dict[str, float], rows: Optional[Iterable[Hashable]] = None) -> pd.Series:
+        """Weighted sum of the components, for all players or only ``rows`` (index labels)"""
+        if rows is None:
+            return pd.Series(self.matrix @ self.weight_vector(weights), index=self.index)
+        rows = pd.Index(rows)
+        return pd.Series(self.matrix[self.index.get_indexer(rows)] @ self.weight_vector(weights), index=rows)
+
+    def column(self, name: str) -> pd.Series:
+        return pd.Series(self.matrix[:, self._positions[name]], index=self.index, name=name)
+
+    def frame(self, prefix: str = '') -> pd.DataFrame:
+        """The components as a DataFrame (columns optionally prefixed)"""
+        return pd.DataFrame(self.matrix, index=self.index, columns=[f"{prefix}{name}" for name in self.columns])
+
+
+def data_version(data: pd.DataFrame, columns: Iterable[str]) -> int:
+    """Content hash of the columns a component build reads"""
+    columns = [c for c in columns if c in data.columns]
+    return int(pd.util.hash_pandas_object(data[columns], index=True).sum())
+
+
+class ComponentCache:
+    """Component matrices keyed by (engine name, data version, extra key)"""
+
+    def __init__(self, max_entries: int = MAX_CACHED_MATRICES):
+        self.max_entries = max_entries
+        self._entries: Dict[tuple, ComponentMatrix] = {}
+        self._lock = threading.Lock()
+
+    def get(self, name: str, data: pd.DataFrame, columns: Iterable[str],
+            build: Callable[[pd.DataFrame], Dict[str, pd.Series]], extra_key: Hashable = None) -> ComponentMatrix:
+        """
+        Return the component matrix for ``data``, building it only when the
+        columns it depends on (or extra_key, e.g. a file version) changed.
+        """
+        key = (name, data_version(data, columns), extra_key)
+        with self._lock:
+            matrix = self._entries.get(key)
+        if matrix is not None:
+            metrics.CACHE_REQUESTS.inc(cache=f"mvp.{name}", result="hit")
+            return matrix
+
+        metrics.CACHE_REQUESTS.inc(cache=f"mvp.{name}", result="miss")
+        with metrics.RECOMPUTE_SECONDS.time(kind="mvp"):
+            matrix = ComponentMatrix(build(data))
+        with self._lock:
+            if len(self._entries) >= self.max_entries:
+                self._entries.pop(next(iter(self._entries)))
+            self._entries[key] = matrix
+        return matrix
+
+
+COMPONENT_CACHE = ComponentCache()
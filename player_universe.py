@@ -0,0 +1,201 @@
+import pandas as pd
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from array import array
+import hashlib
+import json
+import os
+import threading
+import time
+import metrics
+import tracing
+
+# getPlayerIds barely changes during a day; refetch it at most this often
+PLAYER_UNIVERSE_TTL_SECONDS = int(os.getenv("ABL_PLAYER_UNIVERSE_TTL_SECONDS", 24 * 3600))
+
+# After a failed fetch, keep serving the previous universe and try again after this long
+PLAYER_UNIVERSE_RETRY_SECONDS = 15 * 60
+
+# Compact columnar copy persisted between restarts
+PLAYER_UNIVERSE_CACHE_PATH = "data/cache/player_universe.json"
+
+PLAYER_UNIVERSE_PLAYERS = metrics.Gauge(
+    "abl_player_universe_players",
+    "Players held in the compact getPlayerIds store",
+)
+PLAYER_UNIVERSE_FETCHES = metrics.Counter(
+    "abl_player_universe_fetches_total",
+    "getPlayerIds fetches by the player universe store, by outcome (live/failed)",
+    ["outcome"],
+)
+
+
+class PlayerUniverse:
+    """
+    Compact, read-only Fantrax player universe keyed by Fantrax player ID.
+
+    Only the fields process_rosters needs are kept, column by column: names in
+    a tuple, MLB teams as small integer codes into a shared team list, and a
+    dict from player ID to row. ``fingerprint`` identifies the content, so
+    change detection does not have to re-hash the full payload.
+    """
+    __slots__ = ("_index", "_names", "_team_codes", "_teams", "_frame", "fingerprint", "fetched_at")
+
+    def __init__(self, ids: Iterable[str], names: Iterable[str], teams: Iterable[str], fetched_at: float = None):
+        ids = list(ids)
+        self._index: Dict[str, int] = {player_id: row for row, player_id in enumerate(ids)}
+        self._names: Tuple[str, ...] = tuple(names)
+
+        team_lookup: Dict[str, int] = {}
+        codes = array('H')
+        for team in teams:
+            codes.append(team_lookup.setdefault(team, len(team_lookup)))
+        self._teams: Tuple[str, ...] = tuple(team_lookup)
+        self._team_codes = codes
+
+        digest = hashlib.sha256()
+        for player_id, name, team in zip(ids, self._names, self.iter_teams()):
+            digest.update(f"{player_id}\x1f{name}\x1f{team}\x1e".encode("utf-8"))
+        self.fingerprint = digest.hexdigest()
+        self.fetched_at = fetched_at if fetched_at is not None else time.time()
+        self._frame: Optional[pd.DataFrame] = None
+
+    @classmethod
+    def from_payload(cls, payload: Any, fetched_at: float = None) -> "PlayerUniverse":
+        """Build from a decoded getPlayerIds payload ({player_id: {'name': ..., 'team': ...}})"""
+        ids, names, teams = [], [], []
+        if isinstance(payload, dict):
+            for player_id, details in payload.items():
+                if not isinstance(details, dict):
+                    continue
+                ids.append(str(player_id))
+                names.append(str(details.get('name') or ''))
+                teams.append(str(details.get('team') or 'N/A'))
+        return cls(ids, names, teams, fetched_at)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, player_id: str) -> bool:
+        return player_id in self._index
+
+    def iter_teams(self):
+        teams = self._teams
+        return (teams[code] for code in self._team_codes)
+
+    def name(self, player_id: str, default: Optional[str] = None) -> Optional[str]:
+        row = self._index.get(player_id)
+        return self._names[row] if row is not None and self._names[row] else default
+
+    def team(self, player_id: str, default: Optional[str] = None) -> Optional[str]:
+        row = self._index.get(player_id)
+        return self._teams[self._team_codes[row]] if row is not None else default
+
+    def to_columns(self) -> Dict[str, List[str]]:
+        """Columnar dict (ids, names, teams), e.g. for pd.DataFrame or persistence"""
+        return {'ids': list(self._index), 'names': list(self._names), 'teams': list(self.iter_teams())}
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        Lookup frame indexed by Fantrax ID with 'name' and categorical 'team' columns.
+
+        Built once per universe and shared; treat it as read-only.
+        """
+        if self._frame is None:
+            self._frame = pd.DataFrame(
+                {
+                    'name': self._names,
+                    'team': pd.Categorical.from_codes(list(self._team_codes), categories=list(self._teams)),
+                },
+                index=pd.Index(list(self._index), name='id'),
+            )
+        return self._frame
+
+
+def as_universe(player_ids: Any) -> PlayerUniverse:
+    """Accept either a PlayerUniverse or a raw getPlayerIds payload"""
+    if isinstance(player_ids, PlayerUniverse):
+        return player_ids
+    return PlayerUniverse.from_payload(player_ids or {})
+
+
+class PlayerUniverseStore:
+    """
+    Process-wide holder of the current PlayerUniverse.
+
+    ``get`` only calls getPlayerIds when the held universe is older than
+    ``ttl`` (a day by default). A failed fetch never replaces a good universe;
+    the previous one keeps being served and the fetch is retried later.
+    """
+
+    def __init__(self, ttl: float = PLAYER_UNIVERSE_TTL_SECONDS, cache_path: str = PLAYER_UNIVERSE_CACHE_PATH):
+        self.ttl = ttl
+        self.cache_path = cache_path
+        self._universe: Optional[PlayerUniverse] = None
+        self._next_fetch_at = 0.0
+        self._lock = threading.Lock()
+
+    def get(self, api_client) -> PlayerUniverse:
+        """Return the current universe, fetching it through api_client when it is due"""
+        with self._lock:
+            if self._universe is None:
+                self._universe = self._load()
+                if self._universe is not None:
+                    self._next_fetch_at = self._universe.fetched_at + self.ttl
+            if self._universe is not None and time.time() < self._next_fetch_at:
+                return self._universe
+
+            with tracing.span("player_universe.fetch", "api"):
+                payload = api_client.get_player_ids()
+            live = getattr(api_client, 'last_response_live', True)
+
+            if live or self._universe is None:
+                self._universe = PlayerUniverse.from_payload(payload)
+                PLAYER_UNIVERSE_PLAYERS.set(len(self._universe))
+            if live:
+                PLAYER_UNIVERSE_FETCHES.inc(outcome="live")
+                self._next_fetch_at = time.time() + self.ttl
+                self._save(self._universe)
+            else:
+                PLAYER_UNIVERSE_FETCHES.inc(outcome="failed")
+                self._next_fetch_at = time.time() + PLAYER_UNIVERSE_RETRY_SECONDS
+            return self._universe
+
+    def invalidate(self):
+        """Force the next get() to refetch"""
+        with self._lock:
+            self._next_fetch_at = 0.0
+
+    def _save(self, universe: PlayerUniverse):
+        try:
+            directory = os.path.dirname(self.cache_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            tmp_path = f"{self.cache_path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(dict(universe.to_columns(), fetched_at=universe.fetched_at), f, separators=(",", ":"))
+            os.replace(tmp_path, self.cache_path)
+        except OSError:
+            pass
+
+    def _load(self) -> Optional[PlayerUniverse]:
+        try:
+            with open(self.cache_path, encoding="utf-8") as f:
+                stored = json.load(f)
+            universe = PlayerUniverse(stored['ids'], stored['names'], stored['teams'], float(stored['fetched_at']))
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        PLAYER_UNIVERSE_PLAYERS.set(len(universe))
+        return universe
+
+
+_store: Optional[PlayerUniverseStore] = None
+_store_lock = threading.Lock()
+
+
+def get_player_universe_store() -> PlayerUniverseStore:
+    """Process-wide store shared by the refresh worker and fetch_api_data"""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = PlayerUniverseStore()
+        return _store
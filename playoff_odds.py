@@ -0,0 +1,324 @@
+import pandas as pd
+import numpy as np
+from typing import Dict, List, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from statistics import NormalDist
+import copy
+import hashlib
+import os
+import tracing
+from change_detection import file_version
+from matchup_results import MATCHUP_RESULTS_FILE, MatchupResultsStore
+
+SCHEDULE_FILE = "attached_assets/fantasy_baseball_schedule.csv"
+DIVISIONS_FILE = "attached_assets/divisions.csv"
+
+# Playoff format: every division winner plus the best remaining records as
+# wild cards, seeded by record (division winners first) into a single
+# elimination bracket of one-week rounds.
+PLAYOFF_WILDCARDS = 2
+# Round-one pairings as (higher seed, lower seed), 0-based; winners of
+# adjacent pairs meet in the next round
+PLAYOFF_BRACKET = [(0, 7), (3, 4), (1, 6), (2, 5)]
+
+# Weekly score spread used until a team has enough stored matchups of its own,
+# as a fraction of its mean weekly score
+DEFAULT_SCORE_CV = 0.15
+MIN_WEEKS_FOR_OWN_SPREAD = 4
+
+DEFAULT_SIMULATIONS = 100_000
+# Simulations per vectorized batch; bounds peak memory at roughly
+# chunk * remaining weeks * teams * 4 bytes for the score draws
+SIMULATION_CHUNK = 16_384
+
+# Weekly score noise is drawn as uint16 indices into a table of standard normal
+# quantiles, which is several times faster than standard_normal and
+# indistinguishable from it at this resolution
+NORMAL_TABLE_SIZE = 1 << 16
+
+
+def load_schedule(path: str = SCHEDULE_FILE) -> pd.DataFrame:
+    """Full season schedule with columns 'period', 'away', 'home'"""
+    schedule = tracing.read_csv(path)
+    schedule.columns = [c.strip().lower() for c in schedule.columns]
+    schedule = schedule.rename(columns={'scoring period': 'period'})
+    schedule['away'] = schedule['away'].str.strip()
+    schedule['home'] = schedule['home'].str.strip()
+    return schedule[['period', 'away', 'home']]
+
+
+def load_divisions(path: str = DIVISIONS_FILE) -> Dict[str, str]:
+    """Team name -> division (the CSV has no header and may start with a BOM)"""
+    divisions = tracing.read_csv(path, header=None, names=['division', 'team'], encoding='utf-8-sig')
+    return dict(zip(divisions['team'].str.strip(), divisions['division'].str.strip()))
+
+
+@lru_cache(maxsize=1)
+def _normal_table() -> np.ndarray:
+    """Standard normal quantiles at the midpoints of NORMAL_TABLE_SIZE equal-probability bins"""
+    inv_cdf = NormalDist().inv_cdf
+    return np.array([inv_cdf((k + 0.5) / NORMAL_TABLE_SIZE) for k in range(NORMAL_TABLE_SIZE)], dtype=np.float32)
+
+
+def _numeric(frame: pd.DataFrame, column: str) -> pd.Series:
+    if column not in frame.columns:
+        return pd.Series(0.0, index=frame.index)
+    return pd.to_numeric(frame[column], errors='coerce').fillna(0)
+
+
+class SeasonModel:
+    """
+    Everything a simulation needs, as flat NumPy arrays over a fixed team order.
+
+    Remaining games are three parallel index arrays (week, away team, home
+    team) into the per-simulation score tensor; divisions are integer codes.
+    Plain arrays keep the model cheap to pickle for process-pool runs.
+    """
+
+    def __init__(self, teams: List[str], divisions: List[str], wins: np.ndarray, points: np.ndarray,
+                 mean: np.ndarray, std: np.ndarray, weeks: np.ndarray, away: np.ndarray, home: np.ndarray,
+                 first_week: int):
+        self.teams = list(teams)
+        self.division_names, self.division_codes = np.unique(np.asarray(divisions), return_inverse=True)
+        self.wins = wins.astype(np.float64)
+        self.points = points.astype(np.float64)
+        self.mean = mean.astype(np.float32)
+        self.std = std.astype(np.float32)
+        self.weeks = weeks.astype(np.intp)
+        self.away = away.astype(np.intp)
+        self.home = home.astype(np.intp)
+        self.first_week = first_week
+        self.n_weeks = int(self.weeks.max()) + 1 if len(self.weeks) else 0
+
+        n_teams = len(self.teams)
+        games = len(self.weeks)
+        # sim_wins = away_won @ swing + home_games: one matmul turns per-game
+        # outcomes into per-team win totals
+        self.swing = np.zeros((games, n_teams), dtype=np.float32)
+        self.swing[np.arange(games), self.away] += 1
+        self.swing[np.arange(games), self.home] -= 1
+        # Positions of each game's sides in a flattened (week, team) score row
+        self.away_cells = self.weeks * n_teams + self.away
+        self.home_cells = self.weeks * n_teams + self.home
+        self.home_games = np.bincount(self.home, minlength=n_teams).astype(np.float32)
+        self.division_members = [np.flatnonzero(self.division_codes == d) for d in range(len(self.division_names))]
+        self.seeds = min(len(self.division_names) + PLAYOFF_WILDCARDS, n_teams)
+
+    @property
+    def remaining_games(self) -> int:
+        return len(self.weeks)
+
+    def with_scores(self, mean: np.ndarray, std: np.ndarray) -> "SeasonModel":
+        """Copy of this model with different weekly score distributions (e.g. from projections)"""
+        model = copy.copy(self)
+        model.mean = np.asarray(mean, dtype=np.float32)
+        model.std = np.asarray(std, dtype=np.float32)
+        return model
+
+
+def team_score_distributions(standings: pd.DataFrame, teams: List[str], matchups_per_week: float,
+                             matchups: Optional[pd.DataFrame] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Mean and standard deviation of each team's weekly score.
+
+    The mean comes from season points over weeks played; the spread from the
+    team's stored weekly matchup scores when there are enough of them,
+    otherwise DEFAULT_SCORE_CV of the mean.
+    """
+    frame = standings.set_index('team_name').reindex(teams)
+    points = _numeric(frame, 'fptsf')
+    points = points.where(points > 0, _numeric(frame, 'points_for'))
+    games = _numeric(frame, 'wins') + _numeric(frame, 'losses') + _numeric(frame, 'ties')
+    weeks = (games / max(matchups_per_week, 1)).clip(lower=1)
+    mean = points / weeks
+    if (mean <= 0).all():
+        # No scoring data at all: every team is a coin flip
+        mean = pd.Series(100.0, index=mean.index)
+    mean = mean.where(mean > 0, mean[mean > 0].mean())
+    std = mean * DEFAULT_SCORE_CV
+
+    if matchups is not None and not matchups.empty:
+        # A team scores once per week no matter how many opponents it faces
+        weekly = matchups.drop_duplicates(['period', 'team'])
+        spread = weekly.groupby('team')['team_score'].agg(['std', 'count'])
+        spread = spread[spread['count'] >= MIN_WEEKS_FOR_OWN_SPREAD]['std'].reindex(teams)
+        std = spread.where(spread > 0).fillna(std)
+    return mean.to_numpy(), std.to_numpy()
+
+
+def build_model(standings: pd.DataFrame, schedule: pd.DataFrame = None, divisions: Dict[str, str] = None,
+                matchups: pd.DataFrame = None, completed_weeks: int = None) -> SeasonModel:
+    """
+    Assemble a SeasonModel from processed standings.
+
+    Args:
+        standings: process_standings() output (team_name, wins, losses, ties, fptsf)
+        schedule: load_schedule() output; read from SCHEDULE_FILE if None
+        divisions: team -> division; read from DIVISIONS_FILE if None
+        matchups: stored matchup results for per-team score spreads (optional)
+        completed_weeks: scoring periods already reflected in standings; inferred
+            from games played when None
+    """
+    schedule = load_schedule() if schedule is None else schedule
+    divisions = load_divisions() if divisions is None else divisions
+
+    teams = sorted(set(schedule['away']) | set(schedule['home']))
+    team_index = {team: i for i, team in enumerate(teams)}
+    games_per_week = schedule.groupby('period').size().mean() * 2 / len(teams)
+
+    frame = standings.set_index('team_name').reindex(teams)
+    wins = (_numeric(frame, 'wins') + 0.5 * _numeric(frame, 'ties')).to_numpy(dtype=float)
+    points = _numeric(frame, 'fptsf').to_numpy(dtype=float)
+
+    if completed_weeks is None:
+        games = (_numeric(frame, 'wins') + _numeric(frame, 'losses') + _numeric(frame, 'ties'))
+        completed_weeks = int(round(games.median() / games_per_week))
+    remaining = schedule[schedule['period'] > completed_weeks]
+    first_week = int(remaining['period'].min()) if not remaining.empty else int(schedule['period'].max()) + 1
+
+    mean, std = team_score_distributions(standings, teams, games_per_week, matchups)
+    return SeasonModel(
+        teams=teams,
+        divisions=[divisions.get(team, 'Unassigned') for team in teams],
+        wins=wins,
+        points=points,
+        mean=mean,
+        std=std,
+        weeks=(remaining['period'] - first_week).to_numpy(),
+        away=remaining['away'].map(team_index).to_numpy(),
+        home=remaining['home'].map(team_index).to_numpy(),
+        first_week=first_week,
+    )
+
+
+def _play(model: SeasonModel, rng: np.random.Generator, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """One playoff week between team arrays a and b; returns the winners"""
+    noise = rng.standard_normal((2, len(a)), dtype=np.float32)
+    score_a = model.mean[a] + model.std[a] * noise[0]
+    score_b = model.mean[b] + model.std[b] * noise[1]
+    return np.where(score_a >= score_b, a, b)
+
+
+def simulate_chunk(model: SeasonModel, n_sims: int, seed) -> Dict[str, np.ndarray]:
+    """
+    Play out the rest of the season ``n_sims`` times.
+
+    Returns per-team counts: 'division', 'seed' (teams x seeds), 'semifinal',
+    'final', 'champion', plus 'wins' (sum of final win totals).
+    """
+    rng = np.random.default_rng(seed)
+    n_teams = len(model.teams)
+    counts = {
+        'division': np.zeros(n_teams, dtype=np.int64),
+        'seed': np.zeros((n_teams, model.seeds), dtype=np.int64),
+        'semifinal': np.zeros(n_teams, dtype=np.int64),
+        'final': np.zeros(n_teams, dtype=np.int64),
+        'champion': np.zeros(n_teams, dtype=np.int64),
+        'wins': np.zeros(n_teams, dtype=np.float64),
+    }
+    for start in range(0, n_sims, SIMULATION_CHUNK):
+        n = min(SIMULATION_CHUNK, n_sims - start)
+        wins = np.broadcast_to(model.wins, (n, n_teams))
+        points = np.broadcast_to(model.points, (n, n_teams))
+        if model.remaining_games:
+            noise = rng.integers(0, NORMAL_TABLE_SIZE, (n, model.n_weeks, n_teams), dtype=np.uint16)
+            scores = _normal_table()[noise]
+            scores *= model.std
+            scores += model.mean
+            flat = scores.reshape(n, -1)
+            away_won = np.greater(np.take(flat, model.away_cells, axis=1),
+                                  np.take(flat, model.home_cells, axis=1)).astype(np.float32)
+            wins = wins + (away_won @ model.swing + model.home_games)
+            points = points + scores.sum(axis=1)
+
+        # Points scored break ties in the standings
+        strength = wins + points * 1e-7
+        rows = np.arange(n)
+        division_winner = np.zeros((n, n_teams), dtype=bool)
+        for members in model.division_members:
+            winners = members[np.argmax(strength[:, members], axis=1)]
+            division_winner[rows, winners] = True
+            counts['division'] += np.bincount(winners, minlength=n_teams)
+
+        seeded = np.argsort(-(strength + division_winner * 1e6), axis=1)[:, :model.seeds]
+        for seed_slot in range(model.seeds):
+            counts['seed'][:, seed_slot] += np.bincount(seeded[:, seed_slot], minlength=n_teams)
+        counts['wins'] += wins.sum(axis=0)
+
+        alive = [seeded[:, i] for pair in PLAYOFF_BRACKET if max(pair) < model.seeds for i in pair]
+        while len(alive) > 1:
+            alive = [_play(model, rng, alive[i], alive[i + 1]) for i in range(0, len(alive) - 1, 2)]
+            if len(alive) == 2:
+                for team in alive:
+                    counts['final'] += np.bincount(team, minlength=n_teams)
+            elif len(alive) == 4:
+                for team in alive:
+                    counts['semifinal'] += np.bincount(team, minlength=n_teams)
+        if alive:
+            counts['champion'] += np.bincount(alive[0], minlength=n_teams)
+    return counts
+
+
+def simulate(model: SeasonModel, n_sims: int = DEFAULT_SIMULATIONS, seed: int = None,
+             processes: int = 1) -> pd.DataFrame:
+    """
+    Monte Carlo playoff odds.
+
+    Args:
+        model: build_model() output
+        n_sims: Season completions to simulate
+        seed: Base seed; runs with the same seed and model are reproducible
+        processes: Split the simulations across this many worker processes
+
+    Returns:
+        DataFrame: One row per team with projected wins and division, playoff,
+                   per-seed, semifinal, final and championship probabilities
+    """
+    with tracing.span("playoff_odds.simulate", "compute"):
+        if processes > 1:
+            seeds = np.random.SeedSequence(seed).spawn(processes)
+            shares = [n_sims // processes + (i < n_sims % processes) for i in range(processes)]
+            with ProcessPoolExecutor(max_workers=processes) as pool:
+                parts = list(pool.map(simulate_chunk, [model] * processes, shares, seeds))
+            counts = {key: sum(part[key] for part in parts) for key in parts[0]}
+        else:
+            counts = simulate_chunk(model, n_sims, seed)
+
+    odds = pd.DataFrame({
+        'team': model.teams,
+        'division': model.division_names[model.division_codes],
+        'projected_wins': counts['wins'] / n_sims,
+        'division_pct': counts['division'] / n_sims,
+        'playoff_pct': counts['seed'].sum(axis=1) / n_sims,
+    })
+    for seed_slot in range(model.seeds):
+        odds[f'seed_{seed_slot + 1}_pct'] = counts['seed'][:, seed_slot] / n_sims
+    odds['semifinal_pct'] = counts['semifinal'] / n_sims
+    odds['final_pct'] = counts['final'] / n_sims
+    odds['champion_pct'] = counts['champion'] / n_sims
+    return odds.sort_values(['champion_pct', 'playoff_pct'], ascending=False).reset_index(drop=True)
+
+
+def data_version(standings: pd.DataFrame) -> str:
+    """
+    Fingerprint of every simulator input: the standings columns it reads plus
+    the schedule, division and matchup files. Odds only need recomputing when
+    this changes.
+    """
+    columns = [c for c in ('team_name', 'wins', 'losses', 'ties', 'fptsf', 'points_for') if c in standings.columns]
+    digest = hashlib.sha256(pd.util.hash_pandas_object(standings[columns], index=False).values.tobytes())
+    digest.update(repr(file_version(SCHEDULE_FILE, DIVISIONS_FILE, MATCHUP_RESULTS_FILE)).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def playoff_odds(standings: pd.DataFrame, n_sims: int = DEFAULT_SIMULATIONS, processes: int = 1,
+                 version: str = None) -> pd.DataFrame:
+    """
+    Playoff odds for the current standings, seeded by the data version so a
+    rerun on unchanged data gives identical numbers.
+    """
+    version = version or data_version(standings)
+    matchups = MatchupResultsStore().frame() if os.path.exists(MATCHUP_RESULTS_FILE) else None
+    model = build_model(standings, matchups=matchups)
+    return simulate(model, n_sims, seed=int(version[:16], 16), processes=processes)
@@ -0,0 +1,114 @@
+import pandas as pd
+from typing import Iterable, Optional
+from functools import lru_cache
+import tracing
+from change_detection import file_version
+from data_processor import DataProcessor
+
+PROSPECT_IMPORT_FILE = "attached_assets/ABL-Import.csv"
+
+# Prospects listed per team in team_prospect_scores
+DEFAULT_TOP_PROSPECTS = 5
+
+PROSPECT_COLUMNS = ['Name', 'Position', 'MLB Team', 'Score', 'Rank']
+TEAM_SCORE_COLUMNS = ['team', 'total_score', 'avg_score', 'prospect_count', 'player_count',
+                      'top_score', 'top_prospects']
+
+
+def normalize_names(names: pd.Series) -> pd.Series:
+    """Vectorized prospects.normalize_name (including its special cases)"""
+    # Matched after accent folding but before "Last, First" is reordered, as normalize_name does
+    folded = (names.fillna('').astype(str).str.lower()
+              .str.normalize('NFKD').str.encode('ascii', 'ignore').str.decode('ascii'))
+    special = folded.str.contains('de jesus gonzalez|gonzalez, josuar', regex=True)
+    return DataProcessor().normalize_names(names).mask(special, 'josuar gonzalez')
+
+
+@lru_cache(maxsize=2)
+def _prospect_import(version: tuple) -> pd.DataFrame:
+    prospects = tracing.read_csv(PROSPECT_IMPORT_FILE, na_values=['NA', ''], keep_default_na=True)
+    prospects = prospects[[c for c in PROSPECT_COLUMNS if c in prospects.columns]]
+    return prospects.assign(clean_name=normalize_names(prospects['Name']))
+
+
+def prospect_import() -> pd.DataFrame:
+    """ABL-Import.csv with a normalized 'clean_name', reloaded only when the file changes"""
+    return _prospect_import(file_version(PROSPECT_IMPORT_FILE))
+
+
+def prospect_lookup() -> pd.DataFrame:
+    """
+    Score sum and number of import rows per normalized name. A name listed
+    twice in the import counts twice, as the roster join does.
+    """
+    prospects = prospect_import()
+    prospects = prospects[prospects['Score'].notna()]
+    return prospects.groupby('clean_name')['Score'].agg(score='sum', matches='size')
+
+
+def match_prospects(roster_data: pd.DataFrame, statuses: Optional[Iterable[str]] = None,
+                    how: str = 'inner') -> pd.DataFrame:
+    """
+    Join the league roster against the prospect import on normalized name.
+
+    Args:
+        roster_data: Roster rows (team, player_name, ...)
+        statuses: Only roster rows with these statuses (case-insensitive), e.g. ('MINORS',)
+        how: 'inner' keeps matched players only; 'left' keeps every roster row
+
+    Returns:
+        DataFrame: roster columns plus clean_name, roster_row (position in
+                   the filtered roster) and the import's Name, Position, MLB
+                   Team, Score and Rank (one row per match)
+    """
+    roster = roster_data
+    if statuses is not None:
+        wanted = {status.upper() for status in statuses}
+        roster = roster[roster['status'].astype(str).str.upper().isin(wanted)]
+    roster = roster.assign(clean_name=normalize_names(roster['player_name']), roster_row=range(len(roster)))
+    return roster.merge(prospect_import(), on='clean_name', how=how, suffixes=('', '_prospect'))
+
+
+def team_prospect_scores(roster_data: Optional[pd.DataFrame] = None, matched: Optional[pd.DataFrame] = None,
+                         statuses: Optional[Iterable[str]] = None,
+                         top_n: int = DEFAULT_TOP_PROSPECTS) -> pd.DataFrame:
+    """
+    Prospect system of every team from one join and one groupby.
+
+    Pass ``roster_data`` to match against the import here, or a ``matched``
+    frame (match_prospects output, possibly filtered) to aggregate as is.
+
+    Returns:
+        DataFrame: one row per team in roster order (teams without prospects
+                   score 0) with total_score, avg_score and prospect_count over
+                   matched prospects, player_count (roster rows considered,
+                   matched or not), top_score (sum of the best top_n) and
+                   top_prospects (their names, best first)
+    """
+    if matched is None:
+        matched = match_prospects(roster_data, statuses, how='left')
+    teams = pd.unique((roster_data if roster_data is not None else matched)['team'].astype(str))
+    with tracing.span("prospects.team_scores", "compute"):
+        players = matched.assign(team=matched['team'].astype(str))
+        if 'roster_row' in players:
+            player_count = players.groupby('team', sort=False)['roster_row'].nunique()
+        else:
+            player_count = players.groupby('team', sort=False).size()
+
+        scored = players[players['Score'].notna()].sort_values('Score', ascending=False, kind='stable')
+        by_team = scored.groupby('team', sort=False)
+        top = scored[by_team.cumcount() < top_n].groupby('team', sort=False)
+        scores = pd.DataFrame({
+            'total_score': by_team['Score'].sum(),
+            'avg_score': by_team['Score'].mean(),
+            'prospect_count': by_team.size(),
+            'top_score': top['Score'].sum(),
+            'top_prospects': top['player_name'].agg(list),
+        })
+
+    scores = scores.reindex(teams)
+    scores['player_count'] = player_count.reindex(teams).fillna(0).astype(int)
+    scores['top_prospects'] = scores['top_prospects'].map(lambda names: names if isinstance(names, list) else [])
+    scores = scores.fillna({'total_score': 0.0, 'avg_score': 0.0, 'prospect_count': 0, 'top_score': 0.0})
+    scores['prospect_count'] = scores['prospect_count'].astype(int)
+    return scores.rename_axis('team').reset_index()[TEAM_SCORE_COLUMNS]
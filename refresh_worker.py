@@ -0,0 +1,183 @@
+import streamlit as st
+import pandas as pd
+from typing import Any, Dict, Optional
+from types import MappingProxyType
+import datetime
+import os
+import threading
+import traceback
+import change_detection
+import league_state
+import metrics
+import tracing
+
+# Seconds between background refreshes of rosters, standings and transactions
+DEFAULT_REFRESH_INTERVAL = 300
+REFRESH_INTERVAL_ENV_VAR = "ABL_REFRESH_INTERVAL_SECONDS"
+
+# How long a page load waits for the very first snapshot before falling back
+# to a blocking fetch of its own
+FIRST_SNAPSHOT_WAIT_SECONDS = 60
+
+REFRESH_RUNS = metrics.Counter(
+    "abl_refresh_runs_total",
+    "Background refresh cycles by outcome (updated/unchanged/error)",
+    ["outcome"],
+)
+
+
+class LeagueSnapshot:
+    """
+    Immutable view of one successful league refresh.
+
+    ``data`` has the same keys as fetch_api_data() ('league_data', 'roster_data',
+    'standings_data', 'current_period', 'transactions') but is a read-only mapping
+    of frozen frames (league_state.freeze_frame): Arrow-backed strings and
+    read-only numeric columns, held once per process and referenced by every
+    session. Consumers copy before mutating.
+    ``fingerprints`` holds the per-endpoint payload hashes it was built from and
+    ``roster_diff`` the player movement relative to the previous snapshot.
+    """
+    __slots__ = ("version", "fingerprints", "fetched_at", "data", "roster_diff", "nbytes")
+
+    def __init__(self, version: int, fingerprints: Dict[str, str], data: Dict[str, Any],
+                 roster_diff: Optional[change_detection.RosterDiff] = None):
+        object.__setattr__(self, "version", version)
+        object.__setattr__(self, "fingerprints", MappingProxyType(dict(fingerprints)))
+        object.__setattr__(self, "fetched_at", datetime.datetime.now())
+        data = league_state.freeze_league_data(data)
+        object.__setattr__(self, "data", MappingProxyType(data))
+        object.__setattr__(self, "roster_diff", roster_diff)
+        object.__setattr__(self, "nbytes", sum(
+            int(value.memory_usage(deep=True).sum()) for value in data.values() if isinstance(value, pd.DataFrame)))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("LeagueSnapshot is immutable")
+
+
+class RefreshWorker:
+    """
+    Daemon thread that keeps a warm LeagueSnapshot.
+
+    Every ``interval`` seconds it fetches the raw Fantrax payloads and
+    fingerprints each endpoint. If nothing changed, nothing is reprocessed;
+    otherwise only outputs derived from changed endpoints are rebuilt, and the
+    new snapshot replaces the old one in a single reference assignment, so
+    readers never see a half-built snapshot.
+    """
+
+    def __init__(self, interval: Optional[float] = None):
+        if interval is None:
+            interval = float(os.getenv(REFRESH_INTERVAL_ENV_VAR, DEFAULT_REFRESH_INTERVAL))
+        self.interval = interval
+        self._snapshot: Optional[LeagueSnapshot] = None
+        self._ready = threading.Event()
+        self._wake = threading.Event()
+        self._refresh_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self.last_checked: Optional[datetime.datetime] = None
+        self.last_error: Optional[str] = None
+        self.last_matchup_error: Optional[str] = None
+
+    def start(self):
+        """Start the background thread (idempotent)"""
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name="abl-refresh-worker", daemon=True)
+            self._thread.start()
+        return self
+
+    def _run(self):
+        while True:
+            self.refresh()
+            self.sync_matchups()
+            self._wake.wait(self.interval)
+            self._wake.clear()
+
+    def trigger(self):
+        """Ask the background thread to refresh now instead of at the next tick"""
+        self._wake.set()
+
+    def refresh(self) -> bool:
+        """
+        Run one refresh cycle synchronously.
+
+        Returns:
+            bool: True if a new snapshot was published, False if content was
+                  unchanged or the refresh failed
+        """
+        # Imported lazily: utils imports this module for get_league_data()
+        from api_client import FantraxAPI
+        from utils import fetch_raw_league_payloads, process_league_payloads
+
+        with self._refresh_lock:
+            try:
+                with tracing.span("refresh.fetch", "fetch"):
+                    raw = fetch_raw_league_payloads(FantraxAPI(), include_transactions=True)
+                fingerprints = change_detection.fingerprint_payloads(raw)
+                self.last_checked = datetime.datetime.now()
+
+                current = self._snapshot
+                previous_fps = dict(current.fingerprints) if current is not None else None
+                changed = change_detection.changed_endpoints(previous_fps, fingerprints)
+                if current is not None and not changed:
+                    REFRESH_RUNS.inc(outcome="unchanged")
+                    return False
+
+                rebuild = change_detection.outputs_to_rebuild(changed)
+                previous_data = current.data if current is not None else None
+                with tracing.span("refresh.process", "process"):
+                    processed = process_league_payloads(raw, previous=previous_data, rebuild=rebuild)
+
+                roster_diff = None
+                if 'roster_data' in rebuild:
+                    old_rosters = previous_data['roster_data'] if previous_data is not None else None
+                    roster_diff = change_detection.diff_rosters(old_rosters, processed['roster_data'])
+                elif current is not None:
+                    roster_diff = change_detection.RosterDiff()
+
+                version = current.version + 1 if current is not None else 1
+                self._snapshot = LeagueSnapshot(version, fingerprints, processed, roster_diff)
+                league_state.update_shared_bytes()
+                self.last_error = None
+                REFRESH_RUNS.inc(outcome="updated")
+                return True
+            except Exception as e:
+                self.last_error = f"{e}\n{traceback.format_exc()}"
+                REFRESH_RUNS.inc(outcome="error")
+                return False
+            finally:
+                # Unblock page loads waiting on the first snapshot even if it failed
+                self._ready.set()
+
+    def sync_matchups(self) -> int:
+        """
+        Ingest matchups for weekly periods that finished since the last sync.
+
+        Returns:
+            int: Number of periods stored (0 when nothing new finished or on error)
+        """
+        from api_client import FantraxAPI
+        from matchup_results import get_matchup_ingestor
+        from season_calendar import get_league_calendars
+
+        try:
+            with tracing.span("refresh.matchups", "fetch"):
+                calendar = get_league_calendars(FantraxAPI()).weekly
+                stored = get_matchup_ingestor().run(FantraxAPI, calendar)
+            self.last_matchup_error = None
+            return stored
+        except Exception as e:
+            self.last_matchup_error = f"{e}\n{traceback.format_exc()}"
+            return 0
+
+    def get_snapshot(self, wait: float = FIRST_SNAPSHOT_WAIT_SECONDS) -> Optional[LeagueSnapshot]:
+        """Return the current snapshot, waiting up to ``wait`` seconds for the first one"""
+        if self._snapshot is None and wait:
+            self._ready.wait(wait)
+        return self._snapshot
+
+
+@st.cache_resource
+def get_refresh_worker() -> RefreshWorker:
+    """Process-wide refresh worker, started on first use"""
+    return RefreshWorker().start()
@@ -0,0 +1,290 @@
+import pandas as pd
+import numpy as np
+from typing import Dict, Tuple
+from functools import lru_cache
+from statistics import NormalDist
+import tracing
+from change_detection import TeamResultCache, file_version
+from data_processor import DataProcessor
+from playoff_odds import DEFAULT_SCORE_CV, SeasonModel, build_model
+
+HITTER_ROS_FILE = "attached_assets/hitter_ROS.csv"
+PITCHER_ROS_FILE = "attached_assets/pitcher_ROS.csv"
+
+# League scoring (same weights as the MVP race ROS scores)
+HITTER_POINTS = {'1B': 1, '2B': 2, '3B': 3, 'HR': 4, 'SB': 2, 'RBI': 1, 'R': 1, 'BB': 1, 'HBP': 1, 'IBB': 1}
+PITCHER_POINTS = {'IP': 2, 'SO': 1, 'SV': 6, 'HLD': 3, 'ER': -1, 'H': -0.5, 'BB': -0.5, 'HBP': -0.5}
+QA7_POINTS = 8
+
+# MLB games per week (162 games over ~26 weeks); turns the ROS games of an
+# everyday player into the number of weeks the projection files cover
+MLB_GAMES_PER_WEEK = 162 / 26
+
+# Weekly active lineup: (slot, count, roster positions that can fill it).
+# Each team starts the assignment of eligible players to slots with the most
+# projected points (see best_lineup), so multi-position players go wherever
+# the team needs them.
+HITTER_POSITIONS = ('C', '1B', '2B', '3B', 'SS', 'OF', 'LF', 'CF', 'RF', 'UT', 'DH')
+PITCHER_POSITIONS = ('SP', 'RP', 'P')
+LINEUP_SLOTS = [
+    ('C', 1, ('C',)),
+    ('1B', 1, ('1B',)),
+    ('2B', 1, ('2B',)),
+    ('3B', 1, ('3B',)),
+    ('SS', 1, ('SS',)),
+    ('OF', 3, ('OF', 'LF', 'CF', 'RF')),
+    ('UT', 1, HITTER_POSITIONS),
+    ('SP', 3, ('SP',)),
+    ('RP', 3, ('RP',)),
+    ('P', 1, PITCHER_POSITIONS),
+]
+
+# Roster statuses that cannot be started
+INACTIVE_STATUSES = ('minors', 'injured reserve', 'ir')
+
+# LINEUP_SLOTS index of every individual starting spot (one per slot count)
+SLOT_COLUMNS = np.repeat(np.arange(len(LINEUP_SLOTS)), [count for _, count, _ in LINEUP_SLOTS])
+
+# Per-start bonus that breaks ties between starting a 0-point player and
+# leaving the spot empty in favor of starting the player
+FILL_BONUS = 1e-6
+
+LINEUP_CACHE = TeamResultCache("ros_lineups")
+
+
+def _stat(frame: pd.DataFrame, column: str) -> pd.Series:
+    if column not in frame.columns:
+        return pd.Series(0.0, index=frame.index)
+    return pd.to_numeric(frame[column], errors='coerce').fillna(0.0)
+
+
+def hitter_ros_points(hitters: pd.DataFrame) -> pd.Series:
+    """ROS fantasy points for every row of a hitter ROS table"""
+    return sum(_stat(hitters, stat) * weight for stat, weight in HITTER_POINTS.items())
+
+
+def pitcher_ros_points(pitchers: pd.DataFrame) -> pd.Series:
+    """
+    ROS fantasy points for every row of a pitcher ROS table.
+
+    QA7 is scored per appearance, so it is applied to the pitcher's average
+    start (ROS IP and ER per GS) and credited once per projected start.
+    """
+    points = sum(_stat(pitchers, stat) * weight for stat, weight in PITCHER_POINTS.items())
+    starts = _stat(pitchers, 'GS')
+    ip_per_start = _stat(pitchers, 'IP') / starts.where(starts > 0)
+    er_per_start = _stat(pitchers, 'ER') / starts.where(starts > 0)
+    quality = (((ip_per_start >= 4) & (ip_per_start <= 4.67) & (er_per_start <= 1)) |
+               ((ip_per_start >= 5) & (ip_per_start <= 6.67) & (er_per_start <= 2)) |
+               ((ip_per_start >= 7) & (er_per_start <= 3)))
+    return points + quality * starts * QA7_POINTS
+
+
+@lru_cache(maxsize=2)
+def _player_table(version: tuple) -> Tuple[pd.Series, float]:
+    hitters = tracing.read_csv(HITTER_ROS_FILE, encoding='utf-8-sig')
+    pitchers = tracing.read_csv(PITCHER_ROS_FILE, encoding='utf-8-sig')
+    normalize = DataProcessor().normalize_names
+
+    points = pd.concat([
+        pd.Series(hitter_ros_points(hitters).values, index=normalize(hitters['Name'])),
+        pd.Series(pitcher_ros_points(pitchers).values, index=normalize(pitchers['Name'])),
+    ])
+    # Two-way players score on both tables; same-name duplicates keep the larger line
+    points = points.groupby(level=0).agg(list).map(lambda values: sum(values) if len(values) == 2 else max(values))
+
+    everyday_games = _stat(hitters, 'G').quantile(0.99) if not hitters.empty else 0
+    horizon_weeks = max(everyday_games / MLB_GAMES_PER_WEEK, 1.0)
+    return points, horizon_weeks
+
+
+def player_ros_points() -> Tuple[pd.Series, float]:
+    """
+    Cached ROS fantasy points per normalized player name, plus the number of
+    weeks the ROS files cover. Reloaded only when either file changes.
+    """
+    return _player_table(file_version(HITTER_ROS_FILE, PITCHER_ROS_FILE))
+
+
+def _eligibility(positions: pd.Series, accepted: Tuple[str, ...]) -> pd.Series:
+    pattern = r'(?:^|[,/ ])(?:' + '|'.join(accepted) + r')(?:$|[,/ ])'
+    return positions.str.contains(pattern, regex=True)
+
+
+def slot_eligibility(positions: pd.Series) -> np.ndarray:
+    """Boolean (players x LINEUP_SLOTS) matrix of the slots each player can fill"""
+    positions = positions.astype(str).str.upper()
+    return np.column_stack([_eligibility(positions, accepted).to_numpy(dtype=bool)
+                            for _, _, accepted in LINEUP_SLOTS])
+
+
+def min_cost_assignment(cost: np.ndarray) -> np.ndarray:
+    """
+    Column assigned to each row of an (n x m, n <= m) cost matrix such that
+    the total cost is minimal (Hungarian algorithm, O(n^2 m), vectorized over
+    the columns).
+    """
+    n, m = cost.shape
+    u, v = np.zeros(n + 1), np.zeros(m + 1)
+    match = np.zeros(m + 1, dtype=np.intp)  # 1-based row matched to each column, 0 = free
+    way = np.zeros(m + 1, dtype=np.intp)
+    for row in range(1, n + 1):
+        match[0] = row
+        col = 0
+        min_slack = np.full(m + 1, np.inf)
+        done = np.zeros(m + 1, dtype=bool)
+        while True:
+            done[col] = True
+            free = ~done[1:]
+            slack = cost[match[col] - 1] - u[match[col]] - v[1:]
+            better = free & (slack < min_slack[1:])
+            min_slack[1:][better] = slack[better]
+            way[1:][better] = col
+            candidates = np.where(free, min_slack[1:], np.inf)
+            next_col = int(np.argmin(candidates)) + 1
+            delta = candidates[next_col - 1]
+            u[match[done]] += delta
+            v[done] -= delta
+            min_slack[1:][free] -= delta
+            col = next_col
+            if match[col] == 0:
+                break
+        while col:
+            previous = way[col]
+            match[col] = match[previous]
+            col = previous
+    assigned = np.empty(n, dtype=np.intp)
+    cols = np.nonzero(match[1:])[0]
+    assigned[match[1:][cols] - 1] = cols
+    return assigned
+
+
+def best_lineup(weekly_points: np.ndarray, eligibility: np.ndarray) -> np.ndarray:
+    """
+    Starter mask of one team's active players: the assignment of players to
+    the individual spots of LINEUP_SLOTS with the most projected weekly
+    points. A spot may stay empty (no eligible player, or only ones projected
+    below zero). Small enough to rerun per candidate trade.
+    """
+    n_players, n_spots = len(weekly_points), len(SLOT_COLUMNS)
+    used = np.zeros(n_players, dtype=bool)
+    if n_players == 0:
+        return used
+    points = np.asarray(weekly_points, dtype=float)
+    eligible = eligibility[:, SLOT_COLUMNS].T
+    # Any ineligible pairing costs more than leaving every spot empty
+    ineligible_cost = np.abs(points).sum() + n_spots + 1.0
+    cost = np.hstack([
+        np.where(eligible, -(points + FILL_BONUS), ineligible_cost),
+        np.zeros((n_spots, n_spots)),  # one "empty" column per spot
+    ])
+    assigned = min_cost_assignment(cost)
+    starters = assigned[assigned < n_players]
+    spots = np.nonzero(assigned < n_players)[0]
+    used[starters[eligible[spots, starters]]] = True
+    return used
+
+
+def optimal_lineups(roster_data: pd.DataFrame) -> Dict[str, Dict[str, float]]:
+    """
+    Best weekly active lineup for every team in roster_data (best_lineup per
+    team over its active players).
+
+    Returns:
+        dict: team -> {'weekly_points', 'starters', 'projected_starters'}
+    """
+    points, horizon_weeks = player_ros_points()
+    normalize = DataProcessor().normalize_names
+
+    players = pd.DataFrame({
+        'team': roster_data['team'].astype(str).values,
+        'weekly_points': normalize(roster_data['player_name']).map(points).values / horizon_weeks,
+        'position': roster_data['position'].astype(str).str.upper().values,
+    })
+    status = roster_data['status'].astype(str).str.lower().values
+    players = players[~np.isin(status, INACTIVE_STATUSES)]
+    players = players.assign(projected=players['weekly_points'].notna(),
+                             weekly_points=players['weekly_points'].fillna(0.0))
+
+    eligibility = slot_eligibility(players['position'])
+    weekly_points = players['weekly_points'].to_numpy()
+    used = np.zeros(len(players), dtype=bool)
+    for rows in players.groupby('team', sort=False).indices.values():
+        used[rows] = best_lineup(weekly_points[rows], eligibility[rows])
+
+    lineup = players[used].groupby('team', sort=False).agg(
+        weekly_points=('weekly_points', 'sum'),
+        starters=('weekly_points', 'size'),
+        projected_starters=('projected', 'sum'),
+    )
+    return {
+        team: {'weekly_points': float(row.weekly_points), 'starters': int(row.starters),
+               'projected_starters': int(row.projected_starters)}
+        for team, row in lineup.iterrows()
+    }
+
+
+def team_weekly_projections(roster_data: pd.DataFrame) -> pd.DataFrame:
+    """
+    Projected weekly score of each team's optimal lineup, indexed by team.
+
+    Lineups are cached per team by roster fingerprint, so when one roster
+    changes only that team is re-optimized; a change to either ROS file
+    recomputes everything.
+    """
+    if roster_data is None or roster_data.empty:
+        return pd.DataFrame(columns=['weekly_points', 'starters', 'projected_starters'])
+    with tracing.span("ros.lineups", "compute"):
+        lineups = LINEUP_CACHE.get_many_batched(
+            roster_data, optimal_lineups, dependency_key=file_version(HITTER_ROS_FILE, PITCHER_ROS_FILE)
+        )
+    return pd.DataFrame.from_dict(lineups, orient='index')
+
+
+def ros_model(standings: pd.DataFrame, roster_data: pd.DataFrame, **kwargs) -> SeasonModel:
+    """SeasonModel over the remaining schedule with weekly scores from ROS lineups"""
+    model = build_model(standings, **kwargs)
+    weekly = team_weekly_projections(roster_data)['weekly_points'].reindex(model.teams)
+    if weekly.notna().any():
+        weekly = weekly.fillna(weekly.mean())
+        model = model.with_scores(weekly.to_numpy(), weekly.to_numpy() * DEFAULT_SCORE_CV)
+    return model
+
+
+def projected_standings(standings: pd.DataFrame, roster_data: pd.DataFrame, **kwargs) -> pd.DataFrame:
+    """
+    Final standings projected from ROS lineups against the real remaining schedule.
+
+    Each remaining game adds its win probability, P(score_a > score_b) for
+    normally distributed weekly scores, to the teams' expected wins.
+    """
+    model = ros_model(standings, roster_data, **kwargs)
+    mean, std = model.mean.astype(float), model.std.astype(float)
+    spread = np.sqrt(std[model.away] ** 2 + std[model.home] ** 2)
+    z = (mean[model.away] - mean[model.home]) / np.where(spread > 0, spread, 1.0)
+    away_win = np.frompyfunc(NormalDist().cdf, 1, 1)(z).astype(float)
+
+    n_teams = len(model.teams)
+    expected = (np.bincount(model.away, weights=away_win, minlength=n_teams) +
+                np.bincount(model.home, weights=1 - away_win, minlength=n_teams))
+    games = np.bincount(model.away, minlength=n_teams) + np.bincount(model.home, minlength=n_teams)
+
+    current = standings.set_index('team_name').reindex(model.teams)
+    projection = pd.DataFrame({
+        'team': model.teams,
+        'division': model.division_names[model.division_codes],
+        'wins': current['wins'].fillna(0).to_numpy(),
+        'losses': current['losses'].fillna(0).to_numpy(),
+        'ties': current['ties'].fillna(0).to_numpy(),
+        'projected_weekly_score': mean,
+        'remaining_games': games,
+        'expected_wins_remaining': expected,
+    })
+    projection['projected_wins'] = projection['wins'] + expected
+    projection['projected_losses'] = projection['losses'] + games - expected
+    total = projection['projected_wins'] + projection['projected_losses'] + projection['ties']
+    projection['projected_win_pct'] = ((projection['projected_wins'] + 0.5 * projection['ties']) /
+                                       total.where(total > 0, 1))
+    projection = projection.sort_values('projected_win_pct', ascending=False).reset_index(drop=True)
+    projection['projected_rank'] = np.arange(1, len(projection) + 1)
+    return projection
@@ -0,0 +1,157 @@
+import pandas as pd
+import numpy as np
+from typing import Dict, Iterable, Optional
+from functools import lru_cache
+import metrics
+import tracing
+from change_detection import file_version
+from league_state import ARROW_STRING, freeze_frame
+
+# Column kinds:
+#   category  low-cardinality text (teams, positions, statuses, contracts)
+#   string    high-cardinality text (names, IDs); Arrow-backed when pyarrow is installed
+#   int       whole numbers as int32 (int64 when they don't fit; nullable Int*
+#             when values are missing). Never narrower: scoring multiplies these
+#             counts vectorized, and int8/int16 would wrap without an error
+#   float32   measurements that are only displayed
+#   float     float64, for inputs of score calculations
+COLUMN_KINDS = ('category', 'string', 'int', 'float32', 'float')
+
+DATASET_BYTES = metrics.Gauge(
+    "abl_dataset_bytes",
+    "Deep memory usage of each typed dataset after its last load",
+    ["dataset"],
+)
+
+
+def _downcast_int(values: pd.Series) -> pd.Series:
+    numeric = pd.to_numeric(values, errors='coerce')
+    present = numeric.dropna()
+    if present.empty or not (present == np.floor(present)).all():
+        return numeric
+    nullable = len(present) < len(numeric)
+    low, high = present.min(), present.max()
+    for bits in (32, 64):
+        info = np.iinfo(f'int{bits}')
+        if info.min <= low and high <= info.max:
+            return numeric.astype(f'Int{bits}' if nullable else f'int{bits}')
+    return numeric
+
+
+class Schema:
+    """
+    Columns a dataset is used with and the dtype of each.
+
+    ``read_csv`` loads only the declared columns (missing ones are skipped)
+    and ``apply`` converts an already loaded frame, so both CSV assets and
+    API-built frames end up with the same lean dtypes.
+    """
+    __slots__ = ('name', 'columns', 'read_kwargs')
+
+    def __init__(self, name: str, columns: Dict[str, str], **read_kwargs):
+        unknown = set(columns.values()) - set(COLUMN_KINDS)
+        if unknown:
+            raise ValueError(f"Unknown column kinds in schema {name}: {sorted(unknown)}")
+        self.name = name
+        self.columns = columns
+        self.read_kwargs = read_kwargs
+
+    def _convert(self, values: pd.Series, kind: str) -> pd.Series:
+        if kind == 'category':
+            return values.astype('category')
+        if kind == 'string':
+            return values.astype(ARROW_STRING) if ARROW_STRING is not None else values.astype(object)
+        if kind == 'int':
+            return _downcast_int(values)
+        numeric = pd.to_numeric(values, errors='coerce')
+        return numeric.astype('float32') if kind == 'float32' else numeric.astype('float64')
+
+    def apply(self, frame: pd.DataFrame) -> pd.DataFrame:
+        """Declared columns only, in declaration order, converted to their kinds"""
+        present = [column for column in self.columns if column in frame.columns]
+        typed = pd.DataFrame({column: self._convert(frame[column], self.columns[column]) for column in present},
+                             index=frame.index)
+        DATASET_BYTES.set(int(typed.memory_usage(deep=True).sum()), dataset=self.name)
+        return typed
+
+    def read_csv(self, path: str, **kwargs) -> pd.DataFrame:
+        """Load the declared columns of a CSV and type them"""
+        kwargs = {**self.read_kwargs, **kwargs}
+        frame = tracing.read_csv(path, usecols=lambda column: column in self.columns, **kwargs)
+        return self.apply(frame)
+
+    def memory_report(self, path: str) -> Dict[str, object]:
+        """Rows, columns and deep memory of the CSV loaded untyped vs. with this schema"""
+        untyped = pd.read_csv(path, **self.read_kwargs)
+        typed = self.read_csv(path)
+        before = int(untyped.memory_usage(deep=True).sum())
+        after = int(typed.memory_usage(deep=True).sum())
+        return {'dataset': self.name, 'rows': len(typed), 'columns_before': untyped.shape[1],
+                'columns_after': typed.shape[1], 'bytes_before': before, 'bytes_after': after,
+                'saved_pct': round(100 * (1 - after / before), 1) if before else 0.0}
+
+
+# --- Datasets -----------------------------------------------------------------
+
+# process_rosters output; team stays a string column because pages group
+# and index by it (categorical groupers would add rows for empty teams)
+ROSTERS = Schema('rosters', {
+    'team': 'string', 'player_name': 'string', 'position': 'category', 'status': 'category',
+    'salary': 'float', 'mlb_team': 'category',
+})
+
+MVP_PLAYERS_FILE = "attached_assets/MVP-Player-List.csv"
+MVP_PLAYERS = Schema('mvp_players', {
+    'Player': 'string', 'Position': 'category', 'Team': 'category', 'Age': 'int', 'Salary': 'int',
+    'Contract': 'category', 'FPts': 'float', 'FP/G': 'float',
+})
+
+# Of PLAYERIDMAP's 45 columns only the name spellings and the MLBAM ID are used
+PLAYER_ID_MAP_FILE = "attached_assets/PLAYERIDMAP.csv"
+PLAYER_ID_MAP = Schema('player_id_map', {
+    'PLAYERNAME': 'string', 'MLBID': 'int', 'MLBNAME': 'string', 'FANTRAXNAME': 'string', 'FANGRAPHSNAME': 'string',
+})
+
+# Season projections used for the roster page's fantasy points
+HITTER_PROJECTIONS_FILE = "attached_assets/batx-hitters.csv"
+HITTER_PROJECTIONS = Schema('hitter_projections', {
+    'Name': 'string', 'Team': 'category', 'H': 'int', '2B': 'int', '3B': 'int', 'HR': 'int', 'R': 'int',
+    'RBI': 'int', 'BB': 'int', 'HBP': 'int', 'SB': 'int',
+}, na_values=['NA', ''], keep_default_na=True)
+
+PITCHER_PROJECTIONS_FILE = "attached_assets/oopsy-pitchers-2.csv"
+PITCHER_PROJECTIONS = Schema('pitcher_projections', {
+    'Name': 'string', 'Team': 'category', 'IP': 'float', 'SO': 'int', 'SV': 'int', 'HLD': 'int', 'ER': 'int',
+    'H': 'int', 'BB': 'int',
+}, na_values=['NA', ''], keep_default_na=True)
+
+CSV_DATASETS = {
+    MVP_PLAYERS_FILE: MVP_PLAYERS,
+    PLAYER_ID_MAP_FILE: PLAYER_ID_MAP,
+    HITTER_PROJECTIONS_FILE: HITTER_PROJECTIONS,
+    PITCHER_PROJECTIONS_FILE: PITCHER_PROJECTIONS,
+}
+
+
+@lru_cache(maxsize=8)
+def _load_csv(path: str, version: tuple) -> pd.DataFrame:
+    return freeze_frame(CSV_DATASETS[path].read_csv(path))
+
+
+def load_csv(path: str) -> pd.DataFrame:
+    """
+    Typed, read-only frame of a CSV_DATASETS file, loaded once per file
+    version and shared by all callers (copy before mutating).
+    """
+    return _load_csv(path, file_version(path))
+
+
+def memory_report(datasets: Optional[Iterable[str]] = None) -> pd.DataFrame:
+    """Memory of every CSV dataset before and after typing (one row per file)"""
+    paths = list(datasets) if datasets is not None else list(CSV_DATASETS)
+    return pd.DataFrame([CSV_DATASETS[path].memory_report(path) for path in paths])
+
+
+if __name__ == "__main__":
+    with pd.option_context('display.width', 200):
+        print(memory_report().to_string(index=False))
@@ -0,0 +1,342 @@
+import pandas as pd
+import numpy as np
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from bisect import bisect_right
+import datetime
+import os
+import threading
+import time
+import metrics
+
+# Optional authoritative weekly table (columns: period, name, start_date, end_date).
+# When present it wins over anything derived from the API; only rows of the
+# requested season (by start date) are used. The file is not shipped, so
+# unless it is added the weekly table comes from getLeagueInfo or is
+# synthesized (see abl_season_calendar_synthesized).
+CALENDAR_FILE = "data/season_calendar.csv"
+
+# Weekly periods synthesized from April 1 when no real table is available
+DEFAULT_SEASON_START = (4, 1)
+DEFAULT_WEEKS_IN_SEASON = 26
+
+# First daily roster period per season. Fantrax numbers roster (transaction)
+# periods by day; trade history has "Period 72" on Thu Jun 5, 2025, so
+# daily period 1 was Wed Mar 26, 2025. Seasons missing here start their
+# daily periods on the first day of the weekly table (synthesized).
+DAILY_PERIOD_ONE = {
+    2025: datetime.date(2025, 3, 26),
+}
+
+# How long the league's current season is trusted before getLeagueInfo is
+# asked again, so a long-running server rolls over to the next season
+DEFAULT_SEASON_RECHECK_SECONDS = 24 * 3600
+
+CALENDAR_SYNTHESIZED = metrics.Gauge(
+    "abl_season_calendar_synthesized",
+    "1 if the current season's weekly or daily period table is synthesized rather than loaded, else 0",
+    ["table"],
+)
+
+_DATE_FORMATS = ("%Y-%m-%d", "%a %b %d, %Y", "%m/%d/%Y")
+
+
+def _parse_date(value: Any) -> Optional[datetime.date]:
+    if isinstance(value, datetime.datetime):
+        return value.date()
+    if isinstance(value, datetime.date):
+        return value
+    if not value:
+        return None
+    text = str(value).strip()
+    for fmt in _DATE_FORMATS:
+        try:
+            return datetime.datetime.strptime(text, fmt).date()
+        except ValueError:
+            continue
+    try:
+        return pd.Timestamp(text).date()
+    except (ValueError, TypeError):
+        return None
+
+
+class ScoringPeriod:
+    """One scoring period: inclusive [start, end] dates"""
+    __slots__ = ("number", "name", "start", "end")
+
+    def __init__(self, number: int, name: str, start: datetime.date, end: datetime.date):
+        self.number = number
+        self.name = name
+        self.start = start
+        self.end = end
+
+    def __repr__(self):
+        return f"ScoringPeriod({self.number}, {self.start} - {self.end})"
+
+
+class SeasonCalendar:
+    """
+    Sorted, non-overlapping scoring periods with O(log n) lookups.
+
+    ``period_for(day)`` bisects the period start dates; ``date_range(number)``
+    is a dict lookup. Instances are immutable once built and shared process-wide.
+    """
+
+    def __init__(self, periods: Iterable[ScoringPeriod], kind: str = "weekly", source: str = ""):
+        self.periods: Tuple[ScoringPeriod, ...] = tuple(sorted(periods, key=lambda p: p.start))
+        self.kind = kind
+        self.source = source
+        self._starts: List[datetime.date] = [p.start for p in self.periods]
+        self._by_number: Dict[int, ScoringPeriod] = {p.number: p for p in self.periods}
+        self._starts64 = np.array(self._starts, dtype="datetime64[D]")
+        self._numbers = np.array([p.number for p in self.periods])
+
+    @classmethod
+    def weekly(cls, first_day: datetime.date, weeks: int, source: str = "synthesized") -> "SeasonCalendar":
+        periods = []
+        for week in range(1, weeks + 1):
+            start = first_day + datetime.timedelta(days=(week - 1) * 7)
+            periods.append(ScoringPeriod(week, f"Week {week}", start, start + datetime.timedelta(days=6)))
+        return cls(periods, "weekly", source)
+
+    @classmethod
+    def daily(cls, first_day: datetime.date, last_day: datetime.date, source: str = "derived") -> "SeasonCalendar":
+        days = (last_day - first_day).days + 1
+        periods = [
+            ScoringPeriod(n, f"Period {n}", first_day + datetime.timedelta(days=n - 1),
+                          first_day + datetime.timedelta(days=n - 1))
+            for n in range(1, max(days, 1) + 1)
+        ]
+        return cls(periods, "daily", source)
+
+    def __len__(self) -> int:
+        return len(self.periods)
+
+    @property
+    def first_day(self) -> Optional[datetime.date]:
+        return self.periods[0].start if self.periods else None
+
+    @property
+    def last_day(self) -> Optional[datetime.date]:
+        return self.periods[-1].end if self.periods else None
+
+    def period(self, number: int) -> Optional[ScoringPeriod]:
+        return self._by_number.get(int(number))
+
+    def date_range(self, number: int) -> Optional[Tuple[datetime.date, datetime.date]]:
+        """(start, end) of a period, or None if the number is unknown"""
+        period = self.period(number)
+        return (period.start, period.end) if period is not None else None
+
+    def period_for(self, day: datetime.date) -> Optional[ScoringPeriod]:
+        """Period containing ``day``, or None if it falls outside every period"""
+        i = bisect_right(self._starts, day) - 1
+        if i < 0:
+            return None
+        period = self.periods[i]
+        return period if day <= period.end else None
+
+    def number_for(self, day: datetime.date, clamp: bool = True) -> Optional[int]:
+        """
+        Period number for ``day``.
+
+        With ``clamp``, days before the season map to the first period and days
+        after it (or in gaps) to the last period that has started.
+        """
+        if not self.periods:
+            return None
+        period = self.period_for(day)
+        if period is not None:
+            return period.number
+        if not clamp:
+            return None
+        i = bisect_right(self._starts, day) - 1
+        return self.periods[max(i, 0)].number
+
+    def current(self, today: datetime.date = None) -> Optional[int]:
+        return self.number_for(today or datetime.date.today())
+
+    def numbers_for(self, dates: pd.Series) -> pd.Series:
+        """Vectorized number_for (clamped) for a Series of dates; NaT stays missing"""
+        values = pd.to_datetime(dates, errors='coerce')
+        positions = np.searchsorted(self._starts64, values.values.astype("datetime64[D]"), side="right") - 1
+        numbers = pd.Series(self._numbers[np.clip(positions, 0, len(self._numbers) - 1)], index=dates.index)
+        return numbers.where(values.notna())
+
+    def starts_for(self, numbers: pd.Series) -> pd.Series:
+        """Start date of each period number in a Series; unknown numbers become NaT"""
+        lookup = pd.Series(self._starts64, index=self._numbers)
+        starts = lookup.reindex(pd.to_numeric(numbers, errors='coerce').values)
+        return pd.Series(pd.to_datetime(starts.values), index=numbers.index)
+
+    def to_payload(self, today: datetime.date = None) -> Dict[str, Any]:
+        """Legacy getScoringPeriods-style payload ({'periods': [...], 'currentPeriod': {...}})"""
+        today = today or datetime.date.today()
+        current = self.current(today)
+        periods = [{
+            'periodName': p.name,
+            'periodNum': p.number,
+            'id': p.number,
+            'startDate': p.start.strftime('%Y-%m-%d'),
+            'endDate': p.end.strftime('%Y-%m-%d'),
+            'isActive': p.number == current and p.start <= today <= p.end,
+            'isCurrent': p.number == current,
+            'isCompleted': today > p.end,
+            'isFuture': today < p.start,
+        } for p in self.periods]
+        return {
+            'periods': periods,
+            'currentPeriod': next((p for p in periods if p['isCurrent']), periods[0] if periods else {}),
+        }
+
+
+def parse_periods(payload: Any) -> List[ScoringPeriod]:
+    """
+    Extract dated periods from any of the payload shapes Fantrax (or our own
+    to_payload) produce: a list of periods, or a dict holding one under
+    'periods', 'items' or 'scoringPeriods'. Periods use startDate/endDate or a
+    caption/subCaption pair like "(Tue Mar 18, 2025 - Sun Mar 30, 2025)".
+    """
+    if isinstance(payload, dict):
+        for key in ('periods', 'items', 'scoringPeriods'):
+            if isinstance(payload.get(key), list):
+                payload = payload[key]
+                break
+    if not isinstance(payload, list):
+        return []
+
+    periods = []
+    for i, item in enumerate(payload, 1):
+        if not isinstance(item, dict):
+            continue
+        start = _parse_date(item.get('startDate', item.get('start')))
+        end = _parse_date(item.get('endDate', item.get('end')))
+        if (start is None or end is None) and isinstance(item.get('subCaption'), str):
+            bounds = item['subCaption'].strip('()').split(' - ')
+            if len(bounds) == 2:
+                start, end = _parse_date(bounds[0]), _parse_date(bounds[1])
+        if start is None or end is None:
+            continue
+        number = item.get('periodNum', item.get('id', item.get('period', i)))
+        try:
+            number = int(number)
+        except (TypeError, ValueError):
+            number = i
+        name = item.get('periodName', item.get('caption', f"Week {number}"))
+        periods.append(ScoringPeriod(number, str(name), start, end))
+    return periods
+
+
+def calendar_from_payload(payload: Any, source: str = "payload") -> Optional[SeasonCalendar]:
+    periods = parse_periods(payload)
+    return SeasonCalendar(periods, "weekly", source) if periods else None
+
+
+def _load_calendar_file(season: int, path: str = CALENDAR_FILE) -> Optional[SeasonCalendar]:
+    if not os.path.exists(path):
+        return None
+    try:
+        table = pd.read_csv(path)
+    except (OSError, ValueError):
+        return None
+    periods = []
+    for row in table.itertuples(index=False):
+        start, end = _parse_date(row.start_date), _parse_date(row.end_date)
+        if start is not None and end is not None and start.year == season:
+            name = getattr(row, 'name', None)
+            periods.append(ScoringPeriod(int(row.period), str(name) if pd.notna(name) else f"Week {row.period}",
+                                         start, end))
+    return SeasonCalendar(periods, "weekly", path) if periods else None
+
+
+class LeagueCalendars:
+    """
+    The weekly scoring calendar and the daily roster calendar of one season.
+
+    Each calendar's ``source`` says where it came from; "synthesized" means
+    it is a stand-in (weekly from April 1, or daily periods starting on the
+    first weekly day) rather than the league's real table.
+    """
+    __slots__ = ("season", "weekly", "daily")
+
+    def __init__(self, season: int, weekly: SeasonCalendar):
+        self.season = season
+        self.weekly = weekly
+        first = DAILY_PERIOD_ONE.get(season)
+        source = "DAILY_PERIOD_ONE"
+        if first is None:
+            first, source = weekly.first_day, "synthesized"
+        last = max(weekly.last_day, first) if weekly.last_day else first
+        self.daily = SeasonCalendar.daily(first, last, source)
+
+    @property
+    def synthesized(self) -> Dict[str, bool]:
+        """Which of the tables are synthesized stand-ins"""
+        return {'weekly': self.weekly.source == "synthesized", 'daily': self.daily.source == "synthesized"}
+
+    def weekly_for_daily(self, daily_period: int) -> Optional[int]:
+        """Weekly scoring period that a daily roster period (e.g. trade "Period 72") falls in"""
+        day = self.daily.date_range(daily_period)
+        return self.weekly.number_for(day[0]) if day else None
+
+
+_calendars: Dict[int, LeagueCalendars] = {}
+_default_season: Optional[int] = None
+_default_season_checked = 0.0
+_calendars_lock = threading.Lock()
+
+
+def _set_default_season(season: int):
+    """Remember the current season (caller holds _calendars_lock)"""
+    global _default_season, _default_season_checked
+    _default_season = season
+    _default_season_checked = time.monotonic()
+    for table, synthesized in _calendars[season].synthesized.items():
+        CALENDAR_SYNTHESIZED.set(int(synthesized), table=table)
+
+
+def get_league_calendars(api_client=None, season: int = None) -> LeagueCalendars:
+    """
+    Season calendars, loaded once per season and shared by the whole process.
+
+    The weekly table comes from CALENDAR_FILE if present, else from dated
+    periods in the league info payload, else it is synthesized (weekly from
+    April 1). Without ``season``, the league's season is read from
+    getLeagueInfo through api_client, at most once per
+    DEFAULT_SEASON_RECHECK_SECONDS.
+    """
+    league_info = None
+    if season is None:
+        with _calendars_lock:
+            # Without a client the re-check could only guess the season from
+            # today's date, so the last answer from getLeagueInfo is kept
+            if _default_season is not None and (
+                    api_client is None
+                    or time.monotonic() - _default_season_checked < DEFAULT_SEASON_RECHECK_SECONDS):
+                return _calendars[_default_season]
+        if api_client is not None:
+            league_info = api_client.get_league_info()
+        try:
+            season = int((league_info or {}).get('season', datetime.date.today().year))
+        except (TypeError, ValueError, AttributeError):
+            season = datetime.date.today().year
+        default = True
+    else:
+        default = False
+
+    with _calendars_lock:
+        if season in _calendars:
+            if default:
+                _set_default_season(season)
+            return _calendars[season]
+
+    weekly = _load_calendar_file(season)
+    if weekly is None and isinstance(league_info, dict):
+        weekly = calendar_from_payload(league_info, "getLeagueInfo")
+    if weekly is None:
+        weekly = SeasonCalendar.weekly(datetime.date(season, *DEFAULT_SEASON_START), DEFAULT_WEEKS_IN_SEASON)
+
+    with _calendars_lock:
+        calendars = _calendars.setdefault(season, LeagueCalendars(season, weekly))
+        if default:
+            _set_default_season(season)
+        return calendars
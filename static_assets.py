@@ -0,0 +1,211 @@
+from typing import Dict, List, Optional
+from functools import lru_cache
+import base64
+import hashlib
+import html
+import io
+import json
+import os
+import threading
+import tracing
+from change_detection import file_version
+
+try:
+    from PIL import Image, features
+except ImportError:  # pragma: no cover - Pillow is optional, the app falls back to the source images
+    Image = None
+
+# Images the app displays, by asset name, with the widths (px) built for each.
+# Widths above the source width are skipped.
+STATIC_ASSETS = {
+    'logo': {
+        'source': "attached_assets/331073D2-5049-4D62-B0E8-56A215C5C224.jpeg",
+        'widths': (150, 300, 600, 900),
+    },
+}
+
+# Built variants go under static/, which Streamlit serves at app/static/
+# (server.enableStaticServing); names carry a content hash, so browsers can
+# cache them indefinitely
+ASSET_BUILD_DIR = os.getenv("ABL_ASSET_BUILD_DIR", "static/build")
+ASSET_MANIFEST_FILE = os.path.join(ASSET_BUILD_DIR, "manifest.json")
+ASSET_URL_PREFIX = os.getenv("ABL_ASSET_URL_PREFIX", "app/static/build")
+
+# Encoders in order of preference (smallest first) and their quality settings.
+# AVIF is not built: Streamlit's static handler (1.43+, see requirements.txt)
+# serves extensions outside its safe list, .avif included, as text/plain with
+# nosniff, so browsers would pick the AVIF source and fail to decode it
+FORMAT_QUALITY = {'webp': 80}
+MIME_TYPES = {'webp': 'image/webp'}
+
+# WebP variants up to this width also get a base64 data URI in the manifest
+INLINE_MAX_WIDTH = 300
+HASH_LENGTH = 12
+
+_build_lock = threading.Lock()
+
+
+def _sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def available_formats() -> List[str]:
+    """Output formats the installed Pillow can encode"""
+    if Image is None:
+        return []
+    return [fmt for fmt in FORMAT_QUALITY if features.check(fmt)]
+
+
+def encode_variants(source_bytes: bytes, widths, formats) -> List[dict]:
+    """
+    Resize one source image to every width and encode it in every format.
+
+    Returns:
+        list: {'width', 'height', 'format', 'data'} per variant
+    """
+    variants = []
+    with Image.open(io.BytesIO(source_bytes)) as image:
+        image = image.convert('RGBA' if 'A' in image.getbands() else 'RGB')
+        for width in sorted({min(w, image.width) for w in widths}):
+            height = round(image.height * width / image.width)
+            resized = image if width == image.width else image.resize((width, height), Image.LANCZOS)
+            for fmt in formats:
+                buffer = io.BytesIO()
+                resized.save(buffer, fmt.upper(), quality=FORMAT_QUALITY[fmt])
+                variants.append({'width': width, 'height': height, 'format': fmt, 'data': buffer.getvalue()})
+    return variants
+
+
+def build_asset(name: str, source: str, widths, out_dir: str = ASSET_BUILD_DIR) -> dict:
+    """
+    Write the content-hashed variants of one asset and return its manifest entry.
+
+    Variant files are named <name>-<width>.<hash>.<format>; files that already
+    exist are not rewritten.
+    """
+    with open(source, 'rb') as f:
+        source_bytes = f.read()
+    os.makedirs(out_dir, exist_ok=True)
+    entry = {'source': source, 'source_hash': _sha256(source_bytes), 'source_bytes': len(source_bytes),
+             'variants': [], 'inline': {}}
+    for variant in encode_variants(source_bytes, widths, available_formats()):
+        data = variant.pop('data')
+        file_name = f"{name}-{variant['width']}.{_sha256(data)[:HASH_LENGTH]}.{variant['format']}"
+        path = os.path.join(out_dir, file_name)
+        if not os.path.exists(path):
+            with open(f"{path}.tmp", 'wb') as f:
+                f.write(data)
+            os.replace(f"{path}.tmp", path)
+        entry['variants'].append({**variant, 'file': file_name, 'bytes': len(data)})
+        if variant['format'] == 'webp' and variant['width'] <= INLINE_MAX_WIDTH:
+            entry['inline'][str(variant['width'])] = (
+                "data:image/webp;base64," + base64.b64encode(data).decode('ascii'))
+    return entry
+
+
+def build_assets(out_dir: str = ASSET_BUILD_DIR) -> Dict[str, dict]:
+    """
+    Build every STATIC_ASSETS entry, write manifest.json and delete variant
+    files no longer referenced by it.
+    """
+    with tracing.span("assets.build", "process"):
+        manifest = {name: build_asset(name, spec['source'], spec['widths'], out_dir)
+                    for name, spec in STATIC_ASSETS.items()}
+        manifest_path = os.path.join(out_dir, "manifest.json")
+        with open(f"{manifest_path}.tmp", 'w') as f:
+            json.dump(manifest, f, indent=2)
+        os.replace(f"{manifest_path}.tmp", manifest_path)
+
+        referenced = {variant['file'] for entry in manifest.values() for variant in entry['variants']}
+        for file_name in os.listdir(out_dir):
+            if file_name.startswith(tuple(f"{name}-" for name in STATIC_ASSETS)) and file_name not in referenced:
+                try:
+                    os.remove(os.path.join(out_dir, file_name))
+                except OSError:
+                    pass
+    return manifest
+
+
+def _is_current(manifest: Dict[str, dict]) -> bool:
+    """True if the manifest covers every asset, matches its source and formats and its files exist"""
+    formats = set(available_formats())
+    for name, spec in STATIC_ASSETS.items():
+        entry = manifest.get(name)
+        if entry is None or entry.get('source') != spec['source']:
+            return False
+        if {variant['format'] for variant in entry['variants']} != formats:
+            return False
+        try:
+            with open(spec['source'], 'rb') as f:
+                if _sha256(f.read()) != entry['source_hash']:
+                    return False
+        except OSError:
+            return False
+        if not all(os.path.exists(os.path.join(ASSET_BUILD_DIR, v['file'])) for v in entry['variants']):
+            return False
+    return True
+
+
+@lru_cache(maxsize=2)
+def _load_manifest(version: tuple) -> Dict[str, dict]:
+    try:
+        with open(ASSET_MANIFEST_FILE) as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        manifest = {}
+    if _is_current(manifest):
+        return manifest
+    if Image is None:
+        return {}
+    with _build_lock:
+        try:
+            return build_assets()
+        except OSError:
+            return {}
+
+
+def asset_manifest() -> Dict[str, dict]:
+    """
+    Manifest of the built assets, loaded once per process. A missing or stale
+    build (source image changed) is rebuilt on first use; without Pillow the
+    manifest is empty and callers fall back to the source images.
+    """
+    sources = [spec['source'] for spec in STATIC_ASSETS.values()]
+    return _load_manifest(file_version(ASSET_MANIFEST_FILE, *sources))
+
+
+def asset_data_uri(name: str, width: int) -> Optional[str]:
+    """Precomputed WebP data URI of the smallest inline variant at least ``width`` px wide"""
+    inline = asset_manifest().get(name, {}).get('inline', {})
+    if not inline:
+        return None
+    widths = sorted(int(w) for w in inline)
+    return inline[str(next((w for w in widths if w >= width), widths[-1]))]
+
+
+def picture_html(name: str, alt: str = "", style: str = "", sizes: str = "100vw") -> Optional[str]:
+    """
+    <picture> element offering every built width in every format; the browser
+    downloads a single variant.
+    """
+    variants = asset_manifest().get(name, {}).get('variants', [])
+    if not variants:
+        return None
+    srcsets = {}
+    for variant in sorted(variants, key=lambda v: v['width']):
+        srcsets.setdefault(variant['format'], []).append(
+            f"{ASSET_URL_PREFIX}/{variant['file']} {variant['width']}w")
+    sources = ''.join(
+        f'<source type="{MIME_TYPES[fmt]}" srcset="{", ".join(srcsets[fmt])}" sizes="{html.escape(sizes)}">'
+        for fmt in FORMAT_QUALITY if fmt in srcsets
+    )
+    fallback = max((v for v in variants if v['format'] == 'webp'), key=lambda v: v['width'], default=variants[-1])
+    return (f'<picture>{sources}<img src="{ASSET_URL_PREFIX}/{fallback["file"]}" alt="{html.escape(alt)}" '
+            f'width="{fallback["width"]}" height="{fallback["height"]}" style="{html.escape(style)}"></picture>')
+
+
+if __name__ == "__main__":
+    for asset_name, asset in build_assets().items():
+        print(f"{asset_name}: {asset['source']} ({asset['source_bytes'] / 1024:.0f} KB)")
+        for built in asset['variants']:
+            print(f"  {built['file']}: {built['width']}x{built['height']}, {built['bytes'] / 1024:.1f} KB")
@@ -0,0 +1,87 @@
+import json
+import time
+import fantrax_guard
+from fantrax_guard import CLOSED, OPEN, FantraxGuard, LastKnownGoodStore
+from api_client import FantraxAPI
+
+
+class FakeResponse:
+    """Just enough of requests.Response for FantraxAPI's request paths"""
+    status_code = 200
+    raw = None
+
+    def __init__(self, body: bytes):
+        self.content = body
+        self.text = body.decode('utf-8')
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return json.loads(self.text)
+
+
+class FakeSessionManager:
+    def __init__(self, body: bytes):
+        self.body = body
+        self.requests = 0
+
+    def get(self, url, **kwargs):
+        self.requests += 1
+        return FakeResponse(self.body)
+
+
+def half_open_api(monkeypatch, tmp_path, body: bytes):
+    """FantraxAPI on a fresh guard whose circuit is due for its half-open trial"""
+    guard = FantraxGuard()
+    guard.last_known_good = LastKnownGoodStore(str(tmp_path))
+    guard.breaker.state = OPEN
+    guard.breaker.opened_at = time.monotonic() - guard.breaker.reset_seconds
+    monkeypatch.setattr(fantrax_guard, "_guard", guard)
+
+    api = FantraxAPI.__new__(FantraxAPI)
+    api.base_url = "https://www.fantrax.com/fxea/general"
+    api.league_id = "test-league"
+    api.last_response_live = False
+    api._session_manager = FakeSessionManager(body)
+    return api, guard
+
+
+def test_api_error_payload_ends_half_open_trial(monkeypatch, tmp_path):
+    api, guard = half_open_api(monkeypatch, tmp_path, b'{"error": "Invalid period"}')
+
+    api.get_league_info()
+    assert guard.breaker.state == CLOSED
+    assert not guard.breaker._trial_in_flight
+
+    # The circuit lets the next request through instead of refusing every request
+    api.get_league_info()
+    assert api._session_manager.requests == 2
+
+
+def test_unknown_standings_format_ends_half_open_trial(monkeypatch, tmp_path):
+    api, guard = half_open_api(monkeypatch, tmp_path, b'{"unexpected": []}')
+
+    assert api.get_standings() == {"unexpected": []}
+    assert guard.breaker.state == CLOSED
+    assert guard.breaker.allow_request()
+    # An unrecognized payload is not kept as last-known-good
+    assert guard.last_known_good.get("getStandings", {"leagueId": api.league_id}) is None
+
+
+def test_failed_trial_reopens_circuit(monkeypatch, tmp_path):
+    api, guard = half_open_api(monkeypatch, tmp_path, b'<html>maintenance</html>')
+
+    api.get_league_info()
+    assert guard.breaker.state == OPEN
+    assert not guard.breaker.allow_request()
+
+
+def test_roster_fallback_survives_period_change(tmp_path):
+    store = LastKnownGoodStore(str(tmp_path))
+    store.put("getTeamRosters", {"leagueId": "test-league", "period": "170"}, {"rosters": {"t1": {}}})
+
+    # The next day's request asks for a new period; yesterday's rosters are still served
+    entry = LastKnownGoodStore(str(tmp_path)).get("getTeamRosters", {"leagueId": "test-league", "period": "171"})
+    assert entry is not None and entry[1] == {"rosters": {"t1": {}}}
+    assert store.get("getTeamRosters", {"leagueId": "other-league", "period": "171"}) is None
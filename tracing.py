@@ -0,0 +1,265 @@
+import streamlit as st
+import pandas as pd
+from typing import Any, Callable, Dict, List, Optional
+from contextlib import contextmanager
+from functools import wraps
+import datetime
+import json
+import os
+import threading
+import time
+
+# Default time budgets (milliseconds) per stage category. A stage whose
+# duration exceeds its budget is flagged as slow in the panel and the log.
+DEFAULT_BUDGETS_MS = {
+    "api": 3000,      # Single Fantrax request
+    "process": 250,   # DataProcessor step
+    "csv": 250,       # Single CSV asset load
+    "render": 2000,   # One component / tab render
+    "fetch": 8000,    # Whole fetch_api_data call
+    "rerun": 10000,   # Whole Streamlit rerun
+}
+
+# Budgets can be overridden with a JSON object keyed by category or by
+# exact stage name, e.g. ABL_PERF_BUDGETS_MS='{"api": 2000, "render.ddi": 4000}'
+BUDGETS_ENV_VAR = "ABL_PERF_BUDGETS_MS"
+
+TRACE_LOG_PATH = "data/logs/perf_trace.jsonl"
+TRACE_LOG_MAX_BYTES = 5 * 1024 * 1024  # Rotate after 5 MB
+TRACE_LOG_BACKUPS = 3                  # Keep perf_trace.jsonl.1 .. .3
+
+_local = threading.local()
+_log_lock = threading.Lock()
+
+
+def _load_budgets() -> Dict[str, float]:
+    """Merge default budgets with any overrides from the environment"""
+    budgets = dict(DEFAULT_BUDGETS_MS)
+    raw = os.getenv(BUDGETS_ENV_VAR)
+    if raw:
+        try:
+            overrides = json.loads(raw)
+            if isinstance(overrides, dict):
+                budgets.update({str(k): float(v) for k, v in overrides.items()})
+        except (ValueError, TypeError):
+            pass
+    return budgets
+
+
+BUDGETS_MS = _load_budgets()
+
+
+def get_budget(name: str, category: str) -> Optional[float]:
+    """Return the budget for a stage, preferring an exact name match over its category"""
+    if name in BUDGETS_MS:
+        return BUDGETS_MS[name]
+    return BUDGETS_MS.get(category)
+
+
+def _current_trace() -> Optional[Dict[str, Any]]:
+    return getattr(_local, "trace", None)
+
+
+def start_trace(name: str = "rerun") -> None:
+    """
+    Begin collecting spans for the current thread (one Streamlit rerun).
+
+    Any trace already in progress on this thread is discarded.
+    """
+    _local.trace = {
+        "name": name,
+        "started_at": datetime.datetime.now().isoformat(timespec="seconds"),
+        "start": time.perf_counter(),
+        "spans": [],
+        "stack": [],
+    }
+
+
+@contextmanager
+def span(name: str, category: str = "stage"):
+    """
+    Time a block of work as a named stage.
+
+    Spans nest: a span opened inside another records the parent's path, so
+    e.g. ``fetch/api.getTeamRosters`` shows where the time inside a fetch went.
+    When no trace is active on this thread the block runs untimed.
+    """
+    trace = _current_trace()
+    if trace is None:
+        yield
+        return
+
+    stack = trace["stack"]
+    path = "/".join(stack + [name])
+    stack.append(name)
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        duration_ms = (time.perf_counter() - start) * 1000
+        stack.pop()
+        trace["spans"].append({
+            "name": name,
+            "path": path,
+            "category": category,
+            "depth": len(stack),
+            "duration_ms": duration_ms,
+        })
+
+
+def traced(name: str, category: str = "stage") -> Callable:
+    """Decorator form of :func:`span`"""
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(name, category):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def read_csv(path: str, **kwargs) -> pd.DataFrame:
+    """pd.read_csv wrapped in a ``csv.<file>`` span"""
+    with span(f"csv.{os.path.basename(str(path))}", "csv"):
+        return pd.read_csv(path, **kwargs)
+
+
+def aggregate_spans(spans: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Aggregate raw spans by path.
+
+    Args:
+        spans: Raw span records collected during a trace
+
+    Returns:
+        list: One row per stage path with call count, total/max time and budget status,
+              ordered by path so children follow their parent
+    """
+    stages: Dict[str, Dict[str, Any]] = {}
+    for s in spans:
+        stage = stages.get(s["path"])
+        if stage is None:
+            stage = stages[s["path"]] = {
+                "path": s["path"],
+                "name": s["name"],
+                "category": s["category"],
+                "depth": s["depth"],
+                "calls": 0,
+                "total_ms": 0.0,
+                "max_ms": 0.0,
+                "budget_ms": get_budget(s["name"], s["category"]),
+            }
+        stage["calls"] += 1
+        stage["total_ms"] += s["duration_ms"]
+        stage["max_ms"] = max(stage["max_ms"], s["duration_ms"])
+
+    for stage in stages.values():
+        budget = stage["budget_ms"]
+        stage["over_budget"] = budget is not None and stage["max_ms"] > budget
+
+    # Children finish before their parents, so order rows by path to keep
+    # each parent directly above its children
+    return sorted(stages.values(), key=lambda stage: stage["path"])
+
+
+def finish_trace(write_log: bool = True) -> Optional[Dict[str, Any]]:
+    """
+    Close the current trace, aggregate it and optionally append it to the JSONL log.
+
+    Returns:
+        dict: Trace summary with total time, aggregated stages and slow stages,
+              or None if no trace was active
+    """
+    trace = _current_trace()
+    if trace is None:
+        return None
+    _local.trace = None
+
+    total_ms = (time.perf_counter() - trace["start"]) * 1000
+    stages = aggregate_spans(trace["spans"])
+    rerun_budget = get_budget(trace["name"], "rerun")
+
+    summary = {
+        "name": trace["name"],
+        "started_at": trace["started_at"],
+        "total_ms": round(total_ms, 2),
+        "budget_ms": rerun_budget,
+        "over_budget": rerun_budget is not None and total_ms > rerun_budget,
+        "stages": stages,
+        "slow_stages": [s["path"] for s in stages if s["over_budget"]],
+    }
+
+    if write_log:
+        append_trace_log(summary)
+
+    return summary
+
+
+def _rotate_log(path: str) -> None:
+    """Shift perf_trace.jsonl -> .1 -> .2 ... dropping the oldest backup"""
+    for i in range(TRACE_LOG_BACKUPS - 1, 0, -1):
+        src = f"{path}.{i}"
+        if os.path.exists(src):
+            os.replace(src, f"{path}.{i + 1}")
+    os.replace(path, f"{path}.1")
+
+
+def append_trace_log(summary: Dict[str, Any], file_path: str = TRACE_LOG_PATH) -> bool:
+    """
+    Append a trace summary as one JSON line, rotating the file when it grows too large
+
+    Returns:
+        bool: True if written, False otherwise
+    """
+    try:
+        record = dict(summary)
+        record["stages"] = [
+            {k: (round(v, 2) if isinstance(v, float) else v) for k, v in s.items()}
+            for s in summary.get("stages", [])
+        ]
+        line = json.dumps(record, default=str)
+
+        with _log_lock:
+            os.makedirs(os.path.dirname(file_path), exist_ok=True)
+            if os.path.exists(file_path) and os.path.getsize(file_path) >= TRACE_LOG_MAX_BYTES:
+                _rotate_log(file_path)
+            with open(file_path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+        return True
+    except Exception:
+        # Tracing must never break the app
+        return False
+
+
+def render_performance_panel(summary: Optional[Dict[str, Any]]):
+    """Render a collapsible Performance panel for a finished trace"""
+    if not summary:
+        return
+
+    slow = summary["slow_stages"]
+    label = f"⏱️ Performance — {summary['total_ms'] / 1000:.2f}s"
+    if slow or summary["over_budget"]:
+        label += f" ⚠️ {len(slow)} slow"
+
+    with st.expander(label, expanded=False):
+        if summary["over_budget"]:
+            st.warning(f"Rerun took {summary['total_ms']:.0f} ms (budget {summary['budget_ms']:.0f} ms)")
+        if slow:
+            st.warning("Over budget: " + ", ".join(slow))
+
+        if not summary["stages"]:
+            st.caption("No stages recorded (all data served from cache).")
+            return
+
+        rows = []
+        for s in summary["stages"]:
+            rows.append({
+                "Stage": " " * s["depth"] + s["name"],
+                "Calls": s["calls"],
+                "Total (ms)": round(s["total_ms"], 1),
+                "Max (ms)": round(s["max_ms"], 1),
+                "Budget (ms)": s["budget_ms"],
+                "Slow": "⚠️" if s["over_budget"] else "",
+            })
+        st.dataframe(pd.DataFrame(rows), hide_index=True, use_container_width=True)
+        st.caption(f"Logged to {TRACE_LOG_PATH}")
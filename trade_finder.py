@@ -0,0 +1,206 @@
+import pandas as pd
+import numpy as np
+from typing import List, Optional, Sequence, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from itertools import combinations
+import os
+import tracing
+from ros_projections import LINEUP_SLOTS
+from trade_sandbox import RosterSnapshot
+
+# Positions whose depth decides surplus and need (the flex UT/P slots are not a need)
+POSITION_GROUPS = ('C', '1B', '2B', '3B', 'SS', 'OF', 'SP', 'RP')
+REQUIRED_STARTERS = {slot: count for slot, count, _ in LINEUP_SLOTS if slot in POSITION_GROUPS}
+
+# A player received at a position of need is worth a premium to the receiver;
+# a surplus player costs the giver less than face value. Both sides must gain
+# under these weights, which bounds the value ratio of every candidate trade
+# to (SURPLUS_DISCOUNT / NEED_PREMIUM, NEED_PREMIUM / SURPLUS_DISCOUNT).
+NEED_PREMIUM = 1.15
+SURPLUS_DISCOUNT = 0.85
+
+# Players below this trade value are not worth a roster move
+MIN_PLAYER_VALUE = 5.0
+
+# Best candidates kept per team pair and per team in the final report
+MAX_CANDIDATES_PER_PAIR = 25
+DEFAULT_TOP_TRADES = 5
+
+
+class TradeMarket:
+    """
+    Per-player value vectors and indexed positional surplus/need of every team.
+
+    A position is a need when a team has fewer starter-calibre active players
+    there than lineup slots; starter-calibre means at least the value of the
+    league's (teams x slots)-th best eligible player. Players beyond a team's
+    starters at a surplus position are expendable. Plain arrays only, so a
+    market pickles cheaply to worker processes.
+    """
+    __slots__ = ('teams', 'names', 'values', 'team_of', 'need', 'surplus', 'expendable', 'fills_need')
+
+    def __init__(self, snapshot: RosterSnapshot):
+        players = snapshot.players
+        slots = [slot for slot, _, _ in LINEUP_SLOTS]
+        eligible = snapshot.eligibility[:, [slots.index(group) for group in POSITION_GROUPS]]
+        values = players['trade_value'].to_numpy(dtype=float)
+        active = players['active'].to_numpy() & (values >= MIN_PLAYER_VALUE)
+
+        self.teams = list(snapshot.teams)
+        self.names = players['player_name'].to_numpy()
+        self.values = values
+        self.team_of = players['team'].map({team: i for i, team in enumerate(self.teams)}).to_numpy()
+
+        n_teams, n_groups = len(self.teams), len(POSITION_GROUPS)
+        starter_calibre = np.zeros_like(eligible)
+        depth_rank = np.full(eligible.shape, np.iinfo(np.int32).max)
+        for g, group in enumerate(POSITION_GROUPS):
+            pool = np.flatnonzero(eligible[:, g] & active)
+            if len(pool) == 0:
+                continue
+            order = pool[np.argsort(-values[pool], kind='stable')]
+            cutoff = values[order[min(len(order), n_teams * REQUIRED_STARTERS[group]) - 1]]
+            starter_calibre[pool, g] = values[pool] >= cutoff
+            # Depth chart position of each player on their own team at this group
+            depth_rank[order, g] = pd.Series(self.team_of[order]).groupby(self.team_of[order]).cumcount().to_numpy()
+
+        required = np.array([REQUIRED_STARTERS[group] for group in POSITION_GROUPS])
+        strong = np.zeros((n_teams, n_groups), dtype=int)
+        np.add.at(strong, self.team_of, starter_calibre.astype(int))
+        self.need = strong < required
+        self.surplus = strong > required
+
+        self.expendable = active & (eligible & self.surplus[self.team_of] & (depth_rank >= required)).any(axis=1)
+        # fills_need[p, t]: p is a starter-calibre player at one of team t's needs
+        self.fills_need = (starter_calibre.astype(int) @ self.need.T.astype(int)) > 0
+
+    def offers(self, giver: int, receiver: int) -> np.ndarray:
+        """Expendable players of ``giver`` that fill a need of ``receiver``"""
+        return np.flatnonzero((self.team_of == giver) & self.expendable & self.fills_need[:, receiver])
+
+    def depth(self, team: int) -> np.ndarray:
+        return np.flatnonzero((self.team_of == team) & self.expendable)
+
+
+def _value_window(sorted_values: np.ndarray, targets: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Index ranges of sorted_values inside the mutual-benefit ratio bounds of each target"""
+    low = np.searchsorted(sorted_values, targets * SURPLUS_DISCOUNT / NEED_PREMIUM, side='right')
+    high = np.searchsorted(sorted_values, targets * NEED_PREMIUM / SURPLUS_DISCOUNT, side='left')
+    return low, high
+
+
+def _pairs_in_window(sorted_values: np.ndarray, targets: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """(target index, sorted index) of every combination that survives the value bounds"""
+    low, high = _value_window(sorted_values, targets)
+    counts = np.maximum(high - low, 0)
+    target_index = np.repeat(np.arange(len(targets)), counts)
+    offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    return target_index, np.repeat(low, counts) + offsets
+
+
+def _one_for_one(market: TradeMarket, a: int, b: int) -> List[tuple]:
+    give_a, give_b = market.offers(a, b), market.offers(b, a)
+    if len(give_a) == 0 or len(give_b) == 0:
+        return []
+    give_b = give_b[np.argsort(market.values[give_b], kind='stable')]
+    xi, yi = _pairs_in_window(market.values[give_b], market.values[give_a])
+    x, y = give_a[xi], give_b[yi]
+    vx, vy = market.values[x], market.values[y]
+    gain_a = vy * NEED_PREMIUM - vx * SURPLUS_DISCOUNT
+    gain_b = vx * NEED_PREMIUM - vy * SURPLUS_DISCOUNT
+    return [(a, b, (px,), (py,), ga, gb) for px, py, ga, gb in zip(x, y, gain_a, gain_b)]
+
+
+def _two_for_one(market: TradeMarket, a: int, b: int) -> List[tuple]:
+    """Team a sends two players (at least one filling a need of b) for one of b's"""
+    give_a, depth_a, give_b = market.offers(a, b), market.depth(a), market.offers(b, a)
+    if len(give_a) == 0 or len(depth_a) < 2 or len(give_b) == 0:
+        return []
+    fills = set(give_a.tolist())
+    packages = np.array([(x1, x2) for x1, x2 in combinations(depth_a.tolist(), 2) if x1 in fills or x2 in fills])
+    if len(packages) == 0:
+        return []
+    sums = market.values[packages].sum(axis=1)
+    order = np.argsort(sums, kind='stable')
+    packages, sums = packages[order], sums[order]
+
+    yi, pi = _pairs_in_window(sums, market.values[give_b])
+    y, pair = give_b[yi], packages[pi]
+    vy = market.values[y]
+    received_b = (market.values[pair] * np.where(market.fills_need[pair, b], NEED_PREMIUM, 1.0)).sum(axis=1)
+    gain_a = vy * NEED_PREMIUM - sums[pi] * SURPLUS_DISCOUNT
+    gain_b = received_b - vy * SURPLUS_DISCOUNT
+    return [(a, b, tuple(package), (py,), ga, gb) for package, py, ga, gb in zip(pair, y, gain_a, gain_b)]
+
+
+def search_pairs(market: TradeMarket, pairs: Sequence[Tuple[int, int]]) -> List[tuple]:
+    """
+    Mutually beneficial 1-for-1, 2-for-1 and 1-for-2 trades for each team pair.
+
+    Returns:
+        list: (team_a, team_b, a_gives, b_gives, a_gain, b_gain) with players
+              as market row indices, the best MAX_CANDIDATES_PER_PAIR per pair
+    """
+    found = []
+    for a, b in pairs:
+        candidates = _one_for_one(market, a, b) + _two_for_one(market, a, b)
+        candidates += [(a, b, a_gives, b_gives, a_gain, b_gain)
+                       for _, _, b_gives, a_gives, b_gain, a_gain in _two_for_one(market, b, a)]
+        candidates = [c for c in candidates if c[4] > 0 and c[5] > 0]
+        candidates.sort(key=lambda c: min(c[4], c[5]), reverse=True)
+        found.extend(candidates[:MAX_CANDIDATES_PER_PAIR])
+    return found
+
+
+def find_trades(snapshot: RosterSnapshot, top_n: int = DEFAULT_TOP_TRADES,
+                processes: Optional[int] = None) -> pd.DataFrame:
+    """
+    Search every team pair for trades that turn one side's positional surplus
+    into the other's need, with both sides gaining value.
+
+    Args:
+        snapshot: Rosters with trade values (RosterSnapshot with a player_table)
+        top_n: Trades kept per team
+        processes: Worker processes for the pair search (default: CPU count)
+
+    Returns:
+        DataFrame: Up to top_n rows per team, best first: team, partner, kind,
+                   gives, receives, value_out, value_in, team_gain,
+                   partner_gain and balance (smaller side / larger side)
+    """
+    with tracing.span("trades.finder", "compute"):
+        market = TradeMarket(snapshot)
+        pairs = list(combinations(range(len(market.teams)), 2))
+        processes = max(1, min(processes or os.cpu_count() or 1, len(pairs)))
+        if processes > 1:
+            chunks = [pairs[i::processes] for i in range(processes)]
+            with ProcessPoolExecutor(max_workers=processes) as pool:
+                found = [trade for part in pool.map(search_pairs, [market] * processes, chunks) for trade in part]
+        else:
+            found = search_pairs(market, pairs)
+
+    columns = ['team', 'partner', 'kind', 'gives', 'receives', 'value_out', 'value_in',
+               'team_gain', 'partner_gain', 'balance']
+    if not found:
+        return pd.DataFrame(columns=columns)
+
+    rows = []
+    for a, b, a_gives, b_gives, a_gain, b_gain in found:
+        a_out, b_out = market.values[list(a_gives)].sum(), market.values[list(b_gives)].sum()
+        balance = min(a_out, b_out) / max(a_out, b_out)
+        for team, partner, gives, receives, out, into, gain, partner_gain in (
+                (a, b, a_gives, b_gives, a_out, b_out, a_gain, b_gain),
+                (b, a, b_gives, a_gives, b_out, a_out, b_gain, a_gain)):
+            rows.append((market.teams[team], market.teams[partner], f"{len(gives)}-for-{len(receives)}",
+                         " + ".join(market.names[list(gives)]), " + ".join(market.names[list(receives)]),
+                         out, into, gain, partner_gain, balance))
+    trades = pd.DataFrame(rows, columns=columns)
+    trades['mutual_gain'] = trades[['team_gain', 'partner_gain']].min(axis=1)
+    trades = trades.sort_values(['team', 'mutual_gain', 'balance'], ascending=[True, False, False], kind='stable')
+    return trades.groupby('team', sort=False).head(top_n).drop(columns='mutual_gain').reset_index(drop=True)
+
+
+def trade_moves(row: pd.Series) -> List[Tuple[str, str, str]]:
+    """A find_trades row as RosterSnapshot.evaluate moves"""
+    moves = [(name, row['team'], row['partner']) for name in row['gives'].split(" + ")]
+    return moves + [(name, row['partner'], row['team']) for name in row['receives'].split(" + ")]
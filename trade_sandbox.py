@@ -0,0 +1,214 @@
+import pandas as pd
+import numpy as np
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from functools import lru_cache
+import tracing
+from data_processor import DataProcessor
+from components.ddi import HISTORY_WEIGHT, PLAYOFF_WEIGHT, POWER_RANK_WEIGHT, PROSPECT_WEIGHT
+from prospect_scores import normalize_names, prospect_lookup
+from ros_projections import INACTIVE_STATUSES, best_lineup, player_ros_points, slot_eligibility
+from trade_valuation import parse_items
+
+# A proposed move: (item, from_team, to_team). Items are roster player names,
+# or draft pick / FA budget text as written in the Fantrax trade log.
+Move = Tuple[str, str, str]
+
+# Team metrics tracked by the sandbox, and the ranks derived from them
+TEAM_METRICS = ['weekly_points', 'prospect_total', 'prospect_count', 'trade_value', 'ddi_score']
+RANKED_METRICS = {'weekly_points': 'points_rank', 'prospect_total': 'prospect_rank', 'ddi_score': 'ddi_rank'}
+
+
+def _is_asset(item: str) -> bool:
+    """Draft picks and FA budget (classified the same way as trade_valuation.parse_items)"""
+    return 'Draft Pick' in item or 'Budget Amount' in item
+
+
+@lru_cache(maxsize=1024)
+def _asset_value(item: str) -> float:
+    return float(parse_items(pd.Series([item], dtype=object))['value'].iat[0])
+
+
+def _ranks(values: np.ndarray) -> np.ndarray:
+    """1 = highest; ties keep team order. Missing values (e.g. DDI without ddi_scores) get NaN ranks"""
+    ranks = np.empty(len(values), dtype=int)
+    ranks[np.argsort(-values, kind='stable')] = np.arange(1, len(values) + 1)
+    missing = np.isnan(values)
+    if missing.any():
+        ranks = np.where(missing, np.nan, ranks)
+    return ranks
+
+
+class RosterSnapshot:
+    """
+    Immutable per-player inputs of every roster plus each team's baseline.
+
+    Player rows (weekly ROS points, slot eligibility, prospect score, trade
+    value) are computed once. ``evaluate`` applies a trade copy-on-write:
+    only the teams that send or receive something get new row lists, and only
+    their lineups and totals are recomputed. League-wide steps (DDI prospect
+    normalization, ranks) are vector operations over the team arrays.
+    """
+    __slots__ = ('teams', 'players', 'eligibility', 'has_ddi', '_team_ids', '_team_rows', '_name_rows',
+                 '_points', '_active', '_prospect', '_matches', '_value', '_baseline', '_ddi_fixed')
+
+    def __init__(self, roster_data: pd.DataFrame, ddi_scores: Optional[pd.DataFrame] = None,
+                 player_table: Optional[pd.DataFrame] = None):
+        """
+        Args:
+            roster_data: Processed rosters (team, player_name, position, status)
+            ddi_scores: Output of ddi.calculate_ddi_scores; without it DDI columns are NaN
+            player_table: trade_valuation.player_value_table, for trade value totals
+        """
+        points, horizon_weeks = player_ros_points()
+        prospects = prospect_lookup()
+        names = roster_data['player_name'].fillna('').astype(str)
+        prospect_names = normalize_names(names)
+
+        players = pd.DataFrame({
+            'team': roster_data['team'].astype(str).to_numpy(),
+            'player_name': names.to_numpy(),
+            'weekly_points': (DataProcessor().normalize_names(names).map(points) / horizon_weeks).fillna(0.0).to_numpy(),
+            'active': ~roster_data['status'].astype(str).str.lower().isin(INACTIVE_STATUSES).to_numpy(),
+            'prospect_score': prospect_names.map(prospects['score']).fillna(0.0).to_numpy(),
+            'prospect_matches': prospect_names.map(prospects['matches']).fillna(0).astype(int).to_numpy(),
+            'trade_value': (names.map(player_table['total_value']).fillna(0.0).to_numpy()
+                            if player_table is not None else np.zeros(len(names))),
+        })
+        self.players = players
+        self.eligibility = slot_eligibility(roster_data['position'])
+        self.eligibility.setflags(write=False)
+        self._points = players['weekly_points'].to_numpy()
+        self._active = players['active'].to_numpy()
+        self._prospect = players['prospect_score'].to_numpy()
+        self._matches = players['prospect_matches'].to_numpy()
+        self._value = players['trade_value'].to_numpy()
+        for array in (self._points, self._active, self._prospect, self._matches, self._value):
+            array.setflags(write=False)
+
+        self.teams = list(pd.unique(players['team']))
+        self._team_ids = {team: i for i, team in enumerate(self.teams)}
+        grouped = players.groupby('team', sort=False).indices
+        self._team_rows = {team: grouped[team] for team in self.teams}
+        self._name_rows = {}
+        for row, (team, name) in enumerate(zip(players['team'], players['player_name'])):
+            self._name_rows.setdefault((team, name), row)
+
+        baseline = np.array([self._team_totals(self._team_rows[team]) for team in self.teams])
+        self._baseline = {metric: baseline[:, i] for i, metric in enumerate(TEAM_METRICS[:-1])}
+
+        self.has_ddi = ddi_scores is not None and not ddi_scores.empty
+        if self.has_ddi:
+            ddi = ddi_scores.set_index('Team').reindex(self.teams)
+            self._ddi_fixed = (ddi['Power Score'].fillna(0).to_numpy() * POWER_RANK_WEIGHT +
+                               ddi['Historical Score'].fillna(0).to_numpy() * HISTORY_WEIGHT +
+                               ddi['Playoff Score'].fillna(0).to_numpy() * PLAYOFF_WEIGHT)
+        else:
+            self._ddi_fixed = np.full(len(self.teams), np.nan)
+        self._baseline['ddi_score'] = self._ddi_scores(self._baseline['prospect_total'])
+
+    def _team_totals(self, rows: np.ndarray) -> Tuple[float, float, int, float]:
+        active = rows[self._active[rows]]
+        starters = best_lineup(self._points[active], self.eligibility[active])
+        return (self._points[active][starters].sum(), self._prospect[rows].sum(),
+                self._matches[rows].sum(), self._value[rows].sum())
+
+    def _ddi_scores(self, prospect_totals: np.ndarray) -> np.ndarray:
+        """DDI with the prospect component normalized to the league-best system, as in ddi.py"""
+        best = prospect_totals.max()
+        prospect_score = prospect_totals / best * 100 if best > 0 else np.zeros_like(prospect_totals)
+        return self._ddi_fixed + prospect_score * PROSPECT_WEIGHT
+
+    def _row_of(self, team: str, item: str) -> int:
+        row = self._name_rows.get((team, item))
+        if row is None:
+            raise ValueError(f"{item} is not on the {team} roster")
+        return row
+
+    def baseline(self) -> pd.DataFrame:
+        """Current team metrics and ranks, indexed by team"""
+        frame = pd.DataFrame({metric: values for metric, values in self._baseline.items()}, index=self.teams)
+        for metric, rank in RANKED_METRICS.items():
+            frame[rank] = _ranks(frame[metric].to_numpy())
+        return frame
+
+    def _apply(self, moves: Sequence[Move]) -> Tuple[List[int], Dict[str, np.ndarray]]:
+        """Team ids touched by the moves and the metric arrays after them"""
+        moves = list(moves)
+        rows: Dict[str, List[int]] = {}
+        extra_value: Dict[str, float] = {}
+        for item, from_team, to_team in moves:
+            for team in (from_team, to_team):
+                if team not in self._team_ids:
+                    raise ValueError(f"Unknown team: {team}")
+                if team not in rows:
+                    rows[team] = list(self._team_rows[team])
+            if not _is_asset(str(item)):
+                row = self._row_of(from_team, str(item))
+                if row not in rows[from_team]:
+                    raise ValueError(f"{item} was already moved off the {from_team} roster")
+                rows[from_team].remove(row)
+                rows[to_team].append(row)
+            else:
+                # Picks and FA budget only carry trade value
+                value = _asset_value(str(item))
+                extra_value[to_team] = extra_value.get(to_team, 0.0) + value
+                extra_value[from_team] = extra_value.get(from_team, 0.0) - value
+
+        after = {metric: values.copy() for metric, values in self._baseline.items()}
+        touched = []
+        for team, team_rows in rows.items():
+            i = self._team_ids[team]
+            totals = self._team_totals(np.asarray(team_rows, dtype=np.intp))
+            for metric, total in zip(TEAM_METRICS, totals):
+                after[metric][i] = total
+            after['trade_value'][i] += extra_value.get(team, 0.0)
+            touched.append(i)
+        after['ddi_score'] = self._ddi_scores(after['prospect_total'])
+        return touched, after
+
+    def evaluate(self, moves: Sequence[Move]) -> pd.DataFrame:
+        """
+        Effect of one trade on every team that sends or receives an item.
+
+        Returns:
+            DataFrame: indexed by team, with ``<metric>_before``, ``_after`` and
+                       ``_delta`` for each of TEAM_METRICS and
+                       ``<rank>_before``/``_after``/``_change`` (positive =
+                       moved up) for points, prospect and DDI ranks
+        """
+        touched, after = self._apply(moves)
+        return pd.DataFrame(self._impact(touched, after), index=pd.Index([self.teams[i] for i in touched], name='team'))
+
+    def _impact(self, touched: List[int], after: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        columns = {}
+        for metric in TEAM_METRICS:
+            before, now = self._baseline[metric][touched], after[metric][touched]
+            columns[f'{metric}_before'] = before
+            columns[f'{metric}_after'] = now
+            columns[f'{metric}_delta'] = now - before
+        for metric, rank in RANKED_METRICS.items():
+            before, now = _ranks(self._baseline[metric])[touched], _ranks(after[metric])[touched]
+            columns[f'{rank}_before'] = before
+            columns[f'{rank}_after'] = now
+            columns[f'{rank}_change'] = before - now
+        return columns
+
+    def evaluate_many(self, trades: Iterable[Sequence[Move]]) -> pd.DataFrame:
+        """
+        Evaluate a batch of candidate trades against the same snapshot.
+
+        Returns:
+            DataFrame: the evaluate() rows of every trade, with 'trade' (the
+                       trade's position in ``trades``) and 'team' columns
+        """
+        numbers, teams, impacts = [], [], []
+        with tracing.span("trades.sandbox", "compute"):
+            for number, moves in enumerate(trades):
+                touched, after = self._apply(moves)
+                numbers.extend([number] * len(touched))
+                teams.extend(self.teams[i] for i in touched)
+                impacts.append(self._impact(touched, after))
+        frame = pd.DataFrame({'trade': np.asarray(numbers, dtype=int), 'team': teams})
+        for column in (impacts[0] if impacts else ()):
+            frame[column] = np.concatenate([impact[column] for impact in impacts])
+        return frame
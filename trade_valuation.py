@@ -0,0 +1,354 @@
+import pandas as pd
+import numpy as np
+from typing import Any, Dict, Iterable, List, Optional
+import tracing
+from schemas import MVP_PLAYERS_FILE
+from value_curves import CURVES, DEFAULT_CURVE, apply_curve, curve_frame, get_curve
+
+TRADES_FILE = "attached_assets/Fantrax-Transaction-History-Trades-ABL Season 5.csv"
+PROSPECTS_FILE = "attached_assets/ABL-Import.csv"
+
+DROP = "(Drop)"
+
+# Player value blend (sums to 1.0, scaled to 0-100)
+PLAYER_VALUE_WEIGHTS = {
+    'fpts': 0.60,       # Fantasy points - primary performance metric
+    'fpg': 0.10,        # Fantasy points per game - health/consistency factor
+    'position': 0.05,   # Scarcity-based position value
+    'contract': 0.10,   # Longer contracts more valuable
+    'age': 0.10,        # Younger players more valuable
+    'salary': 0.05,     # Lower salary is better
+}
+
+# Position scarcity (multi-position players take their best position)
+POSITION_VALUES = {
+    'C': 1.0, 'SS': 0.9, '2B': 0.85, '3B': 0.8, 'CF': 0.75, 'SP': 0.7,
+    '1B': 0.65, 'LF': 0.6, 'RF': 0.6, 'RP': 0.5, 'UT': 0.55, 'DH': 0.4,
+}
+
+# Contract length values for trade purposes
+CONTRACT_VALUES = {
+    '2050': 1.0, '2045': 0.95, '2040': 0.9, '2035': 0.85,
+    '2029': 0.8, '2028': 0.7, '2027': 0.6, '2026': 0.5,
+    '2025': 0.3, '1st': 0.2,
+}
+UNKNOWN_CONTRACT_VALUE = 0.1
+
+# Age score falls linearly from 1.0 at 20 to 0 at 35
+AGE_CEILING = 35
+AGE_RANGE = 15
+
+# Curve applied to the normalized MVP values of traded players to emphasize elites
+DEFAULT_VALUE_CURVE = DEFAULT_CURVE
+
+# Prospect score multipliers: 0-35 for pure prospects, 0-15 once a player has MLB FPts
+PROSPECT_MULTIPLIER = 3.5
+PRODUCING_PROSPECT_MULTIPLIER = 1.5
+
+# Draft picks: base value by round, discounted by years out, then curved
+# against a current-year 1st rounder to emphasize elite picks
+CURRENT_DRAFT_YEAR = 2025
+PICK_ROUND_VALUES = {1: 50, 2: 35, 3: 25, 4: 18, 5: 12}
+LATE_ROUND_VALUE = 8
+PICK_YEAR_MULTIPLIERS = {0: 1.0, 1: 0.85, 2: 0.7, 3: 0.55}
+DISTANT_PICK_MULTIPLIER = 0.4
+MAX_PICK_VALUE = 50
+MIN_PICK_VALUE = 1
+PICK_VALUE_CURVE = 'quadratic'
+
+# FA budget: 1.2 points per dollar (~$499 left across the league)
+BUDGET_POINTS_PER_DOLLAR = 1.2
+
+# Value gap between the best and worst team that makes a trade lopsided
+LOPSIDED_THRESHOLD = 30
+
+# Pick year/round and budget dollars, extracted from all item names at once
+ITEM_PATTERN = (r'(?P<pick_year>\d{4})\D*?Draft Pick.*?Round (?P<pick_round>\d+)'
+                r'|Budget Amount.*?\$(?P<budget_amount>\d+(?:\.\d+)?)')
+
+
+def player_values(mvp_data: pd.DataFrame) -> pd.Series:
+    """Raw 0-100 trade value for every row of the MVP player list at once"""
+    def column(name: str, default: float) -> pd.Series:
+        if name not in mvp_data.columns:
+            return pd.Series(default, index=mvp_data.index, dtype=float)
+        return pd.to_numeric(mvp_data[name], errors='coerce')
+
+    fpts, fpg = column('FPts', 0), column('FP/G', 0)
+    age, salary = column('Age', 25), column('Salary', 1)
+    max_fpts = fpts.max() if 'FPts' in mvp_data.columns else 400
+    max_fpg = fpg.max() if 'FP/G' in mvp_data.columns else 25
+    max_salary = salary.max() if 'Salary' in mvp_data.columns else 70
+
+    positions = mvp_data.get('Position', pd.Series('UT', index=mvp_data.index)).astype(str)
+    position_score = (positions.str.split(',').explode().str.strip().map(POSITION_VALUES)
+                      .groupby(level=0).max().reindex(mvp_data.index).fillna(0.0))
+    contracts = mvp_data.get('Contract', pd.Series('2025', index=mvp_data.index)).astype(str)
+
+    scores = {
+        'fpts': (fpts / max_fpts).clip(upper=1.0) if max_fpts > 0 else 0,
+        'fpg': (fpg / max_fpg).clip(upper=1.0) if max_fpg > 0 else 0,
+        'position': position_score,
+        'contract': contracts.map(CONTRACT_VALUES).fillna(UNKNOWN_CONTRACT_VALUE),
+        'age': ((AGE_CEILING - age) / AGE_RANGE).clip(lower=0).fillna(0.0),
+        'salary': 1.0 - salary / max_salary if max_salary > 0 else 0.5,
+    }
+    return sum(scores[name] * weight for name, weight in PLAYER_VALUE_WEIGHTS.items()) * 100
+
+
+def parse_items(items: pd.Series) -> pd.DataFrame:
+    """
+    Classify trade items and value draft picks and FA budget in one pass.
+
+    Returns:
+        DataFrame: item_type ('Player'/'Draft Pick'/'Budget') and value, on the
+                   index of ``items``; player values are filled in later
+    """
+    items = items.astype(str)
+    parts = items.str.extract(ITEM_PATTERN).apply(pd.to_numeric, errors='coerce')
+    is_pick = items.str.contains('Draft Pick', regex=False)
+    is_budget = ~is_pick & items.str.contains('Budget Amount', regex=False)
+
+    years_out = (parts['pick_year'] - CURRENT_DRAFT_YEAR).clip(lower=0)
+    year_multiplier = years_out.map(PICK_YEAR_MULTIPLIERS).fillna(DISTANT_PICK_MULTIPLIER)
+    round_value = parts['pick_round'].map(PICK_ROUND_VALUES).fillna(LATE_ROUND_VALUE)
+    normalized = (round_value * year_multiplier / MAX_PICK_VALUE).clip(upper=1.0)
+    pick_value = (get_curve(PICK_VALUE_CURVE)(normalized) * MAX_PICK_VALUE).clip(lower=MIN_PICK_VALUE)
+    pick_value = pick_value.where(parts['pick_year'].notna() & parts['pick_round'].notna(), 0.0)
+
+    return pd.DataFrame({
+        'item_type': np.select([is_pick, is_budget], ['Draft Pick', 'Budget'], default='Player'),
+        'value': np.select([is_pick, is_budget],
+                           [pick_value, (parts['budget_amount'] * BUDGET_POINTS_PER_DOLLAR).fillna(0.0)],
+                           default=np.nan),
+    }, index=items.index)
+
+
+def player_value_table(mvp_data: pd.DataFrame, prospect_data: Optional[pd.DataFrame] = None,
+                       traded_players: Optional[Iterable[str]] = None,
+                       curve: str = DEFAULT_VALUE_CURVE) -> pd.DataFrame:
+    """
+    Trade value of every known player, indexed by name.
+
+    MVP values are curve-scaled among ``traded_players`` (all players when
+    none are given). Players with MLB FPts get a reduced prospect multiplier;
+    players with both scores but no FPts are valued on their prospect score
+    alone (``zero_fpts_override``).
+
+    Columns: mvp_raw (before the curve), mvp_value, prospect_value, fpts,
+    fpg, zero_fpts_override, reduced_prospect_override, total_value, source
+    """
+    named = mvp_data[mvp_data['Player'].notna() & (mvp_data['Player'] != '')]
+    raw = pd.Series(player_values(mvp_data)[named.index].to_numpy(), index=named['Player'].to_numpy())
+    # A repeated name keeps its last value; production stats come from its first row
+    raw = raw[~raw.index.duplicated(keep='last')]
+    first = named.drop_duplicates('Player').set_index('Player')
+
+    traded = set(traded_players or ())
+    if traded:
+        raw = raw[raw.index.isin(traded)]
+    mvp_value = apply_curve(raw, curve)
+
+    if prospect_data is not None and not prospect_data.empty:
+        scores = pd.to_numeric(prospect_data['Score'], errors='coerce')
+        prospects = pd.Series(scores.to_numpy(), index=prospect_data['Name'].to_numpy())
+        prospects = prospects[prospects.index.notna() & prospects.notna()]
+        prospects = prospects[~prospects.index.duplicated(keep='last')]
+    else:
+        prospects = pd.Series(dtype=float)
+
+    table = pd.DataFrame(index=mvp_value.index.union(prospects.index))
+    table['mvp_raw'] = raw.reindex(table.index).fillna(0.0)
+    table['mvp_value'] = mvp_value.reindex(table.index).fillna(0.0)
+    table['fpts'] = pd.to_numeric(first['FPts'], errors='coerce').reindex(table.index) if 'FPts' in first else np.nan
+    table['fpg'] = pd.to_numeric(first['FP/G'], errors='coerce').reindex(table.index) if 'FP/G' in first else np.nan
+
+    producing = table.index.isin(mvp_value.index) & (table['fpts'] > 0)
+    multiplier = np.where(producing, PRODUCING_PROSPECT_MULTIPLIER, PROSPECT_MULTIPLIER)
+    table['prospect_value'] = (prospects.reindex(table.index) * multiplier).fillna(0.0)
+
+    both = (table['mvp_value'] > 0) & (table['prospect_value'] > 0)
+    table['zero_fpts_override'] = both & (table['fpts'] == 0)
+    table['reduced_prospect_override'] = both & table['fpts'].notna() & (table['fpts'] != 0)
+    table.loc[table['zero_fpts_override'], 'mvp_value'] = 0.0
+    table['total_value'] = table['mvp_value'] + table['prospect_value']
+    table['source'] = np.select(
+        [table['zero_fpts_override'], table['mvp_value'] > table['prospect_value'], table['prospect_value'] > 0],
+        ['Prospect (MLB inactive)', 'MLB', 'Prospect'], default='Unknown')
+    return table
+
+
+def value_breakdown(table: pd.DataFrame, player_name: str) -> Dict[str, Any]:
+    """Detailed value of one player (an index lookup into the player value table)"""
+    if player_name not in table.index:
+        return {'mvp_value': 0, 'prospect_value': 0, 'total_value': 0, 'source': 'Unknown', 'details': ''}
+    row = table.loc[player_name]
+    if row['zero_fpts_override']:
+        details = "No MLB FPts - using prospect value only"
+    elif row['reduced_prospect_override']:
+        details = f"FPts: {row['fpts']:.1f}, FP/G: {row['fpg']:.1f} (prospect score reduced)"
+    elif row['mvp_value'] > 0 and pd.notna(row['fpts']):
+        details = f"FPts: {row['fpts']:.1f}, FP/G: {row['fpg']:.1f}"
+    else:
+        details = ""
+    return {
+        'mvp_value': row['mvp_value'],
+        'prospect_value': row['prospect_value'],
+        'total_value': row['total_value'],
+        'source': row['source'],
+        'details': details,
+    }
+
+
+def traded_player_names(trades: pd.DataFrame) -> set:
+    """Names of the players (not picks or budget) that appear in the trade log"""
+    items = trades['Player'].dropna().astype(str)
+    return set(items[parse_items(items)['item_type'] == 'Player'])
+
+
+def trade_keys(trades: pd.DataFrame) -> pd.Series:
+    """Transaction key per row: Fantrax's 'Unique' id, else the trade timestamp and period"""
+    fallback = trades['Date'].astype(str) + '_' + trades['Period'].astype(str)
+    if 'Unique' not in trades.columns:
+        return fallback
+    return trades['Unique'].astype(str).where(trades['Unique'].notna(), fallback)
+
+
+def value_trades(trades: pd.DataFrame, table: pd.DataFrame) -> pd.DataFrame:
+    """
+    Value every trade item for both sides of its trade in one merge.
+
+    ``trades`` needs Player/From/To/Date/Period (and 'Unique' when available).
+    Only transactions with at least two items between at least two teams are
+    kept; items sent to "(Drop)" carry no value.
+
+    Returns:
+        tuple: (sides, teams) - one row per (item, team side) with trade,
+               team, item, type, value, direction ('received'/'gave') and net
+               (the signed value for the team), in trade log order; and the
+               (trade, team) pairs of every valued trade
+    """
+    items = trades.reset_index(drop=True).assign(trade=trade_keys(trades).to_numpy())
+    items = items[items.groupby('trade', sort=False)['trade'].transform('size') >= 2]
+
+    ends = pd.concat([items[['trade', 'From']].rename(columns={'From': 'team'}),
+                      items[['trade', 'To']].rename(columns={'To': 'team'})])
+    teams = ends[ends['team'].notna() & (ends['team'] != DROP)].drop_duplicates()
+    teams = teams[teams.groupby('trade', sort=False)['team'].transform('size') >= 2]
+
+    items = items[items['trade'].isin(teams['trade']) & (items['To'] != DROP)]
+    parsed = parse_items(items['Player'])
+    items = items.assign(item=items['Player'], type=parsed['item_type'], value=parsed['value'])
+    players = items['type'] == 'Player'
+    items.loc[players, 'value'] = items.loc[players, 'item'].map(table['total_value']).fillna(0.0).to_numpy()
+
+    columns = ['trade', 'team', 'item', 'type', 'value', 'direction', 'sign']
+    sides = pd.concat([
+        items.rename(columns={'To': 'team'}).assign(direction='received', sign=1.0)[columns].reset_index(),
+        items.rename(columns={'From': 'team'}).assign(direction='gave', sign=-1.0)[columns].reset_index(),
+    ])
+    sides = sides.merge(teams, on=['trade', 'team'], how='inner')
+    # Trade log order, with the receiving side of an item before the giving side
+    sides = sides.sort_values(['index', 'sign'], ascending=[True, False], kind='stable')
+    sides['net'] = sides['value'] * sides['sign']
+    return sides.drop(columns=['index', 'sign']).reset_index(drop=True), teams
+
+
+def analyze_trades(trades: pd.DataFrame, table: pd.DataFrame) -> List[Dict[str, Any]]:
+    """
+    Per-trade summary, most lopsided first.
+
+    Each entry holds date, scoring_period, teams_involved, team_values (net
+    value per team), trade_details (items per team, as received/gave
+    entries), total_value, value_difference and is_lopsided.
+    """
+    with tracing.span("trades.value", "compute"):
+        trades = trades.reset_index(drop=True)
+        sides, teams = value_trades(trades, table)
+        if teams.empty:
+            return []
+
+        team_index = pd.MultiIndex.from_frame(teams[['trade', 'team']])
+        team_values = sides.groupby(['trade', 'team'], sort=False)['net'].sum().reindex(team_index, fill_value=0.0)
+        by_trade = team_values.groupby(level='trade', sort=False)
+        summary = pd.DataFrame({
+            'total_value': team_values.abs().groupby(level='trade', sort=False).sum() / 2,
+            'value_difference': by_trade.max() - by_trade.min(),
+        })
+        first = trades.assign(trade=trade_keys(trades).to_numpy()).drop_duplicates('trade').set_index('trade')
+        summary = summary.join(first[[c for c in ('Date', 'Scoring Period') if c in first.columns]])
+
+        details: Dict[Any, Dict[str, list]] = {}
+        for trade, team in team_index:
+            details.setdefault(trade, {})[team] = []
+        for trade, team, item, item_type, value, direction in sides[
+                ['trade', 'team', 'item', 'type', 'value', 'direction']].itertuples(index=False, name=None):
+            details[trade][team].append({'item': item, 'value': value, 'type': item_type, 'direction': direction})
+
+        values: Dict[Any, Dict[str, float]] = {}
+        for (trade, team), value in team_values.items():
+            values.setdefault(trade, {})[team] = value
+
+    analysis = [{
+        'date': row.get('Date'),
+        'scoring_period': row.get('Scoring Period'),
+        'teams_involved': list(values[trade]),
+        'team_values': values[trade],
+        'trade_details': details[trade],
+        'total_value': row['total_value'],
+        'value_difference': row['value_difference'],
+        'is_lopsided': row['value_difference'] > LOPSIDED_THRESHOLD,
+    } for trade, row in summary.iterrows()]
+    analysis.sort(key=lambda t: t['value_difference'], reverse=True)
+    return analysis
+
+
+def compare_curves(trades: pd.DataFrame, table: pd.DataFrame,
+                   curves: Optional[Iterable[str]] = None) -> pd.DataFrame:
+    """
+    Trade outcomes under every value curve at once.
+
+    MVP values are re-curved from ``table['mvp_raw']`` as one matrix with a
+    column per curve (pick and budget values do not depend on the curve), and
+    every trade is valued for all curves in a single groupby.
+
+    Returns:
+        DataFrame: indexed by curve, with mean_trade_value,
+                   mean_value_difference, max_value_difference,
+                   lopsided_trades and winner_changes (trades whose biggest
+                   winner differs from the default curve's)
+    """
+    curves = list(curves) if curves is not None else list(CURVES)
+    columns = ['mean_trade_value', 'mean_value_difference', 'max_value_difference', 'lopsided_trades',
+               'winner_changes']
+    with tracing.span("trades.curves", "compute"):
+        sides, teams = value_trades(trades.reset_index(drop=True), table)
+        if teams.empty:
+            return pd.DataFrame(columns=columns, index=pd.Index(curves, name='curve'))
+
+        raw = table['mvp_raw'][table['mvp_raw'] > 0]
+        mvp = curve_frame(raw, curves).reindex(table.index, fill_value=0.0)
+        player_values = mvp.mask(table['zero_fpts_override'], 0.0).add(table['prospect_value'], axis=0)
+
+        values = np.repeat(sides['value'].to_numpy(dtype=float)[:, None], len(curves), axis=1)
+        players = (sides['type'] == 'Player').to_numpy()
+        values[players] = player_values.reindex(sides.loc[players, 'item']).fillna(0.0).to_numpy()
+        sign = np.where(sides['direction'] == 'received', 1.0, -1.0)
+        net = pd.DataFrame(values * sign[:, None], columns=curves)
+        net['trade'], net['team'] = sides['trade'].to_numpy(), sides['team'].to_numpy()
+
+        team_index = pd.MultiIndex.from_frame(teams[['trade', 'team']])
+        team_values = net.groupby(['trade', 'team'], sort=False)[curves].sum().reindex(team_index, fill_value=0.0)
+        by_trade = team_values.groupby(level='trade', sort=False)
+        difference = by_trade.max() - by_trade.min()
+        winners = by_trade.idxmax()
+        baseline = DEFAULT_VALUE_CURVE if DEFAULT_VALUE_CURVE in curves else curves[0]
+
+        report = pd.DataFrame({
+            'mean_trade_value': (team_values.abs().groupby(level='trade', sort=False).sum() / 2).mean(),
+            'mean_value_difference': difference.mean(),
+            'max_value_difference': difference.max(),
+            'lopsided_trades': (difference > LOPSIDED_THRESHOLD).sum(),
+            'winner_changes': winners.ne(winners[baseline], axis=0).sum(),
+        }, index=pd.Index(curves, name='curve'))
+    return report[columns]
@@ -3,16 +3,113 @@ from api_client import FantraxAPI
 from data_processor import DataProcessor
 from typing import Any, Dict, List
 import pandas as pd
+import tracing
+import metrics
+import league_state
+from player_universe import get_player_universe_store
+from season_calendar import calendar_from_payload
 import os
 import datetime
 from pathlib import Path
 
-@st.cache_data(ttl=300)  # Cache for 5 minutes only to ensure fresh trade data
+def fetch_raw_league_payloads(api_client: FantraxAPI, include_transactions: bool = False) -> Dict[str, Any]:
+    """
+    Fetch the raw (unprocessed) Fantrax payloads needed to build the dashboard data.
+
+    Args:
+        api_client: Client used for all requests
+        include_transactions: Also fetch recent transactions
+
+    Returns:
+        dict: Raw payloads keyed by endpoint name
+    """
+    raw = {
+        'league_info': api_client.get_league_info(),
+        'rosters': api_client.get_team_rosters(),
+        'player_ids': get_player_universe_store().get(api_client),
+        'standings': api_client.get_standings(),
+        'scoring_periods': api_client.get_scoring_periods(),
+    }
+    if include_transactions:
+        raw['transactions'] = api_client.get_transactions()
+    return raw
+
+def resolve_current_period(scoring_periods: Any) -> int:
+    """Determine the current scoring period from a getScoringPeriods-style payload"""
+    try:
+        # Check if there was an API error response
+        if isinstance(scoring_periods, dict) and 'error' in scoring_periods:
+            error_msg = scoring_periods.get('error', {}).get('message', 'Unknown API error')
+            st.sidebar.warning(f"Could not get scoring periods: {error_msg}. Using default period 1.")
+            return 1
+
+        # Dated periods (any supported shape): bisect today's date
+        calendar = calendar_from_payload(scoring_periods)
+        if calendar is not None:
+            return calendar.current()
+
+        # Undated payloads: trust the flags / direct keys Fantrax sent
+        periods = scoring_periods
+        if isinstance(scoring_periods, dict):
+            periods = scoring_periods.get('periods', scoring_periods.get('items'))
+            if not isinstance(periods, list):
+                if isinstance(scoring_periods.get('currentPeriod'), dict):
+                    return scoring_periods['currentPeriod'].get('id', 1)
+                return scoring_periods.get('currentPeriodId', 1)
+        if isinstance(periods, list):
+            active = next((p for p in periods if isinstance(p, dict)
+                           and p.get('isActive', False) and not p.get('isCompleted', False)), None)
+            return active.get('id', 1) if active else 1
+
+        st.sidebar.warning(f"Unexpected scoring_periods format: {type(scoring_periods)}")
+    except Exception as period_error:
+        st.sidebar.warning(f"Error processing scoring periods: {str(period_error)}")
+    return 1  # Fallback to period 1
+
+def process_league_payloads(raw: Dict[str, Any], data_processor: DataProcessor = None,
+                            previous: Dict[str, Any] = None, rebuild: set = None) -> Dict[str, Any]:
+    """
+    Turn raw payloads from fetch_raw_league_payloads into the processed dashboard data.
+
+    Args:
+        raw: Raw endpoint payloads
+        data_processor: Processor to use (a new one if omitted)
+        previous: Previously processed data to reuse outputs from
+        rebuild: Outputs to reprocess (see change_detection.outputs_to_rebuild);
+                 any other output present in previous is reused as-is
+
+    Returns:
+        dict: 'league_data', 'roster_data', 'standings_data', 'current_period'
+              (plus 'transactions' when they were fetched)
+    """
+    data_processor = data_processor or DataProcessor()
+    builders = {
+        'league_data': lambda: data_processor.process_league_info(raw.get('league_info')),
+        'roster_data': lambda: data_processor.process_rosters(raw.get('rosters'), raw.get('player_ids')),
+        'standings_data': lambda: data_processor.process_standings(raw.get('standings')),
+        'current_period': lambda: resolve_current_period(raw.get('scoring_periods')),
+    }
+    if 'transactions' in raw:
+        builders['transactions'] = lambda: raw['transactions']
+
+    processed = {}
+    for output, build in builders.items():
+        if previous is not None and rebuild is not None and output not in rebuild and output in previous:
+            processed[output] = previous[output]
+        else:
+            processed[output] = build()
+    return processed
+
+@st.cache_resource(ttl=300)  # Cache for 5 minutes only to ensure fresh trade data
 def fetch_api_data():
     """
     Fetch all required data from API and process it.
     Returns processed data or None if an error occurs.
+
+    The result is one frozen dict shared by every session (cache_resource
+    does not copy per caller), like the refresh worker's snapshot.
     """
+    metrics.mark_cache_miss("fetch_api_data")
     try:
         # Create a placeholder in the sidebar for a single loading indicator
         with st.sidebar:
@@ -23,98 +120,38 @@ def fetch_api_data():
             api_client = FantraxAPI()
             data_processor = DataProcessor()
 
-            # Fetch and process all data with a single progress indicator
+            # Fetch everything, then process it with a single progress indicator
             status_container.progress(25)
-            league_data = api_client.get_league_info()
-            processed_league_data = data_processor.process_league_info(league_data)
-
-            status_container.progress(50)
-            roster_data = api_client.get_team_rosters()
-            processed_roster_data = data_processor.process_rosters(roster_data, api_client.get_player_ids())
+            raw = fetch_raw_league_payloads(api_client)
 
             status_container.progress(75)
-            standings_data = api_client.get_standings()
-            processed_standings_data = data_processor.process_standings(standings_data)
-            
-            # Fetch scoring periods to determine current period
-            try:
-                scoring_periods = api_client.get_scoring_periods()
-                current_period = 1  # Default to period 1
-                
-                # Check if there was an API error response
-                if isinstance(scoring_periods, dict) and 'error' in scoring_periods:
-                    error_msg = scoring_periods.get('error', {}).get('message', 'Unknown API error')
-                    st.sidebar.warning(f"Could not get scoring periods: {error_msg}. Using default period 1.")
-                # Check if scoring_periods is properly formatted
-                elif isinstance(scoring_periods, list):
-                    # Handle list of period dictionaries (expected format)
-                    for period in scoring_periods:
-                        # Make sure each period is a dictionary
-                        if isinstance(period, dict):
-                            if period.get('isActive', False) and not period.get('isCompleted', False):
-                                current_period = period.get('id', 1)
-                                break
-                        else:
-                            st.sidebar.warning(f"Unexpected period format: {type(period)}")
-                elif isinstance(scoring_periods, dict):
-                    # Handle dictionary response format
-                    st.sidebar.info("Processing dictionary-formatted scoring periods data")
-                    
-                    # The API might return scoring periods in a dictionary structure
-                    # Try to extract periods data from common fields
-                    if 'items' in scoring_periods and isinstance(scoring_periods['items'], list):
-                        periods_list = scoring_periods['items']
-                        st.sidebar.info(f"Found {len(periods_list)} periods in 'items' field")
-                        
-                        for period in periods_list:
-                            if isinstance(period, dict):
-                                # Look for active period
-                                if period.get('isActive', False) and not period.get('isCompleted', False):
-                                    current_period = period.get('id', 1)
-                                    break
-                    elif 'periods' in scoring_periods and isinstance(scoring_periods['periods'], list):
-                        periods_list = scoring_periods['periods']
-                        st.sidebar.info(f"Found {len(periods_list)} periods in 'periods' field")
-                        
-                        for period in periods_list:
-                            if isinstance(period, dict):
-                                # Look for active period
-                                if period.get('isActive', False) and not period.get('isCompleted', False):
-                                    current_period = period.get('id', 1)
-                                    break
-                    else:
-                        # If we can't find a list of periods, try direct key
-                        st.sidebar.info(f"Dictionary keys: {list(scoring_periods.keys())}")
-                        
-                        # Directly look for the current period if present
-                        if 'currentPeriod' in scoring_periods and isinstance(scoring_periods['currentPeriod'], dict):
-                            current_period = scoring_periods['currentPeriod'].get('id', 1)
-                        elif 'currentPeriodId' in scoring_periods:
-                            current_period = scoring_periods['currentPeriodId']
-                            
-                        st.sidebar.info(f"Using current period: {current_period}")
-                elif isinstance(scoring_periods, str):
-                    st.sidebar.warning(f"Received string instead of scoring periods data: {scoring_periods[:50]}...")
-                else:
-                    st.sidebar.warning(f"Unexpected scoring_periods format: {type(scoring_periods)}")
-            except Exception as period_error:
-                st.sidebar.warning(f"Error processing scoring periods: {str(period_error)}")
-                current_period = 1  # Fallback to period 1
+            processed = process_league_payloads(raw, data_processor)
 
             # Clear the progress bar
             status_container.empty()
 
-            return {
-                'league_data': processed_league_data,
-                'roster_data': processed_roster_data,
-                'standings_data': processed_standings_data,
-                'current_period': current_period
-            }
+            return league_state.freeze_league_data(processed)
     except Exception as e:
         with st.sidebar:
             st.error(f"❌ Error loading data: {str(e)}")
         return None
 
+def get_league_data():
+    """
+    Return the dashboard data for this page load.
+
+    Reads the warm snapshot kept by the background refresh worker; only falls
+    back to a blocking fetch_api_data() when the worker has not produced a
+    snapshot yet (e.g. the very first Fantrax fetch failed).
+    """
+    from refresh_worker import get_refresh_worker
+
+    snapshot = get_refresh_worker().get_snapshot()
+    if snapshot is not None:
+        return snapshot.data
+    with metrics.cache_lookup("fetch_api_data"):
+        return fetch_api_data()
+
 def format_percentage(value: float) -> str:
     """Format percentage values"""
     return f"{value:.3f}%"
@@ -181,7 +218,7 @@ def load_power_rankings_data(file_path: str = 'data/team_season_stats.csv') -> d
     """
     try:
         if os.path.exists(file_path):
-            df = pd.read_csv(file_path)
+            df = tracing.read_csv(file_path)
             
             # Convert DataFrame to dictionary format expected by the app
             data = {}
@@ -269,7 +306,7 @@ def load_weekly_results(file_path: str = 'data/weekly_results.csv') -> list:
     """
     try:
         if os.path.exists(file_path):
-            df = pd.read_csv(file_path)
+            df = tracing.read_csv(file_path)
             
             # Process the data
             results = []
@@ -367,7 +404,7 @@ def save_rankings_history(rankings_df: pd.DataFrame, ranking_type: str = "power"
         # If file exists, append; otherwise create new
         if file_path.exists():
             # Load existing data
-            existing_df = pd.read_csv(file_path)
+            existing_df = tracing.read_csv(file_path)
             
             # Check if we already have data for today
             today_data = existing_df[existing_df['date'] == current_date]
@@ -413,7 +450,7 @@ def load_rankings_history(team_name: str = None, ranking_type: str = "power") ->
             return pd.DataFrame()  # Return empty DataFrame if no history exists
         
         # Load data
-        df = pd.read_csv(file_path)
+        df = tracing.read_csv(file_path)
         
         # Convert date column to datetime for easier manipulation
         df['date'] = pd.to_datetime(df['date'])
@@ -0,0 +1,60 @@
+import pandas as pd
+import numpy as np
+from typing import Callable, Dict, Iterable, Optional, Union
+
+ArrayLike = Union[np.ndarray, pd.Series]
+
+# Steepness of the sigmoid curve around the midpoint
+SIGMOID_STEEPNESS = 5
+
+
+def power_curve(exponent: float) -> Callable[[ArrayLike], ArrayLike]:
+    """y = x^exponent; above 1 emphasizes the top of the range, below 1 flattens it"""
+    return lambda x: x ** exponent
+
+
+# Curves over normalized (0-1) values; every curve maps 0 -> 0 and 1 -> 1,
+# except the sigmoid, which only approaches both ends
+CURVES: Dict[str, Callable[[ArrayLike], ArrayLike]] = {
+    'linear': lambda x: x,
+    'exponential': power_curve(1.6),
+    'logarithmic': lambda x: np.log1p(x * (np.e - 1)),
+    'square_root': np.sqrt,
+    'sigmoid': lambda x: 1 / (1 + np.exp(-SIGMOID_STEEPNESS * (x - 0.5))),
+    'quadratic': power_curve(2),
+    'cubic': power_curve(3),
+}
+DEFAULT_CURVE = 'quadratic'
+
+
+def register_curve(name: str, curve: Callable[[ArrayLike], ArrayLike]):
+    """Add (or replace) a named curve; it must accept and return whole arrays"""
+    CURVES[name] = curve
+
+
+def get_curve(name: str) -> Callable[[ArrayLike], ArrayLike]:
+    """Named curve; unknown names fall back to linear"""
+    return CURVES.get(name, CURVES['linear'])
+
+
+def apply_curve(values: ArrayLike, curve: str = DEFAULT_CURVE, scale: Optional[float] = None) -> ArrayLike:
+    """
+    Normalize by ``scale`` (default: the max value), apply the curve, and
+    scale back, so the top value is unchanged and the rest are reshaped.
+    Series keep their index.
+    """
+    scale = np.nanmax(values) if scale is None and len(values) else scale
+    if scale is None or not scale > 0:
+        return values * 0.0
+    return get_curve(curve)(values / scale) * scale
+
+
+def curve_frame(values: pd.Series, curves: Optional[Iterable[str]] = None,
+                scale: Optional[float] = None) -> pd.DataFrame:
+    """Every curve applied to the same values at once, one column per curve"""
+    curves = list(curves) if curves is not None else list(CURVES)
+    scale = values.max() if scale is None else scale
+    if not len(values) or not scale > 0:
+        return pd.DataFrame(0.0, index=values.index, columns=curves)
+    normalized = values.to_numpy(dtype=float) / scale
+    return pd.DataFrame({name: get_curve(name)(normalized) * scale for name in curves}, index=values.index)